@@ -8,7 +8,6 @@ sys.path.append('/app')
 
 from pyairbyte.utils.cache_db_manager import PyAirbyteCacheDBManager
 from pyairbyte.utils.common_cache import CACHE_CONFIGS
-import psycopg2
 
 def _drop_associated_types_sweden(context: AssetExecutionContext, cache_config: dict):
     """
@@ -16,18 +15,12 @@ def _drop_associated_types_sweden(context: AssetExecutionContext, cache_config:
     This handles the case where PyAirbyte creates custom types that can cause
     unique constraint violations when trying to recreate tables.
     """
-    host = cache_config['host']
-    dbname = cache_config['database']
-    user = cache_config['username']
-    password = cache_config['password']
-    port = str(cache_config['port'])
     schema_name = cache_config['schema_name']
     
     conn = None
     try:
-        conn = psycopg2.connect(
-            host=host, dbname=dbname, user=user, password=password, port=port
-        )
+        # Pooled connection; close() returns it to the shared pool for the cache database
+        conn = PyAirbyteCacheDBManager(cache_config=cache_config).get_connection()
         conn.autocommit = True
         with conn.cursor() as cur:
             # Drop types that might cause conflicts
@@ -154,11 +147,6 @@ def _truncate_tables_sweden(context: AssetExecutionContext, tables: list[str]):
     # Get Sweden cache configuration
     sweden_cache_config = CACHE_CONFIGS["sweden"]
     
-    host = sweden_cache_config['host']
-    dbname = sweden_cache_config['database']
-    user = sweden_cache_config['username']
-    password = sweden_cache_config['password']
-    port = sweden_cache_config['port']
     schema_name = sweden_cache_config['schema_name']
 
     if not tables:
@@ -167,13 +155,7 @@ def _truncate_tables_sweden(context: AssetExecutionContext, tables: list[str]):
 
     conn = None
     try:
-        conn = psycopg2.connect(
-            host=host,
-            dbname=dbname,
-            user=user,
-            password=password,
-            port=port,
-        )
+        conn = PyAirbyteCacheDBManager(cache_config=sweden_cache_config).get_connection()
         conn.autocommit = True
         with conn.cursor() as cur:
             for table in tables:
@@ -4,6 +4,8 @@ import requests
 import logging
 from typing import Optional, Dict, Any, Literal
 
+from .http_session import get_http_session
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -184,19 +186,10 @@ def call_api_for_event_processing(
         if body:
             logger.debug(f"Request body: {json.dumps(body, indent=2)}")
         
-        # Make the request based on method
-        if method == 'GET':
-            response = requests.get(url, **request_kwargs)
-        elif method == 'POST':
-            response = requests.post(url, **request_kwargs)
-        elif method == 'PUT':
-            response = requests.put(url, **request_kwargs)
-        elif method == 'PATCH':
-            response = requests.patch(url, **request_kwargs)
-        elif method == 'DELETE':
-            response = requests.delete(url, **request_kwargs)
-        else:
+        # Make the request over the shared keep-alive session
+        if method not in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']:
             raise ValueError(f"Unsupported HTTP method: {method}")
+        response = get_http_session().request(method, url, **request_kwargs)
         
         # Parse response
         response_data = None
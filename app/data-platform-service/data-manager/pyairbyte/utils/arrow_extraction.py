@@ -0,0 +1,197 @@
+import re
+import logging
+import datetime
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from .load_verification import ChunkChecksums, chunk_hash_aggregate
+from .pg_bulk_loader import format_postgres_value
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Extraction backends (connector config key 'extract_backend')
+EXTRACT_BACKEND_PANDAS = 'pandas'  # pd.read_sql chunks, normalized column by column
+EXTRACT_BACKEND_ARROW = 'arrow'    # cursor.fetchmany rows straight into typed Arrow arrays
+
+# PostgreSQL column type (as produced by map_mssql_to_postgres_type/map_mysql_to_postgres_type,
+# without length/precision) -> Arrow type. Types not listed are carried as strings.
+POSTGRES_TO_ARROW_TYPES = {
+    'SMALLINT': pa.int16(),
+    'INTEGER': pa.int32(),
+    'BIGINT': pa.int64(),
+    'BOOLEAN': pa.bool_(),
+    'REAL': pa.float32(),
+    'DOUBLE PRECISION': pa.float64(),
+    'TIMESTAMP': pa.timestamp('us'),
+    'TIMESTAMP WITH TIME ZONE': pa.timestamp('us', tz='UTC'),
+    'DATE': pa.date32(),
+    'TIME': pa.time64('us'),
+    'BYTEA': pa.binary(),
+    'UUID': pa.string(),
+    'TEXT': pa.string(),
+    'VARCHAR': pa.string(),
+    'CHAR': pa.string(),
+}
+
+# Largest precision decimal128 can hold
+_MAX_DECIMAL128_PRECISION = 38
+
+_TYPE_PATTERN = re.compile(r'^\s*([A-Za-z ]+?)\s*(?:\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\))?\s*$')
+
+
+def arrow_type_for_postgres(pg_type: str) -> pa.DataType:
+    """
+    Get the Arrow type used to carry values of a PostgreSQL column type.
+
+    NUMERIC/DECIMAL with a precision become decimal128 (exact); without one, or beyond
+    38 digits, they are carried as strings so no digits are lost.
+
+    Args:
+        pg_type: PostgreSQL type, e.g. 'INTEGER', 'VARCHAR(50)' or 'NUMERIC(19,4)'
+
+    Returns:
+        Arrow data type
+    """
+    match = _TYPE_PATTERN.match(pg_type)
+    if not match:
+        return pa.string()
+    base_type = match.group(1).upper()
+    if base_type in ('NUMERIC', 'DECIMAL'):
+        precision = int(match.group(2)) if match.group(2) else None
+        scale = int(match.group(3)) if match.group(3) else 0
+        if precision and precision <= _MAX_DECIMAL128_PRECISION:
+            return pa.decimal128(precision, scale)
+        return pa.string()
+    return POSTGRES_TO_ARROW_TYPES.get(base_type, pa.string())
+
+
+def arrow_schema(column_names: Sequence[str], pg_types: Dict[str, str]) -> pa.Schema:
+    """
+    Build the Arrow schema of a result set.
+
+    Args:
+        column_names: Column names in result order (from cursor.description)
+        pg_types: Column name -> PostgreSQL type of the target column
+
+    Returns:
+        Arrow schema; columns without a known type are strings
+    """
+    return pa.schema([
+        pa.field(name, arrow_type_for_postgres(pg_types[name]) if name in pg_types else pa.string())
+        for name in column_names
+    ])
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        # MySQL BIT values arrive as bytes
+        return int.from_bytes(value, 'little') != 0
+    return bool(value)
+
+
+def _to_time(value: Any) -> Any:
+    # MySQL TIME values arrive as timedelta; times of day convert, others are left to fail
+    if isinstance(value, datetime.timedelta) and datetime.timedelta(0) <= value < datetime.timedelta(days=1):
+        return (datetime.datetime.min + value).time()
+    return value
+
+
+def _to_text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode('utf-8', errors='replace')
+    return str(value)
+
+
+def _to_bytes(value: Any) -> Any:
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+
+def _converter_for(arrow_type: pa.DataType):
+    """Per-value conversion for driver types Arrow cannot take as-is (None if not needed)."""
+    if pa.types.is_boolean(arrow_type):
+        return _to_bool
+    if pa.types.is_time(arrow_type):
+        return _to_time
+    if pa.types.is_string(arrow_type):
+        return _to_text
+    if pa.types.is_binary(arrow_type):
+        return _to_bytes
+    return None
+
+
+def column_to_arrow(name: str, values: Sequence[Any], arrow_type: pa.DataType) -> pa.Array:
+    """
+    Convert the values of one column of fetched rows to an Arrow array.
+
+    Values are converted by Arrow in one call; only if that fails are they converted
+    per value (bytes BIT values, timedelta TIME values, ...), and as a last resort
+    carried as PostgreSQL text input, formatted like the pandas path formats it.
+
+    Args:
+        name: Column name (for logging)
+        values: Column values as returned by the driver
+        arrow_type: Target Arrow type
+
+    Returns:
+        Arrow array
+    """
+    try:
+        return pa.array(values, type=arrow_type, from_pandas=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+        pass
+
+    converter = _converter_for(arrow_type)
+    if converter is not None:
+        try:
+            return pa.array([converter(v) for v in values], type=arrow_type, from_pandas=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+            pass
+
+    logger.warning(f"Could not convert column {name} to {arrow_type}, carrying it as text")
+    return pa.array([None if v is None else format_postgres_value(v) for v in values], type=pa.string())
+
+
+def rows_to_record_batch(rows: Sequence[Sequence[Any]], schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Convert rows fetched with cursor.fetchmany() into an Arrow record batch.
+
+    Args:
+        rows: Fetched rows (tuples, pyodbc.Row or SQLAlchemy Row), in schema column order
+        schema: Schema from arrow_schema()
+
+    Returns:
+        Record batch with one typed array per column
+    """
+    columns = list(zip(*rows)) if rows else [() for _ in schema]
+    arrays = [
+        column_to_arrow(field.name, values, field.type)
+        for field, values in zip(schema, columns)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, names=schema.names)
+
+
+def add_batch_checksums(
+    checksums: ChunkChecksums,
+    rows: Sequence[Sequence[Any]],
+    batch: pa.RecordBatch,
+    plan: Tuple[Tuple[str, str], ...]
+) -> None:
+    """
+    Hash the rows as fetched and the record batch written from them (see ChunkChecksums).
+
+    Both sides are converted to pandas for hashing, so 'checksum' verification gives up
+    part of the Arrow backend's savings.
+    """
+    source = pd.DataFrame.from_records(rows, columns=batch.schema.names, coerce_float=True)
+    checksums.add_chunk(chunk_hash_aggregate(source, plan), batch.to_pandas(), plan)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the extraction/load pipeline of the MSSQL/MySQL sync.
+
+Simulates a source that takes read_ms per chunk and a target that takes load_ms per chunk
+(both sleep, like threads waiting on the network or on COPY) and runs them through
+chunk_pipeline.run_chunk_pipeline with different queue depths. Depth 0 is the previous
+behaviour: one thread alternating between reading and loading. No database is needed.
+
+Usage:
+    python benchmark_chunk_pipeline.py [chunks] [read_ms] [load_ms]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the data-manager path to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from pyairbyte.utils.chunk_pipeline import run_chunk_pipeline
+
+
+def simulated_chunks(chunks: int, read_seconds: float):
+    for i in range(chunks):
+        time.sleep(read_seconds)
+        yield i
+
+
+def main():
+    chunks = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    read_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    load_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 15
+
+    print(f"\n{chunks} chunks, read {read_ms:.0f} ms, load {load_ms:.0f} ms per chunk")
+    print(f"{'Depth':<8} {'Seconds':>9} {'Extract idle':>13} {'Load idle':>10} {'Bottleneck':>11}")
+    baseline = None
+    for depth in (0, 1, 2, 4):
+        started_at = time.perf_counter()
+        stats = run_chunk_pipeline(
+            simulated_chunks(chunks, read_ms / 1000),
+            lambda chunk, read_seconds: time.sleep(load_ms / 1000),
+            depth
+        )
+        seconds = time.perf_counter() - started_at
+        baseline = baseline or seconds
+        print(
+            f"{depth:<8} {seconds:>9.3f} {stats['extract_idle_seconds']:>13.3f} "
+            f"{stats['load_idle_seconds']:>10.3f} {stats['bottleneck']:>11}"
+        )
+    print(f"\nSpeedup of depth 4 over sequential: {baseline / seconds:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the MSSQL/MySQL extraction backends.
+
+Starts from the rows a DB-API cursor returns from fetchmany() and compares the work
+each backend does per chunk before COPY:
+    - pandas: DataFrame.from_records + column_normalizer + dataframe_to_csv_buffer
+    - arrow:  arrow_extraction.rows_to_record_batch + record_batch_to_csv_buffer
+
+No database is needed.
+
+Usage:
+    python benchmark_extract_backends.py [rows] [repeats]
+"""
+
+import sys
+import time
+import uuid
+import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+# Add the data-manager path to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from pyairbyte.utils.arrow_extraction import arrow_schema, rows_to_record_batch
+from pyairbyte.utils.column_normalizer import compile_normalization_plan, normalize_chunk
+from pyairbyte.utils.pg_bulk_loader import dataframe_to_csv_buffer, record_batch_to_csv_buffer
+
+COLUMNS = [
+    {'name': 'id', 'mssql_type': 'int', 'pg_type': 'INTEGER'},
+    {'name': 'row_guid', 'mssql_type': 'uniqueidentifier', 'pg_type': 'UUID'},
+    {'name': 'is_active', 'mssql_type': 'bit', 'pg_type': 'BOOLEAN'},
+    {'name': 'amount', 'mssql_type': 'decimal', 'pg_type': 'NUMERIC(19,4)'},
+    {'name': 'name', 'mssql_type': 'nvarchar', 'pg_type': 'VARCHAR(100)'},
+    {'name': 'created_at', 'mssql_type': 'datetime2', 'pg_type': 'TIMESTAMP'},
+    {'name': 'updated_at', 'mssql_type': 'datetime', 'pg_type': 'TIMESTAMP'},
+]
+
+
+def build_rows(rows: int) -> list:
+    """Build rows shaped like pyodbc fetchmany() output (Python objects, None for NULL)."""
+    start = datetime.datetime(2024, 1, 1)
+    data = []
+    for i in range(rows):
+        created = start + datetime.timedelta(minutes=i)
+        data.append((
+            i,
+            str(uuid.UUID(int=i)),
+            None if i % 23 == 0 else bool(i % 2),
+            None if i % 11 == 0 else Decimal(i % 100000) / Decimal(100),
+            None if i % 9 == 0 else f'Customer {i}',
+            None if i % 13 == 0 else created,
+            None if i % 5 == 0 else created,
+        ))
+    return data
+
+
+def pandas_backend(rows: list, column_names: list, plan) -> None:
+    chunk = pd.DataFrame.from_records(rows, columns=column_names, coerce_float=True)
+    dataframe_to_csv_buffer(normalize_chunk(chunk, plan))
+
+
+def arrow_backend(rows: list, schema) -> None:
+    record_batch_to_csv_buffer(rows_to_record_batch(rows, schema))
+
+
+def best_of(repeats: int, func, *args) -> float:
+    """Return the fastest run time in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    data = build_rows(rows)
+
+    column_names = [col['name'] for col in COLUMNS]
+    plan = compile_normalization_plan(COLUMNS, 'mssql_type')
+    schema = arrow_schema(column_names, {col['name']: col['pg_type'] for col in COLUMNS})
+
+    pandas_s = best_of(repeats, pandas_backend, data, column_names, plan)
+    arrow_s = best_of(repeats, arrow_backend, data, schema)
+
+    print(f"\n{rows} rows x {len(COLUMNS)} columns, best of {repeats}")
+    print(f"{'Backend':<44} {'Seconds':>9} {'Rows/sec':>12}")
+    results = [
+        ('pandas: from_records + normalize + CSV', pandas_s),
+        ('arrow: record batch + Arrow CSV writer', arrow_s),
+    ]
+    for name, seconds in results:
+        rate = rows / seconds if seconds > 0 else 0
+        print(f"{name:<44} {seconds:>9.3f} {rate:>12,.0f}")
+    print(f"\nArrow speedup: {pandas_s / arrow_s:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Manual benchmark for the PostgreSQL cache write paths.
+
+Loads the same synthetic DataFrame into PostgreSQL with:
+    - the legacy row-by-row path (iterrows + execute_values)
+    - pandas to_sql(method='multi')
+    - COPY ... FROM STDIN (pg_bulk_loader.copy_dataframe_to_postgres)
+
+and prints rows/sec for each, so the COPY path can be compared against the old loaders.
+
+Usage:
+    python benchmark_pg_bulk_loader.py [rows]
+
+Environment Variables (from .env):
+    PYAIRBYTE_CACHE_DB_HOST=db
+    PYAIRBYTE_CACHE_DB_PORT=5432
+    PYAIRBYTE_CACHE_DB_USER=dataplatuser
+    PYAIRBYTE_CACHE_DB_PASSWORD=dataplatpassword
+    PYAIRBYTE_CACHE_DB_NAME=dataplatform
+"""
+
+import os
+import sys
+import time
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import psycopg2
+from psycopg2.extras import execute_values
+from sqlalchemy import create_engine
+
+# Add the data-manager path to sys.path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from pyairbyte.utils.pg_bulk_loader import copy_dataframe_to_postgres
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SCHEMA_NAME = 'pyairbyte_benchmark'
+TABLE_NAME = 'bulk_load_benchmark'
+
+
+def get_pg_params() -> dict:
+    """Get PostgreSQL connection parameters from environment variables."""
+    return {
+        'host': os.getenv('PYAIRBYTE_CACHE_DB_HOST', 'db'),
+        'port': int(os.getenv('PYAIRBYTE_CACHE_DB_PORT', '5432')),
+        'user': os.getenv('PYAIRBYTE_CACHE_DB_USER', 'dataplatuser'),
+        'password': os.getenv('PYAIRBYTE_CACHE_DB_PASSWORD', 'dataplatpassword'),
+        'database': os.getenv('PYAIRBYTE_CACHE_DB_NAME', 'dataplatform'),
+    }
+
+
+def build_dataframe(rows: int) -> pd.DataFrame:
+    """Build a synthetic DataFrame resembling a typical MSSQL/MySQL table."""
+    rng = np.random.default_rng(42)
+    amounts = rng.random(rows) * 1000
+    amounts[::17] = np.nan
+    return pd.DataFrame({
+        'id': np.arange(rows, dtype='int64'),
+        'customer_id': rng.integers(1, 50000, rows),
+        'amount': amounts,
+        'description': [f'Order line {i}, "sample" text' for i in range(rows)],
+        'created_at': pd.date_range('2024-01-01', periods=rows, freq='s'),
+        'is_active': rng.integers(0, 2, rows).astype(bool),
+    })
+
+
+def reset_table(pg_conn) -> None:
+    """(Re)create the benchmark table."""
+    cursor = pg_conn.cursor()
+    cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA_NAME}")
+    cursor.execute(f"DROP TABLE IF EXISTS {SCHEMA_NAME}.{TABLE_NAME}")
+    cursor.execute(f"""
+        CREATE TABLE {SCHEMA_NAME}.{TABLE_NAME} (
+            id BIGINT,
+            customer_id BIGINT,
+            amount DOUBLE PRECISION,
+            description TEXT,
+            created_at TIMESTAMP,
+            is_active BOOLEAN
+        )
+    """)
+    pg_conn.commit()
+    cursor.close()
+
+
+def load_with_execute_values(pg_conn, df: pd.DataFrame) -> None:
+    """Legacy loader: convert rows one by one, then execute_values."""
+    data = []
+    for _, row in df.iterrows():
+        data.append(tuple(None if pd.isna(v) else v for v in row))
+    cursor = pg_conn.cursor()
+    columns = ','.join(df.columns)
+    execute_values(
+        cursor,
+        f"INSERT INTO {SCHEMA_NAME}.{TABLE_NAME} ({columns}) VALUES %s",
+        data,
+        page_size=1000
+    )
+    pg_conn.commit()
+    cursor.close()
+
+
+def load_with_to_sql(engine, df: pd.DataFrame) -> None:
+    """pandas multi-row INSERT, as previously used by SqlWriter/ExcelToDbWriter."""
+    # Stay under the 65535 bind parameter limit
+    chunksize = max(1, 60000 // len(df.columns))
+    df.to_sql(TABLE_NAME, engine, schema=SCHEMA_NAME, if_exists='append',
+              index=False, method='multi', chunksize=chunksize)
+
+
+def load_with_copy(pg_conn, df: pd.DataFrame) -> None:
+    """COPY ... FROM STDIN via the shared bulk loader."""
+    copy_dataframe_to_postgres(pg_conn, SCHEMA_NAME, TABLE_NAME, df)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    params = get_pg_params()
+    df = build_dataframe(rows)
+
+    pg_conn = psycopg2.connect(**params)
+    engine = create_engine('postgresql+psycopg2://', creator=lambda: psycopg2.connect(**params))
+
+    loaders = [
+        ('iterrows + execute_values', lambda: load_with_execute_values(pg_conn, df)),
+        ("to_sql(method='multi')", lambda: load_with_to_sql(engine, df)),
+        ('COPY FROM STDIN', lambda: load_with_copy(pg_conn, df)),
+    ]
+
+    results = []
+    try:
+        for name, load in loaders:
+            reset_table(pg_conn)
+            start = time.time()
+            load()
+            elapsed = time.time() - start
+            results.append((name, elapsed, rows / elapsed if elapsed > 0 else 0))
+            logger.info(f"{name}: {rows} rows in {elapsed:.2f}s")
+
+        print(f"\nLoaded {rows} rows into {SCHEMA_NAME}.{TABLE_NAME}")
+        print(f"{'Loader':<28} {'Seconds':>10} {'Rows/sec':>12}")
+        for name, elapsed, rate in results:
+            print(f"{name:<28} {elapsed:>10.2f} {rate:>12,.0f}")
+    finally:
+        cursor = pg_conn.cursor()
+        cursor.execute(f"DROP SCHEMA IF EXISTS {SCHEMA_NAME} CASCADE")
+        pg_conn.commit()
+        cursor.close()
+        pg_conn.close()
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
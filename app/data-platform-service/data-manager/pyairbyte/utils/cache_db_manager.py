@@ -5,6 +5,8 @@ from typing import List, Optional, Dict, Any
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from psycopg2 import OperationalError, ProgrammingError, IntegrityError
 
+from .connection_pool import get_shared_pool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -68,9 +70,24 @@ class PyAirbyteCacheDBManager:
             raise ImportError("common_cache module not available. Please provide cache_config directly.")
     
     def get_connection(self, database: Optional[str] = None) -> psycopg2.extensions.connection:
-        """Get a database connection with retry logic."""
+        """
+        Get a database connection from the process-wide pool for this server and database.
+
+        The connection behaves like a psycopg2 connection; close() returns it to the
+        pool (rolled back, autocommit off) instead of closing the socket, so repeated
+        calls reuse connections rather than reconnecting.
+        """
         db_to_connect = database or self.db_name
-        
+        pool = get_shared_pool(
+            ('postgres', self.host, str(self.port), self.user, self.password, db_to_connect),
+            lambda: self._connect(db_to_connect),
+            name=f"postgres://{self.user}@{self.host}:{self.port}/{db_to_connect}",
+            validate=lambda conn: conn.closed == 0
+        )
+        return pool.checkout()
+
+    def _connect(self, database: str) -> psycopg2.extensions.connection:
+        """Open a new database connection with retry logic."""
         for attempt in range(self.max_retries):
             try:
                 conn = psycopg2.connect(
@@ -78,9 +95,9 @@ class PyAirbyteCacheDBManager:
                     port=self.port,
                     user=self.user,
                     password=self.password,
-                    database=db_to_connect
+                    database=database
                 )
-                logger.info(f"Successfully connected to database: {db_to_connect}")
+                logger.info(f"Successfully connected to database: {database}")
                 return conn
             except OperationalError as e:
                 logger.warning(f"Connection attempt {attempt + 1} failed: {e}")
@@ -99,14 +116,16 @@ class PyAirbyteCacheDBManager:
         try:
             # Connect to the main database and create schema
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Create schema if it doesn't exist
-            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema_name}")
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                # Create schema if it doesn't exist
+                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema_name}")
+                
+                conn.commit()
+                cursor.close()
+            finally:
+                conn.close()
             
             logger.info(f"Created PyAirbyte cache schema: {self.schema_name}")
             return True
@@ -122,14 +141,16 @@ class PyAirbyteCacheDBManager:
         """Create the pyairbyte_cache schema if it doesn't exist."""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Create schema if it doesn't exist
-            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema_name}")
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                # Create schema if it doesn't exist
+                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema_name}")
+                
+                conn.commit()
+                cursor.close()
+            finally:
+                conn.close()
             
             logger.info(f"Created cache schema: {self.schema_name}")
             return True
@@ -145,18 +166,20 @@ class PyAirbyteCacheDBManager:
         """Create a dedicated schema for a specific connector."""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Create schema if it doesn't exist - sanitize name for SQL
-            schema_name = f"airbyte_{connector_name.replace('-', '_')}"
-            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
-            
-            # Create sync metadata table for this connector
-            self._create_sync_metadata_table(cursor, schema_name)
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                # Create schema if it doesn't exist - sanitize name for SQL
+                schema_name = f"airbyte_{connector_name.replace('-', '_')}"
+                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
+                
+                # Create sync metadata table for this connector
+                self._create_sync_metadata_table(cursor, schema_name)
+                
+                conn.commit()
+                cursor.close()
+            finally:
+                conn.close()
             
             logger.info(f"Created schema for connector '{connector_name}': {schema_name}")
             return True
@@ -192,19 +215,21 @@ class PyAirbyteCacheDBManager:
         """List all connector schemas in the cache database."""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT schema_name 
-                FROM information_schema.schemata 
-                WHERE schema_name LIKE 'airbyte_%'
-                ORDER BY schema_name
-            """)
-            
-            schemas = [row[0] for row in cursor.fetchall()]
-            
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT schema_name 
+                    FROM information_schema.schemata 
+                    WHERE schema_name LIKE 'airbyte_%'
+                    ORDER BY schema_name
+                """)
+                
+                schemas = [row[0] for row in cursor.fetchall()]
+                
+                cursor.close()
+            finally:
+                conn.close()
             
             return schemas
             
@@ -223,19 +248,21 @@ class PyAirbyteCacheDBManager:
         """List all tables in the pyairbyte_cache schema."""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(f"""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = '{self.schema_name}'
-                ORDER BY table_name
-            """)
-            
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                cursor.execute(f"""
+                    SELECT table_name 
+                    FROM information_schema.tables 
+                    WHERE table_schema = '{self.schema_name}'
+                    ORDER BY table_name
+                """)
+                
+                tables = [row[0] for row in cursor.fetchall()]
+                
+                cursor.close()
+            finally:
+                conn.close()
             
             return tables
             
@@ -250,31 +277,33 @@ class PyAirbyteCacheDBManager:
         """Get information about a specific table in the cache schema."""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Get table structure
-            cursor.execute(f"""
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns 
-                WHERE table_schema = '{self.schema_name}' 
-                AND table_name = '{table_name}'
-                ORDER BY ordinal_position
-            """)
-            
-            columns = []
-            for row in cursor.fetchall():
-                columns.append({
-                    'name': row[0],
-                    'type': row[1],
-                    'nullable': row[2] == 'YES'
-                })
-            
-            # Get row count
-            cursor.execute(f"SELECT COUNT(*) FROM {self.schema_name}.{table_name}")
-            row_count = cursor.fetchone()[0]
-            
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                # Get table structure
+                cursor.execute(f"""
+                    SELECT column_name, data_type, is_nullable
+                    FROM information_schema.columns 
+                    WHERE table_schema = '{self.schema_name}' 
+                    AND table_name = '{table_name}'
+                    ORDER BY ordinal_position
+                """)
+                
+                columns = []
+                for row in cursor.fetchall():
+                    columns.append({
+                        'name': row[0],
+                        'type': row[1],
+                        'nullable': row[2] == 'YES'
+                    })
+                
+                # Get row count
+                cursor.execute(f"SELECT COUNT(*) FROM {self.schema_name}.{table_name}")
+                row_count = cursor.fetchone()[0]
+                
+                cursor.close()
+            finally:
+                conn.close()
             
             return {
                 'table_name': table_name,
@@ -294,13 +323,15 @@ class PyAirbyteCacheDBManager:
         """Truncate a table in the cache schema."""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(f"TRUNCATE TABLE {self.schema_name}.{table_name}")
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                cursor.execute(f"TRUNCATE TABLE {self.schema_name}.{table_name}")
+                
+                conn.commit()
+                cursor.close()
+            finally:
+                conn.close()
             
             logger.info(f"Truncated table: {self.schema_name}.{table_name}")
             return True
@@ -316,13 +347,15 @@ class PyAirbyteCacheDBManager:
         """Drop a table from the cache schema."""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(f"DROP TABLE IF EXISTS {self.schema_name}.{table_name}")
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                cursor.execute(f"DROP TABLE IF EXISTS {self.schema_name}.{table_name}")
+                
+                conn.commit()
+                cursor.close()
+            finally:
+                conn.close()
             
             logger.info(f"Dropped table: {self.schema_name}.{table_name}")
             return True
@@ -343,26 +376,28 @@ class PyAirbyteCacheDBManager:
             
             # Connect to the main database
             conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Create central sync metadata table
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {self.schema_name}.sync_metadata (
-                    id SERIAL PRIMARY KEY,
-                    connector_name VARCHAR(255) NOT NULL,
-                    schema_name VARCHAR(255) NOT NULL,
-                    sync_started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    sync_completed_at TIMESTAMP,
-                    sync_status VARCHAR(50) DEFAULT 'running',
-                    records_synced INTEGER DEFAULT 0,
-                    error_message TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                # Create central sync metadata table
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {self.schema_name}.sync_metadata (
+                        id SERIAL PRIMARY KEY,
+                        connector_name VARCHAR(255) NOT NULL,
+                        schema_name VARCHAR(255) NOT NULL,
+                        sync_started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        sync_completed_at TIMESTAMP,
+                        sync_status VARCHAR(50) DEFAULT 'running',
+                        records_synced INTEGER DEFAULT 0,
+                        error_message TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                conn.commit()
+                cursor.close()
+            finally:
+                conn.close()
             
             logger.info("Initialized PyAirbyte cache schema with metadata table")
             return True
@@ -0,0 +1,195 @@
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Chunks buffered between extraction and load (table config key 'pipeline_depth').
+# At most depth + 2 chunks are in memory: the queued ones, one being read and one being
+# loaded. 0 reads and loads on the calling thread, one chunk at a time.
+DEFAULT_PIPELINE_DEPTH = 2
+
+# How often a producer blocked on a full queue checks whether the load has stopped
+_PUT_POLL_SECONDS = 0.1
+
+# Marks the end of the chunks in the queue
+_DONE = object()
+
+
+class _ExtractError:
+    """Carries an extraction error from the producer thread to the loader."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class StageTimes:
+    """Busy and idle seconds of one pipeline stage."""
+
+    def __init__(self):
+        self.busy = 0.0
+        self.idle = 0.0
+
+
+def _bottleneck(extract: StageTimes, load: StageTimes) -> Optional[str]:
+    """The stage the other one waited on longer: 'source' (extraction) or 'target' (load)."""
+    if extract.idle == 0 and load.idle == 0:
+        return None
+    return 'source' if load.idle >= extract.idle else 'target'
+
+
+def _stats(depth: int, extract: StageTimes, load: StageTimes) -> Dict[str, Any]:
+    return {
+        'depth': depth,
+        'extract_busy_seconds': round(extract.busy, 3),
+        'extract_idle_seconds': round(extract.idle, 3),
+        'load_busy_seconds': round(load.busy, 3),
+        'load_idle_seconds': round(load.idle, 3),
+        'bottleneck': _bottleneck(extract, load)
+    }
+
+
+def run_chunk_pipeline(
+    chunks: Iterable[Any],
+    load_chunk: Callable[[Any, float], None],
+    depth: int = DEFAULT_PIPELINE_DEPTH,
+    name: str = 'pipeline'
+) -> Dict[str, Any]:
+    """
+    Read chunks on a producer thread and load them on the calling thread.
+
+    The two stages are joined by a queue of at most depth chunks, so the source is read
+    while the previous chunk is written to PostgreSQL and memory stays bounded. The chunk
+    iterator runs entirely on the producer thread (including its close()), and load_chunk
+    entirely on the calling thread, so each connection is used by one thread at a time.
+
+    Extraction is busy while the iterator produces a chunk and idle while the queue is full;
+    loading is busy in load_chunk and idle while the queue is empty. Whichever stage the
+    other waited on longer is reported as the bottleneck.
+
+    Args:
+        chunks: Iterable of chunks (e.g. iter_transformed_chunks)
+        load_chunk: Called with each chunk and the seconds it took to read
+        depth: Queue depth; 0 reads and loads alternately on the calling thread
+        name: Name of the producer thread (for logs)
+
+    Returns:
+        Dictionary with depth, extract/load busy and idle seconds and bottleneck
+        ('source', 'target' or None)
+
+    Raises:
+        Exception: An error raised by the iterator or by load_chunk; a load error stops
+                   the producer and closes the iterator
+    """
+    extract = StageTimes()
+    load = StageTimes()
+
+    if depth <= 0:
+        # Sequential: each stage is idle while the other one works
+        iterator = iter(chunks)
+        while True:
+            started_at = time.perf_counter()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                break
+            read_seconds = time.perf_counter() - started_at
+            started_at = time.perf_counter()
+            load_chunk(chunk, read_seconds)
+            load_seconds = time.perf_counter() - started_at
+            del chunk
+            extract.busy += read_seconds
+            extract.idle += load_seconds
+            load.busy += load_seconds
+            load.idle += read_seconds
+        return _stats(depth, extract, load)
+
+    chunk_queue: 'queue.Queue[Any]' = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        started_at = time.perf_counter()
+        while not stop.is_set():
+            try:
+                chunk_queue.put(item, timeout=_PUT_POLL_SECONDS)
+                extract.idle += time.perf_counter() - started_at
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        outcome: Any = _DONE
+        iterator = iter(chunks)
+        try:
+            while not stop.is_set():
+                started_at = time.perf_counter()
+                try:
+                    chunk = next(iterator)
+                except StopIteration:
+                    break
+                read_seconds = time.perf_counter() - started_at
+                extract.busy += read_seconds
+                if not put((chunk, read_seconds)):
+                    break
+                del chunk
+        except BaseException as e:
+            outcome = _ExtractError(e)
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"Closing the chunk iterator of {name} failed: {e}")
+        put(outcome)
+
+    producer = threading.Thread(target=produce, name=f'{name}-extract', daemon=True)
+    producer.start()
+    try:
+        while True:
+            started_at = time.perf_counter()
+            item = chunk_queue.get()
+            load.idle += time.perf_counter() - started_at
+            if item is _DONE:
+                break
+            if isinstance(item, _ExtractError):
+                raise item.error
+            chunk, read_seconds = item
+            del item
+            started_at = time.perf_counter()
+            load_chunk(chunk, read_seconds)
+            load.busy += time.perf_counter() - started_at
+            del chunk
+    finally:
+        stop.set()
+        producer.join()
+
+    return _stats(depth, extract, load)
+
+
+def combine_pipeline_stats(stats: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Add up the pipeline statistics of partitions loaded in parallel.
+
+    Args:
+        stats: Results of run_chunk_pipeline
+
+    Returns:
+        Combined statistics, or None if stats is empty
+    """
+    if not stats:
+        return None
+    extract = StageTimes()
+    load = StageTimes()
+    for item in stats:
+        extract.busy += item['extract_busy_seconds']
+        extract.idle += item['extract_idle_seconds']
+        load.busy += item['load_busy_seconds']
+        load.idle += item['load_idle_seconds']
+    return _stats(stats[0]['depth'], extract, load)
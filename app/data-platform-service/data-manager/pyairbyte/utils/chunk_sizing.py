@@ -0,0 +1,219 @@
+import logging
+from typing import Dict, Any, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Bounds on the rows of an adaptively sized chunk
+MIN_CHUNK_ROWS = 100
+MAX_CHUNK_ROWS = 500000
+
+# Chunks grow by at most this factor per measured chunk (they shrink at once), so a few
+# narrow rows at the start of a table cannot size a chunk for much wider rows later on
+MAX_GROWTH_FACTOR = 2
+
+# pandas chunks are measured with memory_usage(deep=True), which walks every object value,
+# so after the first RESAMPLE_INTERVAL chunks only every RESAMPLE_INTERVAL-th one is
+# measured; Arrow batches report their size for free and are measured every time
+RESAMPLE_INTERVAL = 8
+
+# Assumed size of a value of an unbounded column (VARCHAR(MAX), TEXT, BLOB, ...) until the
+# first chunk has been measured
+LOB_ESTIMATE_BYTES = 8000
+
+# Memory budget of one chunk of a table with LOB columns when no max_chunk_bytes is set,
+# so tables holding attachments are chunked by size even when other tables use batch_size
+DEFAULT_LOB_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Rows of the first chunk of a table with LOB columns: the size of a LOB value is unknown
+# until a chunk has been read, so LOB tables start small and grow as they are measured
+# (down to a single row per chunk for very large values)
+LOB_INITIAL_CHUNK_ROWS = 16
+
+# Types stored out of row whatever their declared length (MSSQL and MySQL names)
+LOB_TYPES = frozenset({
+    'text', 'ntext', 'image', 'xml',
+    'blob', 'mediumblob', 'longblob', 'mediumtext', 'longtext', 'json'
+})
+
+# Per-value overhead of a Python object held in an object column (str, Decimal, bytes, ...)
+_OBJECT_OVERHEAD_BYTES = 56
+
+# In-memory bytes per value of fixed-width source types (MSSQL and MySQL names)
+FIXED_WIDTH_BYTES = {
+    'bit': 8, 'bool': 8, 'boolean': 8,
+    'tinyint': 8, 'smallint': 8, 'mediumint': 8, 'int': 8, 'integer': 8, 'bigint': 8, 'year': 8,
+    'float': 8, 'real': 8, 'double': 8,
+    'date': 8, 'datetime': 8, 'datetime2': 8, 'smalldatetime': 8, 'timestamp': 8,
+    'datetimeoffset': 8 + _OBJECT_OVERHEAD_BYTES, 'time': 8 + _OBJECT_OVERHEAD_BYTES,
+    'decimal': 48 + _OBJECT_OVERHEAD_BYTES, 'numeric': 48 + _OBJECT_OVERHEAD_BYTES,
+    'money': 48 + _OBJECT_OVERHEAD_BYTES, 'smallmoney': 48 + _OBJECT_OVERHEAD_BYTES,
+    'uniqueidentifier': 36 + _OBJECT_OVERHEAD_BYTES,
+}
+
+
+def is_lob_column(col: Dict[str, Any], type_key: str) -> bool:
+    """
+    Whether a column can hold large objects: a LOB type, a (MAX) column (declared
+    length -1) or a declared length above LOB_ESTIMATE_BYTES.
+
+    Args:
+        col: Column metadata (extract_mssql_schema / extract_mysql_schema)
+        type_key: Key holding the source type ('mssql_type' or 'mysql_type')
+    """
+    if str(col.get(type_key) or '').lower() in LOB_TYPES:
+        return True
+    max_length = col.get('max_length')
+    return max_length is not None and (max_length == -1 or max_length > LOB_ESTIMATE_BYTES)
+
+
+def lob_column_names(columns: List[Dict[str, Any]], type_key: str) -> List[str]:
+    """Names of the columns of a table that can hold large objects (see is_lob_column)."""
+    return [col['name'] for col in columns if is_lob_column(col, type_key)]
+
+
+def estimate_row_bytes(columns: List[Dict[str, Any]], type_key: str) -> int:
+    """
+    Estimate the in-memory size of one row of a chunk from column metadata.
+
+    Character and binary columns count their full declared length (CHARACTER_MAXIMUM_LENGTH),
+    unbounded ones LOB_ESTIMATE_BYTES, so the estimate errs on the large side until the
+    first chunk has been measured.
+
+    Args:
+        columns: Column metadata (extract_mssql_schema / extract_mysql_schema)
+        type_key: Key holding the source type ('mssql_type' or 'mysql_type')
+
+    Returns:
+        Estimated bytes per row
+    """
+    total = 0
+    for col in columns:
+        source_type = str(col.get(type_key) or '').lower()
+        if source_type in FIXED_WIDTH_BYTES:
+            total += FIXED_WIDTH_BYTES[source_type]
+            continue
+        max_length = col.get('max_length')
+        if max_length is None or max_length <= 0 or max_length > LOB_ESTIMATE_BYTES:
+            # -1 is SQL Server's length of (MAX) columns
+            max_length = LOB_ESTIMATE_BYTES
+        total += int(max_length) + _OBJECT_OVERHEAD_BYTES
+    return max(total, 1)
+
+
+class ChunkSizer:
+    """
+    Chooses how many rows to fetch for each chunk of a table.
+
+    Without a memory budget every chunk has batch_size rows. With max_chunk_bytes the first
+    chunk is sized from the estimated row width, and later chunks from the measured size of
+    the chunks read so far, so wide tables get small chunks and narrow tables large ones.
+
+    Tables with LOB columns (lob_columns) always get a budget (DEFAULT_LOB_CHUNK_BYTES if
+    none is set), start with LOB_INITIAL_CHUNK_ROWS rows, are measured on every chunk and
+    may shrink to one row per chunk.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_chunk_bytes: Optional[int] = None,
+        estimated_row_bytes: Optional[int] = None,
+        lob_columns: Optional[List[str]] = None
+    ):
+        """
+        Initialize the sizer.
+
+        Args:
+            batch_size: Rows per chunk when there is no memory budget
+            max_chunk_bytes: Memory budget of one chunk (None: fixed batch_size)
+            estimated_row_bytes: Row width from estimate_row_bytes(), used until the
+                                 first chunk has been measured
+            lob_columns: Columns of the table that can hold large objects (see
+                         lob_column_names)
+        """
+        self.lob_columns = list(lob_columns or [])
+        if self.lob_columns and max_chunk_bytes is None:
+            max_chunk_bytes = DEFAULT_LOB_CHUNK_BYTES
+        self.max_chunk_bytes = max_chunk_bytes
+        self.estimated_row_bytes = estimated_row_bytes
+        self.measured_row_bytes: Optional[float] = None
+        self.peak_chunk_bytes = 0
+        self.chunks = 0
+        self.min_rows = 1 if self.lob_columns else MIN_CHUNK_ROWS
+        if max_chunk_bytes is None:
+            self.rows = int(batch_size)
+        elif self.lob_columns:
+            self.rows = min(LOB_INITIAL_CHUNK_ROWS, self._rows_for(estimated_row_bytes or LOB_ESTIMATE_BYTES))
+        else:
+            self.rows = self._rows_for(estimated_row_bytes or LOB_ESTIMATE_BYTES)
+
+    @classmethod
+    def for_columns(
+        cls,
+        columns: List[Dict[str, Any]],
+        type_key: str,
+        batch_size: int,
+        max_chunk_bytes: Optional[int] = None
+    ) -> 'ChunkSizer':
+        """Create a sizer for a table, estimating its row width when there is a budget or LOB columns."""
+        lob_columns = lob_column_names(columns, type_key)
+        if max_chunk_bytes is None and not lob_columns:
+            return cls(batch_size)
+        if lob_columns:
+            logger.info(f"Sizing chunks by memory for LOB columns {lob_columns}")
+        return cls(
+            batch_size, int(max_chunk_bytes) if max_chunk_bytes is not None else None,
+            estimate_row_bytes(columns, type_key), lob_columns
+        )
+
+    @property
+    def adaptive(self) -> bool:
+        return self.max_chunk_bytes is not None
+
+    def _rows_for(self, row_bytes: float) -> int:
+        return max(self.min_rows, min(MAX_CHUNK_ROWS, int(self.max_chunk_bytes // max(row_bytes, 1))))
+
+    def observe(self, chunk: Union[pd.DataFrame, pa.RecordBatch]) -> None:
+        """
+        Record a chunk that was read and resize the following ones (see MAX_GROWTH_FACTOR).
+
+        Args:
+            chunk: The chunk as it will be loaded (after normalization)
+        """
+        if not self.adaptive:
+            return
+        self.chunks += 1
+        row_count = len(chunk)
+        if row_count == 0:
+            return
+        if isinstance(chunk, pa.RecordBatch):
+            chunk_bytes = chunk.nbytes
+        elif self.lob_columns or self.chunks <= RESAMPLE_INTERVAL or self.chunks % RESAMPLE_INTERVAL == 0:
+            chunk_bytes = int(chunk.memory_usage(index=False, deep=True).sum())
+        else:
+            return
+        self.peak_chunk_bytes = max(self.peak_chunk_bytes, chunk_bytes)
+        self.measured_row_bytes = chunk_bytes / row_count
+        rows = min(self._rows_for(self.measured_row_bytes), max(self.rows, row_count) * MAX_GROWTH_FACTOR)
+        if rows != self.rows:
+            logger.info(
+                f"Resizing chunks from {self.rows} to {rows} rows "
+                f"({self.measured_row_bytes:.0f} bytes/row, budget {self.max_chunk_bytes} bytes)"
+            )
+            self.rows = rows
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'max_chunk_bytes': self.max_chunk_bytes,
+            'estimated_row_bytes': self.estimated_row_bytes,
+            'measured_row_bytes': round(self.measured_row_bytes, 1) if self.measured_row_bytes else None,
+            'peak_chunk_bytes': self.peak_chunk_bytes,
+            'chunk_rows': self.rows,
+            'lob_columns': self.lob_columns
+        }
@@ -0,0 +1,166 @@
+import logging
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Normalization kinds
+NORMALIZE_UUID = 'uuid'
+NORMALIZE_BOOL = 'bool'
+NORMALIZE_DATETIME = 'datetime'
+NORMALIZE_TIME = 'time'
+NORMALIZE_NULLS = 'nulls'
+
+# Source type -> normalization kind. Types not listed only get NULL normalization.
+MSSQL_NORMALIZATION_KINDS = {
+    'uniqueidentifier': NORMALIZE_UUID,
+    'bit': NORMALIZE_BOOL,
+    'datetime': NORMALIZE_DATETIME,
+    'datetime2': NORMALIZE_DATETIME,
+    'smalldatetime': NORMALIZE_DATETIME,
+    'date': NORMALIZE_DATETIME,
+    'datetimeoffset': NORMALIZE_DATETIME,
+    'time': NORMALIZE_TIME,
+}
+
+MYSQL_NORMALIZATION_KINDS = {
+    'bit': NORMALIZE_BOOL,
+    'datetime': NORMALIZE_DATETIME,
+    'timestamp': NORMALIZE_DATETIME,
+    'date': NORMALIZE_DATETIME,
+    'time': NORMALIZE_TIME,
+}
+
+_KIND_MAPS = {
+    'mssql_type': MSSQL_NORMALIZATION_KINDS,
+    'mysql_type': MYSQL_NORMALIZATION_KINDS,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_plan(type_key: str, schema: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """Build the (column, kind) plan for a hashable table schema."""
+    kind_map = _KIND_MAPS[type_key]
+    return tuple((name, kind_map.get(source_type, NORMALIZE_NULLS)) for name, source_type in schema)
+
+
+def compile_normalization_plan(
+    columns: List[Dict[str, Any]],
+    type_key: str = 'mssql_type'
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Compile the column normalization plan for a table schema.
+
+    The plan maps each column to the conversion it needs and is cached per schema,
+    so it is built once per table rather than once per chunk.
+
+    Args:
+        columns: Column metadata as returned by extract_mssql_schema/extract_mysql_schema
+        type_key: Key holding the source type in the column metadata
+                  ('mssql_type' or 'mysql_type')
+
+    Returns:
+        Tuple of (column_name, kind) pairs
+
+    Raises:
+        ValueError: If type_key is not supported
+    """
+    if type_key not in _KIND_MAPS:
+        raise ValueError(f"Unsupported type key '{type_key}'. Supported: {list(_KIND_MAPS.keys())}")
+
+    schema = tuple((col['name'], str(col[type_key]).lower()) for col in columns)
+    return _compile_plan(type_key, schema)
+
+
+def _to_nullable_bool(series: pd.Series) -> pd.Series:
+    """
+    Convert a BIT column to a nullable boolean column.
+
+    Values are factorized so the truthiness check runs once per distinct value
+    (bool, int or the bytes MySQL returns for BIT) instead of once per row.
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return series
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    lookup = np.array([
+        bool(int.from_bytes(v, 'little')) if isinstance(v, (bytes, bytearray)) else bool(v)
+        for v in uniques
+    ], dtype=bool)
+
+    null_mask = codes < 0
+    values = lookup[np.where(null_mask, 0, codes)] if len(lookup) else np.zeros(len(codes), dtype=bool)
+    return pd.Series(pd.arrays.BooleanArray(values, null_mask), index=series.index)
+
+
+def _to_nullable_str(series: pd.Series) -> pd.Series:
+    """Convert a UNIQUEIDENTIFIER column to strings, keeping NULLs as None."""
+    null_mask = series.isna().to_numpy()
+    result = series.astype(str).astype(object)
+    if null_mask.any():
+        result[null_mask] = None
+    return result
+
+
+def _nulls_to_none(series: pd.Series) -> pd.Series:
+    """
+    Replace NaN/NaT with None in object columns.
+
+    Typed columns (int, float, datetime64, ...) are left as-is: the COPY loader writes
+    their NaN/NaT as NULL, and converting them to object would only slow it down.
+    """
+    if series.dtype != object:
+        return series
+    null_mask = series.isna().to_numpy()
+    if not null_mask.any():
+        return series
+    return series.where(~null_mask, None)
+
+
+def normalize_chunk(chunk: pd.DataFrame, plan: Tuple[Tuple[str, str], ...]) -> pd.DataFrame:
+    """
+    Normalize a chunk read from the source database for loading into PostgreSQL.
+
+    Every conversion works on whole columns with pandas/NumPy masks:
+    - uuid: values to str, NULLs stay None
+    - bool: BIT values (bool, int or bytes) to nullable boolean, NULLs preserved
+    - datetime: parsed to datetime64, invalid values become NaT (loaded as NULL)
+    - time: kept as Python objects, NaN/NaT to None
+    - nulls: NaN/NaT to None for object columns
+
+    Args:
+        chunk: DataFrame chunk as returned by pd.read_sql
+        plan: Plan from compile_normalization_plan()
+
+    Returns:
+        Normalized DataFrame chunk
+    """
+    for col_name, kind in plan:
+        if col_name not in chunk.columns:
+            continue
+
+        series = chunk[col_name]
+        try:
+            if kind == NORMALIZE_UUID:
+                chunk[col_name] = _to_nullable_str(series)
+            elif kind == NORMALIZE_BOOL:
+                chunk[col_name] = _to_nullable_bool(series)
+            elif kind == NORMALIZE_DATETIME:
+                if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+                    chunk[col_name] = pd.to_datetime(series, errors='coerce', utc=False)
+            elif kind == NORMALIZE_TIME:
+                chunk[col_name] = series.astype(object).where(series.notna(), None)
+            else:
+                chunk[col_name] = _nulls_to_none(series)
+        except Exception as e:
+            # Fallback: ensure None for null-like values
+            logger.warning(f"Could not normalize column {col_name} as {kind}: {e}")
+            chunk[col_name] = series.astype(object).where(series.notna(), None)
+
+    return chunk
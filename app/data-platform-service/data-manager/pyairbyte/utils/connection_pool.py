@@ -0,0 +1,370 @@
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Idle connections kept by each shared pool (see get_shared_pool)
+DEFAULT_SHARED_POOL_SIZE = 4
+
+# Idle connections older than this are closed instead of reused, before the server or a
+# firewall drops them
+DEFAULT_MAX_IDLE_SECONDS = 300
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of DB-API connections.
+
+    Connections are created lazily with the given factory, up to max_size. Callers
+    beyond that block until a connection is returned, or (block=False) get an extra
+    connection that is closed when it comes back to a full pool. Works for any driver
+    whose connections have close() (pyodbc, psycopg2, ...).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int,
+        name: str = 'pool',
+        reset: Optional[Callable[[Any], None]] = None,
+        block: bool = True,
+        validate: Optional[Callable[[Any], bool]] = None,
+        max_idle_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable creating a new connection
+            max_size: Maximum number of open connections (idle connections kept when
+                      block is False)
+            name: Name used in log messages and metrics
+            reset: Optional callable run on a connection before it is returned to the
+                   pool (e.g. rollback for psycopg2 connections)
+            block: Wait for a free connection when max_size are checked out; False opens
+                   an extra one instead
+            validate: Optional check of an idle connection before it is handed out;
+                      connections failing it are closed and replaced
+            max_idle_seconds: Close idle connections older than this instead of reusing them
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.factory = factory
+        self.max_size = max_size
+        self.name = name
+        self.reset = reset
+        self.block = block
+        self.validate = validate
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: 'queue.LifoQueue[Tuple[Any, float]]' = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._open = 0
+        self._closed = False
+        self._checkouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a connection, creating one if the pool is not full.
+
+        Args:
+            timeout: Seconds to wait for a free connection (None waits forever)
+
+        Returns:
+            A connection
+
+        Raises:
+            RuntimeError: If the pool is closed
+            queue.Empty: If no connection became free within timeout
+        """
+        if self._closed:
+            raise RuntimeError(f"Connection pool '{self.name}' is closed")
+
+        started_at = time.perf_counter()
+        conn = self._checkout(timeout)
+        waited = time.perf_counter() - started_at
+        with self._lock:
+            self._checkouts += 1
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        return conn
+
+    def _checkout(self, timeout: Optional[float]) -> Any:
+        while True:
+            try:
+                conn, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._usable(conn, released_at):
+                return conn
+
+        with self._lock:
+            can_create = self._open < self.max_size or not self.block
+            if can_create:
+                self._open += 1
+
+        if can_create:
+            try:
+                conn = self.factory()
+            except Exception:
+                with self._lock:
+                    self._open -= 1
+                raise
+            with self._lock:
+                self._created += 1
+            return conn
+
+        conn, released_at = self._idle.get(timeout=timeout)
+        if self._usable(conn, released_at):
+            return conn
+        # The stale connection's slot is free again
+        return self._checkout(timeout)
+
+    def _usable(self, conn: Any, released_at: float) -> bool:
+        """Check an idle connection; stale or broken ones are closed."""
+        stale = self.max_idle_seconds is not None and time.monotonic() - released_at > self.max_idle_seconds
+        try:
+            usable = not stale and (self.validate is None or self.validate(conn))
+        except Exception:
+            usable = False
+        if not usable:
+            self._close_quietly(conn)
+            with self._lock:
+                self._open -= 1
+                self._discarded += 1
+        return usable
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            conn: Connection from acquire()
+            discard: Close the connection instead of reusing it (e.g. after an error)
+        """
+        if not discard and not self._closed and self.reset is not None:
+            try:
+                self.reset(conn)
+            except Exception as e:
+                logger.warning(f"Discarding connection from pool '{self.name}' that failed to reset: {e}")
+                discard = True
+
+        if discard or self._closed or (not self.block and self._idle.qsize() >= self.max_size):
+            self._close_quietly(conn)
+            with self._lock:
+                self._open -= 1
+                if discard:
+                    self._discarded += 1
+            return
+
+        self._idle.put((conn, time.monotonic()))
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Context manager that checks out a connection and returns it afterwards."""
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            self.release(conn, discard=True)
+            raise
+        else:
+            self.release(conn)
+
+    def checkout(self, timeout: Optional[float] = None) -> 'PooledConnection':
+        """Check out a connection wrapped so that its close() returns it to the pool."""
+        return PooledConnection(self, self.acquire(timeout))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Pool metrics.
+
+        Returns:
+            Dictionary with:
+            {
+                "checkouts": int,         # connections handed out
+                "created": int,           # connections opened by the factory
+                "reused": int,            # checkouts served by an idle connection
+                "discarded": int,         # connections closed after an error or as stale
+                "open": int,              # connections currently open (idle + in use)
+                "idle": int,
+                "wait_seconds": float,    # total time callers spent in acquire()
+                "max_wait_seconds": float
+            }
+        """
+        with self._lock:
+            idle = self._idle.qsize()
+            return {
+                'checkouts': self._checkouts,
+                'created': self._created,
+                'reused': self._checkouts - self._created,
+                'discarded': self._discarded,
+                'open': self._open,
+                'idle': idle,
+                'wait_seconds': round(self._wait_seconds, 3),
+                'max_wait_seconds': round(self._max_wait_seconds, 3)
+            }
+
+    def close_all(self) -> None:
+        """Close idle connections and mark the pool closed; checked-out connections close on release."""
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close_quietly(conn)
+            with self._lock:
+                self._open -= 1
+
+    def _close_quietly(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing connection from pool '{self.name}': {e}")
+
+
+class PooledConnection:
+    """
+    A checked-out connection whose close() returns it to its pool.
+
+    Everything else is passed through to the driver's connection, so code written for a
+    plain connection (conn.cursor(), conn.commit(), conn.autocommit = True, conn.close())
+    works unchanged. A connection dropped without close() is discarded by the garbage
+    collector, so its pool slot is not lost.
+    """
+
+    def __init__(self, pool: ConnectionPool, conn: Any):
+        object.__setattr__(self, '_pool', pool)
+        object.__setattr__(self, '_conn', conn)
+
+    @property
+    def raw_connection(self) -> Any:
+        """The driver's connection (None after close())."""
+        return self._conn
+
+    def close(self) -> None:
+        conn = self._conn
+        if conn is not None:
+            object.__setattr__(self, '_conn', None)
+            self._pool.release(conn)
+
+    def __getattr__(self, name: str) -> Any:
+        conn = object.__getattribute__(self, '_conn')
+        if conn is None:
+            raise AttributeError(f"Connection from pool '{self._pool.name}' is closed")
+        return getattr(conn, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        conn = self._conn
+        if conn is None:
+            raise AttributeError(f"Connection from pool '{self._pool.name}' is closed")
+        setattr(conn, name, value)
+
+    def __enter__(self) -> 'PooledConnection':
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> Any:
+        return self._conn.__exit__(exc_type, exc_value, traceback)
+
+    def __del__(self) -> None:
+        conn = self.__dict__.get('_conn')
+        if conn is not None:
+            self._pool.release(conn, discard=True)
+
+
+def reset_connection(conn: Any) -> None:
+    """Roll back and restore manual commit on a DB-API connection returned to a pool."""
+    conn.rollback()
+    if getattr(conn, 'autocommit', False):
+        conn.autocommit = False
+
+
+_shared_pools: Dict[Hashable, ConnectionPool] = {}
+_shared_pools_lock = threading.Lock()
+_shared_pools_pid = os.getpid()
+
+
+def get_shared_pool(
+    key: Hashable,
+    factory: Callable[[], Any],
+    name: str,
+    max_size: int = DEFAULT_SHARED_POOL_SIZE,
+    reset: Optional[Callable[[Any], None]] = reset_connection,
+    validate: Optional[Callable[[Any], bool]] = None,
+    max_idle_seconds: Optional[float] = DEFAULT_MAX_IDLE_SECONDS
+) -> ConnectionPool:
+    """
+    Get the process-wide pool for a connection configuration, creating it on first use.
+
+    Shared pools never block: they keep up to max_size idle connections for reuse and
+    open extra ones when more are checked out at once, so helpers that nest checkouts
+    (a sync's worker pools drawing from a shared pool) cannot deadlock. A forked child
+    process (e.g. a Dagster step) starts with empty pools instead of sharing its parent's
+    sockets.
+
+    Args:
+        key: Connection configuration (driver, host, database, user, ...); the pool is
+             created by the first caller for a key and reused by all later ones
+        factory: Callable opening a new connection for this configuration
+        name: Pool name for logs and metrics (should not contain secrets)
+        max_size: Idle connections kept
+        reset: Run on a connection before it goes back to the pool (default: rollback
+               and autocommit off)
+        validate: Optional check of an idle connection before reuse
+        max_idle_seconds: Close idle connections older than this instead of reusing them
+
+    Returns:
+        The shared ConnectionPool
+    """
+    global _shared_pools_pid
+    with _shared_pools_lock:
+        if _shared_pools_pid != os.getpid():
+            # Connections inherited from the parent process must not be used (or closed) here
+            _shared_pools.clear()
+            _shared_pools_pid = os.getpid()
+        pool = _shared_pools.get(key)
+        if pool is None or pool.closed:
+            pool = ConnectionPool(
+                factory, max_size, name=name, reset=reset, block=False,
+                validate=validate, max_idle_seconds=max_idle_seconds
+            )
+            _shared_pools[key] = pool
+            logger.info(f"Created shared connection pool '{name}'")
+        return pool
+
+
+def shared_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics of every shared pool of this process, keyed by pool name (see ConnectionPool.stats)."""
+    with _shared_pools_lock:
+        pools = list(_shared_pools.values()) if _shared_pools_pid == os.getpid() else []
+    return {pool.name: pool.stats() for pool in pools}
+
+
+def close_shared_pools() -> None:
+    """Close the idle connections of all shared pools and forget the pools."""
+    with _shared_pools_lock:
+        pools = list(_shared_pools.values()) if _shared_pools_pid == os.getpid() else []
+        _shared_pools.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+atexit.register(close_shared_pools)
@@ -2,9 +2,10 @@ import os
 import tempfile
 import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_values
 import duckdb
 
+from .pg_bulk_loader import copy_dataframe_to_postgres
+
 class PyAirbyteDBBridge:
     """Bridge utility to copy data from DuckDB cache to PostgreSQL for DBT processing."""
     
@@ -90,21 +91,11 @@ class PyAirbyteDBBridge:
                 """
                 cursor.execute(create_table_sql)
             
-            # Insert data
-            if not df.empty:
-                # Convert DataFrame to list of tuples
-                data = [tuple(row) for row in df.values]
-                columns = list(df.columns)
-                
-                # Use execute_values for efficient bulk insert
-                execute_values(
-                    cursor,
-                    f"INSERT INTO {schema_name}.{table_name} ({','.join(columns)}) VALUES %s",
-                    data
-                )
-            
-            pg_conn.commit()
             cursor.close()
+            
+            # Bulk load with COPY; commits together with the truncate/create above
+            copy_dataframe_to_postgres(pg_conn, schema_name, table_name, df)
+            
             pg_conn.close()
             duck_conn.close()
             
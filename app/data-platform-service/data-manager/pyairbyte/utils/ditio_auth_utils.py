@@ -6,6 +6,8 @@ from typing import Dict
 import requests
 from dagster import AssetExecutionContext
 
+from .http_session import get_http_session
+
 
 def _get_ditio_auth_token(
     context: AssetExecutionContext,
@@ -60,7 +62,7 @@ def _get_ditio_auth_token(
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
         context.log.debug(f"Requesting token from: {ditio_auth_token_url}")
-        response = requests.post(
+        response = get_http_session().post(
             ditio_auth_token_url,
             data=payload,
             headers=headers,
@@ -2,15 +2,32 @@ import json
 import hashlib
 import logging
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 
 from .graphql_util import query_graphql_api
+from .hash_filter import (
+    KnownHashFilter, DEFAULT_FILTER_CAPACITY, DEFAULT_FALSE_POSITIVE_RATE, DEFAULT_KNOWN_CAPACITY
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _event_hash_on_conflict() -> Dict[str, Any]:
+    """
+    Hasura on_conflict clause that skips events whose event_hash is already in event_store.
+    
+    The unique constraint on event_store.event_hash is named by EVENT_STORE_HASH_CONSTRAINT
+    (default: event_store_event_hash_key, PostgreSQL's name for UNIQUE (event_hash)).
+    With no update_columns, conflicting rows are left unchanged and not returned.
+    """
+    return {
+        "constraint": os.getenv('EVENT_STORE_HASH_CONSTRAINT', 'event_store_event_hash_key'),
+        "update_columns": []
+    }
+
+
 def _create_event_hash(event_type: str, event_data: Dict[str, Any]) -> str:
     """
     Creates a hash from event_type and event_data to detect duplicates.
@@ -33,70 +50,6 @@ def _create_event_hash(event_type: str, event_data: Dict[str, Any]) -> str:
     return hash_object.hexdigest()
 
 
-def _check_hash_exists(event_hash: str, hasura_url: Optional[str] = None, admin_secret: Optional[str] = None) -> bool:
-    """
-    Checks if an event with the given hash already exists in either:
-    - event_store (pending events)
-    - completed_integration_events (successfully processed events)
-    
-    This ensures we don't re-process events that have already been completed.
-    
-    Args:
-        event_hash: The hash to check
-        hasura_url: Optional Hasura URL (uses graphql_util defaults if not provided)
-        admin_secret: Optional admin secret (uses graphql_util defaults if not provided)
-    
-    Returns:
-        True if hash exists in either table, False otherwise
-    """
-    variables = {
-        "eventHash": event_hash
-    }
-    
-    # Query 1: Check event_store
-    query_store = """
-    query CheckEventHashInStore($eventHash: String!) {
-      event_store(where: {event_hash: {_eq: $eventHash}}, limit: 1) {
-        id
-        event_hash
-      }
-    }
-    """
-    
-    # Query 2: Check completed_integration_events
-    query_completed = """
-    query CheckEventHashInCompleted($eventHash: String!) {
-      completed_integration_events(where: {event_hash: {_eq: $eventHash}}, limit: 1) {
-        id
-        event_hash
-      }
-    }
-    """
-    
-    try:
-        # Check event_store first
-        result_store = query_graphql_api(query_store, variables=variables, hasura_url=hasura_url, admin_secret=admin_secret)
-        events_store = result_store.get('data', {}).get('event_store', [])
-        
-        if len(events_store) > 0:
-            logger.debug(f"Duplicate event hash {event_hash} found in event_store")
-            return True
-        
-        # Check completed_integration_events
-        result_completed = query_graphql_api(query_completed, variables=variables, hasura_url=hasura_url, admin_secret=admin_secret)
-        events_completed = result_completed.get('data', {}).get('completed_integration_events', [])
-        
-        if len(events_completed) > 0:
-            logger.debug(f"Duplicate event hash {event_hash} found in completed_integration_events (already processed)")
-            return True
-        
-        return False
-        
-    except Exception as e:
-        logger.error(f"Error checking event hash existence: {str(e)}")
-        raise
-
-
 def write_event(
     event_type: str,
     event_data: Dict[str, Any],
@@ -109,8 +62,9 @@ def write_event(
     This function:
     1. Validates that event_data is valid JSON (by converting to JSON string)
     2. Creates an event_hash from event_type and event_data
-    3. Checks if the hash already exists in either event_store or completed_integration_events (duplicate detection)
-    4. If not a duplicate, inserts the event into event_store
+    3. Checks if the hash already exists in completed_integration_events (already processed)
+    4. Inserts the event into event_store unless its hash is already there (on_conflict on the
+       unique event_hash constraint, so concurrent writers cannot insert the same event twice)
     
     Args:
         event_type: The type of event (e.g., "UNIT4_DITIO_EVENT")
@@ -146,30 +100,29 @@ def write_event(
     event_hash = _create_event_hash(event_type, event_data)
     logger.info(f"Created event hash: {event_hash} for event_type: {event_type}")
     
-    # Check if hash already exists (duplicate detection)
+    # Check if the event was already processed (duplicates in event_store are skipped by the insert)
     try:
-        hash_exists = _check_hash_exists(event_hash, hasura_url=hasura_url, admin_secret=admin_secret)
-        if hash_exists:
-            logger.warning(f"Duplicate event detected - hash {event_hash} already exists")
+        if _check_hashes_completed([event_hash], hasura_url=hasura_url, admin_secret=admin_secret):
+            logger.warning(f"Duplicate event detected - hash {event_hash} already processed")
             return {
                 "status": "duplicate",
                 "event_id": None,
                 "event_hash": event_hash,
-                "message": "Event with this hash already exists in event_store or completed_integration_events",
+                "message": "Event with this hash already exists in completed_integration_events",
                 "data": None
             }
     except Exception as e:
         logger.error(f"Error checking for duplicate event: {str(e)}")
         raise
     
-    # Insert event using GraphQL mutation
+    # Insert event using GraphQL mutation, skipping it if the hash is already in event_store
     mutation = """
-    mutation InsertEvent($eventType: String!, $eventData: jsonb!, $eventHash: String!) {
+    mutation InsertEvent($eventType: String!, $eventData: jsonb!, $eventHash: String!, $onConflict: event_store_on_conflict) {
       insert_event_store_one(object: {
         event_type: $eventType
         event_data: $eventData
         event_hash: $eventHash
-      }) {
+      }, on_conflict: $onConflict) {
         id
         event_type
         event_created_at
@@ -182,7 +135,8 @@ def write_event(
     variables = {
         "eventType": event_type,
         "eventData": event_data,  # GraphQL will handle JSONB conversion
-        "eventHash": event_hash
+        "eventHash": event_hash,
+        "onConflict": _event_hash_on_conflict()
     }
     
     try:
@@ -202,13 +156,13 @@ def write_event(
                 "data": inserted_event
             }
         else:
-            error_msg = "Event insertion returned no data"
-            logger.error(error_msg)
+            # on_conflict skipped the row: the hash is already in event_store
+            logger.warning(f"Duplicate event detected - hash {event_hash} already exists in event_store")
             return {
-                "status": "error",
+                "status": "duplicate",
                 "event_id": None,
                 "event_hash": event_hash,
-                "message": error_msg,
+                "message": "Event with this hash already exists in event_store",
                 "data": None
             }
             
@@ -217,7 +171,8 @@ def write_event(
         error_msg = str(e)
         logger.error(f"GraphQL error inserting event: {error_msg}")
         
-        # Check if it's a duplicate constraint violation
+        # Check if it's a duplicate constraint violation (e.g. a constraint other than the
+        # one named in on_conflict)
         if "duplicate" in error_msg.lower() or "unique" in error_msg.lower():
             return {
                 "status": "duplicate",
@@ -246,22 +201,176 @@ def write_event(
         }
 
 
-def get_unprocessed_or_failed_events(
+# Unprocessed events (no processing log) or events whose processing failed, after a cursor id
+UNPROCESSED_OR_FAILED_EVENTS_PAGE_QUERY = """
+query GetUnprocessedOrFailedEventsPage($eventType: String!, $afterId: Int!, $limit: Int!) {
+  event_store(
+    where: {
+      _and: [
+        {
+          event_type: {
+            _eq: $eventType
+          }
+        },
+        {
+          id: {
+            _gt: $afterId
+          }
+        },
+        {
+          _or: [
+            {
+              event_processed_logs_aggregate: {
+                count: {
+                  predicate: {
+                    _eq: 0
+                  }
+                }
+              }
+            },
+            {
+              event_processed_logs: {
+                processed_status: {
+                  _eq: "FAILED"
+                }
+              }
+            }
+          ]
+        }
+      ]
+    }
+    order_by: {
+      id: asc
+    }
+    limit: $limit
+  ) {
+    id
+    event_type
+    event_created_at
+    event_data
+    event_hash
+    event_processed_logs(
+      order_by: {
+        processed_at: desc
+      }
+      limit: 1
+    ) {
+      id
+      processed_at
+      processed_status
+      processed_result
+      processed_result_error
+    }
+  }
+}
+"""
+
+
+def _event_read_page_size(page_size: Optional[int]) -> int:
+    """
+    Resolves the page size for reading events (EVENT_READ_PAGE_SIZE env var, default 500).
+    
+    Raises:
+        ValueError: If page_size is not a positive integer
+    """
+    if page_size is None:
+        page_size = int(os.getenv('EVENT_READ_PAGE_SIZE', '500'))
+    if not isinstance(page_size, int) or page_size <= 0:
+        raise ValueError(f"Invalid page_size: must be a positive integer, got {page_size}")
+    return page_size
+
+
+def _iter_unprocessed_or_failed_event_pages(
+    event_type: str,
+    page_size: int,
+    hasura_url: Optional[str] = None,
+    admin_secret: Optional[str] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yields pages of unprocessed or failed events in id order (keyset pagination).
+    
+    Each page asks for events with an id above the last one seen, so pages stay cheap deep
+    into a backlog and events logged as processed while the caller works through earlier
+    pages neither shift nor skip later ones.
+    
+    Raises:
+        ValueError: If a GraphQL query fails
+    """
+    after_id = 0
+    while True:
+        variables = {
+            "eventType": event_type,
+            "afterId": after_id,
+            "limit": page_size
+        }
+        result = query_graphql_api(
+            UNPROCESSED_OR_FAILED_EVENTS_PAGE_QUERY, variables=variables,
+            hasura_url=hasura_url, admin_secret=admin_secret
+        )
+        events = (result.get('data') or {}).get('event_store') or []
+        if events:
+            yield events
+        if len(events) < page_size:
+            return
+        after_id = events[-1]['id']
+
+
+def iter_unprocessed_or_failed_events(
     event_type: str,
+    page_size: Optional[int] = None,
     hasura_url: Optional[str] = None,
     admin_secret: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streams events from event_store that are either not processed yet or previously failed.
+    
+    Events are fetched page by page in id order, so processing can start with the first page
+    while the backlog is still being read, and no single Hasura request has to return the
+    whole backlog. Each event has the same fields as in get_unprocessed_or_failed_events.
+    
+    Args:
+        event_type: The type of event to filter by (e.g., "UNIT4_DITIO_EVENT")
+        page_size: Events per request. If not provided, uses EVENT_READ_PAGE_SIZE env var (default: 500)
+        hasura_url: Optional Hasura GraphQL endpoint URL. If not provided, uses HASURA_URL env var or default
+        admin_secret: Optional Hasura admin secret. If not provided, uses HASURA_GRAPHQL_ADMIN_SECRET env var or default
+    
+    Yields:
+        Event dictionaries (with their latest processing log, if any)
+    
+    Raises:
+        ValueError: If page_size is invalid or a GraphQL query fails
+    
+    Examples:
+        for event in iter_unprocessed_or_failed_events("UNIT4_DITIO_EVENT"):
+            call_api_for_event_processing(event_id=event['id'], method="POST", url=url, body=event['event_data'])
+    """
+    page_size = _event_read_page_size(page_size)
+    
+    logger.info(f"Streaming unprocessed or failed events for event_type: {event_type} (page size {page_size})")
+    for page in _iter_unprocessed_or_failed_event_pages(event_type, page_size, hasura_url, admin_secret):
+        yield from page
+
+
+def get_unprocessed_or_failed_events(
+    event_type: str,
+    hasura_url: Optional[str] = None,
+    admin_secret: Optional[str] = None,
+    page_size: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Retrieves all events from event_store that are either:
     1. Not processed yet (no record in event_processed_logs)
     2. Previously failed (has a record in event_processed_logs with processed_status = 'FAILED')
     
-    Filtered by the specified event_type.
+    Filtered by the specified event_type. Events are read in pages (see
+    iter_unprocessed_or_failed_events, which streams them without collecting the whole
+    backlog in memory) and returned in id order.
     
     Args:
         event_type: The type of event to filter by (e.g., "UNIT4_DITIO_EVENT")
         hasura_url: Optional Hasura GraphQL endpoint URL. If not provided, uses HASURA_URL env var or default
         admin_secret: Optional Hasura admin secret. If not provided, uses HASURA_GRAPHQL_ADMIN_SECRET env var or default
+        page_size: Events per request. If not provided, uses EVENT_READ_PAGE_SIZE env var (default: 500)
     
     Returns:
         Dictionary containing the result:
@@ -270,79 +379,17 @@ def get_unprocessed_or_failed_events(
             "events": list,  # List of event objects
             "count": int,     # Number of events found
             "message": str,
-            "data": dict | None  # Full GraphQL response data
-        }
-    
-    Raises:
-        ValueError: If GraphQL query fails
-    """
-    query = """
-    query GetUnprocessedOrFailedEventsWithType($eventType: String!) {
-      event_store(
-        where: {
-          _and: [
-            {
-              event_type: {
-                _eq: $eventType
-              }
-            },
-            {
-              _or: [
-                {
-                  event_processed_logs_aggregate: {
-                    count: {
-                      predicate: {
-                        _eq: 0
-                      }
-                    }
-                  }
-                },
-                {
-                  event_processed_logs: {
-                    processed_status: {
-                      _eq: "FAILED"
-                    }
-                  }
-                }
-              ]
-            }
-          ]
-        }
-        order_by: {
-          event_created_at: asc
+            "data": {"pages": int, "page_size": int} | None  # Paging details (events are only in "events")
         }
-      ) {
-        id
-        event_type
-        event_created_at
-        event_data
-        event_hash
-        event_processed_logs(
-          order_by: {
-            processed_at: desc
-          }
-          limit: 1
-        ) {
-          id
-          processed_at
-          processed_status
-          processed_result
-          processed_result_error
-        }
-      }
-    }
     """
-    
-    variables = {
-        "eventType": event_type
-    }
-    
     try:
+        page_size = _event_read_page_size(page_size)
         logger.info(f"Retrieving unprocessed or failed events for event_type: {event_type}")
-        result = query_graphql_api(query, variables=variables, hasura_url=hasura_url, admin_secret=admin_secret)
-        
-        # Extract events from the response
-        events = result.get('data', {}).get('event_store', [])
+        events = []
+        pages = 0
+        for page in _iter_unprocessed_or_failed_event_pages(event_type, page_size, hasura_url, admin_secret):
+            events.extend(page)
+            pages += 1
         event_count = len(events)
         
         logger.info(f"Found {event_count} unprocessed or failed events for event_type: {event_type}")
@@ -352,13 +399,16 @@ def get_unprocessed_or_failed_events(
             "events": events,
             "count": event_count,
             "message": f"Retrieved {event_count} unprocessed or failed events",
-            "data": result
+            "data": {
+                "pages": pages,
+                "page_size": page_size
+            }
         }
         
     except ValueError as e:
-        # GraphQL errors
+        # Invalid page_size or GraphQL errors
         error_msg = str(e)
-        logger.error(f"GraphQL error retrieving events: {error_msg}")
+        logger.error(f"Error retrieving events: {error_msg}")
         return {
             "status": "error",
             "events": [],
@@ -708,17 +758,16 @@ def log_event_processing(
         }
 
 
-def _check_hashes_exist(
+def _check_hashes_completed(
     event_hashes: List[str],
     hasura_url: Optional[str] = None,
     admin_secret: Optional[str] = None
 ) -> set:
     """
-    Checks which event hashes already exist in either:
-    - event_store (pending events)
-    - completed_integration_events (successfully processed events)
+    Checks which event hashes already exist in completed_integration_events
+    (successfully processed events).
     
-    This ensures we don't re-process events that have already been completed.
+    Duplicates within event_store need no lookup: inserts skip them through on_conflict.
     
     Args:
         event_hashes: List of hashes to check
@@ -726,27 +775,13 @@ def _check_hashes_exist(
         admin_secret: Optional admin secret (uses graphql_util defaults if not provided)
     
     Returns:
-        Set of hashes that exist in either table
+        Set of hashes found in completed_integration_events
     """
     if not event_hashes:
         return set()
     
-    variables = {
-        "hashes": event_hashes
-    }
-    
-    # Query 1: Check event_store (bulk)
-    query_store = """
-    query CheckEventHashesInStore($hashes: [String!]!) {
-      event_store(where: {event_hash: {_in: $hashes}}) {
-        event_hash
-      }
-    }
-    """
-    
-    # Query 2: Check completed_integration_events (bulk)
-    query_completed = """
-    query CheckEventHashesInCompleted($hashes: [String!]!) {
+    query = """
+    query CheckEventHashesCompleted($hashes: [String!]!) {
       completed_integration_events(where: {event_hash: {_in: $hashes}}) {
         event_hash
       }
@@ -754,38 +789,88 @@ def _check_hashes_exist(
     """
     
     try:
-        # Check event_store
-        result_store = query_graphql_api(query_store, variables=variables, hasura_url=hasura_url, admin_secret=admin_secret)
-        existing_store = result_store.get('data', {}).get('event_store', [])
-        hashes_in_store = {item['event_hash'] for item in existing_store}
-        
-        # Check completed_integration_events
-        result_completed = query_graphql_api(query_completed, variables=variables, hasura_url=hasura_url, admin_secret=admin_secret)
-        existing_completed = result_completed.get('data', {}).get('completed_integration_events', [])
-        hashes_in_completed = {item['event_hash'] for item in existing_completed}
-        
-        # Combine results from both tables
-        all_existing_hashes = hashes_in_store | hashes_in_completed
-        
+        result = query_graphql_api(query, variables={"hashes": event_hashes}, hasura_url=hasura_url, admin_secret=admin_secret)
+        existing = (result.get('data') or {}).get('completed_integration_events') or []
+        hashes_in_completed = {item['event_hash'] for item in existing}
         if hashes_in_completed:
-            logger.debug(
-                f"Found {len(hashes_in_completed)} duplicate hash(es) in completed_integration_events "
-                f"(already processed), {len(hashes_in_store)} in event_store"
-            )
-        elif hashes_in_store:
-            logger.debug(f"Found {len(hashes_in_store)} duplicate hash(es) in event_store")
-        
-        return all_existing_hashes
-        
+            logger.debug(f"Found {len(hashes_in_completed)} hash(es) in completed_integration_events (already processed)")
+        return hashes_in_completed
     except Exception as e:
-        logger.error(f"Error checking event hashes existence: {str(e)}")
+        logger.error(f"Error checking completed event hashes: {str(e)}")
         raise
 
 
+def load_known_event_hashes(
+    hash_filter: Optional[KnownHashFilter] = None,
+    page_size: Optional[int] = None,
+    hasura_url: Optional[str] = None,
+    admin_secret: Optional[str] = None
+) -> KnownHashFilter:
+    """
+    Warm-loads a KnownHashFilter with the hashes in event_store and completed_integration_events.
+    
+    Each table is scanned in id order with keyset pagination (id > last id seen), so every
+    page is a cheap index range read regardless of how far the scan has got. Meant to run
+    once per run; pass the filter to each bulk_write_events call of the run.
+    
+    Args:
+        hash_filter: Filter to load into (a new one sized by EVENT_HASH_FILTER_CAPACITY,
+                     default 1,000,000 hashes at a 1% false-positive rate, remembering the
+                     last EVENT_KNOWN_HASH_CAPACITY hashes scanned exactly, default 100,000,
+                     if not provided)
+        page_size: Hashes per request. If not provided, uses EVENT_HASH_SCAN_PAGE_SIZE env var (default: 10000)
+        hasura_url: Optional Hasura URL (uses graphql_util defaults if not provided)
+        admin_secret: Optional admin secret (uses graphql_util defaults if not provided)
+    
+    Returns:
+        The loaded filter
+    
+    Raises:
+        ValueError: If page_size is not a positive integer
+    """
+    if page_size is None:
+        page_size = int(os.getenv('EVENT_HASH_SCAN_PAGE_SIZE', '10000'))
+    if not isinstance(page_size, int) or page_size <= 0:
+        raise ValueError(f"Invalid page_size: must be a positive integer, got {page_size}")
+    if hash_filter is None:
+        hash_filter = KnownHashFilter(
+            capacity=int(os.getenv('EVENT_HASH_FILTER_CAPACITY', str(DEFAULT_FILTER_CAPACITY))),
+            false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE,
+            known_capacity=int(os.getenv('EVENT_KNOWN_HASH_CAPACITY', str(DEFAULT_KNOWN_CAPACITY)))
+        )
+    
+    for table in ('event_store', 'completed_integration_events'):
+        query = f"""
+        query ScanEventHashes($afterId: Int!, $limit: Int!) {{
+          {table}(where: {{id: {{_gt: $afterId}}}}, order_by: {{id: asc}}, limit: $limit) {{
+            id
+            event_hash
+          }}
+        }}
+        """
+        after_id = 0
+        loaded = 0
+        while True:
+            result = query_graphql_api(
+                query, variables={"afterId": after_id, "limit": page_size},
+                hasura_url=hasura_url, admin_secret=admin_secret
+            )
+            rows = (result.get('data') or {}).get(table) or []
+            hash_filter.update(row['event_hash'] for row in rows if row.get('event_hash'))
+            loaded += len(rows)
+            if len(rows) < page_size:
+                break
+            after_id = rows[-1]['id']
+        logger.info(f"Loaded {loaded} event hashes from {table} into the known hash filter")
+    
+    return hash_filter
+
+
 def _process_batch(
     events: List[Dict[str, Any]],
     hasura_url: Optional[str] = None,
-    admin_secret: Optional[str] = None
+    admin_secret: Optional[str] = None,
+    hash_filter: Optional[KnownHashFilter] = None
 ) -> Dict[str, Any]:
     """
     Processes a single batch of events (internal helper for bulk_write_events).
@@ -794,6 +879,8 @@ def _process_batch(
         events: List of validated event dictionaries with event_type and event_data
         hasura_url: Optional Hasura URL
         admin_secret: Optional admin secret
+        hash_filter: Optional filter of known hashes; hashes it does not contain skip the
+                     completed_integration_events check (see bulk_write_events)
     
     Returns:
         Dictionary with batch processing results
@@ -847,16 +934,40 @@ def _process_batch(
             "errors": [{"index": i, "error": "Failed to process event"} for i in range(len(events))]
         }
     
-    # Step 2: Bulk check for duplicates
-    all_hashes = [e['event_hash'] for e in events_with_hashes]
-    existing_hashes = _check_hashes_exist(all_hashes, hasura_url=hasura_url, admin_secret=admin_secret)
-    
-    # Step 3: Filter out duplicates
-    events_to_insert = [e for e in events_with_hashes if e['event_hash'] not in existing_hashes]
-    duplicate_hashes = list(existing_hashes)
+    # Step 2: Bulk check for already processed events (duplicates within event_store are
+    # skipped by the insert's on_conflict)
+    all_hashes = list(dict.fromkeys(e['event_hash'] for e in events_with_hashes))
+    # Hashes the filter has never seen are definitely new and need no lookup; hashes it
+    # remembers exactly are already stored and need neither the lookup nor the insert
+    known_hashes = set()
+    maybe_known = []
+    for h in all_hashes:
+        found = hash_filter.lookup(h) if hash_filter is not None else None
+        if found:
+            known_hashes.add(h)
+        elif found is None:
+            maybe_known.append(h)
+    completed_hashes = set()
+    if maybe_known:
+        completed_hashes = _check_hashes_completed(maybe_known, hasura_url=hasura_url, admin_secret=admin_secret)
+    stored_hashes = known_hashes | completed_hashes
+    
+    # Step 3: Filter out processed events and repeats within the batch
+    events_to_insert = []
+    duplicate_hashes = list(h for h in all_hashes if h in stored_hashes)
+    seen_hashes = set(stored_hashes)
+    for e in events_with_hashes:
+        if e['event_hash'] in seen_hashes:
+            if e['event_hash'] not in duplicate_hashes:
+                duplicate_hashes.append(e['event_hash'])
+            continue
+        seen_hashes.add(e['event_hash'])
+        events_to_insert.append(e)
     
     if not events_to_insert:
         # All events are duplicates
+        if hash_filter is not None:
+            hash_filter.update(completed_hashes)
         return {
             "status": "success",
             "events_created": 0,
@@ -867,10 +978,11 @@ def _process_batch(
             "errors": []
         }
     
-    # Step 4: Bulk insert non-duplicate events
+    # Step 4: Bulk insert the remaining events; rows whose hash is already in event_store
+    # are skipped by the unique constraint and not returned
     mutation = """
-    mutation BulkInsertEvents($objects: [event_store_insert_input!]!) {
-      insert_event_store(objects: $objects) {
+    mutation BulkInsertEvents($objects: [event_store_insert_input!]!, $onConflict: event_store_on_conflict) {
+      insert_event_store(objects: $objects, on_conflict: $onConflict) {
         affected_rows
         returning {
           id
@@ -893,7 +1005,8 @@ def _process_batch(
     ]
     
     variables = {
-        "objects": objects
+        "objects": objects,
+        "onConflict": _event_hash_on_conflict()
     }
     
     try:
@@ -905,13 +1018,23 @@ def _process_batch(
         returning = insert_result.get('returning', [])
         
         created_event_ids = [item['id'] for item in returning]
+        inserted_hashes = {item.get('event_hash') for item in returning}
+        duplicate_hashes.extend(e['event_hash'] for e in events_to_insert if e['event_hash'] not in inserted_hashes)
+        if hash_filter is not None:
+            # Inserted hashes the filter reported as maybe known were false positives
+            hash_filter.record_false_positives(len(inserted_hashes.intersection(maybe_known)))
+            # Every hash of the batch is stored now: inserted, already in event_store or completed
+            hash_filter.update(all_hashes)
         
-        logger.info(f"Successfully inserted {affected_rows} events")
+        logger.info(
+            f"Successfully inserted {affected_rows} events "
+            f"({len(events_to_insert) - affected_rows} already in event_store)"
+        )
         
         return {
             "status": "success",
             "events_created": affected_rows,
-            "events_duplicate": len(duplicate_hashes),
+            "events_duplicate": len(events_with_hashes) - affected_rows,
             "events_failed": 0,
             "created_event_ids": created_event_ids,
             "duplicate_hashes": duplicate_hashes,
@@ -925,8 +1048,8 @@ def _process_batch(
         
         # Check if it's a duplicate constraint violation
         if "duplicate" in error_msg.lower() or "unique" in error_msg.lower():
-            # If we get here, it means some duplicates weren't caught (race condition)
-            # Mark all as duplicates for safety
+            # on_conflict only covers the event_hash constraint; a violation of another
+            # unique constraint rejects the whole batch, so mark all as duplicates
             return {
                 "status": "error",
                 "events_created": 0,
@@ -940,7 +1063,7 @@ def _process_batch(
         return {
             "status": "error",
             "events_created": 0,
-            "events_duplicate": len(duplicate_hashes),
+            "events_duplicate": len(events_with_hashes) - len(events_to_insert),
             "events_failed": len(events_to_insert),
             "created_event_ids": [],
             "duplicate_hashes": duplicate_hashes,
@@ -952,7 +1075,7 @@ def _process_batch(
         return {
             "status": "error",
             "events_created": 0,
-            "events_duplicate": len(duplicate_hashes),
+            "events_duplicate": len(events_with_hashes) - len(events_to_insert),
             "events_failed": len(events_to_insert),
             "created_event_ids": [],
             "duplicate_hashes": duplicate_hashes,
@@ -964,7 +1087,8 @@ def bulk_write_events(
     events: List[Dict[str, Any]],
     hasura_url: Optional[str] = None,
     admin_secret: Optional[str] = None,
-    batch_size: Optional[int] = None
+    batch_size: Optional[int] = None,
+    hash_filter: Optional[KnownHashFilter] = None
 ) -> Dict[str, Any]:
     """
     Bulk writes multiple events to the event_store table using Hasura GraphQL mutation.
@@ -982,6 +1106,11 @@ def bulk_write_events(
         hasura_url: Optional Hasura GraphQL endpoint URL. If not provided, uses HASURA_URL env var or default
         admin_secret: Optional Hasura admin secret. If not provided, uses HASURA_GRAPHQL_ADMIN_SECRET env var or default
         batch_size: Optional batch size override. If not provided, uses BULK_EVENTS_BATCH_SIZE env var (default: 1000)
+        hash_filter: Optional KnownHashFilter warm-loaded with load_known_event_hashes(). Hashes
+                     it reports as definitely new skip the completed_integration_events check,
+                     hashes it remembers exactly are counted as duplicates without the check or
+                     the insert, and the others are checked as usual. Stored hashes are added
+                     to it. Its lookup statistics are returned as "hash_filter".
     
     Returns:
         Dictionary containing aggregated results from all batches:
@@ -995,6 +1124,7 @@ def bulk_write_events(
             "duplicate_hashes": List[str],
             "errors": List[Dict],
             "batches_processed": int,
+            "hash_filter": Dict | None,  # KnownHashFilter.stats() (hit and false-positive rates)
             "data": Dict | None
         }
     
@@ -1070,6 +1200,7 @@ def bulk_write_events(
             "duplicate_hashes": [],
             "errors": validation_errors,
             "batches_processed": 0,
+            "hash_filter": hash_filter.stats() if hash_filter is not None else None,
             "data": None
         }
     
@@ -1091,7 +1222,7 @@ def bulk_write_events(
     for chunk_idx, chunk in enumerate(chunks, 1):
         try:
             logger.info(f"Processing batch {chunk_idx}/{total_chunks} ({len(chunk)} events)")
-            batch_result = _process_batch(chunk, hasura_url=hasura_url, admin_secret=admin_secret)
+            batch_result = _process_batch(chunk, hasura_url=hasura_url, admin_secret=admin_secret, hash_filter=hash_filter)
             batch_results.append(batch_result)
             
             total_created += batch_result['events_created']
@@ -1144,6 +1275,7 @@ def bulk_write_events(
         "duplicate_hashes": all_duplicate_hashes,
         "errors": all_errors,
         "batches_processed": total_chunks,
+        "hash_filter": hash_filter.stats() if hash_filter is not None else None,
         "data": {
             "batch_results": batch_results
         }
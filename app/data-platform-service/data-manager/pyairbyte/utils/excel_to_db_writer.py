@@ -1,11 +1,15 @@
 import os
 import logging
 from urllib.parse import quote_plus
-from typing import Optional, Dict, Any, Iterator
+from typing import Optional, Dict, Any, Iterator, Callable
 from sqlalchemy import create_engine, Engine, text, inspect
 from sqlalchemy.exc import SQLAlchemyError
 import pandas as pd
 import numpy as np
+from psycopg2 import sql
+
+from .pg_bulk_loader import copy_dataframe_to_postgres
+from .pg_table_swap import create_shadow_table, swap_shadow_table, drop_shadow_table
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -640,12 +644,6 @@ class ExcelToDbWriter:
             return 0
         
         try:
-            # Calculate parameter count: rows * columns
-            # PostgreSQL has a limit of ~65,535 parameters
-            # For method='multi', we need to limit chunk size to avoid parameter limit
-            num_columns = len(df_chunk.columns)
-            max_rows_per_batch = min(3000, 65000 // num_columns) if self.dbms_type == 'postgresql' else len(df_chunk)
-            
             # Drop auto-generated/default columns unless explicitly provided via mapping
             generated_columns = {
                 name for name, meta in table_schema.items()
@@ -660,43 +658,88 @@ class ExcelToDbWriter:
             if columns_to_drop:
                 logger.debug(f"Dropping auto-generated/default columns before write: {columns_to_drop}")
                 df_chunk = df_chunk.drop(columns=columns_to_drop, errors='ignore')
-                num_columns = len(df_chunk.columns)
-                max_rows_per_batch = min(3000, 65000 // num_columns) if self.dbms_type == 'postgresql' else len(df_chunk)
-            
-            if len(df_chunk) > max_rows_per_batch:
-                # Split into smaller batches to avoid parameter limit
-                total_written = 0
-                for i in range(0, len(df_chunk), max_rows_per_batch):
-                    batch_df = df_chunk.iloc[i:i + max_rows_per_batch]
-                    batch_df.to_sql(
-                        table_name,
-                        self.engine,
-                        schema=schema_name,
-                        if_exists=if_exists if i == 0 else 'append',  # Only use if_exists for first batch
-                        index=False,
-                        method='multi' if self.dbms_type == 'postgresql' else None
-                    )
-                    total_written += len(batch_df)
-                logger.debug(f"Wrote {total_written} rows to {schema_name}.{table_name} in batches")
-                return total_written
-            else:
-                # Use pandas to_sql with method='multi' for batch insert performance
-                df_chunk.to_sql(
-                    table_name,
-                    self.engine,
-                    schema=schema_name,
-                    if_exists=if_exists,
-                    index=False,
-                    method='multi' if self.dbms_type == 'postgresql' else None  # MSSQL doesn't support 'multi'
-                )
-                
-                logger.debug(f"Wrote {len(df_chunk)} rows to {schema_name}.{table_name}")
-                return len(df_chunk)
+            
+            if self.dbms_type == 'postgresql':
+                # COPY ... FROM STDIN: no bind parameter limit, so the chunk is written in one statement
+                return self._copy_chunk_to_postgres(df_chunk, schema_name, table_name, if_exists)
+            
+            # MSSQL: pandas to_sql (fast_executemany is enabled on the engine)
+            df_chunk.to_sql(
+                table_name,
+                self.engine,
+                schema=schema_name,
+                if_exists=if_exists,
+                index=False
+            )
+            
+            logger.debug(f"Wrote {len(df_chunk)} rows to {schema_name}.{table_name}")
+            return len(df_chunk)
             
         except Exception as e:
             logger.error(f"Error writing chunk to database: {e}")
             raise SQLAlchemyError(f"Failed to write chunk to {schema_name}.{table_name}: {e}")
     
+    def _copy_chunk_to_postgres(
+        self,
+        df_chunk: pd.DataFrame,
+        schema_name: str,
+        table_name: str,
+        if_exists: str = 'append'
+    ) -> int:
+        """
+        Write a DataFrame chunk to an existing PostgreSQL table using COPY.
+        
+        The target table is never dropped, so its schema, indexes and grants are kept:
+        'replace' truncates the table in the same transaction as the COPY, and 'fail'
+        raises if the table already contains rows.
+        
+        Args:
+            df_chunk: DataFrame chunk to write
+            schema_name: Schema name
+            table_name: Table name
+            if_exists: What to do if data exists ('append', 'replace', 'fail')
+            
+        Returns:
+            Number of rows written
+        """
+        raw_conn = self.engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            target = sql.SQL("{}.{}").format(sql.Identifier(schema_name), sql.Identifier(table_name))
+            if if_exists == 'replace':
+                cursor.execute(sql.SQL("TRUNCATE TABLE {}").format(target))
+            elif if_exists == 'fail':
+                cursor.execute(sql.SQL("SELECT EXISTS (SELECT 1 FROM {})").format(target))
+                if cursor.fetchone()[0]:
+                    raise ValueError(f"Table '{schema_name}.{table_name}' already contains data (if_exists='fail')")
+            cursor.close()
+            
+            rows_written = copy_dataframe_to_postgres(
+                raw_conn, schema_name, table_name, df_chunk,
+                quote_identifiers=True,
+                commit=False
+            )
+            raw_conn.commit()
+            logger.debug(f"Copied {rows_written} rows to {schema_name}.{table_name}")
+            return rows_written
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+    
+    def _run_with_raw_connection(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call func(raw_conn, *args, **kwargs) on a DB-API connection from the engine.
+        
+        Used for the pg_table_swap helpers, which work on psycopg2 connections.
+        """
+        raw_conn = self.engine.raw_connection()
+        try:
+            return func(raw_conn, *args, **kwargs)
+        finally:
+            raw_conn.close()
+    
     def write_excel_to_table(
         self,
         excel_path: str,
@@ -715,7 +758,10 @@ class ExcelToDbWriter:
             schema_name: Database schema name
             table_name: Database table name
             chunk_size: Number of rows to process per chunk (default: 10000)
-            if_exists: What to do if data exists ('append', 'replace', 'fail')
+            if_exists: What to do if data exists ('append', 'replace', 'fail'). On PostgreSQL,
+                       'replace' loads all chunks into an UNLOGGED shadow table and swaps it
+                       in at the end, keeping the table's indexes and grants; if nothing
+                       could be written the existing rows are kept.
             
         Returns:
             Dictionary with processing results:
@@ -756,6 +802,15 @@ class ExcelToDbWriter:
         errors = []
         warnings = []
         
+        # PostgreSQL 'replace' writes into a shadow table so readers never see a partly replaced table
+        shadow_table = None
+        if self.dbms_type == 'postgresql' and if_exists == 'replace':
+            shadow_table = self._run_with_raw_connection(
+                create_shadow_table, schema_name, table_name, quote_identifiers=True
+            )
+        write_table = shadow_table or table_name
+        write_mode = 'append' if shadow_table else if_exists
+        
         # Process Excel file in chunks
         try:
             chunk_iterator = self._read_excel_in_chunks(excel_path, sheet_name, chunk_size)
@@ -774,9 +829,9 @@ class ExcelToDbWriter:
                     rows_written = self._write_chunk_to_db(
                         converted_df,
                         schema_name,
-                        table_name,
+                        write_table,
                         table_schema,
-                        if_exists if chunk_idx == 1 else 'append'  # Only use if_exists for first chunk
+                        write_mode if chunk_idx == 1 else 'append'  # Only use if_exists for first chunk
                     )
                     
                     total_rows_written += rows_written
@@ -836,6 +891,11 @@ class ExcelToDbWriter:
                 error_summary += f"Only {total_rows_written} rows written out of expected data."
                 raise SQLAlchemyError(error_summary)
             
+            if shadow_table:
+                self._run_with_raw_connection(
+                    swap_shadow_table, schema_name, table_name, shadow_table, quote_identifiers=True
+                )
+            
             return {
                 "status": status,
                 "rows_written": total_rows_written,
@@ -846,9 +906,13 @@ class ExcelToDbWriter:
             
         except SQLAlchemyError:
             # Re-raise SQLAlchemy errors (these are our critical failures)
+            if shadow_table:
+                self._run_with_raw_connection(drop_shadow_table, schema_name, shadow_table, quote_identifiers=True)
             raise
         except Exception as e:
             logger.error(f"Fatal error during Excel to DB write: {e}")
+            if shadow_table:
+                self._run_with_raw_connection(drop_shadow_table, schema_name, shadow_table, quote_identifiers=True)
             raise SQLAlchemyError(
                 f"Fatal error during Excel to DB write: {e}. "
                 f"Rows written before failure: {total_rows_written}, "
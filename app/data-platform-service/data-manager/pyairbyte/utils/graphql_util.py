@@ -4,6 +4,8 @@ import requests
 import logging
 from typing import Optional, Dict, Any
 
+from .http_session import get_http_session
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -58,7 +60,7 @@ def query_graphql_api(
     
     try:
         logger.info(f"Executing GraphQL query against {hasura_url}")
-        response = requests.post(hasura_url, json=payload, headers=headers, timeout=30)
+        response = get_http_session().post(hasura_url, json=payload, headers=headers, timeout=30)
         response.raise_for_status()
         
         # Get the JSON response
@@ -0,0 +1,152 @@
+import math
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Sized for this many hashes at DEFAULT_FALSE_POSITIVE_RATE (about 1.2 MB of bits);
+# beyond it the false-positive rate rises, which the stats report
+DEFAULT_FILTER_CAPACITY = 1_000_000
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+# Hashes remembered exactly (the least recently added or found go first), about 15 MB of
+# 64-character hex strings
+DEFAULT_KNOWN_CAPACITY = 100_000
+
+
+class KnownHashFilter:
+    """
+    In-process Bloom filter of event hashes known to Hasura (event_store and
+    completed_integration_events).
+
+    A hash the filter does not contain is definitely new, so its duplicate check can be
+    skipped; a hash it contains is only probably known and still has to be checked
+    remotely. Because a Bloom filter cannot tell a known hash apart from a false positive,
+    the most recently added hashes are also kept in a bounded LRU set: a hash found there
+    is known for certain and needs neither the check nor an insert, which is what makes
+    runs that regenerate mostly known events cheap. Lookups and outcomes are counted so
+    the hit rate (checks answered locally) and the false-positive rate (new hashes the
+    filter could not tell apart) can be reported.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_FILTER_CAPACITY,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        known_capacity: int = DEFAULT_KNOWN_CAPACITY
+    ):
+        """
+        Args:
+            capacity: Expected number of hashes
+            false_positive_rate: Target false-positive rate at capacity
+            known_capacity: Hashes remembered exactly (0 keeps only the Bloom filter)
+        """
+        if capacity <= 0 or not 0 < false_positive_rate < 1:
+            raise ValueError("capacity must be positive and false_positive_rate between 0 and 1")
+        if known_capacity < 0:
+            raise ValueError("known_capacity must not be negative")
+        self.capacity = capacity
+        self.known_capacity = known_capacity
+        self._known: 'OrderedDict[str, None]' = OrderedDict()
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.lookups = 0
+        self.definitely_new = 0
+        self.maybe_known = 0
+        self.known = 0
+        self.false_positives = 0
+
+    def _positions(self, event_hash: str) -> Iterable[int]:
+        """Bit positions of a hash (double hashing over one 128-bit digest)."""
+        digest = hashlib.blake2b(event_hash.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, event_hash: str) -> None:
+        """Record a hash as known."""
+        with self._lock:
+            new = False
+            for position in self._positions(event_hash):
+                byte, bit = divmod(position, 8)
+                if not self._bits[byte] & (1 << bit):
+                    self._bits[byte] |= 1 << bit
+                    new = True
+            if new:
+                self.count += 1
+            if self.known_capacity:
+                self._known[event_hash] = None
+                self._known.move_to_end(event_hash)
+                if len(self._known) > self.known_capacity:
+                    self._known.popitem(last=False)
+
+    def update(self, event_hashes: Iterable[str]) -> None:
+        """Record several hashes as known."""
+        for event_hash in event_hashes:
+            self.add(event_hash)
+
+    def __contains__(self, event_hash: str) -> bool:
+        return all(self._bits[position // 8] & (1 << (position % 8)) for position in self._positions(event_hash))
+
+    def lookup(self, event_hash: str) -> Optional[bool]:
+        """
+        Look up a hash, counted in the stats.
+
+        Returns:
+            True if the hash is known for certain (remembered exactly), False if it is
+            definitely new and None if it may be known (only the Bloom filter has it)
+        """
+        with self._lock:
+            self.lookups += 1
+            if event_hash in self._known:
+                self._known.move_to_end(event_hash)
+                self.known += 1
+                return True
+        maybe_known = event_hash in self
+        with self._lock:
+            if maybe_known:
+                self.maybe_known += 1
+            else:
+                self.definitely_new += 1
+        return None if maybe_known else False
+
+    def record_false_positives(self, count: int) -> None:
+        """Count hashes reported as maybe known that the remote check found to be new."""
+        with self._lock:
+            self.false_positives += count
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Lookup statistics since the filter was created.
+
+        Returns:
+            Dictionary with 'hashes' (approximate number added), 'capacity', 'remembered'
+            (hashes in the exact set), 'lookups', 'known', 'definitely_new', 'maybe_known',
+            'false_positives', 'hit_rate' (share of lookups answered without a remote
+            check) and 'false_positive_rate' (share of new hashes the filter reported as
+            maybe known)
+        """
+        with self._lock:
+            new_hashes = self.definitely_new + self.false_positives
+            answered = self.known + self.definitely_new
+            return {
+                'hashes': self.count,
+                'capacity': self.capacity,
+                'remembered': len(self._known),
+                'lookups': self.lookups,
+                'known': self.known,
+                'definitely_new': self.definitely_new,
+                'maybe_known': self.maybe_known,
+                'false_positives': self.false_positives,
+                'hit_rate': round(answered / self.lookups, 4) if self.lookups else None,
+                'false_positive_rate': round(self.false_positives / new_hashes, 4) if new_hashes else None
+            }
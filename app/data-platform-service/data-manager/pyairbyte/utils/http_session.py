@@ -0,0 +1,97 @@
+import os
+import atexit
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Hosts whose connections are kept (one urllib3 pool per scheme, host and port)
+DEFAULT_POOL_CONNECTIONS = 10
+# Idle keep-alive connections kept per host; busier threads open extra connections
+# that are closed after use instead of waiting
+DEFAULT_POOL_MAXSIZE = 20
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def _create_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+    """Build a session with pooled keep-alive adapters and no cookie persistence."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=False)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # The session is shared by unrelated callers, so cookies set by one API must not be
+    # sent on the next request (module-level requests.* calls never kept them either)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    logger.info(f"Created shared HTTP session ({pool_connections} host pools, {pool_maxsize} connections per host)")
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session used for outbound calls.
+
+    Requests made through it reuse keep-alive TCP/TLS connections per host instead of
+    connecting for every call the way module-level requests.get/post do. The pool sizes
+    come from HTTP_POOL_CONNECTIONS and HTTP_POOL_MAXSIZE (see configure_http_session).
+    Each process (e.g. after a fork) gets its own session.
+
+    Returns:
+        Shared requests.Session (safe to use from several threads; no cookies are kept)
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            _session = _create_session(
+                int(os.getenv('HTTP_POOL_CONNECTIONS', str(DEFAULT_POOL_CONNECTIONS))),
+                int(os.getenv('HTTP_POOL_MAXSIZE', str(DEFAULT_POOL_MAXSIZE)))
+            )
+            _session_pid = os.getpid()
+        return _session
+
+
+def configure_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+) -> requests.Session:
+    """
+    Replace the shared HTTP session with one using the given pool sizes.
+
+    Args:
+        pool_connections: Number of hosts whose connections are kept
+        pool_maxsize: Keep-alive connections kept per host (set to at least the number of
+                      threads calling one host at the same time)
+
+    Returns:
+        The new shared session
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is not None and _session_pid == os.getpid():
+            _session.close()
+        _session = _create_session(pool_connections, pool_maxsize)
+        _session_pid = os.getpid()
+        return _session
+
+
+def close_http_session() -> None:
+    """Close the shared HTTP session's connections; the next call creates a new session."""
+    global _session, _session_pid
+    with _session_lock:
+        if _session is not None and _session_pid == os.getpid():
+            _session.close()
+        _session = None
+        _session_pid = None
+
+
+atexit.register(close_http_session)
@@ -0,0 +1,104 @@
+import math
+import logging
+import datetime
+from typing import List, Optional, Any, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+PARTITION_STRATEGY_MINMAX = 'minmax'
+PARTITION_STRATEGY_HISTOGRAM = 'histogram'
+
+# (lower, upper) key range: lower <= key < upper; None means unbounded on that side
+KeyRange = Tuple[Optional[Any], Optional[Any]]
+
+
+def minmax_boundaries(min_value: Any, max_value: Any, partitions: int) -> List[Any]:
+    """
+    Split [min_value, max_value] into equally wide key ranges.
+
+    Supports integers, dates and datetimes. Dates are split on whole days.
+
+    Args:
+        min_value: Smallest key value
+        max_value: Largest key value
+        partitions: Number of ranges wanted
+
+    Returns:
+        Sorted, distinct interior boundaries (at most partitions - 1 values)
+
+    Raises:
+        TypeError: If the key type cannot be split
+    """
+    if partitions <= 1 or min_value is None or max_value is None or min_value >= max_value:
+        return []
+
+    if isinstance(min_value, datetime.datetime):
+        step = (max_value - min_value) / partitions
+        boundaries = [min_value + step * i for i in range(1, partitions)]
+    elif isinstance(min_value, datetime.date):
+        step_days = max(1, math.ceil(((max_value - min_value).days + 1) / partitions))
+        boundaries = [min_value + datetime.timedelta(days=step_days * i) for i in range(1, partitions)]
+    elif isinstance(min_value, int) and not isinstance(min_value, bool):
+        step = max(1, math.ceil((max_value - min_value + 1) / partitions))
+        boundaries = [min_value + step * i for i in range(1, partitions)]
+    else:
+        raise TypeError(f"Cannot partition keys of type {type(min_value).__name__}")
+
+    return sorted({b for b in boundaries if min_value < b <= max_value})
+
+
+def histogram_boundaries(steps: List[Tuple[Any, float]], partitions: int) -> List[Any]:
+    """
+    Choose boundaries so each range holds about the same number of rows.
+
+    Args:
+        steps: Histogram steps as (upper_key, rows_up_to_and_including_key_since_previous_step),
+               in key order (e.g. from sys.dm_db_stats_histogram)
+        partitions: Number of ranges wanted
+
+    Returns:
+        Sorted, distinct interior boundaries (at most partitions - 1 values)
+    """
+    total_rows = sum(rows for _, rows in steps)
+    if partitions <= 1 or total_rows <= 0 or len(steps) < 2:
+        return []
+
+    target = total_rows / partitions
+    boundaries = []
+    cumulative = 0.0
+    for key, rows in steps[:-1]:
+        cumulative += rows
+        if cumulative >= target * (len(boundaries) + 1):
+            # Ranges are lower-inclusive, so the next range starts at this step's key
+            boundaries.append(key)
+            if len(boundaries) == partitions - 1:
+                break
+    return boundaries
+
+
+def ranges_from_boundaries(boundaries: List[Any]) -> List[KeyRange]:
+    """
+    Turn interior boundaries into contiguous key ranges covering every key.
+
+    The first range has no lower bound and the last has no upper bound, so keys
+    outside the sampled MIN/MAX or histogram are still extracted.
+
+    Args:
+        boundaries: Sorted interior boundaries
+
+    Returns:
+        List of (lower, upper) ranges
+    """
+    edges: List[Optional[Any]] = [None] + list(boundaries) + [None]
+    return [(edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+
+def describe_range(key_range: KeyRange) -> str:
+    """Readable form of a key range for logs and sync results."""
+    lower, upper = key_range
+    lower_text = f"[{lower}" if lower is not None else "(-inf"
+    upper_text = f"{upper})" if upper is not None else "+inf)"
+    return f"{lower_text}, {upper_text}"
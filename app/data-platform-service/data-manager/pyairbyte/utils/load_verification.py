@@ -0,0 +1,165 @@
+import uuid
+import logging
+import datetime
+from decimal import Decimal
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .column_normalizer import NORMALIZE_BOOL, NORMALIZE_DATETIME, NORMALIZE_UUID
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Post-load verification modes (table config key 'verification')
+VERIFICATION_COUNT = 'count'        # SELECT COUNT(*) on source and PostgreSQL (two full scans)
+VERIFICATION_STATS = 'stats'        # rows counted while loading vs source catalog row statistics
+VERIFICATION_CHECKSUM = 'checksum'  # 'stats' plus per-chunk hash aggregates of rows read vs written
+
+# Separator between canonical values of a row before hashing
+_FIELD_SEPARATOR = '\x1f'
+_NULL_MARKER = '\x00'
+
+
+def _canonical_value(value: Any, kind: str) -> str:
+    """
+    Canonical text of a single value for hashing, independent of its Python/pandas type.
+
+    The same value read from the source (pyodbc/pymysql types) and after normalization
+    (pandas types) gets the same text; a changed value gets a different one.
+    """
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+        return _NULL_MARKER
+    if kind == NORMALIZE_BOOL or isinstance(value, (bool, np.bool_)):
+        if isinstance(value, (bytes, bytearray)):
+            value = any(value)
+        return 'true' if bool(value) else 'false'
+    if kind == NORMALIZE_DATETIME:
+        timestamp = pd.to_datetime(value, errors='coerce')
+        return _NULL_MARKER if pd.isna(timestamp) else timestamp.isoformat()
+    if kind == NORMALIZE_UUID or isinstance(value, uuid.UUID):
+        return str(value).lower()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    if isinstance(value, (float, np.floating)):
+        if float(value).is_integer():
+            return str(int(value))
+        return repr(float(value))
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    if isinstance(value, Decimal):
+        return format(value.normalize(), 'f')
+    if isinstance(value, (pd.Timestamp, datetime.datetime, datetime.date)):
+        return pd.Timestamp(value).isoformat()
+    return str(value)
+
+
+def chunk_hash_aggregate(chunk: pd.DataFrame, plan: Tuple[Tuple[str, str], ...]) -> int:
+    """
+    Order-independent hash aggregate of the rows of a chunk.
+
+    Each row is hashed from the canonical text of its values (64-bit hash), and the row
+    hashes are summed modulo 2**64, so aggregates of chunks, partitions and threads can be
+    combined by addition in any order.
+
+    Args:
+        chunk: Chunk before or after normalization
+        plan: Normalization plan of the table (see column_normalizer)
+
+    Returns:
+        Hash aggregate as an unsigned 64-bit integer
+    """
+    if chunk.empty:
+        return 0
+    kinds = dict(plan)
+    rows = None
+    for col_name in chunk.columns:
+        kind = kinds.get(col_name)
+        text = chunk[col_name].map(lambda value: _canonical_value(value, kind)).astype(object)
+        rows = text if rows is None else rows + _FIELD_SEPARATOR + text
+    row_hashes = pd.util.hash_pandas_object(rows, index=False).to_numpy(dtype=np.uint64)
+    return int(row_hashes.sum(dtype=np.uint64))
+
+
+class ChunkChecksums:
+    """
+    Per-chunk hash aggregates of the rows read from the source and the rows written.
+
+    Both sides are hashed in-process from data the loader already holds, so verifying a
+    table costs no extra query. A difference means a value was changed or lost between
+    extraction and COPY; PostgreSQL's own row count for each COPY covers the write itself.
+    """
+
+    def __init__(self):
+        self.chunks = 0
+        self.rows = 0
+        self.source = 0
+        self.written = 0
+        self.mismatched_chunks = 0
+
+    def add_chunk(self, source_hash: int, chunk: pd.DataFrame, plan: Tuple[Tuple[str, str], ...]) -> None:
+        """
+        Hash a normalized chunk and compare it with the hash of the same chunk as read.
+
+        Args:
+            source_hash: chunk_hash_aggregate() of the chunk before normalization
+                         (normalize_chunk works in place, so hash it first)
+            chunk: The normalized chunk that is written to PostgreSQL
+            plan: Normalization plan of the table
+        """
+        written_hash = chunk_hash_aggregate(chunk, plan)
+        self.chunks += 1
+        self.rows += len(chunk)
+        self.source = (self.source + source_hash) % 2 ** 64
+        self.written = (self.written + written_hash) % 2 ** 64
+        if written_hash != source_hash:
+            self.mismatched_chunks += 1
+            logger.warning(f"Chunk {self.chunks} ({len(chunk)} rows) changed between extraction and load")
+
+    def merge(self, other: 'ChunkChecksums') -> None:
+        """Add the aggregates of another partition of the same table."""
+        self.chunks += other.chunks
+        self.rows += other.rows
+        self.source = (self.source + other.source) % 2 ** 64
+        self.written = (self.written + other.written) % 2 ** 64
+        self.mismatched_chunks += other.mismatched_chunks
+
+    @property
+    def matched(self) -> bool:
+        return self.mismatched_chunks == 0 and self.source == self.written
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'chunks': self.chunks,
+            'rows': self.rows,
+            'source_hash': f"{self.source:016x}",
+            'written_hash': f"{self.written:016x}",
+            'mismatched_chunks': self.mismatched_chunks,
+            'matched': self.matched
+        }
+
+
+def compare_row_counts(
+    source_rows: Optional[int],
+    loaded_rows: Optional[int],
+    tolerance: float = 0.0
+) -> bool:
+    """
+    Compare a source row count or estimate with the rows loaded.
+
+    Args:
+        source_rows: Source rows (exact count or catalog statistic)
+        loaded_rows: Rows in PostgreSQL
+        tolerance: Allowed relative difference (e.g. 0.5 for InnoDB estimates)
+
+    Returns:
+        True if the counts agree within tolerance
+    """
+    if source_rows is None or loaded_rows is None or source_rows < 0 or loaded_rows < 0:
+        return False
+    if tolerance <= 0:
+        return source_rows == loaded_rows
+    return abs(source_rows - loaded_rows) <= tolerance * max(source_rows, loaded_rows)
@@ -2,15 +2,86 @@ import os
 import pyodbc
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import psycopg2
-from psycopg2.extras import execute_values
 from psycopg2.extensions import register_adapter, AsIs
 import logging
 import json
 import yaml
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Callable, Union, Set
+from concurrent.futures import ThreadPoolExecutor
 from airbyte.caches import PostgresCache
 import time
+from datetime import datetime
+
+from .pg_bulk_loader import copy_dataframe_to_postgres, copy_record_batch_to_postgres, upsert_dataframe_to_postgres
+from .column_normalizer import compile_normalization_plan, normalize_chunk
+from .sync_state import (
+    SYNC_MODE_FULL_REFRESH,
+    SYNC_MODE_INCREMENTAL,
+    CHANGE_DETECTION_CHECKSUM,
+    CHANGE_DETECTION_ROWVERSION,
+    SYNC_STATUS_SKIPPED_UNCHANGED,
+    ensure_sync_metadata_table,
+    get_last_watermark,
+    record_table_sync,
+    get_resume_checkpoint,
+    start_checkpointed_sync,
+    save_checkpoint,
+    finish_checkpointed_sync,
+    postgres_table_exists,
+    postgres_table_columns,
+    resolve_incremental_config,
+    describe_watermark,
+    format_fingerprint,
+    is_table_unchanged
+)
+from .connection_pool import ConnectionPool, get_shared_pool, shared_pool_metrics
+from .sync_runner import run_table_syncs
+from .key_partitioning import (
+    KeyRange,
+    PARTITION_STRATEGY_MINMAX,
+    PARTITION_STRATEGY_HISTOGRAM,
+    minmax_boundaries,
+    histogram_boundaries,
+    ranges_from_boundaries,
+    describe_range
+)
+from .source_catalog import SourceCatalog
+from .chunk_pipeline import DEFAULT_PIPELINE_DEPTH, run_chunk_pipeline, combine_pipeline_stats
+from .chunk_sizing import ChunkSizer
+from .arrow_extraction import (
+    EXTRACT_BACKEND_PANDAS,
+    EXTRACT_BACKEND_ARROW,
+    arrow_schema,
+    rows_to_record_batch,
+    add_batch_checksums
+)
+from .load_verification import (
+    VERIFICATION_COUNT,
+    VERIFICATION_STATS,
+    VERIFICATION_CHECKSUM,
+    ChunkChecksums,
+    chunk_hash_aggregate,
+    compare_row_counts
+)
+from .pg_indexes import create_source_indexes
+from .source_projection import (
+    project_columns,
+    projected_key,
+    projected_unique_indexes,
+    loaded_columns_differ,
+    combine_conditions,
+    projection_signature
+)
+from .sync_planner import plan_table_syncs, apply_sync_plan, record_plan_actuals
+from .pg_table_swap import (
+    REPLACE_STRATEGY_SWAP,
+    shadow_table_name,
+    set_shadow_logged,
+    swap_shadow_table,
+    drop_shadow_table
+)
 
 # Register psycopg2 adapter for pandas NaT to handle NULL values properly
 try:
@@ -61,8 +132,23 @@ MSSQL_TO_POSTGRES_TYPE_MAP = {
     'varbinary': 'BYTEA',
     'image': 'BYTEA',
     'xml': 'TEXT',
+    # INFORMATION_SCHEMA reports rowversion columns as 'timestamp'
+    'timestamp': 'BYTEA',
+    'rowversion': 'BYTEA',
 }
 
+# Key types that can be split into ranges for partitioned extraction
+PARTITIONABLE_MSSQL_TYPES = ('int', 'bigint', 'smallint', 'tinyint', 'date', 'datetime', 'datetime2', 'smalldatetime')
+
+# Key types a resumable load can checkpoint: their values survive the round trip through a
+# chunk exactly (datetime2 and datetimeoffset lose their 100ns digits in Python). datetime
+# keys only compare exactly when the parameter is cast back to datetime (see
+# _keyset_condition)
+RESUMABLE_KEY_MSSQL_TYPES = (
+    'int', 'bigint', 'smallint', 'tinyint', 'date', 'datetime', 'smalldatetime',
+    'char', 'varchar', 'nchar', 'nvarchar', 'uniqueidentifier'
+)
+
 
 def map_mssql_to_postgres_type(
     mssql_type: str,
@@ -112,6 +198,25 @@ def map_mssql_to_postgres_type(
     return 'TEXT'
 
 
+# ODBC drivers tried in order; the one that last worked for a server is tried first
+MSSQL_ODBC_DRIVERS = [
+    "ODBC Driver 18 for SQL Server",
+    "ODBC Driver 17 for SQL Server"
+]
+_working_mssql_drivers: Dict[str, str] = {}
+
+
+def _mssql_connection_alive(conn: pyodbc.Connection) -> bool:
+    """Check an idle pooled MSSQL connection before it is reused."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        return True
+    finally:
+        cursor.close()
+
+
 def get_mssql_connection(
     server: str,
     database: str,
@@ -121,7 +226,10 @@ def get_mssql_connection(
     retry_delay: int = 5
 ) -> pyodbc.Connection:
     """
-    Create MSSQL connection with retry logic.
+    Get an MSSQL connection from the process-wide pool for this server and database.
+
+    A new connection (with driver probing and retries) is only opened when the pool has
+    no idle one. close() on the returned connection gives it back to the pool.
     
     Args:
         server: MSSQL server hostname or IP
@@ -132,16 +240,31 @@ def get_mssql_connection(
         retry_delay: Delay between retries in seconds
         
     Returns:
-        pyodbc.Connection object
+        pyodbc.Connection object (pooled)
         
     Raises:
         Exception: If connection fails after all retries
     """
-    # Try ODBC Driver 18 first, fallback to 17
-    drivers_to_try = [
-        "ODBC Driver 18 for SQL Server",
-        "ODBC Driver 17 for SQL Server"
-    ]
+    pool = get_shared_pool(
+        ('mssql', server, database, username, password),
+        lambda: _connect_mssql(server, database, username, password, max_retries, retry_delay),
+        name=f"mssql://{username}@{server}/{database}",
+        validate=_mssql_connection_alive
+    )
+    return pool.checkout()
+
+
+def _connect_mssql(
+    server: str,
+    database: str,
+    username: str,
+    password: str,
+    max_retries: int,
+    retry_delay: int
+) -> pyodbc.Connection:
+    """Open a new MSSQL connection with retry logic (see get_mssql_connection)."""
+    working_driver = _working_mssql_drivers.get(server)
+    drivers_to_try = sorted(MSSQL_ODBC_DRIVERS, key=lambda driver: driver != working_driver)
     
     last_error = None
     for driver in drivers_to_try:
@@ -158,6 +281,7 @@ def get_mssql_connection(
         for attempt in range(max_retries):
             try:
                 conn = pyodbc.connect(connection_string, timeout=30)
+                _working_mssql_drivers[server] = driver
                 logger.info(f"Successfully connected to MSSQL server: {server}/{database} using {driver}")
                 return conn
             except pyodbc.Error as e:
@@ -226,41 +350,161 @@ def extract_mssql_schema(
     return columns
 
 
-def validate_tables_exist(
+def get_mssql_primary_key(
     conn: pyodbc.Connection,
     schema_name: str,
-    table_names: List[str]
-) -> Tuple[List[str], List[str]]:
+    table_name: str
+) -> List[str]:
     """
-    Validate that all specified tables exist in MSSQL.
+    Get the primary key columns of an MSSQL table.
     
     Args:
         conn: MSSQL connection
         schema_name: Schema name
-        table_names: List of table names to validate
+        table_name: Table name
         
     Returns:
-        Tuple of (existing_tables, missing_tables)
+        Primary key column names in key order (empty if the table has no primary key)
     """
     query = """
-        SELECT TABLE_NAME
-        FROM INFORMATION_SCHEMA.TABLES
-        WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
+        SELECT kcu.COLUMN_NAME
+        FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+            ON kcu.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+            AND kcu.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+        WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+            AND tc.TABLE_SCHEMA = ? AND tc.TABLE_NAME = ?
+        ORDER BY kcu.ORDINAL_POSITION
     """
     
     cursor = conn.cursor()
-    existing = []
-    missing = []
+    cursor.execute(query, schema_name, table_name)
+    key_columns = [row.COLUMN_NAME for row in cursor.fetchall()]
+    cursor.close()
+    return key_columns
+
+
+def load_mssql_catalog(
+    conn: pyodbc.Connection,
+    schema_name: str,
+    table_names: List[str]
+) -> SourceCatalog:
+    """
+    Load existence, columns, primary keys, unique indexes and row estimates of MSSQL tables.
     
-    for table_name in table_names:
-        cursor.execute(query, schema_name, table_name)
-        if cursor.fetchone():
-            existing.append(table_name)
-        else:
-            missing.append(table_name)
+    Row estimates come from sys.partitions (heap or clustered index), which is kept by
+    SQL Server and needs no table scan. Unique indexes (and unique constraints) other than
+    the primary key are read from sys.indexes in a second query; filtered and disabled
+    ones are left out, as are included (non-key) columns.
+    
+    Args:
+        conn: MSSQL connection
+        schema_name: Schema name
+        table_names: Tables of the sync
+        
+    Returns:
+        SourceCatalog for the tables that exist
+    """
+    if not table_names:
+        return SourceCatalog(schema_name, {})
+    
+    placeholders = ', '.join('?' for _ in table_names)
+    query = f"""
+        SELECT 
+            c.TABLE_NAME,
+            c.COLUMN_NAME,
+            c.DATA_TYPE,
+            c.CHARACTER_MAXIMUM_LENGTH,
+            c.NUMERIC_PRECISION,
+            c.NUMERIC_SCALE,
+            c.IS_NULLABLE,
+            c.COLUMN_DEFAULT,
+            pk.ORDINAL_POSITION AS PK_ORDINAL,
+            rc.ROW_ESTIMATE
+        FROM INFORMATION_SCHEMA.COLUMNS c
+        LEFT JOIN (
+            SELECT kcu.TABLE_NAME, kcu.COLUMN_NAME, kcu.ORDINAL_POSITION
+            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                ON kcu.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+                AND kcu.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+            WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY' AND tc.TABLE_SCHEMA = ?
+        ) pk ON pk.TABLE_NAME = c.TABLE_NAME AND pk.COLUMN_NAME = c.COLUMN_NAME
+        LEFT JOIN (
+            SELECT t.name AS TABLE_NAME, SUM(p.rows) AS ROW_ESTIMATE
+            FROM sys.tables t
+            JOIN sys.schemas s ON s.schema_id = t.schema_id
+            JOIN sys.partitions p ON p.object_id = t.object_id AND p.index_id IN (0, 1)
+            WHERE s.name = ?
+            GROUP BY t.name
+        ) rc ON rc.TABLE_NAME = c.TABLE_NAME
+        WHERE c.TABLE_SCHEMA = ? AND c.TABLE_NAME IN ({placeholders})
+        ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+    """
+    
+    cursor = conn.cursor()
+    cursor.execute(query, schema_name, schema_name, schema_name, *table_names)
+    rows = [
+        {
+            'table_name': row.TABLE_NAME,
+            'column_name': row.COLUMN_NAME,
+            'data_type': row.DATA_TYPE,
+            'max_length': row.CHARACTER_MAXIMUM_LENGTH,
+            'precision': row.NUMERIC_PRECISION,
+            'scale': row.NUMERIC_SCALE,
+            'is_nullable': row.IS_NULLABLE == 'YES',
+            'default': row.COLUMN_DEFAULT,
+            'pk_ordinal': row.PK_ORDINAL,
+            'row_estimate': row.ROW_ESTIMATE
+        }
+        for row in cursor.fetchall()
+    ]
     
+    cursor.execute(f"""
+        SELECT t.name AS TABLE_NAME, i.name AS INDEX_NAME, c.name AS COLUMN_NAME, ic.key_ordinal AS KEY_ORDINAL
+        FROM sys.indexes i
+        JOIN sys.tables t ON t.object_id = i.object_id
+        JOIN sys.schemas s ON s.schema_id = t.schema_id
+        JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+        JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+        WHERE s.name = ? AND t.name IN ({placeholders})
+          AND i.is_unique = 1 AND i.is_primary_key = 0 AND i.has_filter = 0 AND i.is_disabled = 0
+          AND ic.is_included_column = 0
+        ORDER BY t.name, i.name, ic.key_ordinal
+    """, schema_name, *table_names)
+    index_rows = [
+        {
+            'table_name': row.TABLE_NAME,
+            'index_name': row.INDEX_NAME,
+            'column_name': row.COLUMN_NAME,
+            'key_ordinal': row.KEY_ORDINAL
+        }
+        for row in cursor.fetchall()
+    ]
     cursor.close()
-    return existing, missing
+    
+    catalog = SourceCatalog.from_rows(schema_name, table_names, rows, 'mssql_type', index_rows)
+    logger.info(f"Loaded MSSQL catalog for {len(catalog.tables)}/{len(table_names)} tables in {schema_name}")
+    return catalog
+
+
+def validate_tables_exist(
+    conn: pyodbc.Connection,
+    schema_name: str,
+    table_names: List[str]
+) -> Tuple[List[str], List[str]]:
+    """
+    Validate that all specified tables exist in MSSQL.
+    
+    Args:
+        conn: MSSQL connection
+        schema_name: Schema name
+        table_names: List of table names to validate
+        
+    Returns:
+        Tuple of (existing_tables, missing_tables)
+    """
+    return load_mssql_catalog(conn, schema_name, table_names).split(table_names)
 
 
 def create_postgresql_table(
@@ -268,7 +512,9 @@ def create_postgresql_table(
     schema_name: str,
     table_name: str,
     columns: List[Dict[str, Any]],
-    table_prefix: str = ''
+    table_prefix: str = '',
+    primary_key: Optional[List[str]] = None,
+    unlogged: bool = False
 ) -> bool:
     """
     Create PostgreSQL table from MSSQL schema.
@@ -279,6 +525,8 @@ def create_postgresql_table(
         table_name: Table name
         columns: List of column metadata dictionaries
         table_prefix: Optional prefix for table name
+        primary_key: Optional primary key column names (required for upserts)
+        unlogged: Create an UNLOGGED table (shadow tables, see pg_table_swap)
         
     Returns:
         True if successful, False otherwise
@@ -308,9 +556,13 @@ def create_postgresql_table(
             nullable = 'NULL' if col['is_nullable'] else 'NOT NULL'
             column_defs.append(f"{col_name} {pg_type} {nullable}")
         
+        if primary_key:
+            pk_cols = [c.replace('-', '_').replace(' ', '_') for c in primary_key]
+            column_defs.append(f"PRIMARY KEY ({', '.join(pk_cols)})")
+        
         # Create table
         create_sql = f"""
-            CREATE TABLE {schema_name}.{safe_table_name} (
+            CREATE {'UNLOGGED ' if unlogged else ''}TABLE {schema_name}.{safe_table_name} (
                 {', '.join(column_defs)}
             )
         """
@@ -328,74 +580,196 @@ def create_postgresql_table(
         return False
 
 
-def extract_and_transform_data(
+def _select_list(columns: List[Dict[str, Any]]) -> str:
+    """SELECT list reading exactly the given columns (the table's projected columns)."""
+    return ', '.join('[' + col['name'].replace(']', ']]') + ']' for col in columns)
+
+
+def _transform_chunk(
+    chunk: pd.DataFrame,
+    columns: List[Dict[str, Any]],
+    plan: Optional[Tuple[Tuple[str, str], ...]] = None
+) -> pd.DataFrame:
+    """
+    Transform a single chunk read from MSSQL so it can be written to PostgreSQL.
+    
+    Args:
+        chunk: DataFrame chunk as returned by pd.read_sql
+        columns: Column metadata
+        plan: Optional precompiled normalization plan (compiled from columns if omitted)
+        
+    Returns:
+        Transformed DataFrame chunk
+    """
+    if plan is None:
+        plan = compile_normalization_plan(columns, 'mssql_type')
+    return normalize_chunk(chunk, plan)
+
+
+def iter_transformed_chunks(
     mssql_conn: pyodbc.Connection,
     schema_name: str,
     table_name: str,
     columns: List[Dict[str, Any]],
-    batch_size: int = 10000
-) -> pd.DataFrame:
+    batch_size: Union[int, ChunkSizer] = 10000,
+    where: Optional[str] = None,
+    params: Optional[List[Any]] = None,
+    checksums: Optional[ChunkChecksums] = None,
+    order_by: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
     """
-    Extract data from MSSQL table and transform for PostgreSQL.
+    Stream data from an MSSQL table as transformed chunks.
+    
+    Rows are fetched from the cursor with fetchmany() and turned into a DataFrame the way
+    pd.read_sql does, so only one chunk is held in memory at a time. Only the columns in
+    columns are selected.
     
     Args:
         mssql_conn: MSSQL connection
         schema_name: Schema name
         table_name: Table name
         columns: Column metadata
-        batch_size: Batch size for reading data
+        batch_size: Rows per chunk, or a ChunkSizer choosing the rows of each chunk
+        where: Optional WHERE condition (without the WHERE keyword) using ? placeholders
+        params: Parameters for the placeholders in where
+        checksums: If set, hash each chunk as read and as transformed into this accumulator
+        order_by: Optional columns to read the rows in order of (e.g. the primary key)
         
-    Returns:
-        DataFrame with transformed data
+    Yields:
+        Transformed DataFrame chunks
     """
-    query = f'SELECT * FROM [{schema_name}].[{table_name}]'
+    query = f'SELECT {_select_list(columns)} FROM [{schema_name}].[{table_name}]'
+    if where:
+        query += f' WHERE {where}'
+    if order_by:
+        query += ' ORDER BY ' + ', '.join(f'[{col}]' for col in order_by)
+    sizer = batch_size if isinstance(batch_size, ChunkSizer) else ChunkSizer(batch_size)
+    # Compile the column type map once for all chunks of the table
+    plan = compile_normalization_plan(columns, 'mssql_type')
     
     logger.info(f"Extracting data from MSSQL table: {schema_name}.{table_name}")
     
-    # Read data in chunks
-    chunks = []
+    cursor = mssql_conn.cursor()
     try:
-        for chunk in pd.read_sql(query, mssql_conn, chunksize=batch_size):
-            # Transform data types
-            for col in columns:
-                col_name = col['name']
-                if col_name not in chunk.columns:
-                    continue
-                    
-                mssql_type = col['mssql_type'].lower()
-                
-                # Handle UNIQUEIDENTIFIER -> UUID (convert to string first)
-                if mssql_type == 'uniqueidentifier':
-                    chunk[col_name] = chunk[col_name].astype(str)
-                
-                # Handle BIT -> BOOLEAN
-                elif mssql_type == 'bit':
-                    chunk[col_name] = chunk[col_name].astype(bool)
-                
-                # Handle DATE/TIME types: coerce invalid to NaT, then convert to python datetime or None
-                elif mssql_type in ('datetime', 'datetime2', 'smalldatetime', 'date', 'datetimeoffset', 'time'):
-                    try:
-                        # Coerce to datetime where applicable; for 'time' keep as string then parse if needed
-                        if mssql_type == 'time':
-                            # Ensure strings and replace NaN/NaT with None
-                            chunk[col_name] = chunk[col_name].astype(object).where(pd.notnull(chunk[col_name]), None)
-                        else:
-                            series_dt = pd.to_datetime(chunk[col_name], errors='coerce', utc=False)
-                            # Convert to Python datetime (or None) to avoid 'NaT' literals reaching psycopg2
-                            chunk[col_name] = series_dt.apply(lambda v: v.to_pydatetime() if pd.notnull(v) else None)
-                    except Exception:
-                        # Fallback: ensure None for null-like values
-                        chunk[col_name] = chunk[col_name].where(pd.notnull(chunk[col_name]), None)
-                
-                # Handle NULL values for all other types
-                if mssql_type not in ('datetime', 'datetime2', 'smalldatetime', 'date', 'datetimeoffset', 'time'):
-                    chunk[col_name] = chunk[col_name].where(pd.notnull(chunk[col_name]), None)
-            
-            chunks.append(chunk)
-            
+        cursor.execute(query, *(params or []))
+        column_names = [d[0] for d in cursor.description]
+        while True:
+            rows = cursor.fetchmany(sizer.rows)
+            if not rows:
+                break
+            chunk = pd.DataFrame.from_records(rows, columns=column_names, coerce_float=True)
+            del rows
+            # Hash the rows as read before normalization changes them in place
+            source_hash = chunk_hash_aggregate(chunk, plan) if checksums is not None else None
+            chunk = _transform_chunk(chunk, columns, plan)
+            if checksums is not None:
+                checksums.add_chunk(source_hash, chunk, plan)
+            sizer.observe(chunk)
+            yield chunk
+    except Exception as e:
+        logger.error(f"Error extracting data from {table_name}: {e}")
+        raise
+    finally:
+        cursor.close()
+
+
+def iter_arrow_batches(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    batch_size: Union[int, ChunkSizer] = 10000,
+    where: Optional[str] = None,
+    params: Optional[List[Any]] = None,
+    checksums: Optional[ChunkChecksums] = None,
+    order_by: Optional[List[str]] = None
+) -> Iterator[pa.RecordBatch]:
+    """
+    Stream data from an MSSQL table as Arrow record batches.
+    
+    Rows are fetched with cursor.fetchmany() and converted column by column
+    into Arrow arrays typed after the PostgreSQL column types
+    (map_mssql_to_postgres_type), skipping pandas entirely.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_name: Table name
+        columns: Column metadata
+        batch_size: Rows per batch, or a ChunkSizer choosing the rows of each batch
+        where: Optional WHERE condition (without the WHERE keyword) using ? placeholders
+        params: Parameters for the placeholders in where
+        checksums: If set, hash each batch as fetched and as converted into this accumulator
+        order_by: Optional columns to read the rows in order of (e.g. the primary key)
+        
+    Yields:
+        Record batches
+    """
+    query = f'SELECT {_select_list(columns)} FROM [{schema_name}].[{table_name}]'
+    if where:
+        query += f' WHERE {where}'
+    if order_by:
+        query += ' ORDER BY ' + ', '.join(f'[{col}]' for col in order_by)
+    pg_types = {
+        col['name']: map_mssql_to_postgres_type(col['mssql_type'], col['max_length'], col['precision'], col['scale'])
+        for col in columns
+    }
+    plan = compile_normalization_plan(columns, 'mssql_type')
+    sizer = batch_size if isinstance(batch_size, ChunkSizer) else ChunkSizer(batch_size)
+    
+    logger.info(f"Extracting data from MSSQL table: {schema_name}.{table_name} (arrow)")
+    
+    cursor = mssql_conn.cursor()
+    try:
+        cursor.execute(query, *(params or []))
+        schema = arrow_schema([d[0] for d in cursor.description], pg_types)
+        while True:
+            rows = cursor.fetchmany(sizer.rows)
+            if not rows:
+                break
+            batch = rows_to_record_batch(rows, schema)
+            if checksums is not None:
+                add_batch_checksums(checksums, rows, batch, plan)
+            del rows
+            sizer.observe(batch)
+            yield batch
     except Exception as e:
         logger.error(f"Error extracting data from {table_name}: {e}")
         raise
+    finally:
+        cursor.close()
+
+
+def extract_and_transform_data(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    batch_size: int = 10000,
+    checksums: Optional[ChunkChecksums] = None,
+    where: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Extract data from MSSQL table and transform for PostgreSQL.
+    
+    Note: This materializes the whole table in memory. Prefer stream_table_to_postgres()
+    for large tables.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_name: Table name
+        columns: Column metadata
+        batch_size: Batch size for reading data
+        checksums: Optional accumulator for chunk checksums (see iter_transformed_chunks)
+        where: Optional WHERE condition for the source query (see iter_transformed_chunks)
+        
+    Returns:
+        DataFrame with transformed data
+    """
+    chunks = list(iter_transformed_chunks(
+        mssql_conn, schema_name, table_name, columns, batch_size, where=where, checksums=checksums
+    ))
     
     if not chunks:
         logger.warning(f"No data found in table: {schema_name}.{table_name}")
@@ -413,68 +787,52 @@ def load_data_to_postgres(
     pg_conn: psycopg2.extensions.connection,
     schema_name: str,
     table_name: str,
-    df: pd.DataFrame,
-    table_prefix: str = ''
+    df: Union[pd.DataFrame, pa.RecordBatch],
+    table_prefix: str = '',
+    key_columns: Optional[List[str]] = None,
+    commit: bool = True
 ) -> int:
     """
-    Load data into PostgreSQL table using bulk insert.
+    Load data into PostgreSQL table using COPY (see pg_bulk_loader).
     
     Args:
         pg_conn: PostgreSQL connection
         schema_name: Schema name
         table_name: Table name
-        df: DataFrame with data to insert
+        df: DataFrame or Arrow record batch with data to insert
         table_prefix: Optional prefix for table name
+        key_columns: If set, upsert by these (source) key columns with
+                     INSERT ... ON CONFLICT instead of appending
+        commit: If False, leave an appended chunk uncommitted for the caller to commit
+                (upserts always commit)
         
     Returns:
         Number of rows inserted
     """
-    if df.empty:
+    is_batch = isinstance(df, pa.RecordBatch)
+    if len(df) == 0:
         logger.info(f"No data to insert for table {table_name}")
         return 0
     
     try:
-        cursor = pg_conn.cursor()
         safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+        # Column names are sanitized the same way as in create_postgresql_table
+        source_columns = df.schema.names if is_batch else df.columns
+        column_names = [str(col).replace('-', '_').replace(' ', '_') for col in source_columns]
         
-        # Prepare data for bulk insert
-        # Convert DataFrame to list of tuples, replacing NaT/NaN with None
-        # This must be done carefully to avoid NaT being converted to string "NaT"
-        columns = list(df.columns)
-        data_tuples = []
-        
-        for _, row in df.iterrows():
-            # Convert each row to a tuple, handling NaT/NaN properly
-            row_values = []
-            for col in columns:
-                val = row[col]
-                # Check for pandas NaT/NaN and convert to None
-                if pd.isna(val) or val is pd.NaT:
-                    row_values.append(None)
-                # Convert pandas datetime to Python datetime
-                elif isinstance(val, pd.Timestamp):
-                    row_values.append(val.to_pydatetime())
-                # Convert numpy datetime64 to Python datetime
-                elif hasattr(val, 'to_pydatetime'):
-                    try:
-                        row_values.append(val.to_pydatetime())
-                    except (ValueError, AttributeError):
-                        row_values.append(None)
-                else:
-                    row_values.append(val)
-            data_tuples.append(tuple(row_values))
-        
-        # Use execute_values for efficient bulk insert
-        execute_values(
-            cursor,
-            f"INSERT INTO {schema_name}.{safe_table_name} ({','.join(columns)}) VALUES %s",
-            data_tuples,
-            page_size=1000
-        )
-        
-        pg_conn.commit()
-        rows_inserted = len(data_tuples)
-        cursor.close()
+        if key_columns:
+            safe_keys = [str(col).replace('-', '_').replace(' ', '_') for col in key_columns]
+            rows_inserted = upsert_dataframe_to_postgres(
+                pg_conn, schema_name, safe_table_name, df, safe_keys, column_names
+            )
+        elif is_batch:
+            rows_inserted = copy_record_batch_to_postgres(
+                pg_conn, schema_name, safe_table_name, df, column_names, commit=commit
+            )
+        else:
+            rows_inserted = copy_dataframe_to_postgres(
+                pg_conn, schema_name, safe_table_name, df, column_names, commit=commit
+            )
         
         logger.info(f"Inserted {rows_inserted} rows into {schema_name}.{safe_table_name}")
         return rows_inserted
@@ -485,16 +843,34 @@ def load_data_to_postgres(
         raise
 
 
-def validate_row_counts(
+def stream_table_to_postgres(
     mssql_conn: pyodbc.Connection,
     pg_conn: psycopg2.extensions.connection,
     schema_name: str,
     table_name: str,
     pg_schema_name: str,
-    table_prefix: str = ''
-) -> Tuple[int, int]:
+    columns: List[Dict[str, Any]],
+    batch_size: int = 10000,
+    table_prefix: str = '',
+    where: Optional[str] = None,
+    params: Optional[List[Any]] = None,
+    key_columns: Optional[List[str]] = None,
+    pg_table_name: Optional[str] = None,
+    checksums: Optional[ChunkChecksums] = None,
+    extract_backend: str = EXTRACT_BACKEND_PANDAS,
+    pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+    max_chunk_bytes: Optional[int] = None,
+    order_by: Optional[List[str]] = None,
+    checkpoint: Optional[Callable[[Union[pd.DataFrame, pa.RecordBatch], int], None]] = None
+) -> Dict[str, Any]:
     """
-    Validate row counts between MSSQL and PostgreSQL.
+    Stream an MSSQL table into PostgreSQL chunk by chunk.
+    
+    Chunks are read and transformed on a producer thread and loaded on this thread as
+    they arrive (see chunk_pipeline), so PostgreSQL is written to while the next chunk is
+    read from MSSQL, and peak memory is bounded by the chunk size and pipeline_depth
+    rather than the table size. With max_chunk_bytes, chunks are sized to that memory
+    budget instead of batch_size (see chunk_sizing).
     
     Args:
         mssql_conn: MSSQL connection
@@ -502,58 +878,825 @@ def validate_row_counts(
         schema_name: MSSQL schema name
         table_name: Table name
         pg_schema_name: PostgreSQL schema name
+        columns: Column metadata
+        batch_size: Number of rows per chunk (without max_chunk_bytes)
         table_prefix: Optional prefix for table name
+        where: Optional WHERE condition for the source query (see iter_transformed_chunks)
+        params: Parameters for the placeholders in where
+        key_columns: If set, upsert chunks by these key columns instead of appending
+        pg_table_name: PostgreSQL table to load, before table_prefix (default: table_name)
+        checksums: Optional accumulator for chunk checksums (see iter_transformed_chunks)
+        extract_backend: 'pandas' (iter_transformed_chunks) or 'arrow' (iter_arrow_batches)
+        pipeline_depth: Chunks buffered between extraction and load (0: read and load
+                        alternately on this thread)
+        max_chunk_bytes: Memory budget of one chunk; rows per chunk are derived from the
+                         column metadata and the measured size of the chunks read
+        order_by: Optional columns to read the rows in order of (see iter_transformed_chunks)
+        checkpoint: Called with each appended chunk and the rows loaded so far, before the
+                    chunk is committed; what it writes on pg_conn commits with the chunk
         
     Returns:
-        Tuple of (mssql_count, postgres_count)
+        Dictionary with load statistics:
+        {
+            "rows_synced": int,
+            "chunks": int,
+            "elapsed_seconds": float,
+            "rows_per_second": float,
+            "min_chunk_rows_per_second": float | None,
+            "max_chunk_rows_per_second": float | None,
+            "pipeline": {busy/idle seconds of extraction and load, "bottleneck"},
+            "chunk_sizing": {row width estimate and measurement} (with max_chunk_bytes)
+        }
     """
-    try:
-        # Get MSSQL count
-        mssql_cursor = mssql_conn.cursor()
-        mssql_cursor.execute(f'SELECT COUNT(*) FROM [{schema_name}].[{table_name}]')
-        mssql_count = mssql_cursor.fetchone()[0]
-        mssql_cursor.close()
-        
-        # Get PostgreSQL count
-        safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
-        pg_cursor = pg_conn.cursor()
-        pg_cursor.execute(f'SELECT COUNT(*) FROM {pg_schema_name}.{safe_table_name}')
-        pg_count = pg_cursor.fetchone()[0]
-        pg_cursor.close()
+    totals = {'rows_synced': 0, 'chunks': 0}
+    chunk_rates = []
+    started_at = time.perf_counter()
+    pg_table_name = pg_table_name or table_name
+    
+    def load_chunk(chunk: Union[pd.DataFrame, pa.RecordBatch], read_seconds: float) -> None:
+        load_started_at = time.perf_counter()
+        rows_inserted = load_data_to_postgres(
+            pg_conn, pg_schema_name, pg_table_name, chunk, table_prefix, key_columns,
+            commit=checkpoint is None
+        )
+        if checkpoint is not None:
+            try:
+                checkpoint(chunk, totals['rows_synced'] + rows_inserted)
+                pg_conn.commit()
+            except Exception:
+                pg_conn.rollback()
+                raise
+        load_seconds = time.perf_counter() - load_started_at
         
-        return mssql_count, pg_count
+        totals['chunks'] += 1
+        totals['rows_synced'] += rows_inserted
+        chunk_seconds = read_seconds + load_seconds
+        chunk_rate = rows_inserted / chunk_seconds if chunk_seconds > 0 else 0.0
+        chunk_rates.append(chunk_rate)
+        logger.info(
+            f"Chunk {totals['chunks']} of {table_name}: {rows_inserted} rows "
+            f"(read {read_seconds:.2f}s, load {load_seconds:.2f}s, {chunk_rate:.0f} rows/s), "
+            f"total {totals['rows_synced']} rows"
+        )
+    
+    sizer = ChunkSizer.for_columns(columns, 'mssql_type', batch_size, max_chunk_bytes)
+    iter_chunks = iter_arrow_batches if extract_backend == EXTRACT_BACKEND_ARROW else iter_transformed_chunks
+    pipeline_stats = run_chunk_pipeline(
+        iter_chunks(mssql_conn, schema_name, table_name, columns, sizer, where, params, checksums, order_by),
+        load_chunk, pipeline_depth, name=table_name
+    )
+    
+    elapsed_seconds = time.perf_counter() - started_at
+    rows_synced = totals['rows_synced']
+    if totals['chunks'] == 0:
+        logger.warning(f"No data found in table: {schema_name}.{table_name}")
+    
+    load_stats = {
+        'rows_synced': rows_synced,
+        'chunks': totals['chunks'],
+        'elapsed_seconds': round(elapsed_seconds, 3),
+        'rows_per_second': round(rows_synced / elapsed_seconds, 1) if elapsed_seconds > 0 else 0.0,
+        'min_chunk_rows_per_second': round(min(chunk_rates), 1) if chunk_rates else None,
+        'max_chunk_rows_per_second': round(max(chunk_rates), 1) if chunk_rates else None,
+        'pipeline': pipeline_stats
+    }
+    if sizer.adaptive:
+        load_stats['chunk_sizing'] = sizer.as_dict()
+    return load_stats
+
+
+def get_mssql_key_bounds(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str,
+    column_name: str,
+    where: Optional[str] = None
+) -> Tuple[Any, Any]:
+    """
+    Get MIN and MAX of a key column in one query.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_name: Table name
+        column_name: Key column name
+        where: Optional row filter the bounds are taken over
         
-    except Exception as e:
-        logger.error(f"Error validating row counts for {table_name}: {e}")
-        return -1, -1
+    Returns:
+        Tuple of (min_value, max_value); both None for an empty table
+    """
+    cursor = mssql_conn.cursor()
+    cursor.execute(
+        f'SELECT MIN([{column_name}]), MAX([{column_name}]) FROM [{schema_name}].[{table_name}]'
+        + (f' WHERE {where}' if where else '')
+    )
+    row = cursor.fetchone()
+    cursor.close()
+    return row[0], row[1]
 
 
-def get_mssql_config_from_connector(connector_name: str) -> Dict[str, str]:
+def get_mssql_histogram_steps(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str,
+    column_name: str
+) -> List[Tuple[Any, float]]:
     """
-    Extract MSSQL configuration from PYAIRBYTE_CONNECTOR_CONFIGS environment variable.
+    Read the statistics histogram of a column (SQL Server 2016 SP1+).
+    
+    Uses the first statistics object whose leading column is column_name.
     
     Args:
-        connector_name: Name of the connector to get configuration for
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_name: Table name
+        column_name: Key column name
         
     Returns:
-        Dictionary with MSSQL configuration keys: server, database, username, password, schema
+        List of (range_high_key, rows) steps in key order (empty if no statistics exist)
+    """
+    query = """
+        SELECT h.range_high_key, h.range_rows + h.equal_rows
+        FROM sys.stats s
+        JOIN sys.stats_columns sc
+            ON sc.object_id = s.object_id AND sc.stats_id = s.stats_id AND sc.stats_column_id = 1
+        CROSS APPLY sys.dm_db_stats_histogram(s.object_id, s.stats_id) h
+        WHERE s.object_id = OBJECT_ID(?)
+            AND sc.column_id = COLUMNPROPERTY(OBJECT_ID(?), ?, 'ColumnId')
+            AND s.stats_id = (
+                SELECT MIN(s2.stats_id)
+                FROM sys.stats s2
+                JOIN sys.stats_columns sc2
+                    ON sc2.object_id = s2.object_id AND sc2.stats_id = s2.stats_id AND sc2.stats_column_id = 1
+                WHERE s2.object_id = s.object_id AND sc2.column_id = sc.column_id
+            )
+        ORDER BY h.step_number
+    """
+    object_name = f'[{schema_name}].[{table_name}]'
+    cursor = mssql_conn.cursor()
+    cursor.execute(query, object_name, object_name, column_name)
+    steps = [(row[0], float(row[1])) for row in cursor.fetchall()]
+    cursor.close()
+    return steps
+
+
+def plan_mssql_key_ranges(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str,
+    column_name: str,
+    partitions: int,
+    strategy: str = PARTITION_STRATEGY_MINMAX,
+    where: Optional[str] = None
+) -> List[KeyRange]:
+    """
+    Split a table into key ranges for partitioned extraction.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_name: Table name
+        column_name: Integer or date key column
+        partitions: Number of ranges wanted
+        strategy: 'minmax' (equal-width ranges between MIN and MAX) or 'histogram'
+                  (equal row counts from column statistics, falls back to 'minmax')
+        where: Optional row filter; 'minmax' splits the key range of the filtered rows
         
-    Raises:
-        ValueError: If connector configuration is not found or invalid
+    Returns:
+        Contiguous key ranges covering all keys (a single unbounded range if the table
+        cannot be split)
     """
-    # Load connector-specific overrides from JSON env var (same pattern as pyairbyte_sync.py)
-    env_json = os.getenv('PYAIRBYTE_CONNECTOR_CONFIGS')
-    if not env_json:
-        raise ValueError(f"PYAIRBYTE_CONNECTOR_CONFIGS environment variable not set")
+    boundaries = []
+    if strategy == PARTITION_STRATEGY_HISTOGRAM:
+        try:
+            boundaries = histogram_boundaries(
+                get_mssql_histogram_steps(mssql_conn, schema_name, table_name, column_name), partitions
+            )
+        except Exception as e:
+            logger.warning(f"Could not read statistics histogram for {table_name}.{column_name}: {e}")
+        if not boundaries:
+            logger.info(f"No usable histogram for {table_name}.{column_name}, using MIN/MAX boundaries")
     
-    # Normalize value: trim and strip surrounding quotes if present
-    normalized = env_json.strip()
-    if (normalized.startswith("'") and normalized.endswith("'")) or (normalized.startswith('"') and normalized.endswith('"')):
-        normalized = normalized[1:-1]
+    if not boundaries:
+        min_value, max_value = get_mssql_key_bounds(mssql_conn, schema_name, table_name, column_name, where)
+        try:
+            boundaries = minmax_boundaries(min_value, max_value, partitions)
+        except TypeError as e:
+            logger.warning(f"Cannot split {table_name}.{column_name} into key ranges: {e}")
     
-    # Try JSON first, then YAML as a fallback
-    parsed_configs = None
-    try:
+    return ranges_from_boundaries(boundaries)
+
+
+def _key_range_condition(
+    column_name: str,
+    key_range: KeyRange,
+    include_nulls: bool
+) -> Tuple[Optional[str], List[Any]]:
+    """Build the WHERE condition and parameters selecting one key range."""
+    lower, upper = key_range
+    conditions = []
+    params = []
+    if lower is not None:
+        conditions.append(f'[{column_name}] >= ?')
+        params.append(lower)
+    if upper is not None:
+        conditions.append(f'[{column_name}] < ?')
+        params.append(upper)
+    if not conditions:
+        return None, []
+    condition = ' AND '.join(conditions)
+    if include_nulls:
+        condition = f'([{column_name}] IS NULL OR {condition})'
+    return condition, params
+
+
+def stream_table_partitioned_to_postgres(
+    mssql_pool: ConnectionPool,
+    pg_pool: ConnectionPool,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    columns: List[Dict[str, Any]],
+    key_column: str,
+    key_ranges: List[KeyRange],
+    batch_size: int = 10000,
+    table_prefix: str = '',
+    pg_table_name: Optional[str] = None,
+    checksums: Optional[ChunkChecksums] = None,
+    extract_backend: str = EXTRACT_BACKEND_PANDAS,
+    pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+    max_chunk_bytes: Optional[int] = None,
+    where: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Extract key ranges of one MSSQL table in parallel and load them into the same PostgreSQL table.
+    
+    Each range is streamed by stream_table_to_postgres() on its own MSSQL and PostgreSQL
+    connection. The target table must already exist. Rows with a NULL key are read by the
+    first range.
+    
+    Args:
+        mssql_pool: Pool providing one MSSQL connection per concurrent range
+        pg_pool: Pool providing one PostgreSQL connection per concurrent range
+        schema_name: MSSQL schema name
+        table_name: Table name
+        pg_schema_name: PostgreSQL schema name
+        columns: Column metadata
+        key_column: Column the ranges are defined on
+        key_ranges: Contiguous key ranges from plan_mssql_key_ranges()
+        batch_size: Number of rows per chunk
+        table_prefix: Optional prefix for table name
+        pg_table_name: PostgreSQL table to load, before table_prefix (default: table_name)
+        checksums: Optional accumulator; each partition hashes into its own and they
+                   are merged into this one
+        extract_backend: 'pandas' or 'arrow' (see stream_table_to_postgres)
+        pipeline_depth: Chunks buffered between extraction and load of each partition
+        max_chunk_bytes: Memory budget of one chunk of each partition
+        where: Optional row filter applied to every partition (without ? placeholders)
+        
+    Returns:
+        Combined load statistics (same keys as stream_table_to_postgres, with the
+        pipeline times summed over partitions) plus 'partitions', a list with the range
+        and statistics of each partition
+        
+    Raises:
+        Exception: The first partition error, after all partitions have finished
+    """
+    key_nullable = any(col['name'] == key_column and col.get('is_nullable') for col in columns)
+    partition_checksums = [ChunkChecksums() if checksums is not None else None for _ in key_ranges]
+    started_at = time.perf_counter()
+    
+    def load_range(index: int, key_range: KeyRange) -> Dict[str, Any]:
+        range_condition, params = _key_range_condition(key_column, key_range, key_nullable and index == 0)
+        logger.info(f"Partition {index + 1}/{len(key_ranges)} of {table_name}: {key_column} in {describe_range(key_range)}")
+        with mssql_pool.connection() as mssql_conn, pg_pool.connection() as pg_conn:
+            stats = stream_table_to_postgres(
+                mssql_conn, pg_conn, schema_name, table_name, pg_schema_name,
+                columns, batch_size, table_prefix, where=combine_conditions(where, range_condition), params=params,
+                pg_table_name=pg_table_name, checksums=partition_checksums[index],
+                extract_backend=extract_backend, pipeline_depth=pipeline_depth,
+                max_chunk_bytes=max_chunk_bytes
+            )
+        stats['key_range'] = describe_range(key_range)
+        return stats
+    
+    with ThreadPoolExecutor(max_workers=len(key_ranges), thread_name_prefix=f'{table_name}-part') as executor:
+        futures = [executor.submit(load_range, i, key_range) for i, key_range in enumerate(key_ranges)]
+        partition_stats = []
+        first_error = None
+        for future in futures:
+            try:
+                partition_stats.append(future.result())
+            except Exception as e:
+                logger.error(f"Partition of {table_name} failed: {e}")
+                first_error = first_error or e
+    
+    if first_error is not None:
+        raise first_error
+    
+    if checksums is not None:
+        for partition in partition_checksums:
+            checksums.merge(partition)
+    
+    elapsed_seconds = time.perf_counter() - started_at
+    rows_synced = sum(stats['rows_synced'] for stats in partition_stats)
+    chunk_min_rates = [s['min_chunk_rows_per_second'] for s in partition_stats if s['min_chunk_rows_per_second'] is not None]
+    chunk_max_rates = [s['max_chunk_rows_per_second'] for s in partition_stats if s['max_chunk_rows_per_second'] is not None]
+    
+    return {
+        'rows_synced': rows_synced,
+        'chunks': sum(stats['chunks'] for stats in partition_stats),
+        'elapsed_seconds': round(elapsed_seconds, 3),
+        'rows_per_second': round(rows_synced / elapsed_seconds, 1) if elapsed_seconds > 0 else 0.0,
+        'min_chunk_rows_per_second': min(chunk_min_rates) if chunk_min_rates else None,
+        'max_chunk_rows_per_second': max(chunk_max_rates) if chunk_max_rates else None,
+        'pipeline': combine_pipeline_stats([stats['pipeline'] for stats in partition_stats]),
+        'partitions': partition_stats
+    }
+
+
+def get_mssql_max_value(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str,
+    column_name: str,
+    where: Optional[str] = None
+) -> Any:
+    """
+    Get the current maximum value of a column (the high-watermark for incremental syncs).
+    
+    Args:
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_name: Table name
+        column_name: Column name
+        where: Optional row filter the maximum is taken over
+        
+    Returns:
+        The maximum value, or None if the table is empty
+    """
+    cursor = mssql_conn.cursor()
+    cursor.execute(
+        f'SELECT MAX([{column_name}]) FROM [{schema_name}].[{table_name}]' + (f' WHERE {where}' if where else '')
+    )
+    value = cursor.fetchone()[0]
+    cursor.close()
+    return value
+
+
+def sync_mssql_table_incremental(
+    mssql_conn: pyodbc.Connection,
+    pg_conn: psycopg2.extensions.connection,
+    connector_name: str,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    columns: List[Dict[str, Any]],
+    table_config: Dict[str, Any],
+    batch_size: int = 10000,
+    table_prefix: str = '',
+    primary_key: Optional[List[str]] = None,
+    checksums: Optional[ChunkChecksums] = None
+) -> Dict[str, Any]:
+    """
+    Incrementally sync an MSSQL table using a high-watermark column.
+    
+    The first sync (or a sync after the target table was dropped) creates the table with
+    its primary key and loads all rows. Later syncs only read rows with
+    last_watermark < watermark_column <= current MAX(watermark_column) and upsert them by
+    primary key with INSERT ... ON CONFLICT. The new watermark is stored in the cache
+    schema's sync_metadata table once the load has completed.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        pg_conn: PostgreSQL connection
+        connector_name: Connector name (key for the stored watermark)
+        schema_name: MSSQL schema name
+        table_name: Table name
+        pg_schema_name: PostgreSQL schema name
+        columns: Column metadata
+        table_config: Per-table config with 'watermark_column' (e.g. a rowversion or
+                      modified_at column) and optional 'primary_key' and 'where'
+        batch_size: Number of rows per chunk
+        table_prefix: Optional prefix for table name
+        primary_key: Source primary key from the sync's catalog (read from MSSQL if None)
+        checksums: Optional accumulator for chunk checksums (see iter_transformed_chunks)
+        
+    Returns:
+        Dictionary with rows_synced, load_stats, watermark_column, previous_watermark,
+        watermark and full_reload
+        
+    Raises:
+        ValueError: If the incremental config is invalid
+        Exception: If extraction or loading fails (the stored watermark is left unchanged)
+    """
+    sync_started_at = datetime.now()
+    watermark_column, key_columns = resolve_incremental_config(
+        table_name, table_config, columns,
+        lambda: primary_key if primary_key is not None else get_mssql_primary_key(mssql_conn, schema_name, table_name)
+    )
+    safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+    extract_backend = table_config.get('extract_backend', EXTRACT_BACKEND_PANDAS)
+    pipeline_depth = int(table_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH))
+    max_chunk_bytes = table_config.get('max_chunk_bytes')
+    row_filter = table_config.get('where')
+    
+    ensure_sync_metadata_table(pg_conn, pg_schema_name)
+    last_watermark = get_last_watermark(pg_conn, pg_schema_name, connector_name, table_name, watermark_column)
+    full_reload = last_watermark is None or not postgres_table_exists(pg_conn, pg_schema_name, safe_table_name)
+    if not full_reload and loaded_columns_differ(postgres_table_columns(pg_conn, pg_schema_name, safe_table_name), columns):
+        # Upserts need the loaded table to have exactly the columns read
+        logger.info(f"Columns of {table_name} changed since the last sync, loading all rows")
+        full_reload = True
+    
+    try:
+        high_watermark = get_mssql_max_value(mssql_conn, schema_name, table_name, watermark_column, row_filter)
+        
+        if full_reload:
+            logger.info(f"No usable watermark for {table_name}, loading all rows")
+            if not create_postgresql_table(
+                pg_conn, pg_schema_name, table_name, columns, table_prefix, primary_key=key_columns
+            ):
+                raise Exception("Failed to create PostgreSQL table")
+            load_stats = stream_table_to_postgres(
+                mssql_conn, pg_conn, schema_name, table_name, pg_schema_name,
+                columns, batch_size, table_prefix, where=row_filter, checksums=checksums,
+                extract_backend=extract_backend, pipeline_depth=pipeline_depth, max_chunk_bytes=max_chunk_bytes
+            )
+        elif high_watermark is None:
+            load_stats = {'rows_synced': 0, 'chunks': 0}
+        else:
+            logger.info(
+                f"Loading rows of {table_name} with {watermark_column} in "
+                f"({describe_watermark(last_watermark)}, {describe_watermark(high_watermark)}]"
+            )
+            load_stats = stream_table_to_postgres(
+                mssql_conn, pg_conn, schema_name, table_name, pg_schema_name,
+                columns, batch_size, table_prefix,
+                where=combine_conditions(row_filter, f'[{watermark_column}] > ? AND [{watermark_column}] <= ?'),
+                params=[last_watermark, high_watermark],
+                key_columns=key_columns,
+                checksums=checksums,
+                extract_backend=extract_backend,
+                pipeline_depth=pipeline_depth,
+                max_chunk_bytes=max_chunk_bytes
+            )
+    except Exception as e:
+        pg_conn.rollback()
+        try:
+            record_table_sync(
+                pg_conn, pg_schema_name, connector_name, table_name, 'failed', 0,
+                sync_started_at, watermark_column, None, str(e)
+            )
+        except Exception as record_error:
+            logger.warning(f"Could not record failed sync of {table_name}: {record_error}")
+        raise
+    
+    new_watermark = high_watermark if high_watermark is not None else last_watermark
+    record_table_sync(
+        pg_conn, pg_schema_name, connector_name, table_name, 'completed',
+        load_stats['rows_synced'], sync_started_at, watermark_column, new_watermark
+    )
+    
+    return {
+        'rows_synced': load_stats['rows_synced'],
+        'load_stats': load_stats,
+        'watermark_column': watermark_column,
+        'previous_watermark': describe_watermark(last_watermark),
+        'watermark': describe_watermark(new_watermark),
+        'full_reload': full_reload
+    }
+
+
+def validate_row_counts(
+    mssql_conn: pyodbc.Connection,
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    table_prefix: str = '',
+    where: Optional[str] = None
+) -> Tuple[int, int]:
+    """
+    Validate row counts between MSSQL and PostgreSQL.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        pg_conn: PostgreSQL connection
+        schema_name: MSSQL schema name
+        table_name: Table name
+        pg_schema_name: PostgreSQL schema name
+        table_prefix: Optional prefix for table name
+        where: Optional row filter the MSSQL rows are counted with
+        
+    Returns:
+        Tuple of (mssql_count, postgres_count)
+    """
+    try:
+        # Get MSSQL count
+        mssql_cursor = mssql_conn.cursor()
+        mssql_cursor.execute(
+            f'SELECT COUNT(*) FROM [{schema_name}].[{table_name}]' + (f' WHERE {where}' if where else '')
+        )
+        mssql_count = mssql_cursor.fetchone()[0]
+        mssql_cursor.close()
+        
+        # Get PostgreSQL count
+        safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+        pg_cursor = pg_conn.cursor()
+        pg_cursor.execute(f'SELECT COUNT(*) FROM {pg_schema_name}.{safe_table_name}')
+        pg_count = pg_cursor.fetchone()[0]
+        pg_cursor.close()
+        
+        return mssql_count, pg_count
+        
+    except Exception as e:
+        logger.error(f"Error validating row counts for {table_name}: {e}")
+        return -1, -1
+
+
+def get_mssql_table_fingerprint(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    table_config: Dict[str, Any]
+) -> str:
+    """
+    Read a fingerprint of a table's current contents for change detection.
+    
+    'checksum' aggregates BINARY_CHECKSUM(*) of all rows with CHECKSUM_AGG: one scan on
+    the server and a single row returned. BINARY_CHECKSUM skips text, ntext, image and xml
+    columns, so changes limited to those are not seen. 'rowversion' reads MAX() of the
+    table's rowversion column (or table_config['fingerprint_column']), which SQL Server
+    bumps on every insert and update; the row count covers deletes. Both only look at the
+    rows matching the table's 'where' filter, and 'checksum' only at the projected columns;
+    a hash of the projection is appended so changing it reloads the table.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_name: Table name
+        columns: Column metadata (projected)
+        table_config: Per-table config with 'change_detection' and optional 'fingerprint_column'
+        
+    Returns:
+        Fingerprint string (see format_fingerprint)
+        
+    Raises:
+        ValueError: If the mode is unknown or the table has no rowversion column
+    """
+    mode = table_config.get('change_detection')
+    row_filter = table_config.get('where')
+    if mode == CHANGE_DETECTION_CHECKSUM:
+        checksum_columns = _select_list(columns) if table_config.get('columns') is not None else '*'
+        query = f'SELECT COUNT_BIG(*), CHECKSUM_AGG(BINARY_CHECKSUM({checksum_columns})) FROM [{schema_name}].[{table_name}]'
+    elif mode == CHANGE_DETECTION_ROWVERSION:
+        column_name = table_config.get('fingerprint_column') or next(
+            (col['name'] for col in columns if col['mssql_type'] in ('timestamp', 'rowversion')), None
+        )
+        if not column_name:
+            raise ValueError(
+                f"Table {table_name} has no rowversion column; set 'fingerprint_column' "
+                f"or use change_detection '{CHANGE_DETECTION_CHECKSUM}'"
+            )
+        query = f'SELECT COUNT_BIG(*), MAX([{column_name}]) FROM [{schema_name}].[{table_name}]'
+    else:
+        raise ValueError(f"Unknown change_detection '{mode}' for table {table_name}")
+    if row_filter:
+        query += f' WHERE {row_filter}'
+    
+    cursor = mssql_conn.cursor()
+    cursor.execute(query)
+    row_count, value = cursor.fetchone()
+    cursor.close()
+    fingerprint = format_fingerprint(mode, row_count, value)
+    signature = projection_signature(table_config)
+    return f"{fingerprint}:{signature}" if signature else fingerprint
+
+
+def get_mssql_row_count_estimate(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str
+) -> Optional[int]:
+    """
+    Get the row count of a table from sys.dm_db_partition_stats without scanning it.
+    
+    The count is maintained by SQL Server for every heap and clustered index, so it is
+    exact once in-flight transactions have committed.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_name: Table name
+        
+    Returns:
+        Row count, or None for views or without VIEW DATABASE STATE permission
+    """
+    try:
+        cursor = mssql_conn.cursor()
+        cursor.execute(
+            'SELECT SUM(row_count) FROM sys.dm_db_partition_stats '
+            'WHERE object_id = OBJECT_ID(?) AND index_id IN (0, 1)',
+            f'[{schema_name}].[{table_name}]'
+        )
+        row = cursor.fetchone()
+        cursor.close()
+        return int(row[0]) if row and row[0] is not None else None
+    except Exception as e:
+        logger.warning(f"Could not read row count statistics for {table_name}: {e}")
+        return None
+
+
+def get_mssql_table_sizes(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_names: List[str]
+) -> Dict[str, Dict[str, int]]:
+    """
+    Get row counts and data sizes of tables from sys.dm_db_partition_stats in one query.
+    
+    Rows and used pages (in-row, row-overflow and LOB) of each heap or clustered index
+    are summed over its partitions; nonclustered indexes are not counted.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        schema_name: Schema name
+        table_names: Table names
+        
+    Returns:
+        Dictionary {table: {"rows": int, "bytes": int}}; views, missing tables and all
+        tables without VIEW DATABASE STATE permission are left out
+    """
+    try:
+        cursor = mssql_conn.cursor()
+        cursor.execute(
+            'SELECT t.name, SUM(ps.row_count), SUM(ps.used_page_count) * 8192 '
+            'FROM sys.dm_db_partition_stats ps '
+            'JOIN sys.tables t ON t.object_id = ps.object_id '
+            'JOIN sys.schemas s ON s.schema_id = t.schema_id '
+            'WHERE s.name = ? AND ps.index_id IN (0, 1) '
+            'GROUP BY t.name',
+            schema_name
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+    except Exception as e:
+        logger.warning(f"Could not read table size statistics of schema {schema_name}: {e}")
+        return {}
+    wanted = set(table_names)
+    return {
+        name: {'rows': int(row_count or 0), 'bytes': int(data_bytes or 0)}
+        for name, row_count, data_bytes in rows if name in wanted
+    }
+
+
+def _partitionable_tables(
+    catalog: SourceCatalog,
+    table_names: List[str],
+    table_configs: Dict[str, Dict[str, Any]],
+    streaming: bool
+) -> Set[str]:
+    """
+    Tables the sync planner may split into key ranges.
+    
+    Those are streamed full-refresh tables without checkpoints whose 'partition_column'
+    (default: the single-column primary key) is read and has an integer or date type.
+    """
+    if not streaming:
+        return set()
+    partitionable = set()
+    for table_name in table_names:
+        table_config = table_configs.get(table_name) or {}
+        if table_config.get('sync_mode', SYNC_MODE_FULL_REFRESH) != SYNC_MODE_FULL_REFRESH or table_config.get('resumable'):
+            continue
+        key_column = table_config.get('partition_column')
+        if not key_column:
+            primary_key = catalog.primary_key(table_name)
+            if len(primary_key) != 1:
+                continue
+            key_column = primary_key[0]
+        selected = table_config.get('columns')
+        if selected is not None and key_column not in ([selected] if isinstance(selected, str) else selected):
+            continue
+        key_type = next((col['mssql_type'].lower() for col in catalog.columns(table_name) if col['name'] == key_column), None)
+        if key_type in PARTITIONABLE_MSSQL_TYPES:
+            partitionable.add(table_name)
+    return partitionable
+
+
+def get_postgres_row_count(
+    pg_conn: psycopg2.extensions.connection,
+    pg_schema_name: str,
+    table_name: str,
+    table_prefix: str = ''
+) -> int:
+    """Count the rows of a PostgreSQL table (-1 on error)."""
+    try:
+        safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+        pg_cursor = pg_conn.cursor()
+        pg_cursor.execute(f'SELECT COUNT(*) FROM {pg_schema_name}.{safe_table_name}')
+        pg_count = pg_cursor.fetchone()[0]
+        pg_cursor.close()
+        return pg_count
+    except Exception as e:
+        logger.error(f"Error counting PostgreSQL rows for {table_name}: {e}")
+        pg_conn.rollback()
+        return -1
+
+
+def verify_mssql_load(
+    mssql_conn: pyodbc.Connection,
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    table_prefix: str,
+    table_config: Dict[str, Any],
+    rows_loaded: Optional[int],
+    checksums: Optional[ChunkChecksums] = None
+) -> Dict[str, Any]:
+    """
+    Verify a loaded table without scanning the source.
+    
+    In 'stats' and 'checksum' mode the rows PostgreSQL reported for the COPYs are compared
+    with the row count from SQL Server's partition statistics; 'count' runs SELECT COUNT(*)
+    on both sides. Without usable statistics (views, missing permission) the COUNT(*)
+    check is used, and so it is for tables with a 'where' filter, whose loaded rows the
+    table's statistics do not count.
+    
+    Args:
+        mssql_conn: MSSQL connection
+        pg_conn: PostgreSQL connection
+        schema_name: MSSQL schema name
+        table_name: Table name
+        pg_schema_name: PostgreSQL schema name
+        table_prefix: Optional prefix for table name
+        table_config: Per-table settings ('verification', 'verification_tolerance', 'where')
+        rows_loaded: Rows now in the PostgreSQL table if known from the load (None to count them)
+        checksums: Chunk checksums collected during the load ('checksum' mode)
+        
+    Returns:
+        Dictionary with mode, source_rows, loaded_rows, matched and checksum (or None)
+    """
+    mode = table_config.get('verification', VERIFICATION_STATS)
+    tolerance = float(table_config.get('verification_tolerance', 0.0))
+    row_filter = table_config.get('where')
+    
+    source_rows = None
+    if mode != VERIFICATION_COUNT and not row_filter:
+        source_rows = get_mssql_row_count_estimate(mssql_conn, schema_name, table_name)
+        if source_rows is None:
+            logger.info(f"No row count statistics for {table_name}, counting rows")
+    
+    if source_rows is None:
+        mode, tolerance = VERIFICATION_COUNT, 0.0
+        source_rows, loaded_rows = validate_row_counts(
+            mssql_conn, pg_conn, schema_name, table_name, pg_schema_name, table_prefix, row_filter
+        )
+    elif rows_loaded is None:
+        loaded_rows = get_postgres_row_count(pg_conn, pg_schema_name, table_name, table_prefix)
+    else:
+        loaded_rows = rows_loaded
+    
+    return {
+        'mode': mode,
+        'source_rows': source_rows,
+        'loaded_rows': loaded_rows,
+        'matched': compare_row_counts(source_rows, loaded_rows, tolerance),
+        'checksum': checksums.as_dict() if checksums is not None else None
+    }
+
+
+def get_mssql_config_from_connector(connector_name: str) -> Dict[str, str]:
+    """
+    Extract MSSQL configuration from PYAIRBYTE_CONNECTOR_CONFIGS environment variable.
+    
+    Args:
+        connector_name: Name of the connector to get configuration for
+        
+    Returns:
+        Dictionary with MSSQL configuration keys: server, database, username, password, schema,
+        table_configs (per-table sync settings, see sync_mssql_tables), and the defaults for
+        all tables extract_backend, change_detection, pipeline_depth and max_chunk_bytes
+        
+    Raises:
+        ValueError: If connector configuration is not found or invalid
+    """
+    # Load connector-specific overrides from JSON env var (same pattern as pyairbyte_sync.py)
+    env_json = os.getenv('PYAIRBYTE_CONNECTOR_CONFIGS')
+    if not env_json:
+        raise ValueError(f"PYAIRBYTE_CONNECTOR_CONFIGS environment variable not set")
+    
+    # Normalize value: trim and strip surrounding quotes if present
+    normalized = env_json.strip()
+    if (normalized.startswith("'") and normalized.endswith("'")) or (normalized.startswith('"') and normalized.endswith('"')):
+        normalized = normalized[1:-1]
+    
+    # Try JSON first, then YAML as a fallback
+    parsed_configs = None
+    try:
         parsed_configs = json.loads(normalized)
     except Exception:
         try:
@@ -580,19 +1723,603 @@ def get_mssql_config_from_connector(connector_name: str) -> Dict[str, str]:
         'database': connector_config['database'],
         'username': connector_config['username'],
         'password': connector_config['password'],
-        'schema': connector_config.get('schema', 'dbo')
+        'schema': connector_config.get('schema', 'dbo'),
+        'table_configs': connector_config.get('table_configs') or {},
+        'extract_backend': connector_config.get('extract_backend', EXTRACT_BACKEND_PANDAS),
+        'change_detection': connector_config.get('change_detection'),
+        'pipeline_depth': connector_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH),
+        'max_chunk_bytes': connector_config.get('max_chunk_bytes'),
+        'resumable': connector_config.get('resumable', False)
     }
     
     logger.info(f"Loaded MSSQL configuration for connector '{connector_name}' from PYAIRBYTE_CONNECTOR_CONFIGS")
     return mssql_config
 
 
+def _resolve_partition_column(
+    mssql_conn: pyodbc.Connection,
+    schema_name: str,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    table_config: Dict[str, Any],
+    primary_key: List[str]
+) -> Optional[str]:
+    """
+    Pick the key column for partitioned extraction.
+    
+    Uses 'partition_column' from the table config, else a single-column primary key.
+    The column must have an integer or date type.
+    
+    Returns:
+        Column name, or None if the table cannot be partitioned
+    """
+    key_column = table_config.get('partition_column')
+    if not key_column:
+        if len(primary_key) != 1:
+            logger.warning(f"{table_name} has no single-column primary key, extracting without partitions")
+            return None
+        key_column = primary_key[0]
+    
+    key_type = next((col['mssql_type'].lower() for col in columns if col['name'] == key_column), None)
+    if key_type not in PARTITIONABLE_MSSQL_TYPES:
+        logger.warning(
+            f"Partition column {table_name}.{key_column} has type {key_type}; "
+            f"only integer and date keys can be split, extracting without partitions"
+        )
+        return None
+    return key_column
+
+
+def _load_full_refresh(
+    mssql_conn: pyodbc.Connection,
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    columns: List[Dict[str, Any]],
+    primary_key: List[str],
+    table_config: Dict[str, Any],
+    batch_size: int,
+    table_prefix: str,
+    pg_table_name: str,
+    streaming: bool,
+    mssql_connect: Optional[Callable[[], pyodbc.Connection]],
+    pg_connect: Optional[Callable[[], psycopg2.extensions.connection]],
+    checksums: Optional[ChunkChecksums] = None
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Load all rows of an MSSQL table into an existing, empty PostgreSQL table.
+
+    Uses partitioned extraction when the table config asks for it and the table has a
+    suitable key, else streams chunk by chunk (or loads in one go if streaming is off).
+    The 'extract_backend', 'pipeline_depth' and 'max_chunk_bytes' of the table config
+    apply when streaming; its 'where' filter applies to every read.
+
+    Args:
+        primary_key: Source primary key (default partition column)
+        pg_table_name: PostgreSQL table to load, before table_prefix (the live table
+                       or its shadow)
+        checksums: Optional accumulator for chunk checksums (see iter_transformed_chunks)
+        See sync_mssql_table for the other arguments.
+
+    Returns:
+        Tuple of (rows loaded, load statistics or None when not streaming)
+    """
+    partitions = int(table_config.get('partitions', 1))
+    extract_backend = table_config.get('extract_backend', EXTRACT_BACKEND_PANDAS)
+    pipeline_depth = int(table_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH))
+    max_chunk_bytes = table_config.get('max_chunk_bytes')
+    row_filter = table_config.get('where')
+    key_column = None
+    if partitions > 1:
+        key_column = _resolve_partition_column(mssql_conn, schema_name, table_name, columns, table_config, primary_key)
+        if key_column and not (streaming and mssql_connect and pg_connect):
+            logger.warning(f"Partitioned extraction of {table_name} needs streaming and connection factories")
+            key_column = None
+
+    if key_column:
+        # Extract key ranges in parallel, each on its own connections
+        key_ranges = plan_mssql_key_ranges(
+            mssql_conn, schema_name, table_name, key_column, partitions,
+            table_config.get('partition_strategy', PARTITION_STRATEGY_MINMAX), row_filter
+        )
+        mssql_pool = ConnectionPool(mssql_connect, len(key_ranges), name=f'mssql-{table_name}')
+        pg_pool = ConnectionPool(
+            pg_connect, len(key_ranges), name=f'postgres-{table_name}', reset=lambda conn: conn.rollback()
+        )
+        try:
+            load_stats = stream_table_partitioned_to_postgres(
+                mssql_pool, pg_pool, schema_name, table_name, pg_schema_name,
+                columns, key_column, key_ranges, batch_size, table_prefix, pg_table_name, checksums,
+                extract_backend, pipeline_depth, max_chunk_bytes, row_filter
+            )
+        finally:
+            mssql_pool.close_all()
+            pg_pool.close_all()
+        logger.info(
+            f"Loaded {load_stats['rows_synced']} rows into {table_name} from {len(key_ranges)} key ranges "
+            f"({load_stats['rows_per_second']} rows/s)"
+        )
+        return load_stats['rows_synced'], load_stats
+
+    if streaming:
+        # Extract, transform and load chunk by chunk
+        load_stats = stream_table_to_postgres(
+            mssql_conn, pg_conn, schema_name, table_name, pg_schema_name,
+            columns, batch_size, table_prefix, where=row_filter, pg_table_name=pg_table_name, checksums=checksums,
+            extract_backend=extract_backend, pipeline_depth=pipeline_depth, max_chunk_bytes=max_chunk_bytes
+        )
+        logger.info(
+            f"Streamed {load_stats['rows_synced']} rows into {table_name} in {load_stats['chunks']} chunks "
+            f"({load_stats['rows_per_second']} rows/s, bottleneck: {load_stats['pipeline']['bottleneck']})"
+        )
+        return load_stats['rows_synced'], load_stats
+
+    # Extract and transform data
+    df = extract_and_transform_data(mssql_conn, schema_name, table_name, columns, batch_size, checksums, row_filter)
+
+    # Load data to PostgreSQL
+    return load_data_to_postgres(pg_conn, pg_schema_name, pg_table_name, df, table_prefix), None
+
+
+def _resolve_resume_key(
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    table_config: Dict[str, Any],
+    primary_key: List[str]
+) -> Optional[List[str]]:
+    """
+    Pick the key a resumable load is ordered and checkpointed by.
+
+    Uses 'primary_key' from the table config, else the source primary key. Every key
+    column must have a type in RESUMABLE_KEY_MSSQL_TYPES.
+
+    Returns:
+        Key column names, or None if the table cannot be loaded with checkpoints
+    """
+    key_columns = table_config.get('primary_key') or primary_key
+    if isinstance(key_columns, str):
+        key_columns = [key_columns]
+    if not key_columns:
+        logger.warning(f"{table_name} has no primary key, loading without checkpoints")
+        return None
+    key_types = {col['name']: col['mssql_type'].lower() for col in columns}
+    unsupported = [col for col in key_columns if key_types.get(col) not in RESUMABLE_KEY_MSSQL_TYPES]
+    if unsupported:
+        logger.warning(
+            f"Key columns {unsupported} of {table_name} cannot be checkpointed "
+            f"(types: {[key_types.get(col) for col in unsupported]}), loading without checkpoints"
+        )
+        return None
+    return list(key_columns)
+
+
+def _keyset_condition(key_columns: List[str], key_types: Optional[Dict[str, str]] = None) -> str:
+    """
+    WHERE condition selecting the rows after a key, in key order.
+
+    T-SQL has no row-value comparison, so (a, b) > (?, ?) is spelled out as
+    (a > ?) OR (a = ? AND b > ?); see _keyset_params for the matching parameters.
+
+    pyodbc binds Python datetimes as datetime2, and from compatibility level 130 a datetime
+    column is compared with it converted exactly (.003 becomes .0033333), so the last
+    loaded row would compare greater than its own key. Parameters of datetime columns
+    (per key_types, lower-case MSSQL types) are therefore cast back to datetime.
+    """
+    key_types = key_types or {}
+
+    def placeholder(col: str) -> str:
+        return 'CAST(? AS datetime)' if key_types.get(col) == 'datetime' else '?'
+
+    terms = []
+    for position, column in enumerate(key_columns):
+        equal = [f'[{col}] = {placeholder(col)}' for col in key_columns[:position]]
+        terms.append('(' + ' AND '.join(equal + [f'[{column}] > {placeholder(column)}']) + ')')
+    return '(' + ' OR '.join(terms) + ')'
+
+
+def _keyset_params(key_values: List[Any]) -> List[Any]:
+    """Parameters of _keyset_condition for the key values of the last loaded row."""
+    params = []
+    for position in range(len(key_values)):
+        params.extend(key_values[:position + 1])
+    return params
+
+
+def _chunk_last_key(chunk: Union[pd.DataFrame, pa.RecordBatch], key_columns: List[str]) -> List[Any]:
+    """Key values of the last row of a chunk, as plain Python values."""
+    if isinstance(chunk, pa.RecordBatch):
+        return [chunk.column(chunk.schema.get_field_index(col))[chunk.num_rows - 1].as_py() for col in key_columns]
+    key_values = []
+    for col in key_columns:
+        value = chunk[col].iloc[-1]
+        if isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime()
+        elif isinstance(value, np.generic):
+            value = value.item()
+        key_values.append(value)
+    return key_values
+
+
+def _find_resume_checkpoint(
+    pg_conn: psycopg2.extensions.connection,
+    pg_schema_name: str,
+    connector_name: str,
+    table_name: str,
+    key_columns: List[str],
+    pg_table_name: str,
+    table_prefix: str,
+    columns: Optional[List[Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the checkpoint of an unfinished load of a table, if that load can be continued.
+
+    The partly loaded table must still exist and hold exactly the rows the checkpoint
+    counts: an UNLOGGED shadow table is emptied by a PostgreSQL crash, and a later load
+    without checkpoints may have replaced it. If columns are given, it must also have
+    those columns (the table's projection may have changed since).
+
+    Returns:
+        The checkpoint (see get_resume_checkpoint), or None to load from the start
+    """
+    resume = get_resume_checkpoint(pg_conn, pg_schema_name, connector_name, table_name)
+    if resume is None:
+        return None
+    safe_table_name = f"{table_prefix}{pg_table_name}".replace('-', '_').replace(' ', '_')
+    if len(resume['key']) != len(key_columns):
+        logger.warning(f"Checkpoint of {table_name} was taken with another key, loading from the start")
+        return None
+    if not postgres_table_exists(pg_conn, pg_schema_name, safe_table_name):
+        logger.warning(f"Partly loaded table {safe_table_name} is gone, loading {table_name} from the start")
+        return None
+    if columns is not None and loaded_columns_differ(
+        postgres_table_columns(pg_conn, pg_schema_name, safe_table_name), columns
+    ):
+        logger.warning(f"Columns of {table_name} changed since the checkpoint, loading from the start")
+        return None
+    loaded_rows = get_postgres_row_count(pg_conn, pg_schema_name, pg_table_name, table_prefix)
+    if loaded_rows != resume['rows_loaded']:
+        logger.warning(
+            f"{safe_table_name} has {loaded_rows} rows but the checkpoint of {table_name} counts "
+            f"{resume['rows_loaded']}, loading from the start"
+        )
+        return None
+    return resume
+
+
+def _load_resumable(
+    mssql_conn: pyodbc.Connection,
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    columns: List[Dict[str, Any]],
+    key_columns: List[str],
+    table_config: Dict[str, Any],
+    batch_size: int,
+    table_prefix: str,
+    pg_table_name: str,
+    sync_id: int,
+    resume: Optional[Dict[str, Any]],
+    checksums: Optional[ChunkChecksums] = None
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Stream an MSSQL table in key order, checkpointing the key of every committed chunk.
+
+    Each chunk is committed together with the update of its sync_metadata row (sync_id),
+    so after a failure the table holds exactly the rows up to the stored key and the next
+    sync reads only the rows after it. Ordering needs an index on the key (normally the
+    clustered primary key), else SQL Server sorts the whole table first.
+
+    Args:
+        key_columns: Key the rows are ordered and checkpointed by (see _resolve_resume_key)
+        sync_id: sync_metadata row of this load (see start_checkpointed_sync)
+        resume: Checkpoint to continue after, or None to load from the start into an
+                empty table
+        See _load_full_refresh for the other arguments.
+
+    Returns:
+        Tuple of (rows in the table, load statistics with a 'checkpoint' entry)
+    """
+    resumed_rows = resume['rows_loaded'] if resume else 0
+    where, params = table_config.get('where'), None
+    if resume:
+        key_types = {col['name']: col['mssql_type'].lower() for col in columns}
+        where = combine_conditions(where, _keyset_condition(key_columns, key_types))
+        params = _keyset_params(resume['key'])
+        logger.info(
+            f"Resuming {table_name} after key {[describe_watermark(value) for value in resume['key']]} "
+            f"({resumed_rows} rows already loaded)"
+        )
+
+    def checkpoint(chunk: Union[pd.DataFrame, pa.RecordBatch], rows_loaded: int) -> None:
+        save_checkpoint(
+            pg_conn, pg_schema_name, sync_id, _chunk_last_key(chunk, key_columns), resumed_rows + rows_loaded
+        )
+
+    load_stats = stream_table_to_postgres(
+        mssql_conn, pg_conn, schema_name, table_name, pg_schema_name, columns, batch_size, table_prefix,
+        where=where, params=params, pg_table_name=pg_table_name, checksums=checksums,
+        extract_backend=table_config.get('extract_backend', EXTRACT_BACKEND_PANDAS),
+        pipeline_depth=int(table_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH)),
+        max_chunk_bytes=table_config.get('max_chunk_bytes'),
+        order_by=key_columns, checkpoint=checkpoint
+    )
+    load_stats['checkpoint'] = {
+        'key_columns': key_columns,
+        'resumed': resume is not None,
+        'resumed_after_key': [describe_watermark(value) for value in resume['key']] if resume else None,
+        'resumed_rows': resumed_rows
+    }
+    logger.info(
+        f"Streamed {load_stats['rows_synced']} rows into {table_name} in {load_stats['chunks']} checkpointed "
+        f"chunks ({load_stats['rows_per_second']} rows/s), {resumed_rows + load_stats['rows_synced']} rows in total"
+    )
+    return resumed_rows + load_stats['rows_synced'], load_stats
+
+
+def sync_mssql_table(
+    mssql_conn: pyodbc.Connection,
+    pg_conn: psycopg2.extensions.connection,
+    connector_name: str,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    table_config: Dict[str, Any],
+    batch_size: int = 10000,
+    table_prefix: str = '',
+    streaming: bool = True,
+    mssql_connect: Optional[Callable[[], pyodbc.Connection]] = None,
+    pg_connect: Optional[Callable[[], psycopg2.extensions.connection]] = None,
+    catalog: Optional[SourceCatalog] = None
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Sync a single MSSQL table into PostgreSQL and validate its row count.
+    
+    Table-level errors are caught and reported in the table result, so this can run
+    on a worker thread next to other tables.
+    
+    Args:
+        mssql_conn: MSSQL connection (used by this table only while it runs)
+        pg_conn: PostgreSQL connection (used by this table only while it runs)
+        connector_name: Name of the connector
+        schema_name: MSSQL schema name
+        table_name: Table name
+        pg_schema_name: PostgreSQL schema name
+        table_config: Per-table settings (see sync_mssql_tables)
+        batch_size: Number of records per batch
+        table_prefix: Optional prefix for table name
+        streaming: Load each chunk as soon as it is read
+        mssql_connect: Factory for extra MSSQL connections (needed for partitioned extraction)
+        pg_connect: Factory for extra PostgreSQL connections (needed for partitioned extraction)
+        catalog: Catalog of the sync's tables (loaded for this table alone if None)
+        
+    Returns:
+        Tuple of (table_result, succeeded)
+    """
+    table_result = {
+        'rows_synced': 0,
+        'schema_synced': False,
+        'errors': []
+    }
+    sync_started_at = datetime.now()
+    fingerprint = None
+    batch_size = int(table_config.get('batch_size', batch_size))
+    
+    try:
+        logger.info(f"Syncing table: {schema_name}.{table_name}")
+        checksums = ChunkChecksums() if table_config.get('verification') == VERIFICATION_CHECKSUM else None
+        
+        # Column metadata and primary key come from the catalog loaded once per sync
+        if catalog is None:
+            catalog = load_mssql_catalog(mssql_conn, schema_name, [table_name])
+        columns = catalog.columns(table_name)
+        if not columns:
+            raise ValueError(f"No columns found for table {table_name}")
+        # Only the configured columns are read and created; keys on other columns are dropped
+        columns = project_columns(table_name, columns, table_config.get('columns'))
+        primary_key = projected_key(catalog.primary_key(table_name), columns)
+        unique_indexes = projected_unique_indexes(catalog.unique_indexes(table_name), columns)
+        # Keys to build after the load (or on the shadow before it is swapped in)
+        create_indexes = table_config.get('create_indexes', True)
+        index_key = (table_config.get('primary_key') or primary_key) if create_indexes else []
+        index_key = [index_key] if isinstance(index_key, str) else index_key
+        use_shadow = False
+        
+        sync_mode = table_config.get('sync_mode', SYNC_MODE_FULL_REFRESH)
+        table_result['sync_mode'] = sync_mode
+        
+        if table_config.get('change_detection') and sync_mode == SYNC_MODE_FULL_REFRESH:
+            # The fingerprint is read before extraction, so changes made during the load
+            # show up as a different fingerprint on the next run
+            fingerprint = get_mssql_table_fingerprint(mssql_conn, schema_name, table_name, columns, table_config)
+            table_result['fingerprint'] = fingerprint
+            safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+            if is_table_unchanged(pg_conn, pg_schema_name, connector_name, table_name, safe_table_name, fingerprint):
+                logger.info(f"Table {table_name} unchanged since the last sync ({fingerprint}), skipping")
+                table_result['status'] = SYNC_STATUS_SKIPPED_UNCHANGED
+                return table_result, True
+        
+        if sync_mode == SYNC_MODE_INCREMENTAL:
+            # Pull rows past the stored watermark and upsert them by primary key
+            incremental_result = sync_mssql_table_incremental(
+                mssql_conn, pg_conn, connector_name, schema_name, table_name, pg_schema_name,
+                columns, table_config, batch_size, table_prefix, primary_key, checksums
+            )
+            table_result['schema_synced'] = True
+            table_result.update(incremental_result)
+            rows_inserted = incremental_result['rows_synced']
+            # Upserted rows are not the table's row count unless everything was reloaded
+            rows_in_table = rows_inserted if incremental_result['full_reload'] else None
+            analyze_table = rows_inserted > 0
+            logger.info(
+                f"Incremental sync of {table_name}: {rows_inserted} rows, "
+                f"watermark {incremental_result['previous_watermark']} -> {incremental_result['watermark']}"
+            )
+        elif sync_mode == SYNC_MODE_FULL_REFRESH:
+            # 'swap' loads an UNLOGGED shadow table and swaps it in when complete, so readers
+            # keep the previous data (with its indexes and grants) until then; 'drop' reloads in place
+            use_shadow = table_config.get('replace_strategy', REPLACE_STRATEGY_SWAP) == REPLACE_STRATEGY_SWAP
+            safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+            # swap_shadow_table analyzes the table it swaps in
+            analyze_table = not use_shadow
+            if use_shadow:
+                load_table_name, load_prefix = shadow_table_name(safe_table_name), ''
+            else:
+                load_table_name, load_prefix = table_name, table_prefix
+            
+            # 'resumable' loads in key order and checkpoints every chunk; a load that failed
+            # or was interrupted continues after its checkpoint in the table it left behind
+            resume_key = None
+            if table_config.get('resumable'):
+                if not streaming:
+                    logger.warning(f"Resumable load of {table_name} needs streaming, loading without checkpoints")
+                else:
+                    resume_key = _resolve_resume_key(table_name, columns, table_config, primary_key)
+                if resume_key and int(table_config.get('partitions', 1)) > 1:
+                    logger.warning(f"{table_name} is loaded with checkpoints as one key-ordered stream, ignoring 'partitions'")
+            resume = None
+            if resume_key:
+                ensure_sync_metadata_table(pg_conn, pg_schema_name)
+                resume = _find_resume_checkpoint(
+                    pg_conn, pg_schema_name, connector_name, table_name, resume_key, load_table_name, load_prefix,
+                    columns
+                )
+            
+            # Create PostgreSQL table (unless a load into it is resumed)
+            if resume is None and not create_postgresql_table(
+                pg_conn, pg_schema_name, load_table_name, columns, load_prefix, unlogged=use_shadow
+            ):
+                raise Exception("Failed to create PostgreSQL table")
+            
+            table_result['schema_synced'] = True
+            checkpoint_sync_id = None
+            if resume_key:
+                checkpoint_sync_id = start_checkpointed_sync(
+                    pg_conn, pg_schema_name, connector_name, table_name, sync_started_at, resume
+                )
+            
+            try:
+                if checkpoint_sync_id is not None:
+                    rows_inserted, load_stats = _load_resumable(
+                        mssql_conn, pg_conn, schema_name, table_name, pg_schema_name, columns, resume_key,
+                        table_config, batch_size, load_prefix, load_table_name, checkpoint_sync_id, resume, checksums
+                    )
+                else:
+                    rows_inserted, load_stats = _load_full_refresh(
+                        mssql_conn, pg_conn, schema_name, table_name, pg_schema_name, columns, primary_key,
+                        table_config, batch_size, load_prefix, load_table_name, streaming,
+                        mssql_connect, pg_connect, checksums
+                    )
+                rows_in_table = rows_inserted
+                if load_stats is not None:
+                    table_result['load_stats'] = load_stats
+                if use_shadow:
+                    # Keys are built on the shadow, so the build never locks the table readers
+                    # use and a failed build never leaves unindexed data live
+                    index_renames = []
+                    if create_indexes:
+                        # SET LOGGED rewrites the table and its indexes, so it goes first
+                        set_shadow_logged(pg_conn, pg_schema_name, load_table_name)
+                        table_result['indexes'] = create_source_indexes(
+                            pg_conn, pg_schema_name, load_table_name, index_key, unique_indexes,
+                            analyze=False, live_table_name=safe_table_name
+                        )
+                        index_renames = table_result['indexes']['renames']
+                    table_result['swap'] = swap_shadow_table(
+                        pg_conn, pg_schema_name, safe_table_name, load_table_name, index_renames=index_renames
+                    )
+                if checkpoint_sync_id is not None:
+                    finish_checkpointed_sync(pg_conn, pg_schema_name, checkpoint_sync_id, 'completed', rows_inserted)
+            except Exception as e:
+                if checkpoint_sync_id is not None:
+                    # Keep the partly loaded table and its checkpoint for the next sync
+                    try:
+                        pg_conn.rollback()
+                        finish_checkpointed_sync(
+                            pg_conn, pg_schema_name, checkpoint_sync_id, 'failed', error_message=str(e)
+                        )
+                    except Exception as record_error:
+                        logger.warning(f"Could not record the checkpoint of {table_name}: {record_error}")
+                elif use_shadow:
+                    drop_shadow_table(pg_conn, pg_schema_name, load_table_name)
+                raise
+        else:
+            raise ValueError(f"Unknown sync_mode '{sync_mode}' for table {table_name}")
+        table_result['rows_synced'] = rows_inserted
+        
+        # Build the source's primary key and unique indexes now that the rows are in, then
+        # ANALYZE (a swapped-in table got its keys on the shadow and was analyzed by the swap)
+        if not use_shadow and (create_indexes or analyze_table):
+            table_result['indexes'] = create_source_indexes(
+                pg_conn, pg_schema_name, f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_'),
+                index_key,
+                unique_indexes if create_indexes else [],
+                analyze=analyze_table
+            )
+        
+        # Validate row counts (and checksums) against the load
+        verification = verify_mssql_load(
+            mssql_conn, pg_conn, schema_name, table_name, pg_schema_name, table_prefix,
+            table_config, rows_in_table, checksums
+        )
+        table_result['verification'] = verification
+        mssql_count, pg_count = verification['source_rows'], verification['loaded_rows']
+        
+        if not verification['matched']:
+            warning_msg = f"Row count mismatch for {table_name}: MSSQL={mssql_count}, PostgreSQL={pg_count}"
+            logger.warning(warning_msg)
+            table_result['errors'].append(warning_msg)
+        else:
+            logger.info(f"Row count validated for {table_name}: {mssql_count} rows ({verification['mode']})")
+        
+        if checksums is not None and not checksums.matched:
+            warning_msg = (
+                f"Checksum mismatch for {table_name}: {checksums.mismatched_chunks} of "
+                f"{checksums.chunks} chunks changed between extraction and load"
+            )
+            logger.warning(warning_msg)
+            table_result['errors'].append(warning_msg)
+        
+        if fingerprint is not None:
+            # A load that could not be verified is not trusted to match the fingerprint
+            record_table_sync(
+                pg_conn, pg_schema_name, connector_name, table_name, 'completed', rows_inserted,
+                sync_started_at, fingerprint=None if table_result['errors'] else fingerprint
+            )
+        
+        succeeded = True
+        
+    except Exception as e:
+        error_msg = f"Error syncing table {table_name}: {str(e)}"
+        logger.error(error_msg)
+        table_result['errors'].append(error_msg)
+        succeeded = False
+        if fingerprint is not None:
+            try:
+                pg_conn.rollback()
+                record_table_sync(
+                    pg_conn, pg_schema_name, connector_name, table_name, 'failed', 0,
+                    sync_started_at, error_message=str(e)
+                )
+            except Exception as record_error:
+                logger.warning(f"Could not record failed sync of {table_name}: {record_error}")
+    
+    return table_result, succeeded
+
+
 def sync_mssql_tables(
     connector_name: str,
     table_names: List[str],
     cache: Optional[PostgresCache] = None,
     batch_size: int = 10000,
-    table_prefix: str = 'mssql_'
+    table_prefix: str = 'mssql_',
+    streaming: bool = True,
+    table_configs: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_workers: int = 1,
+    extract_backend: Optional[str] = None,
+    max_chunk_bytes: Optional[int] = None,
+    plan_syncs: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Synchronize tables from MSSQL to PostgreSQL cache.
@@ -603,6 +2330,75 @@ def sync_mssql_tables(
         cache: Optional PostgresCache instance (creates new one if None)
         batch_size: Number of records per batch (default: 10000)
         table_prefix: Optional prefix for table names (default: 'mssql_')
+        streaming: If True (default), load each chunk as soon as it is read instead of
+                   materializing the whole table in memory first
+        table_configs: Optional per-table settings keyed by table name (defaults to
+                       'table_configs' in the connector config), e.g.
+                       {"Orders": {"sync_mode": "incremental", "watermark_column": "RowVer",
+                                   "primary_key": ["OrderId"]}}
+                       Tables without an entry use 'full_refresh' (reload).
+                       Full-refresh tables can also set "partitions": N to extract N key
+                       ranges of an integer or date key in parallel, with optional
+                       "partition_column" (default: the single-column primary key) and
+                       "partition_strategy" ('minmax' or 'histogram'), and
+                       "replace_strategy": 'swap' (default: load a shadow table and swap
+                       it in, keeping indexes and grants) or 'drop' (drop and reload in place).
+                       "verification" selects the post-load check: 'stats' (default: rows
+                       reported by COPY vs SQL Server's row count statistics), 'checksum'
+                       ('stats' plus hashes of each chunk as read and as written) or 'count'
+                       (SELECT COUNT(*) on both sides); "verification_tolerance" allows a
+                       relative difference (default 0).
+                       "change_detection" skips full-refresh tables whose source is unchanged
+                       since the last sync: 'checksum' (CHECKSUM_AGG(BINARY_CHECKSUM(*)), a
+                       scan on the server) or 'rowversion' (MAX of the rowversion column or
+                       "fingerprint_column"); defaults to 'change_detection' in the connector
+                       config. Skipped tables are reported with status 'skipped_unchanged'.
+                       "pipeline_depth" sets how many chunks are buffered between the thread
+                       reading MSSQL and the thread writing PostgreSQL (default 2, from the
+                       connector config; 0 reads and loads alternately on one thread). Load
+                       statistics report each stage's busy and idle time and the bottleneck.
+                       "resumable": true (default from the connector config) loads a
+                       full-refresh table in primary-key order (or "primary_key") and
+                       commits the key of every chunk to sync_metadata with the chunk; when
+                       a load fails, the next sync continues after that key in the partly
+                       loaded table instead of reloading it. Needs streaming; such tables
+                       are not partitioned.
+                       After the load, the table gets the source's primary key (or
+                       "primary_key") and unique indexes, built once from the loaded rows
+                       (on the shadow, before a swap), and is analyzed; "create_indexes":
+                       false skips the indexes.
+                       "columns" lists the columns to sync (default: all); only those are
+                       selected from MSSQL and created in PostgreSQL, and keys on other
+                       columns are not built. "where" is a T-SQL condition (without WHERE)
+                       restricting the rows read, e.g. "OrderDate >= '2022-01-01'"; it is
+                       combined with watermark, partition and checkpoint conditions, and
+                       such tables are verified with COUNT(*) over the filter. Changing
+                       "columns" reloads incremental and change-detected tables; a changed
+                       "where" affects incremental tables from the next rows read on.
+                       "batch_size" overrides the batch size for one table.
+        max_workers: Number of tables synced in parallel (default: 1, sequential). Each
+                     worker uses its own MSSQL and PostgreSQL connection from a pool.
+        extract_backend: 'pandas' (pd.read_sql chunks) or 'arrow' (fetchmany into Arrow
+                         record batches loaded without pandas); defaults to
+                         'extract_backend' in the connector config, else 'pandas'.
+                         Tables can override it in their table config.
+        max_chunk_bytes: Memory budget of one chunk in bytes. When set, streamed tables size
+                         their chunks from the row width (estimated from the column metadata,
+                         then measured on the chunks read) instead of using batch_size;
+                         defaults to 'max_chunk_bytes' in the connector config. Tables can
+                         override it in their table config. With the pipeline, up to
+                         pipeline_depth + 2 chunks of a table are in memory. Tables with
+                         LOB columns (image, varbinary(max), nvarchar(max), ntext, xml, ...)
+                         are always sized by memory, within DEFAULT_LOB_CHUNK_BYTES if no
+                         budget is set, starting from a few rows per chunk.
+        plan_syncs: Plan the sync from SQL Server's size statistics (sys.dm_db_partition_stats,
+                    one query for all tables) before extracting; defaults to 'plan_syncs' in
+                    the connector config, else True. Tables are synced largest first, and
+                    tables whose config sets neither option get a "batch_size" from their
+                    average row width and, when streamed full-refresh tables with a
+                    suitable key, "partitions" from their size (see sync_planner). The
+                    plan, with estimated and actual seconds per table, is returned as
+                    result['plan'].
         
     Returns:
         Dictionary with sync status and metadata (matching pyairbyte_sync.py format)
@@ -619,14 +2415,32 @@ def sync_mssql_tables(
         username = mssql_config['username']
         password = mssql_config['password']
         schema_name = mssql_config.get('schema', 'dbo')
+        if table_configs is None:
+            table_configs = mssql_config.get('table_configs', {})
+        if extract_backend is None:
+            extract_backend = mssql_config.get('extract_backend', EXTRACT_BACKEND_PANDAS)
+        if max_chunk_bytes is None:
+            max_chunk_bytes = mssql_config.get('max_chunk_bytes')
+        if plan_syncs is None:
+            plan_syncs = mssql_config.get('plan_syncs', True)
+        # Connector-wide settings apply to every table unless its config overrides them
+        table_defaults = {
+            'extract_backend': extract_backend,
+            'change_detection': mssql_config.get('change_detection'),
+            'pipeline_depth': mssql_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH),
+            'max_chunk_bytes': max_chunk_bytes,
+            'resumable': mssql_config.get('resumable', False)
+        }
+        table_configs = {name: {**table_defaults, **(table_configs.get(name) or {})} for name in table_names}
         
         logger.info(f"Starting MSSQL sync for connector '{connector_name}' with {len(table_names)} tables from {server}/{database}")
         
         # Connect to MSSQL
         mssql_conn = get_mssql_connection(server, database, username, password)
         
-        # Validate tables exist
-        existing_tables, missing_tables = validate_tables_exist(mssql_conn, schema_name, table_names)
+        # Load existence, columns and primary keys of all tables in one round trip
+        catalog = load_mssql_catalog(mssql_conn, schema_name, table_names)
+        existing_tables, missing_tables = catalog.split(table_names)
         if missing_tables:
             error_msg = f"Tables not found in MSSQL: {missing_tables}"
             logger.error(error_msg)
@@ -638,6 +2452,18 @@ def sync_mssql_tables(
                 'error': error_msg
             }
         
+        # Largest tables first, with batch sizes and partitions picked from their size
+        plan = None
+        sync_order = existing_tables
+        if plan_syncs:
+            plan = plan_table_syncs(
+                existing_tables, get_mssql_table_sizes(mssql_conn, schema_name, existing_tables),
+                table_configs, batch_size, max_workers,
+                _partitionable_tables(catalog, existing_tables, table_configs, streaming)
+            )
+            table_configs = apply_sync_plan(table_configs, plan)
+            sync_order = plan['order']
+        
         # Create or use PostgresCache
         if cache is None:
             try:
@@ -673,71 +2499,81 @@ def sync_mssql_tables(
         # Get PostgreSQL connection details and create connection
         # PostgresCache doesn't expose get_connection(), so we create our own
         pg_schema_name = cache.schema_name if hasattr(cache, 'schema_name') else 'pyairbyte_cache'
-        pg_conn = psycopg2.connect(
-            host=os.getenv('PYAIRBYTE_CACHE_DB_HOST', 'db'),
-            port=int(os.getenv('PYAIRBYTE_CACHE_DB_PORT', '5432')),
-            database=os.getenv('PYAIRBYTE_CACHE_DB_NAME', 'dataplatform'),
-            user=os.getenv('PYAIRBYTE_CACHE_DB_USER', 'dataplatuser'),
-            password=os.getenv('PYAIRBYTE_CACHE_DB_PASSWORD', 'dataplatpassword')
-        )
+        pg_params = {
+            'host': os.getenv('PYAIRBYTE_CACHE_DB_HOST', 'db'),
+            'port': int(os.getenv('PYAIRBYTE_CACHE_DB_PORT', '5432')),
+            'database': os.getenv('PYAIRBYTE_CACHE_DB_NAME', 'dataplatform'),
+            'user': os.getenv('PYAIRBYTE_CACHE_DB_USER', 'dataplatuser'),
+            'password': os.getenv('PYAIRBYTE_CACHE_DB_PASSWORD', 'dataplatpassword')
+        }
+        pg_conn = psycopg2.connect(**pg_params)
+        
+        # Factories for the extra connections used by parallel table syncs and partitioned extraction
+        mssql_connect = lambda: get_mssql_connection(server, database, username, password)
+        pg_connect = lambda: psycopg2.connect(**pg_params)
         
         # Initialize result dictionary
         result_tables = {}
         total_records = 0
         successful_tables = 0
         failed_tables = 0
+        skipped_tables = 0
         
-        # Sync each table
-        for table_name in existing_tables:
-            table_result = {
-                'rows_synced': 0,
-                'schema_synced': False,
-                'errors': []
-            }
+        if max_workers > 1 and len(existing_tables) > 1:
+            # Objects shared by all tables are created up front so workers don't race on them
+            pg_cursor = pg_conn.cursor()
+            pg_cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {pg_schema_name}")
+            pg_conn.commit()
+            pg_cursor.close()
+            if any(
+                table_configs[t].get('sync_mode') == SYNC_MODE_INCREMENTAL
+                or table_configs[t].get('change_detection') or table_configs[t].get('resumable')
+                for t in existing_tables
+            ):
+                ensure_sync_metadata_table(pg_conn, pg_schema_name)
+            
+            # Each worker checks out its own MSSQL and PostgreSQL connection
+            mssql_pool = ConnectionPool(mssql_connect, max_workers, name='mssql')
+            pg_pool = ConnectionPool(pg_connect, max_workers, name='postgres', reset=lambda conn: conn.rollback())
             
+            def sync_table(table_name: str) -> Tuple[Dict[str, Any], bool]:
+                with mssql_pool.connection() as worker_mssql_conn, pg_pool.connection() as worker_pg_conn:
+                    return sync_mssql_table(
+                        worker_mssql_conn, worker_pg_conn, connector_name, schema_name, table_name,
+                        pg_schema_name, table_configs.get(table_name) or {}, batch_size, table_prefix, streaming,
+                        mssql_connect, pg_connect, catalog
+                    )
+            
+            syncs_started_at = time.perf_counter()
             try:
-                logger.info(f"Syncing table: {schema_name}.{table_name}")
-                
-                # Extract schema
-                columns = extract_mssql_schema(mssql_conn, schema_name, table_name)
-                if not columns:
-                    raise ValueError(f"No columns found for table {table_name}")
-                
-                # Create PostgreSQL table
-                if not create_postgresql_table(pg_conn, pg_schema_name, table_name, columns, table_prefix):
-                    raise Exception("Failed to create PostgreSQL table")
-                
-                table_result['schema_synced'] = True
-                
-                # Extract and transform data
-                df = extract_and_transform_data(mssql_conn, schema_name, table_name, columns, batch_size)
-                
-                # Load data to PostgreSQL
-                rows_inserted = load_data_to_postgres(pg_conn, pg_schema_name, table_name, df, table_prefix)
-                table_result['rows_synced'] = rows_inserted
-                total_records += rows_inserted
-                
-                # Validate row counts
-                mssql_count, pg_count = validate_row_counts(
-                    mssql_conn, pg_conn, schema_name, table_name, pg_schema_name, table_prefix
+                table_outcomes = run_table_syncs(sync_order, sync_table, max_workers)
+            finally:
+                mssql_pool.close_all()
+                pg_pool.close_all()
+        else:
+            syncs_started_at = time.perf_counter()
+            table_outcomes = run_table_syncs(
+                sync_order,
+                lambda table_name: sync_mssql_table(
+                    mssql_conn, pg_conn, connector_name, schema_name, table_name, pg_schema_name,
+                    table_configs.get(table_name) or {}, batch_size, table_prefix, streaming,
+                    mssql_connect, pg_connect, catalog
                 )
-                
-                if mssql_count != pg_count:
-                    warning_msg = f"Row count mismatch for {table_name}: MSSQL={mssql_count}, PostgreSQL={pg_count}"
-                    logger.warning(warning_msg)
-                    table_result['errors'].append(warning_msg)
-                else:
-                    logger.info(f"Row count validated for {table_name}: {mssql_count} rows")
-                
+            )
+        
+        # Merge per-table results in the requested table order
+        for table_name in existing_tables:
+            table_result, succeeded = table_outcomes[table_name]
+            result_tables[table_name] = table_result
+            total_records += table_result['rows_synced']
+            if succeeded:
                 successful_tables += 1
-                
-            except Exception as e:
-                error_msg = f"Error syncing table {table_name}: {str(e)}"
-                logger.error(error_msg)
-                table_result['errors'].append(error_msg)
+            else:
                 failed_tables += 1
-            
-            result_tables[table_name] = table_result
+            if table_result.get('status') == SYNC_STATUS_SKIPPED_UNCHANGED:
+                skipped_tables += 1
+        if plan:
+            record_plan_actuals(plan, result_tables, time.perf_counter() - syncs_started_at)
         
         # Close connections
         if mssql_conn:
@@ -756,7 +2592,11 @@ def sync_mssql_tables(
                 'total_records': total_records,
                 'total_tables': len(table_names),
                 'successful_tables': successful_tables,
-                'failed_tables': failed_tables
+                'failed_tables': failed_tables,
+                'skipped_tables': skipped_tables,
+                'max_workers': max_workers,
+                'connection_pools': shared_pool_metrics(),
+                'plan': plan
             }
         }
         
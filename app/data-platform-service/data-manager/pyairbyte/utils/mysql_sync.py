@@ -1,23 +1,86 @@
 import os
 import logging
 import json
+import time
 import yaml
-from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Union
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import psycopg2
-from psycopg2.extras import execute_values
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, text, bindparam
 from sqlalchemy.engine import Engine
 
 from airbyte.caches import PostgresCache
 
+from .pg_bulk_loader import copy_dataframe_to_postgres, copy_record_batch_to_postgres, upsert_dataframe_to_postgres
+from .column_normalizer import compile_normalization_plan, normalize_chunk
+from .sync_state import (
+    SYNC_MODE_FULL_REFRESH,
+    SYNC_MODE_INCREMENTAL,
+    CHANGE_DETECTION_CHECKSUM,
+    CHANGE_DETECTION_ROWVERSION,
+    SYNC_STATUS_SKIPPED_UNCHANGED,
+    ensure_sync_metadata_table,
+    get_last_watermark,
+    record_table_sync,
+    postgres_table_exists,
+    postgres_table_columns,
+    resolve_incremental_config,
+    describe_watermark,
+    format_fingerprint,
+    is_table_unchanged
+)
+from .connection_pool import ConnectionPool
+from .sync_runner import run_table_syncs
+from .source_catalog import SourceCatalog
+from .chunk_pipeline import DEFAULT_PIPELINE_DEPTH, run_chunk_pipeline
+from .chunk_sizing import ChunkSizer
+from .pg_indexes import create_source_indexes
+from .source_projection import (
+    project_columns,
+    projected_key,
+    projected_unique_indexes,
+    loaded_columns_differ,
+    combine_conditions,
+    projection_signature
+)
+from .sync_planner import plan_table_syncs, apply_sync_plan, record_plan_actuals
+from .pg_table_swap import (
+    REPLACE_STRATEGY_SWAP, shadow_table_name, set_shadow_logged, swap_shadow_table, drop_shadow_table
+)
+from .arrow_extraction import (
+    EXTRACT_BACKEND_PANDAS,
+    EXTRACT_BACKEND_ARROW,
+    arrow_schema,
+    rows_to_record_batch,
+    add_batch_checksums
+)
+from .load_verification import (
+    VERIFICATION_COUNT,
+    VERIFICATION_STATS,
+    VERIFICATION_CHECKSUM,
+    ChunkChecksums,
+    chunk_hash_aggregate,
+    compare_row_counts
+)
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# How source rows are read (table config key 'read_strategy')
+READ_STRATEGY_STREAM = 'stream'      # one query over an unbuffered (server-side) cursor
+READ_STRATEGY_KEYSET = 'keyset'      # pages of batch_size rows ordered by primary key
+READ_STRATEGY_BUFFERED = 'buffered'  # pd.read_sql over a buffered cursor (whole result in client memory)
+
+# Seconds MySQL waits for a slow reader of a streamed result before dropping the connection
+STREAM_NET_WRITE_TIMEOUT = 3600
+
+
 # MySQL to PostgreSQL Type Mapping
 MYSQL_TO_POSTGRES_TYPE_MAP = {
     # Numeric types
@@ -93,7 +156,10 @@ def map_mysql_to_postgres_type(
 def get_mysql_config_from_connector(connector_name: str) -> Dict[str, str]:
     """
     Extract MySQL configuration from PYAIRBYTE_CONNECTOR_CONFIGS environment variable.
-    Expected keys: host/server, database, username/user, password, (optional) schema
+    Expected keys: host/server, database, username/user, password, (optional) schema,
+    (optional) table_configs with per-table sync settings (see sync_mysql_tables),
+    and the defaults for all tables extract_backend ('pandas' or 'arrow'), change_detection,
+    pipeline_depth and max_chunk_bytes
     """
     env_json = os.getenv('PYAIRBYTE_CONNECTOR_CONFIGS')
     if not env_json:
@@ -146,18 +212,27 @@ def get_mysql_config_from_connector(connector_name: str) -> Dict[str, str]:
         'password': password,
         'schema': schema or database,
         'port': str(connector_config.get('port', '3306')),
-        'ssl': connector_config.get('ssl', {})
+        'ssl': connector_config.get('ssl', {}),
+        'table_configs': connector_config.get('table_configs') or {},
+        'extract_backend': connector_config.get('extract_backend', EXTRACT_BACKEND_PANDAS),
+        'change_detection': connector_config.get('change_detection'),
+        'pipeline_depth': connector_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH),
+        'max_chunk_bytes': connector_config.get('max_chunk_bytes')
     }
 
 
-def get_mysql_engine(host: str, port: str, database: str, username: str, password: str, ssl: Optional[Dict[str, Any]] = None) -> Engine:
+def get_mysql_engine(host: str, port: str, database: str, username: str, password: str, ssl: Optional[Dict[str, Any]] = None, pool_size: int = 5) -> Engine:
     """
     Create a SQLAlchemy engine for MySQL using mysql-connector-python driver.
+    pool_size is the number of pooled connections kept open (raise it for parallel table syncs).
     """
     url = f"mysql+mysqlconnector://{username}:{password}@{host}:{port}/{database}"
 
-    # Enforce SSL; allow optional strict verification via connector config
-    connect_args: Dict[str, Any] = { 'ssl_disabled': False }
+    # Enforce SSL; allow optional strict verification via connector config.
+    # SQLAlchemy's mysqlconnector dialect makes connections buffered, which turns every cursor
+    # into a buffered one; its own cursors ask for buffering explicitly, so unbuffering the
+    # connection only lets extraction open a streaming cursor (see iter_transformed_chunks).
+    connect_args: Dict[str, Any] = { 'ssl_disabled': False, 'buffered': False }
     if isinstance(ssl, dict):
         # Map commonly used SSL fields
         if 'ssl_ca' in ssl and ssl['ssl_ca']:
@@ -173,7 +248,7 @@ def get_mysql_engine(host: str, port: str, database: str, username: str, passwor
         if 'tls_versions' in ssl and ssl['tls_versions']:
             connect_args['tls_versions'] = ssl['tls_versions']
 
-    engine = create_engine(url, pool_pre_ping=True, connect_args=connect_args)
+    engine = create_engine(url, pool_pre_ping=True, pool_size=pool_size, connect_args=connect_args)
     logger.info(f"Created MySQL engine to {host}/{database}")
     return engine
 
@@ -210,23 +285,81 @@ def extract_mysql_schema(engine: Engine, schema_name: str, table_name: str) -> L
     return columns
 
 
-def validate_tables_exist(engine: Engine, schema_name: str, table_names: List[str]) -> Tuple[List[str], List[str]]:
+def get_mysql_primary_key(engine: Engine, schema_name: str, table_name: str) -> List[str]:
+    """Get the primary key columns of a MySQL table in key order (empty if none)."""
     query = text(
         """
-        SELECT TABLE_NAME
-        FROM INFORMATION_SCHEMA.TABLES
+        SELECT COLUMN_NAME
+        FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
         WHERE TABLE_SCHEMA = :schema_name AND TABLE_NAME = :table_name
+          AND CONSTRAINT_NAME = 'PRIMARY'
+        ORDER BY ORDINAL_POSITION
         """
     )
-    existing, missing = [], []
     with engine.connect() as conn:
-        for table_name in table_names:
-            res = conn.execute(query, { 'schema_name': schema_name, 'table_name': table_name }).first()
-            if res:
-                existing.append(table_name)
-            else:
-                missing.append(table_name)
-    return existing, missing
+        rows = conn.execute(query, { 'schema_name': schema_name, 'table_name': table_name }).all()
+    return [row[0] for row in rows]
+
+
+def load_mysql_catalog(engine: Engine, schema_name: str, table_names: List[str]) -> SourceCatalog:
+    """
+    Load existence, columns, primary keys and row estimates (information_schema.TABLES.TABLE_ROWS)
+    of MySQL tables in one query, and their other unique indexes (information_schema.STATISTICS)
+    in a second; indexes on column prefixes or expressions are left out.
+    """
+    if not table_names:
+        return SourceCatalog(schema_name, {})
+    query = text(
+        """
+        SELECT
+            c.TABLE_NAME AS table_name,
+            c.COLUMN_NAME AS column_name,
+            c.DATA_TYPE AS data_type,
+            c.CHARACTER_MAXIMUM_LENGTH AS max_length,
+            c.NUMERIC_PRECISION AS `precision`,
+            c.NUMERIC_SCALE AS scale,
+            c.IS_NULLABLE = 'YES' AS is_nullable,
+            c.COLUMN_DEFAULT AS `default`,
+            k.ORDINAL_POSITION AS pk_ordinal,
+            t.TABLE_ROWS AS row_estimate
+        FROM INFORMATION_SCHEMA.COLUMNS c
+        JOIN INFORMATION_SCHEMA.TABLES t
+          ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+        LEFT JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE k
+          ON k.TABLE_SCHEMA = c.TABLE_SCHEMA AND k.TABLE_NAME = c.TABLE_NAME
+         AND k.COLUMN_NAME = c.COLUMN_NAME AND k.CONSTRAINT_NAME = 'PRIMARY'
+        WHERE c.TABLE_SCHEMA = :schema_name AND c.TABLE_NAME IN :table_names
+        ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+        """
+    ).bindparams(bindparam('table_names', expanding=True))
+    index_query = text(
+        """
+        SELECT
+            TABLE_NAME AS table_name,
+            INDEX_NAME AS index_name,
+            COLUMN_NAME AS column_name,
+            SEQ_IN_INDEX AS key_ordinal,
+            SUB_PART AS sub_part
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = :schema_name AND TABLE_NAME IN :table_names
+          AND NON_UNIQUE = 0 AND INDEX_NAME <> 'PRIMARY'
+        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """
+    ).bindparams(bindparam('table_names', expanding=True))
+    with engine.connect() as conn:
+        params = { 'schema_name': schema_name, 'table_names': list(table_names) }
+        rows = conn.execute(query, params).mappings().all()
+        index_rows = conn.execute(index_query, params).mappings().all()
+    # A unique prefix or expression has no equivalent on the whole columns
+    partial = {(r['table_name'], r['index_name']) for r in index_rows if r['sub_part'] is not None or r['column_name'] is None}
+    index_rows = [r for r in index_rows if (r['table_name'], r['index_name']) not in partial]
+    catalog = SourceCatalog.from_rows(schema_name, table_names, rows, 'mysql_type', index_rows)
+    logger.info(f"Loaded MySQL catalog for {len(catalog.tables)}/{len(table_names)} tables in {schema_name}")
+    return catalog
+
+
+def validate_tables_exist(engine: Engine, schema_name: str, table_names: List[str]) -> Tuple[List[str], List[str]]:
+    return load_mysql_catalog(engine, schema_name, table_names).split(table_names)
 
 
 def create_postgresql_table(
@@ -234,8 +367,11 @@ def create_postgresql_table(
     schema_name: str,
     table_name: str,
     columns: List[Dict[str, Any]],
-    table_prefix: str = ''
+    table_prefix: str = '',
+    primary_key: Optional[List[str]] = None,
+    unlogged: bool = False
 ) -> bool:
+    """Create the PostgreSQL table from MySQL column metadata; unlogged is used for shadow tables (see pg_table_swap)."""
     try:
         cursor = pg_conn.cursor()
         cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
@@ -256,8 +392,12 @@ def create_postgresql_table(
             nullable = 'NULL' if col['is_nullable'] else 'NOT NULL'
             column_defs.append(f"{col_name} {pg_type} {nullable}")
 
+        if primary_key:
+            pk_cols = [c.replace('-', '_').replace(' ', '_') for c in primary_key]
+            column_defs.append(f"PRIMARY KEY ({', '.join(pk_cols)})")
+
         create_sql = f"""
-            CREATE TABLE {schema_name}.{safe_table_name} (
+            CREATE {'UNLOGGED ' if unlogged else ''}TABLE {schema_name}.{safe_table_name} (
                 {', '.join(column_defs)}
             )
         """
@@ -273,50 +413,239 @@ def create_postgresql_table(
         return False
 
 
-def extract_and_transform_data(
+def _frame_from_rows(rows: List[Any], column_names: List[str]) -> pd.DataFrame:
+    """Build a chunk from fetched rows the same way pd.read_sql does."""
+    return pd.DataFrame.from_records(rows, columns=column_names, coerce_float=True)
+
+
+def _open_unbuffered_cursor(dbapi_conn: Any) -> Optional[Any]:
+    """Open a cursor that streams rows from the server, or return None if the driver buffers anyway."""
+    try:
+        cursor = dbapi_conn.cursor(buffered=False)
+    except TypeError:
+        return None
+    if 'Buffered' in type(cursor).__name__:
+        cursor.close()
+        return None
+    return cursor
+
+
+def _iter_streamed_rows(
+    engine: Engine,
+    query: str,
+    params: Optional[Dict[str, Any]],
+    sizer: ChunkSizer
+) -> Iterator[Tuple[List[str], List[Any]]]:
+    """
+    Read a query over an unbuffered cursor as (column_names, rows) batches of sizer.rows rows
+    (yields nothing and returns False if the driver cannot stream). Rows stay on the server
+    until fetched, so client memory holds one batch regardless of the table size.
+    """
+    statement = text(query).compile(dialect=engine.dialect)
+    positional = tuple((params or {})[name] for name in (statement.positiontup or []))
+    with engine.connect() as conn:
+        cursor = _open_unbuffered_cursor(conn.connection.driver_connection)
+        if cursor is None:
+            return False
+        try:
+            cursor.execute(f"SET SESSION net_write_timeout = {STREAM_NET_WRITE_TIMEOUT}")
+            cursor.execute(statement.string, positional)
+            column_names = [d[0] for d in cursor.description]
+            while True:
+                rows = cursor.fetchmany(sizer.rows)
+                if not rows:
+                    break
+                yield column_names, rows
+            cursor.close()
+        except BaseException:
+            # Closing would read the rest of the result; drop the connection instead
+            conn.invalidate()
+            raise
+    return True
+
+
+def _iter_keyset_rows(
+    engine: Engine,
+    query: str,
+    where: Optional[str],
+    params: Optional[Dict[str, Any]],
+    key_columns: List[str],
+    sizer: ChunkSizer
+) -> Iterator[Tuple[List[str], List[Any]]]:
+    """
+    Read a table in pages of sizer.rows rows ordered by key_columns, each page starting after
+    the last key of the previous one (WHERE (key) > (last key) ORDER BY key LIMIT n), so
+    every page is an index range scan and only one page is buffered at a time.
+    """
+    key_list = ', '.join(f"`{col}`" for col in key_columns)
+    last_key = None
+    while True:
+        page_size = sizer.rows
+        conditions = [f"({where})"] if where else []
+        page_params = dict(params or {})
+        if last_key is not None:
+            placeholders = ', '.join(f":_last_key_{i}" for i in range(len(key_columns)))
+            conditions.append(f"({key_list}) > ({placeholders})")
+            page_params.update({ f"_last_key_{i}": value for i, value in enumerate(last_key) })
+        page_query = query
+        if conditions:
+            page_query += " WHERE " + " AND ".join(conditions)
+        page_query += f" ORDER BY {key_list} LIMIT {int(page_size)}"
+
+        with engine.connect() as conn:
+            result = conn.execute(text(page_query), page_params)
+            column_names = list(result.keys())
+            rows = result.fetchall()
+        if not rows:
+            return
+        last_key = tuple(rows[-1]._mapping[col] for col in key_columns)
+        yield column_names, rows
+        if len(rows) < page_size:
+            return
+
+
+def _select_list(columns: List[Dict[str, Any]]) -> str:
+    """SELECT list reading exactly the given columns (the table's projected columns)."""
+    return ', '.join('`' + c['name'].replace('`', '``') + '`' for c in columns)
+
+
+def _iter_source_rows(
+    engine: Engine,
+    schema_name: str,
+    table_name: str,
+    sizer: ChunkSizer,
+    where: Optional[str],
+    params: Optional[Dict[str, Any]],
+    read_strategy: str,
+    primary_key: Optional[List[str]],
+    columns: Optional[List[Dict[str, Any]]] = None
+) -> Iterator[Tuple[List[str], List[Any]]]:
+    """
+    Read a MySQL table as (column_names, rows) batches of sizer.rows rows with the given read strategy.
+    'stream' falls back to 'keyset' pages by primary_key if the driver cannot stream, and to
+    'buffered' without a primary key. Only the given columns are selected (all without columns).
+    """
+    query = f"SELECT {_select_list(columns) if columns else '*'} FROM `{schema_name}`.`{table_name}`"
+    strategy = read_strategy
+    if strategy == READ_STRATEGY_STREAM:
+        streamed = yield from _iter_streamed_rows(engine, f"{query} WHERE {where}" if where else query, params, sizer)
+        if streamed:
+            return
+        strategy = READ_STRATEGY_KEYSET
+        logger.warning(f"MySQL driver cannot stream {table_name} over an unbuffered cursor, using keyset pages")
+    if strategy == READ_STRATEGY_KEYSET:
+        if primary_key:
+            yield from _iter_keyset_rows(engine, query, where, params, primary_key, sizer)
+            return
+        logger.warning(f"{table_name} has no primary key for keyset pages, reading over a buffered cursor")
+    with engine.connect() as conn:
+        result = conn.execute(text(f"{query} WHERE {where}" if where else query), params or {})
+        column_names = list(result.keys())
+        while True:
+            rows = result.fetchmany(sizer.rows)
+            if not rows:
+                break
+            yield column_names, rows
+
+
+def iter_transformed_chunks(
     engine: Engine,
     schema_name: str,
     table_name: str,
     columns: List[Dict[str, Any]],
-    batch_size: int = 10000
-) -> pd.DataFrame:
-    query = f"SELECT * FROM `{schema_name}`.`{table_name}`"
-    logger.info(f"Extracting data from MySQL table: {schema_name}.{table_name}")
-    chunks: List[pd.DataFrame] = []
+    batch_size: Union[int, ChunkSizer] = 10000,
+    where: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    checksums: Optional[ChunkChecksums] = None,
+    read_strategy: str = READ_STRATEGY_STREAM,
+    primary_key: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a MySQL table as transformed chunks of up to batch_size rows (or as many as a
+    ChunkSizer passed as batch_size chooses for each chunk).
+    where is an optional WHERE condition (without the keyword) using :name parameters from params.
+    read_strategy 'stream' (default) reads one query over an unbuffered cursor; if the driver
+    cannot stream it falls back to 'keyset' pages by primary_key, and to 'buffered' without one.
+    If checksums is set, each chunk is hashed as read and as transformed into it.
+    """
+    logger.info(f"Extracting data from MySQL table: {schema_name}.{table_name} ({read_strategy})")
+    # Compile the column type map once for all chunks of the table
+    plan = compile_normalization_plan(columns, 'mysql_type')
+    sizer = batch_size if isinstance(batch_size, ChunkSizer) else ChunkSizer(batch_size)
     try:
-        with engine.connect() as conn:
-            for chunk in pd.read_sql(text(query), conn, chunksize=batch_size):
-                for col in columns:
-                    col_name = col['name']
-                    if col_name not in chunk.columns:
-                        continue
-                    mysql_type = col['mysql_type'].lower()
-
-                    # BIT -> BOOLEAN
-                    if mysql_type == 'bit':
-                        # MySQL returns bytes for BIT; convert to bool
-                        chunk[col_name] = chunk[col_name].apply(lambda v: bool(int.from_bytes(v, 'little')) if isinstance(v, (bytes, bytearray)) else bool(v) if pd.notnull(v) else None)
-
-                    # DATETIME/TIMESTAMP/DATE/TIME handling
-                    elif mysql_type in ('datetime', 'timestamp', 'date', 'time'):
-                        try:
-                            if mysql_type == 'time':
-                                chunk[col_name] = chunk[col_name].astype(object).where(pd.notnull(chunk[col_name]), None)
-                            else:
-                                series_dt = pd.to_datetime(chunk[col_name], errors='coerce', utc=False)
-                                chunk[col_name] = series_dt.apply(lambda v: v.to_pydatetime() if pd.notnull(v) else None)
-                        except Exception:
-                            chunk[col_name] = chunk[col_name].where(pd.notnull(chunk[col_name]), None)
-
-                    # NULLs for others
-                    if mysql_type not in ('datetime', 'timestamp', 'date', 'time'):
-                        chunk[col_name] = chunk[col_name].where(pd.notnull(chunk[col_name]), None)
-
-                chunks.append(chunk)
+        for column_names, rows in _iter_source_rows(
+            engine, schema_name, table_name, sizer, where, params, read_strategy, primary_key, columns
+        ):
+            chunk = _frame_from_rows(rows, column_names)
+            del rows
+            # Hash the rows as read before normalization changes them in place
+            source_hash = chunk_hash_aggregate(chunk, plan) if checksums is not None else None
+            chunk = normalize_chunk(chunk, plan)
+            if checksums is not None:
+                checksums.add_chunk(source_hash, chunk, plan)
+            sizer.observe(chunk)
+            yield chunk
+    except Exception as e:
+        logger.error(f"Error extracting data from {table_name}: {e}")
+        raise
+
+
+def iter_arrow_batches(
+    engine: Engine,
+    schema_name: str,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    batch_size: Union[int, ChunkSizer] = 10000,
+    where: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    checksums: Optional[ChunkChecksums] = None,
+    read_strategy: str = READ_STRATEGY_STREAM,
+    primary_key: Optional[List[str]] = None
+) -> Iterator[pa.RecordBatch]:
+    """
+    Stream a MySQL table as Arrow record batches typed after map_mysql_to_postgres_type(),
+    converting fetched rows without pandas. Arguments as for iter_transformed_chunks.
+    """
+    logger.info(f"Extracting data from MySQL table: {schema_name}.{table_name} ({read_strategy}, arrow)")
+    pg_types = {
+        c['name']: map_mysql_to_postgres_type(c['mysql_type'], c['max_length'], c['precision'], c['scale'])
+        for c in columns
+    }
+    plan = compile_normalization_plan(columns, 'mysql_type')
+    sizer = batch_size if isinstance(batch_size, ChunkSizer) else ChunkSizer(batch_size)
+    schema = None
+    try:
+        for column_names, rows in _iter_source_rows(
+            engine, schema_name, table_name, sizer, where, params, read_strategy, primary_key, columns
+        ):
+            schema = schema or arrow_schema(column_names, pg_types)
+            batch = rows_to_record_batch(rows, schema)
+            if checksums is not None:
+                add_batch_checksums(checksums, rows, batch, plan)
+            del rows
+            sizer.observe(batch)
+            yield batch
     except Exception as e:
         logger.error(f"Error extracting data from {table_name}: {e}")
         raise
 
+
+def extract_and_transform_data(
+    engine: Engine,
+    schema_name: str,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    batch_size: int = 10000,
+    where: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    checksums: Optional[ChunkChecksums] = None
+) -> pd.DataFrame:
+    """
+    Extract data from a MySQL table and transform it for PostgreSQL (see iter_transformed_chunks).
+    This materializes the whole table in memory; prefer stream_table_to_postgres() for large tables.
+    """
+    chunks = list(iter_transformed_chunks(engine, schema_name, table_name, columns, batch_size, where, params, checksums))
+
     if not chunks:
         logger.warning(f"No data found in table: {schema_name}.{table_name}")
         return pd.DataFrame(columns=[c['name'] for c in columns])
@@ -330,43 +659,25 @@ def load_data_to_postgres(
     pg_conn: psycopg2.extensions.connection,
     schema_name: str,
     table_name: str,
-    df: pd.DataFrame,
-    table_prefix: str = ''
+    df: Union[pd.DataFrame, pa.RecordBatch],
+    table_prefix: str = '',
+    key_columns: Optional[List[str]] = None
 ) -> int:
-    if df.empty:
+    """Load a DataFrame or Arrow record batch with COPY, or upsert by key_columns with INSERT ... ON CONFLICT when given."""
+    is_batch = isinstance(df, pa.RecordBatch)
+    if len(df) == 0:
         logger.info(f"No data to insert for table {table_name}")
         return 0
     try:
-        cursor = pg_conn.cursor()
         safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
-        columns = list(df.columns)
-        data_tuples = []
-        for _, row in df.iterrows():
-            row_values = []
-            for col in columns:
-                val = row[col]
-                if pd.isna(val) or val is pd.NaT:
-                    row_values.append(None)
-                elif isinstance(val, pd.Timestamp):
-                    row_values.append(val.to_pydatetime())
-                elif hasattr(val, 'to_pydatetime'):
-                    try:
-                        row_values.append(val.to_pydatetime())
-                    except (ValueError, AttributeError):
-                        row_values.append(None)
-                else:
-                    row_values.append(val)
-            data_tuples.append(tuple(row_values))
-
-        execute_values(
-            cursor,
-            f"INSERT INTO {schema_name}.{safe_table_name} ({','.join(columns)}) VALUES %s",
-            data_tuples,
-            page_size=1000
-        )
-        pg_conn.commit()
-        rows_inserted = len(data_tuples)
-        cursor.close()
+        column_names = [str(col).replace('-', '_').replace(' ', '_') for col in (df.schema.names if is_batch else df.columns)]
+        if key_columns:
+            safe_keys = [str(col).replace('-', '_').replace(' ', '_') for col in key_columns]
+            rows_inserted = upsert_dataframe_to_postgres(pg_conn, schema_name, safe_table_name, df, safe_keys, column_names)
+        elif is_batch:
+            rows_inserted = copy_record_batch_to_postgres(pg_conn, schema_name, safe_table_name, df, column_names)
+        else:
+            rows_inserted = copy_dataframe_to_postgres(pg_conn, schema_name, safe_table_name, df, column_names)
         logger.info(f"Inserted {rows_inserted} rows into {schema_name}.{safe_table_name}")
         return rows_inserted
     except Exception as e:
@@ -375,17 +686,194 @@ def load_data_to_postgres(
         raise
 
 
+def stream_table_to_postgres(
+    engine: Engine,
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    columns: List[Dict[str, Any]],
+    batch_size: int = 10000,
+    table_prefix: str = '',
+    where: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    key_columns: Optional[List[str]] = None,
+    pg_table_name: Optional[str] = None,
+    checksums: Optional[ChunkChecksums] = None,
+    read_strategy: str = READ_STRATEGY_STREAM,
+    primary_key: Optional[List[str]] = None,
+    extract_backend: str = EXTRACT_BACKEND_PANDAS,
+    pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+    max_chunk_bytes: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Stream a MySQL table into PostgreSQL chunk by chunk, reading on a producer thread while
+    this thread loads (see chunk_pipeline); memory stays bounded by batch_size and pipeline_depth.
+    With max_chunk_bytes (and always for tables with LOB columns), chunks are sized to a memory
+    budget instead of batch_size (see chunk_sizing).
+    key_columns upserts chunks instead of appending; pg_table_name is the table to load before
+    table_prefix (default: table_name). See iter_transformed_chunks for the read arguments;
+    extract_backend 'arrow' reads with iter_arrow_batches instead.
+    Returns rows_synced (rows PostgreSQL reported loading), rows_read (rows read from MySQL),
+    chunks, elapsed_seconds, rows_per_second, pipeline (busy/idle seconds of extraction and
+    load, and the bottleneck) and, with max_chunk_bytes, chunk_sizing.
+    """
+    totals = { 'rows_synced': 0, 'rows_read': 0, 'chunks': 0 }
+    started_at = time.perf_counter()
+    pg_table_name = pg_table_name or table_name
+
+    def load_chunk(chunk: Union[pd.DataFrame, pa.RecordBatch], read_seconds: float) -> None:
+        totals['rows_read'] += len(chunk)
+        totals['rows_synced'] += load_data_to_postgres(pg_conn, pg_schema_name, pg_table_name, chunk, table_prefix, key_columns)
+        totals['chunks'] += 1
+        logger.info(
+            f"Chunk {totals['chunks']} of {table_name}: {len(chunk)} rows (read {read_seconds:.2f}s), "
+            f"total {totals['rows_synced']} rows"
+        )
+
+    sizer = ChunkSizer.for_columns(columns, 'mysql_type', batch_size, max_chunk_bytes)
+    iter_chunks = iter_arrow_batches if extract_backend == EXTRACT_BACKEND_ARROW else iter_transformed_chunks
+    pipeline_stats = run_chunk_pipeline(
+        iter_chunks(engine, schema_name, table_name, columns, sizer, where, params, checksums, read_strategy, primary_key),
+        load_chunk, pipeline_depth, name=table_name
+    )
+
+    elapsed_seconds = time.perf_counter() - started_at
+    rows_synced = totals['rows_synced']
+    if totals['chunks'] == 0:
+        logger.warning(f"No data found in table: {schema_name}.{table_name}")
+    load_stats = {
+        'rows_synced': rows_synced,
+        'rows_read': totals['rows_read'],
+        'chunks': totals['chunks'],
+        'elapsed_seconds': round(elapsed_seconds, 3),
+        'rows_per_second': round(rows_synced / elapsed_seconds, 1) if elapsed_seconds > 0 else 0.0,
+        'pipeline': pipeline_stats
+    }
+    if sizer.adaptive:
+        load_stats['chunk_sizing'] = sizer.as_dict()
+    return load_stats
+
+
+def get_mysql_max_value(engine: Engine, schema_name: str, table_name: str, column_name: str, where: Optional[str] = None) -> Any:
+    """Get the current maximum value of a column (the high-watermark) over the rows matching where, or None if there are none."""
+    query = f"SELECT MAX(`{column_name}`) FROM `{schema_name}`.`{table_name}`" + (f" WHERE {where}" if where else '')
+    with engine.connect() as conn:
+        return conn.execute(text(query)).scalar()
+
+
+def sync_mysql_table_incremental(
+    engine: Engine,
+    pg_conn: psycopg2.extensions.connection,
+    connector_name: str,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    columns: List[Dict[str, Any]],
+    table_config: Dict[str, Any],
+    batch_size: int = 10000,
+    table_prefix: str = '',
+    primary_key: Optional[List[str]] = None,
+    checksums: Optional[ChunkChecksums] = None
+) -> Dict[str, Any]:
+    """
+    Incrementally sync a MySQL table using a high-watermark column.
+
+    Same approach as mssql_sync.sync_mssql_table_incremental(): the first sync creates the
+    table with its primary key and loads everything; later syncs read rows with
+    last_watermark < watermark_column <= MAX(watermark_column), upsert them by primary key
+    and store the new watermark in sync_metadata. primary_key is the source key from the
+    sync's catalog (read from MySQL if None); checksums collects chunk checksums. The table
+    config's 'where' filter applies to every read.
+    """
+    sync_started_at = datetime.now()
+    watermark_column, key_columns = resolve_incremental_config(
+        table_name, table_config, columns,
+        lambda: primary_key if primary_key is not None else get_mysql_primary_key(engine, schema_name, table_name)
+    )
+    read_strategy = table_config.get('read_strategy', READ_STRATEGY_STREAM)
+    extract_backend = table_config.get('extract_backend', EXTRACT_BACKEND_PANDAS)
+    pipeline_depth = int(table_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH))
+    max_chunk_bytes = table_config.get('max_chunk_bytes')
+    row_filter = table_config.get('where')
+    safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+
+    ensure_sync_metadata_table(pg_conn, pg_schema_name)
+    last_watermark = get_last_watermark(pg_conn, pg_schema_name, connector_name, table_name, watermark_column)
+    full_reload = last_watermark is None or not postgres_table_exists(pg_conn, pg_schema_name, safe_table_name)
+    if not full_reload and loaded_columns_differ(postgres_table_columns(pg_conn, pg_schema_name, safe_table_name), columns):
+        # Upserts need the loaded table to have exactly the columns read
+        logger.info(f"Columns of {table_name} changed since the last sync, loading all rows")
+        full_reload = True
+
+    try:
+        high_watermark = get_mysql_max_value(engine, schema_name, table_name, watermark_column, row_filter)
+
+        if full_reload:
+            logger.info(f"No usable watermark for {table_name}, loading all rows")
+            if not create_postgresql_table(pg_conn, pg_schema_name, table_name, columns, table_prefix, primary_key=key_columns):
+                raise Exception('Failed to create PostgreSQL table')
+            load_stats = stream_table_to_postgres(
+                engine, pg_conn, schema_name, table_name, pg_schema_name, columns, batch_size, table_prefix,
+                where=row_filter, checksums=checksums, read_strategy=read_strategy, primary_key=key_columns,
+                extract_backend=extract_backend, pipeline_depth=pipeline_depth, max_chunk_bytes=max_chunk_bytes
+            )
+        elif high_watermark is None:
+            load_stats = { 'rows_synced': 0, 'rows_read': 0, 'chunks': 0 }
+        else:
+            logger.info(
+                f"Loading rows of {table_name} with {watermark_column} in "
+                f"({describe_watermark(last_watermark)}, {describe_watermark(high_watermark)}]"
+            )
+            load_stats = stream_table_to_postgres(
+                engine, pg_conn, schema_name, table_name, pg_schema_name, columns, batch_size, table_prefix,
+                where=combine_conditions(
+                    row_filter, f"`{watermark_column}` > :last_watermark AND `{watermark_column}` <= :high_watermark"
+                ),
+                params={ 'last_watermark': last_watermark, 'high_watermark': high_watermark },
+                key_columns=key_columns, checksums=checksums, read_strategy=read_strategy, primary_key=key_columns,
+                extract_backend=extract_backend, pipeline_depth=pipeline_depth, max_chunk_bytes=max_chunk_bytes
+            )
+    except Exception as e:
+        pg_conn.rollback()
+        try:
+            record_table_sync(
+                pg_conn, pg_schema_name, connector_name, table_name, 'failed', 0,
+                sync_started_at, watermark_column, None, str(e)
+            )
+        except Exception as record_error:
+            logger.warning(f"Could not record failed sync of {table_name}: {record_error}")
+        raise
+
+    new_watermark = high_watermark if high_watermark is not None else last_watermark
+    record_table_sync(
+        pg_conn, pg_schema_name, connector_name, table_name, 'completed',
+        load_stats['rows_synced'], sync_started_at, watermark_column, new_watermark
+    )
+
+    return {
+        'rows_synced': load_stats['rows_synced'],
+        'load_stats': load_stats,
+        'watermark_column': watermark_column,
+        'previous_watermark': describe_watermark(last_watermark),
+        'watermark': describe_watermark(new_watermark),
+        'full_reload': full_reload
+    }
+
+
 def validate_row_counts(
     engine: Engine,
     pg_conn: psycopg2.extensions.connection,
     schema_name: str,
     table_name: str,
     pg_schema_name: str,
-    table_prefix: str = ''
+    table_prefix: str = '',
+    where: Optional[str] = None
 ) -> Tuple[int, int]:
     try:
+        count_query = f"SELECT COUNT(*) AS c FROM `{schema_name}`.`{table_name}`" + (f" WHERE {where}" if where else '')
         with engine.connect() as conn:
-            mssql_count = conn.execute(text(f"SELECT COUNT(*) AS c FROM `{schema_name}`.`{table_name}`")).scalar()  # reuse variable name for parity
+            mssql_count = conn.execute(text(count_query)).scalar()  # reuse variable name for parity
         safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
         pg_cursor = pg_conn.cursor()
         pg_cursor.execute(f'SELECT COUNT(*) FROM {pg_schema_name}.{safe_table_name}')
@@ -397,13 +885,381 @@ def validate_row_counts(
         return -1, -1
 
 
+def get_mysql_table_fingerprint(engine: Engine, schema_name: str, table_name: str, table_config: Dict[str, Any]) -> str:
+    """
+    Read a fingerprint of a table's current contents for change detection.
+    'checksum' uses CHECKSUM TABLE (a full scan for InnoDB, but only one row is returned);
+    'rowversion' reads MAX(fingerprint_column), e.g. a TIMESTAMP ... ON UPDATE CURRENT_TIMESTAMP
+    column, plus COUNT(*) to catch deletes, over the rows matching the 'where' filter.
+    A hash of the table's 'columns' and 'where' is appended so changing them reloads the table.
+    """
+    mode = table_config.get('change_detection')
+    row_filter = table_config.get('where')
+    signature = projection_signature(table_config)
+    fingerprint = None
+    with engine.connect() as conn:
+        if mode == CHANGE_DETECTION_CHECKSUM:
+            row = conn.execute(text(f"CHECKSUM TABLE `{schema_name}`.`{table_name}`")).fetchone()
+            fingerprint = format_fingerprint(mode, None, row[1])
+        elif mode == CHANGE_DETECTION_ROWVERSION:
+            column_name = table_config.get('fingerprint_column')
+            if not column_name:
+                raise ValueError(f"change_detection '{mode}' of table {table_name} requires 'fingerprint_column'")
+            query = f"SELECT COUNT(*), MAX(`{column_name}`) FROM `{schema_name}`.`{table_name}`"
+            row = conn.execute(text(query + (f" WHERE {row_filter}" if row_filter else ''))).fetchone()
+            fingerprint = format_fingerprint(mode, row[0], row[1])
+    if fingerprint is None:
+        raise ValueError(f"Unknown change_detection '{mode}' for table {table_name}")
+    return f"{fingerprint}:{signature}" if signature else fingerprint
+
+
+def get_mysql_row_count_estimate(engine: Engine, schema_name: str, table_name: str) -> Optional[int]:
+    """Row count from information_schema.TABLES (an estimate for InnoDB), or None for views."""
+    try:
+        with engine.connect() as conn:
+            value = conn.execute(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = :schema AND TABLE_NAME = :table AND TABLE_TYPE = 'BASE TABLE'"
+                ),
+                { 'schema': schema_name, 'table': table_name }
+            ).scalar()
+        return int(value) if value is not None else None
+    except Exception as e:
+        logger.warning(f"Could not read row count statistics for {table_name}: {e}")
+        return None
+
+
+def get_mysql_table_sizes(engine: Engine, schema_name: str, table_names: List[str]) -> Dict[str, Dict[str, int]]:
+    """
+    Rows (TABLE_ROWS, an estimate for InnoDB) and data size (DATA_LENGTH, without indexes) of
+    base tables from information_schema.TABLES in one query; {} if it cannot be read.
+    """
+    if not table_names:
+        return {}
+    query = text(
+        "SELECT TABLE_NAME AS table_name, TABLE_ROWS AS table_rows, DATA_LENGTH AS data_length "
+        "FROM information_schema.TABLES "
+        "WHERE TABLE_SCHEMA = :schema_name AND TABLE_NAME IN :table_names AND TABLE_TYPE = 'BASE TABLE'"
+    ).bindparams(bindparam('table_names', expanding=True))
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(query, { 'schema_name': schema_name, 'table_names': list(table_names) }).mappings().all()
+    except Exception as e:
+        logger.warning(f"Could not read table size statistics of schema {schema_name}: {e}")
+        return {}
+    return {
+        row['table_name']: { 'rows': int(row['table_rows'] or 0), 'bytes': int(row['data_length'] or 0) }
+        for row in rows
+    }
+
+
+def get_postgres_row_count(pg_conn: psycopg2.extensions.connection, pg_schema_name: str, table_name: str, table_prefix: str = '') -> int:
+    """Count the rows of a PostgreSQL table (-1 on error)."""
+    try:
+        safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+        pg_cursor = pg_conn.cursor()
+        pg_cursor.execute(f'SELECT COUNT(*) FROM {pg_schema_name}.{safe_table_name}')
+        pg_count = pg_cursor.fetchone()[0]
+        pg_cursor.close()
+        return int(pg_count)
+    except Exception as e:
+        logger.error(f"Error counting PostgreSQL rows for {table_name}: {e}")
+        pg_conn.rollback()
+        return -1
+
+
+def verify_mysql_load(
+    engine: Engine,
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    table_prefix: str,
+    table_config: Dict[str, Any],
+    rows_loaded: Optional[int],
+    checksums: Optional[ChunkChecksums] = None,
+    load_stats: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Verify a loaded table against the source without scanning it (see mssql_sync.verify_mssql_load).
+    In 'stats' and 'checksum' mode rows_loaded (the rows now in the table, from the load) is
+    compared with information_schema.TABLES.TABLE_ROWS. InnoDB's TABLE_ROWS is a sampled
+    estimate, so a relative difference up to 'verification_tolerance' (default 0.1) passes;
+    beyond it, or without statistics, the rows are counted with SELECT COUNT(*) on both
+    sides, so a real loss is never waved through. Tables with a 'where' filter and
+    incremental upserts (rows_loaded None) are always counted, as in 'count' mode.
+    rows_read (rows read from MySQL, from load_stats) is reported as a diagnostic only: it
+    comes from the same chunks as the COPY row counts.
+    """
+    mode = table_config.get('verification', VERIFICATION_STATS)
+    tolerance = float(table_config.get('verification_tolerance', 0.1))
+    row_filter = table_config.get('where')
+
+    source_rows = source_rows_estimate = None
+    if mode != VERIFICATION_COUNT and not row_filter and rows_loaded is not None:
+        source_rows_estimate = get_mysql_row_count_estimate(engine, schema_name, table_name)
+        if source_rows_estimate is None:
+            logger.info(f"No row count statistics for {table_name}, counting rows")
+        elif compare_row_counts(source_rows_estimate, rows_loaded, tolerance):
+            source_rows = source_rows_estimate
+        else:
+            logger.info(
+                f"{table_name} has {rows_loaded} rows loaded but TABLE_ROWS estimates {source_rows_estimate} "
+                f"(more than {tolerance:.0%} apart), counting rows"
+            )
+
+    if source_rows is None:
+        mode, tolerance = VERIFICATION_COUNT, 0.0
+        source_rows, loaded_rows = validate_row_counts(
+            engine, pg_conn, schema_name, table_name, pg_schema_name, table_prefix, row_filter
+        )
+    else:
+        loaded_rows = rows_loaded
+
+    return {
+        'mode': mode,
+        'source_rows': source_rows,
+        'loaded_rows': loaded_rows,
+        'source_rows_estimate': source_rows_estimate,
+        'rows_read': (load_stats or {}).get('rows_read'),
+        'matched': compare_row_counts(source_rows, loaded_rows, tolerance),
+        'checksum': checksums.as_dict() if checksums is not None else None
+    }
+
+
+def sync_mysql_table(
+    engine: Engine,
+    pg_conn: psycopg2.extensions.connection,
+    connector_name: str,
+    schema_name: str,
+    table_name: str,
+    pg_schema_name: str,
+    table_config: Dict[str, Any],
+    batch_size: int = 10000,
+    table_prefix: str = '',
+    catalog: Optional[SourceCatalog] = None
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Sync a single MySQL table into PostgreSQL and validate its row count.
+    Table-level errors are caught and reported, so this can run on a worker thread.
+    catalog is the sync's SourceCatalog (loaded for this table alone if None).
+    Returns (table_result, succeeded).
+    """
+    table_result = { 'rows_synced': 0, 'schema_synced': False, 'errors': [] }
+    sync_started_at = datetime.now()
+    fingerprint = None
+    batch_size = int(table_config.get('batch_size', batch_size))
+    try:
+        logger.info(f"Syncing table: {schema_name}.{table_name}")
+        checksums = ChunkChecksums() if table_config.get('verification') == VERIFICATION_CHECKSUM else None
+        if catalog is None:
+            catalog = load_mysql_catalog(engine, schema_name, [table_name])
+        columns = catalog.columns(table_name)
+        if not columns:
+            raise ValueError(f"No columns found for table {table_name}")
+        # Only the configured columns are read and created; keys on other columns are dropped
+        columns = project_columns(table_name, columns, table_config.get('columns'))
+        primary_key = projected_key(catalog.primary_key(table_name), columns)
+        row_filter = table_config.get('where')
+        # Keys to build after the load (or on the shadow before it is swapped in)
+        create_indexes = table_config.get('create_indexes', True)
+        index_key = (table_config.get('primary_key') or primary_key) if create_indexes else []
+        index_key = [index_key] if isinstance(index_key, str) else index_key
+        unique_indexes = projected_unique_indexes(catalog.unique_indexes(table_name), columns) if create_indexes else []
+        use_shadow = False
+
+        sync_mode = table_config.get('sync_mode', SYNC_MODE_FULL_REFRESH)
+        table_result['sync_mode'] = sync_mode
+
+        if table_config.get('change_detection') and sync_mode == SYNC_MODE_FULL_REFRESH:
+            # Read before extraction, so changes made during the load show up on the next run
+            fingerprint = get_mysql_table_fingerprint(engine, schema_name, table_name, table_config)
+            table_result['fingerprint'] = fingerprint
+            safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+            if is_table_unchanged(pg_conn, pg_schema_name, connector_name, table_name, safe_table_name, fingerprint):
+                logger.info(f"Table {table_name} unchanged since the last sync ({fingerprint}), skipping")
+                table_result['status'] = SYNC_STATUS_SKIPPED_UNCHANGED
+                return table_result, True
+
+        if sync_mode == SYNC_MODE_INCREMENTAL:
+            incremental_result = sync_mysql_table_incremental(
+                engine, pg_conn, connector_name, schema_name, table_name, pg_schema_name,
+                columns, table_config, batch_size, table_prefix, primary_key, checksums
+            )
+            table_result['schema_synced'] = True
+            table_result.update(incremental_result)
+            rows_inserted = incremental_result['rows_synced']
+            # Upserted rows are not the table's row count unless everything was reloaded
+            rows_in_table = rows_inserted if incremental_result['full_reload'] else None
+            analyze_table = rows_inserted > 0
+            logger.info(
+                f"Incremental sync of {table_name}: {rows_inserted} rows, "
+                f"watermark {incremental_result['previous_watermark']} -> {incremental_result['watermark']}"
+            )
+        elif sync_mode == SYNC_MODE_FULL_REFRESH:
+            # 'swap' (default) loads an UNLOGGED shadow table and swaps it in when complete; 'drop' reloads in place
+            use_shadow = table_config.get('replace_strategy', REPLACE_STRATEGY_SWAP) == REPLACE_STRATEGY_SWAP
+            safe_table_name = f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_')
+            analyze_table = not use_shadow  # swap_shadow_table analyzes the table it swaps in
+            if use_shadow:
+                load_table_name, load_prefix = shadow_table_name(safe_table_name), ''
+            else:
+                load_table_name, load_prefix = table_name, table_prefix
+
+            if not create_postgresql_table(pg_conn, pg_schema_name, load_table_name, columns, load_prefix, unlogged=use_shadow):
+                raise Exception('Failed to create PostgreSQL table')
+            table_result['schema_synced'] = True
+
+            try:
+                load_stats = stream_table_to_postgres(
+                    engine, pg_conn, schema_name, table_name, pg_schema_name, columns, batch_size, load_prefix,
+                    where=row_filter, pg_table_name=load_table_name, checksums=checksums,
+                    read_strategy=table_config.get('read_strategy', READ_STRATEGY_STREAM),
+                    primary_key=primary_key,
+                    extract_backend=table_config.get('extract_backend', EXTRACT_BACKEND_PANDAS),
+                    pipeline_depth=int(table_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH)),
+                    max_chunk_bytes=table_config.get('max_chunk_bytes')
+                )
+                table_result['load_stats'] = load_stats
+                rows_inserted = rows_in_table = load_stats['rows_synced']
+                if use_shadow:
+                    # Keys are built on the shadow, so the build never locks the live table
+                    index_renames = []
+                    if create_indexes:
+                        # SET LOGGED rewrites the table and its indexes, so it goes first
+                        set_shadow_logged(pg_conn, pg_schema_name, load_table_name)
+                        table_result['indexes'] = create_source_indexes(
+                            pg_conn, pg_schema_name, load_table_name, index_key, unique_indexes,
+                            analyze=False, live_table_name=safe_table_name
+                        )
+                        index_renames = table_result['indexes']['renames']
+                    table_result['swap'] = swap_shadow_table(
+                        pg_conn, pg_schema_name, safe_table_name, load_table_name, index_renames=index_renames
+                    )
+            except Exception:
+                if use_shadow:
+                    drop_shadow_table(pg_conn, pg_schema_name, load_table_name)
+                raise
+        else:
+            raise ValueError(f"Unknown sync_mode '{sync_mode}' for table {table_name}")
+        table_result['rows_synced'] = rows_inserted
+
+        # Source primary key and unique indexes are built after the load, then the table is analyzed
+        # (a swapped-in table got its keys on the shadow and was analyzed by the swap)
+        if not use_shadow and (create_indexes or analyze_table):
+            table_result['indexes'] = create_source_indexes(
+                pg_conn, pg_schema_name, f"{table_prefix}{table_name}".replace('-', '_').replace(' ', '_'),
+                index_key,
+                unique_indexes,
+                analyze=analyze_table
+            )
+
+        verification = verify_mysql_load(
+            engine, pg_conn, schema_name, table_name, pg_schema_name, table_prefix,
+            table_config, rows_in_table, checksums, table_result.get('load_stats')
+        )
+        table_result['verification'] = verification
+        src_count, dst_count = verification['source_rows'], verification['loaded_rows']
+        if not verification['matched']:
+            warning_msg = f"Row count mismatch for {table_name}: MySQL={src_count}, PostgreSQL={dst_count}"
+            logger.warning(warning_msg)
+            table_result['errors'].append(warning_msg)
+        else:
+            logger.info(f"Row count validated for {table_name}: {src_count} rows ({verification['mode']})")
+        if checksums is not None and not checksums.matched:
+            warning_msg = (
+                f"Checksum mismatch for {table_name}: {checksums.mismatched_chunks} of "
+                f"{checksums.chunks} chunks changed between extraction and load"
+            )
+            logger.warning(warning_msg)
+            table_result['errors'].append(warning_msg)
+
+        if fingerprint is not None:
+            # A load that could not be verified is not trusted to match the fingerprint
+            record_table_sync(
+                pg_conn, pg_schema_name, connector_name, table_name, 'completed', rows_inserted,
+                sync_started_at, fingerprint=None if table_result['errors'] else fingerprint
+            )
+
+        succeeded = True
+    except Exception as e:
+        error_msg = f"Error syncing table {table_name}: {str(e)}"
+        logger.error(error_msg)
+        table_result['errors'].append(error_msg)
+        succeeded = False
+        if fingerprint is not None:
+            try:
+                pg_conn.rollback()
+                record_table_sync(
+                    pg_conn, pg_schema_name, connector_name, table_name, 'failed', 0,
+                    sync_started_at, error_message=str(e)
+                )
+            except Exception as record_error:
+                logger.warning(f"Could not record failed sync of {table_name}: {record_error}")
+    return table_result, succeeded
+
+
 def sync_mysql_tables(
     connector_name: str,
     table_names: List[str],
     cache: Optional[PostgresCache] = None,
     batch_size: int = 10000,
-    table_prefix: str = 'mysql_'
+    table_prefix: str = 'mysql_',
+    table_configs: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_workers: int = 1,
+    extract_backend: Optional[str] = None,
+    max_chunk_bytes: Optional[int] = None,
+    plan_syncs: Optional[bool] = None
 ) -> Dict[str, Any]:
+    """
+    Synchronize tables from MySQL to PostgreSQL cache.
+
+    table_configs holds optional per-table settings keyed by table name (defaults to
+    'table_configs' in the connector config), e.g.
+    {"orders": {"sync_mode": "incremental", "watermark_column": "modified_at", "primary_key": ["id"]}}.
+    Tables without an entry use 'full_refresh' (reload). Full-refresh tables can set
+    "replace_strategy": 'swap' (default: load a shadow table and swap it in, keeping
+    indexes and grants) or 'drop' (drop and reload in place). "verification" selects the
+    post-load check: 'stats' (default: rows reported by COPY vs TABLE_ROWS, within
+    "verification_tolerance", default 0.1, else COUNT(*) on both sides), 'checksum' ('stats'
+    plus hashes of each chunk as read and as written) or 'count' (SELECT COUNT(*) on both
+    sides). "read_strategy" selects how rows are read: 'stream' (default: one query over an
+    unbuffered cursor), 'keyset' (primary key pages) or 'buffered'; every table is loaded
+    chunk by chunk.
+    "change_detection" skips full-refresh tables whose source is unchanged since the last
+    sync: 'checksum' (CHECKSUM TABLE) or 'rowversion' (COUNT(*) and MAX of
+    "fingerprint_column"); it defaults to 'change_detection' in the connector config.
+    Skipped tables are reported with status 'skipped_unchanged'. "pipeline_depth" sets how
+    many chunks are buffered between the thread reading MySQL and the thread writing
+    PostgreSQL (default 2, from the connector config; 0 reads and loads on one thread);
+    load_stats report each stage's busy and idle time and the bottleneck. After the load the
+    table gets the source's primary key (or "primary_key") and unique indexes, built once
+    from the loaded rows (on the shadow, before a swap), and is analyzed; "create_indexes":
+    false skips the indexes. "columns" lists the columns to sync (default: all), which are
+    the only ones selected and created; "where" is a MySQL condition (without WHERE)
+    restricting the rows read, combined with the watermark condition (see
+    mssql_sync.sync_mssql_tables).
+    "batch_size" overrides the batch size for one table.
+
+    max_workers sets how many tables are synced in parallel (default 1, sequential).
+    Each worker gets its own pooled MySQL and PostgreSQL connection.
+
+    extract_backend is 'pandas' (DataFrame chunks) or 'arrow' (fetched rows converted to Arrow
+    record batches and loaded without pandas); it defaults to 'extract_backend' in the connector
+    config, else 'pandas', and tables can override it in their table config.
+
+    max_chunk_bytes is a memory budget per chunk: when set, chunks are sized from the row width
+    (estimated from the column metadata, then measured on the chunks read) instead of batch_size.
+    It defaults to 'max_chunk_bytes' in the connector config and tables can override it. With the
+    pipeline, up to pipeline_depth + 2 chunks of a table are in memory.
+
+    plan_syncs (default: 'plan_syncs' in the connector config, else True) plans the sync from
+    information_schema.TABLES before extracting: tables are synced largest first (by
+    DATA_LENGTH) and tables without "batch_size" or a chunk budget get a batch size from their
+    average row length. MySQL tables are read as one stream, so no partitions are planned. The
+    plan, with estimated and actual seconds per table, is returned as result['plan'].
+    """
     engine: Optional[Engine] = None
     pg_conn: Optional[psycopg2.extensions.connection] = None
     try:
@@ -415,12 +1271,30 @@ def sync_mysql_tables(
         schema_name = mysql_config['schema']
         port = mysql_config['port']
         ssl = mysql_config.get('ssl', {})
+        if table_configs is None:
+            table_configs = mysql_config.get('table_configs', {})
+        if extract_backend is None:
+            extract_backend = mysql_config.get('extract_backend', EXTRACT_BACKEND_PANDAS)
+        if max_chunk_bytes is None:
+            max_chunk_bytes = mysql_config.get('max_chunk_bytes')
+        if plan_syncs is None:
+            plan_syncs = mysql_config.get('plan_syncs', True)
+        # Connector-wide settings apply to every table unless its config overrides them
+        table_defaults = {
+            'extract_backend': extract_backend,
+            'change_detection': mysql_config.get('change_detection'),
+            'pipeline_depth': mysql_config.get('pipeline_depth', DEFAULT_PIPELINE_DEPTH),
+            'max_chunk_bytes': max_chunk_bytes
+        }
+        table_configs = { name: { **table_defaults, **(table_configs.get(name) or {}) } for name in table_names }
 
         logger.info(f"Starting MySQL sync for connector '{connector_name}' with {len(table_names)} tables from {host}/{database}")
 
-        engine = get_mysql_engine(host, port, database, username, password, ssl)
+        engine = get_mysql_engine(host, port, database, username, password, ssl, pool_size=max(5, max_workers))
 
-        existing_tables, missing_tables = validate_tables_exist(engine, schema_name, table_names)
+        # Load existence, columns and primary keys of all tables in one round trip
+        catalog = load_mysql_catalog(engine, schema_name, table_names)
+        existing_tables, missing_tables = catalog.split(table_names)
         if missing_tables:
             error_msg = f"Tables not found in MySQL: {missing_tables}"
             logger.error(error_msg)
@@ -432,6 +1306,17 @@ def sync_mysql_tables(
                 'error': error_msg
             }
 
+        # Largest tables first, with batch sizes picked from their row length
+        plan = None
+        sync_order = existing_tables
+        if plan_syncs:
+            plan = plan_table_syncs(
+                existing_tables, get_mysql_table_sizes(engine, schema_name, existing_tables),
+                table_configs, batch_size, max_workers
+            )
+            table_configs = apply_sync_plan(table_configs, plan)
+            sync_order = plan['order']
+
         if cache is None:
             try:
                 cache = PostgresCache(
@@ -463,51 +1348,74 @@ def sync_mysql_tables(
                 logger.info(f"Using provided PostgresCache with parameter table prefix: '{table_prefix}'")
 
         pg_schema_name = cache.schema_name if hasattr(cache, 'schema_name') else 'pyairbyte_cache'
-        pg_conn = psycopg2.connect(
-            host=os.getenv('PYAIRBYTE_CACHE_DB_HOST', 'db'),
-            port=int(os.getenv('PYAIRBYTE_CACHE_DB_PORT', '5432')),
-            database=os.getenv('PYAIRBYTE_CACHE_DB_NAME', 'dataplatform'),
-            user=os.getenv('PYAIRBYTE_CACHE_DB_USER', 'dataplatuser'),
-            password=os.getenv('PYAIRBYTE_CACHE_DB_PASSWORD', 'dataplatpassword')
-        )
+        pg_params = {
+            'host': os.getenv('PYAIRBYTE_CACHE_DB_HOST', 'db'),
+            'port': int(os.getenv('PYAIRBYTE_CACHE_DB_PORT', '5432')),
+            'database': os.getenv('PYAIRBYTE_CACHE_DB_NAME', 'dataplatform'),
+            'user': os.getenv('PYAIRBYTE_CACHE_DB_USER', 'dataplatuser'),
+            'password': os.getenv('PYAIRBYTE_CACHE_DB_PASSWORD', 'dataplatpassword')
+        }
+        pg_conn = psycopg2.connect(**pg_params)
 
         result_tables: Dict[str, Any] = {}
         total_records = 0
         successful_tables = 0
         failed_tables = 0
+        skipped_tables = 0
+
+        if max_workers > 1 and len(existing_tables) > 1:
+            # Objects shared by all tables are created up front so workers don't race on them
+            pg_cursor = pg_conn.cursor()
+            pg_cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {pg_schema_name}")
+            pg_conn.commit()
+            pg_cursor.close()
+            if any(
+                table_configs[t].get('sync_mode') == SYNC_MODE_INCREMENTAL or table_configs[t].get('change_detection')
+                for t in existing_tables
+            ):
+                ensure_sync_metadata_table(pg_conn, pg_schema_name)
+
+            # The MySQL engine pools source connections; PostgreSQL connections come from a pool per worker
+            pg_pool = ConnectionPool(
+                lambda: psycopg2.connect(**pg_params),
+                max_workers, name='postgres', reset=lambda conn: conn.rollback()
+            )
 
-        for table_name in existing_tables:
-            table_result = { 'rows_synced': 0, 'schema_synced': False, 'errors': [] }
+            def sync_table(table_name: str) -> Tuple[Dict[str, Any], bool]:
+                with pg_pool.connection() as worker_pg_conn:
+                    return sync_mysql_table(
+                        engine, worker_pg_conn, connector_name, schema_name, table_name,
+                        pg_schema_name, table_configs.get(table_name) or {}, batch_size, table_prefix, catalog
+                    )
+
+            syncs_started_at = time.perf_counter()
             try:
-                logger.info(f"Syncing table: {schema_name}.{table_name}")
-                columns = extract_mysql_schema(engine, schema_name, table_name)
-                if not columns:
-                    raise ValueError(f"No columns found for table {table_name}")
-
-                if not create_postgresql_table(pg_conn, pg_schema_name, table_name, columns, table_prefix):
-                    raise Exception('Failed to create PostgreSQL table')
-                table_result['schema_synced'] = True
-
-                df = extract_and_transform_data(engine, schema_name, table_name, columns, batch_size)
-                rows_inserted = load_data_to_postgres(pg_conn, pg_schema_name, table_name, df, table_prefix)
-                table_result['rows_synced'] = rows_inserted
-                total_records += rows_inserted
-
-                src_count, dst_count = validate_row_counts(engine, pg_conn, schema_name, table_name, pg_schema_name, table_prefix)
-                if src_count != dst_count:
-                    warning_msg = f"Row count mismatch for {table_name}: MySQL={src_count}, PostgreSQL={dst_count}"
-                    logger.warning(warning_msg)
-                    table_result['errors'].append(warning_msg)
-                else:
-                    logger.info(f"Row count validated for {table_name}: {src_count} rows")
+                table_outcomes = run_table_syncs(sync_order, sync_table, max_workers)
+            finally:
+                pg_pool.close_all()
+        else:
+            syncs_started_at = time.perf_counter()
+            table_outcomes = run_table_syncs(
+                sync_order,
+                lambda table_name: sync_mysql_table(
+                    engine, pg_conn, connector_name, schema_name, table_name, pg_schema_name,
+                    table_configs.get(table_name) or {}, batch_size, table_prefix, catalog
+                )
+            )
 
+        # Merge per-table results in the requested table order
+        for table_name in existing_tables:
+            table_result, succeeded = table_outcomes[table_name]
+            result_tables[table_name] = table_result
+            total_records += table_result['rows_synced']
+            if succeeded:
                 successful_tables += 1
-            except Exception as e:
-                error_msg = f"Error syncing table {table_name}: {str(e)}"
-                logger.error(error_msg)
-                table_result['errors'].append(error_msg)
+            else:
                 failed_tables += 1
-            result_tables[table_name] = table_result
+            if table_result.get('status') == SYNC_STATUS_SKIPPED_UNCHANGED:
+                skipped_tables += 1
+        if plan:
+            record_plan_actuals(plan, result_tables, time.perf_counter() - syncs_started_at)
 
         if pg_conn:
             pg_conn.close()
@@ -522,7 +1430,10 @@ def sync_mysql_tables(
                 'total_records': total_records,
                 'total_tables': len(table_names),
                 'successful_tables': successful_tables,
-                'failed_tables': failed_tables
+                'failed_tables': failed_tables,
+                'skipped_tables': skipped_tables,
+                'max_workers': max_workers,
+                'plan': plan
             }
         }
     except ValueError as e:
@@ -0,0 +1,461 @@
+import io
+import json
+import uuid
+import logging
+import datetime
+from decimal import Decimal
+from typing import List, Optional, Any, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import psycopg2
+from psycopg2 import sql
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Largest integer a float64 can represent exactly; integral floats up to this size
+# are written without a decimal point so they load into INTEGER/BIGINT columns.
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def format_postgres_value(val: Any) -> str:
+    """
+    Format a single non-null Python value as PostgreSQL text input.
+
+    Used for object columns (typed columns are formatted vectorized in _encode_series())
+    and for Arrow columns that could not be typed (see arrow_extraction).
+
+    Args:
+        val: The value to format (must not be null)
+
+    Returns:
+        Text representation accepted by PostgreSQL input functions
+    """
+    if isinstance(val, str):
+        return val
+    if isinstance(val, (bytes, bytearray, memoryview)):
+        # bytea hex format
+        return '\\x' + bytes(val).hex()
+    if isinstance(val, (bool, np.bool_)):
+        return 'true' if val else 'false'
+    if isinstance(val, (float, np.floating)):
+        if np.isfinite(val) and float(val).is_integer() and abs(val) <= _MAX_EXACT_FLOAT_INT:
+            return str(int(val))
+        return repr(float(val))
+    if isinstance(val, pd.Timedelta):
+        val = val.to_pytimedelta()
+    if isinstance(val, datetime.timedelta):
+        # MySQL TIME values arrive as timedelta; HH:MM:SS is valid TIME and INTERVAL input
+        total_us = (val.days * 86400 + val.seconds) * 1000000 + val.microseconds
+        sign = '-' if total_us < 0 else ''
+        hours, rem = divmod(abs(total_us), 3600 * 1000000)
+        minutes, rem = divmod(rem, 60 * 1000000)
+        seconds, micros = divmod(rem, 1000000)
+        return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}.{micros:06d}"
+    if isinstance(val, (datetime.datetime, datetime.date, datetime.time)):
+        return val.isoformat()
+    if isinstance(val, (dict, list)):
+        return json.dumps(val, ensure_ascii=False, default=str)
+    if isinstance(val, (uuid.UUID, Decimal)):
+        return str(val)
+    return str(val)
+
+
+def _encode_series(series: pd.Series) -> pd.Series:
+    """
+    Encode a column as quoted CSV fields for COPY.
+
+    NULL-like values (None, NaN, NaT, pd.NA) become an unquoted empty field, which is
+    how COPY's CSV format represents NULL. Every other value is quoted, so empty strings
+    stay empty strings and no value can be mistaken for NULL.
+
+    Args:
+        series: Column to encode
+
+    Returns:
+        Series of CSV field strings
+    """
+    null_mask = series.isna().to_numpy()
+    if null_mask.all():
+        return pd.Series([''] * len(series), index=series.index, dtype=object)
+
+    values = series[~null_mask]
+
+    if pd.api.types.is_bool_dtype(values.dtype):
+        text = pd.Series(np.where(values.to_numpy(dtype=bool), 'true', 'false'), index=values.index)
+    elif pd.api.types.is_integer_dtype(values.dtype):
+        text = values.astype('int64').astype(str)
+    elif pd.api.types.is_float_dtype(values.dtype):
+        arr = values.to_numpy(dtype='float64')
+        integral = np.isfinite(arr) & (np.abs(arr) <= _MAX_EXACT_FLOAT_INT)
+        integral &= arr == np.trunc(np.where(integral, arr, 0))
+        text = pd.Series(arr, index=values.index).astype(str)
+        if integral.any():
+            text[integral] = arr[integral].astype('int64').astype(str)
+    elif pd.api.types.is_datetime64_any_dtype(values.dtype):
+        # ISO format, keeps the UTC offset for tz-aware columns
+        text = values.astype(str)
+    elif pd.api.types.is_timedelta64_dtype(values.dtype):
+        text = values.map(format_postgres_value)
+    elif values.dtype == object:
+        text = values.map(format_postgres_value)
+    else:
+        # Categorical, string[python], etc.
+        text = values.astype(str)
+
+    quoted = '"' + text.astype(object).str.replace('"', '""', regex=False) + '"'
+
+    encoded = pd.Series([''] * len(series), index=series.index, dtype=object)
+    encoded[~null_mask] = quoted.to_numpy()
+    return encoded
+
+
+def dataframe_to_csv_buffer(df: pd.DataFrame) -> io.StringIO:
+    """
+    Serialize a DataFrame into an in-memory CSV buffer for COPY ... FROM STDIN.
+
+    Handles NULL/NaN/NaT, bytea (hex), UUID, JSON (dict/list) and datetime values.
+    The buffer has no header row and columns are in DataFrame order.
+
+    Args:
+        df: DataFrame to serialize
+
+    Returns:
+        StringIO positioned at the start of the CSV data
+    """
+    buffer = io.StringIO()
+    if df.empty or len(df.columns) == 0:
+        return buffer
+
+    rows = None
+    for col_idx in range(len(df.columns)):
+        encoded = _encode_series(df.iloc[:, col_idx])
+        rows = encoded if rows is None else rows + ',' + encoded
+
+    buffer.write('\n'.join(rows.tolist()))
+    buffer.write('\n')
+    buffer.seek(0)
+    return buffer
+
+
+def record_batch_to_csv_buffer(batch: pa.RecordBatch) -> io.BytesIO:
+    """
+    Serialize an Arrow record batch into an in-memory CSV buffer for COPY ... FROM STDIN.
+
+    Arrow's CSV writer already uses COPY's conventions: NULL is an unquoted empty field,
+    strings are quoted, booleans are true/false and timestamps/dates/decimals are written
+    in PostgreSQL input format. Binary columns are written in bytea hex format.
+
+    Args:
+        batch: Record batch to serialize
+
+    Returns:
+        BytesIO positioned at the start of the CSV data (no header row)
+    """
+    buffer = io.BytesIO()
+    if batch.num_rows == 0 or batch.num_columns == 0:
+        return buffer
+
+    arrays = []
+    for array in batch.columns:
+        if pa.types.is_binary(array.type) or pa.types.is_large_binary(array.type):
+            array = pa.array(
+                [None if v is None else '\\x' + v.hex() for v in array.to_pylist()], type=pa.string()
+            )
+        arrays.append(array)
+    batch = pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+
+    pa_csv.write_csv(batch, buffer, pa_csv.WriteOptions(include_header=False))
+    buffer.seek(0)
+    return buffer
+
+
+def _build_copy_sql(
+    schema_name: Optional[str],
+    table_name: str,
+    column_names: List[str],
+    quote_identifiers: bool
+) -> Any:
+    """
+    Build the COPY ... FROM STDIN statement for a target table.
+
+    Args:
+        schema_name: Target schema name (None for temporary tables)
+        table_name: Target table name
+        column_names: Target column names in buffer order
+        quote_identifiers: Quote names (case-sensitive) instead of using them as-is
+
+    Returns:
+        SQL string or psycopg2.sql.Composed statement
+    """
+    if quote_identifiers:
+        target = sql.Identifier(table_name) if schema_name is None else sql.SQL('{}.{}').format(
+            sql.Identifier(schema_name), sql.Identifier(table_name)
+        )
+        return sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+            target,
+            sql.SQL(',').join(sql.Identifier(c) for c in column_names)
+        )
+    target = table_name if schema_name is None else f"{schema_name}.{table_name}"
+    return f"COPY {target} ({','.join(column_names)}) FROM STDIN WITH (FORMAT csv)"
+
+
+def copy_dataframe_to_postgres(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: Optional[str],
+    table_name: str,
+    df: pd.DataFrame,
+    column_names: Optional[List[str]] = None,
+    quote_identifiers: bool = False,
+    commit: bool = True
+) -> int:
+    """
+    Bulk load a DataFrame into an existing PostgreSQL table with COPY ... FROM STDIN.
+
+    This is the shared write path for all cache loaders (MSSQL/MySQL sync, Excel writers,
+    DuckDB bridge). It replaces row-by-row INSERT/execute_values and to_sql(method='multi'),
+    and is not subject to the 65k bind parameter limit.
+
+    Args:
+        pg_conn: psycopg2 connection
+        schema_name: Target schema name (None for temporary tables)
+        table_name: Target table name
+        df: DataFrame with data to load
+        column_names: Optional target column names (defaults to df.columns), in df column order
+        quote_identifiers: If True, schema/table/column names are quoted (use for tables created
+                           by pandas or with case-sensitive column names). If False, names are
+                           used as-is, matching tables created with unquoted DDL.
+        commit: If True (default), commit after the COPY. Pass False to let the caller
+                control the transaction.
+
+    Returns:
+        Number of rows loaded, as reported by PostgreSQL for the COPY
+
+    Raises:
+        ValueError: If column_names does not match the number of DataFrame columns
+        psycopg2.Error: If the COPY fails (the transaction is rolled back when commit=True)
+    """
+    if df.empty:
+        logger.info(f"No data to copy into {schema_name}.{table_name}")
+        return 0
+
+    if column_names is None:
+        column_names = [str(c) for c in df.columns]
+    elif len(column_names) != len(df.columns):
+        raise ValueError(
+            f"column_names has {len(column_names)} entries but DataFrame has {len(df.columns)} columns"
+        )
+
+    buffer = dataframe_to_csv_buffer(df)
+    return _copy_buffer(pg_conn, schema_name, table_name, buffer, len(df), column_names, quote_identifiers, commit)
+
+
+def copy_record_batch_to_postgres(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: Optional[str],
+    table_name: str,
+    batch: pa.RecordBatch,
+    column_names: Optional[List[str]] = None,
+    quote_identifiers: bool = False,
+    commit: bool = True
+) -> int:
+    """
+    Bulk load an Arrow record batch into an existing PostgreSQL table with COPY ... FROM STDIN.
+
+    Same as copy_dataframe_to_postgres(), but the CSV is written by Arrow from typed
+    columns, without converting the batch to pandas.
+
+    Args:
+        pg_conn: psycopg2 connection
+        schema_name: Target schema name (None for temporary tables)
+        table_name: Target table name
+        batch: Record batch with data to load
+        column_names: Optional target column names (defaults to the batch's), in batch column order
+        quote_identifiers: Quote names instead of using them as-is (see copy_dataframe_to_postgres)
+        commit: If True (default), commit after the COPY
+
+    Returns:
+        Number of rows loaded, as reported by PostgreSQL for the COPY
+
+    Raises:
+        ValueError: If column_names does not match the number of batch columns
+        psycopg2.Error: If the COPY fails (the transaction is rolled back when commit=True)
+    """
+    if batch.num_rows == 0:
+        logger.info(f"No data to copy into {schema_name}.{table_name}")
+        return 0
+
+    if column_names is None:
+        column_names = list(batch.schema.names)
+    elif len(column_names) != batch.num_columns:
+        raise ValueError(
+            f"column_names has {len(column_names)} entries but the record batch has {batch.num_columns} columns"
+        )
+
+    buffer = record_batch_to_csv_buffer(batch)
+    return _copy_buffer(
+        pg_conn, schema_name, table_name, buffer, batch.num_rows, column_names, quote_identifiers, commit
+    )
+
+
+def _copy_buffer(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: Optional[str],
+    table_name: str,
+    buffer: Any,
+    row_count: int,
+    column_names: List[str],
+    quote_identifiers: bool,
+    commit: bool
+) -> int:
+    """Run COPY ... FROM STDIN for a CSV buffer and return the rows PostgreSQL loaded."""
+    copy_sql = _build_copy_sql(schema_name, table_name, column_names, quote_identifiers)
+
+    try:
+        cursor = pg_conn.cursor()
+        cursor.copy_expert(copy_sql, buffer)
+        # The server's row count for the COPY, so callers count rows actually written
+        rows_loaded = cursor.rowcount if isinstance(cursor.rowcount, int) and cursor.rowcount >= 0 else row_count
+        cursor.close()
+        if commit:
+            pg_conn.commit()
+    except Exception as e:
+        logger.error(f"COPY into {schema_name}.{table_name} failed: {e}")
+        if commit:
+            pg_conn.rollback()
+        raise
+
+    logger.debug(f"Copied {rows_loaded} rows into {schema_name}.{table_name}")
+    return rows_loaded
+
+
+def copy_dataframe_with_engine(
+    engine: Any,
+    schema_name: str,
+    table_name: str,
+    df: pd.DataFrame,
+    column_names: Optional[List[str]] = None,
+    quote_identifiers: bool = True
+) -> int:
+    """
+    Bulk load a DataFrame through a SQLAlchemy engine using COPY.
+
+    Checks out the engine's underlying psycopg2 connection, loads and commits.
+
+    Args:
+        engine: SQLAlchemy Engine using the psycopg2 driver
+        schema_name: Target schema name
+        table_name: Target table name
+        df: DataFrame with data to load
+        column_names: Optional target column names (defaults to df.columns)
+        quote_identifiers: Quote names (default True, matching how pandas/SQLAlchemy create tables)
+
+    Returns:
+        Number of rows loaded
+    """
+    raw_conn = engine.raw_connection()
+    try:
+        return copy_dataframe_to_postgres(
+            raw_conn, schema_name, table_name, df,
+            column_names=column_names,
+            quote_identifiers=quote_identifiers
+        )
+    finally:
+        raw_conn.close()
+
+
+def upsert_dataframe_to_postgres(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    df: Union[pd.DataFrame, pa.RecordBatch],
+    key_columns: List[str],
+    column_names: Optional[List[str]] = None,
+    quote_identifiers: bool = False
+) -> int:
+    """
+    Upsert a DataFrame (or Arrow record batch) into an existing PostgreSQL table by primary key.
+
+    Rows are COPY'd into a temporary staging table and merged with
+    INSERT ... ON CONFLICT (key_columns) DO UPDATE, all in one transaction.
+    The target table must have a primary key or unique constraint on key_columns.
+
+    Args:
+        pg_conn: psycopg2 connection
+        schema_name: Target schema name
+        table_name: Target table name
+        df: DataFrame or record batch with data to upsert
+        key_columns: Target column names of the conflict key
+        column_names: Optional target column names (defaults to df.columns), in df column order
+        quote_identifiers: Quote names instead of using them as-is (see copy_dataframe_to_postgres)
+
+    Returns:
+        Number of rows upserted
+
+    Raises:
+        ValueError: If key_columns is empty or not part of the loaded columns
+        psycopg2.Error: If the upsert fails (the transaction is rolled back)
+    """
+    is_batch = isinstance(df, pa.RecordBatch)
+    if len(df) == 0:
+        logger.info(f"No data to upsert into {schema_name}.{table_name}")
+        return 0
+
+    if column_names is None:
+        column_names = [str(c) for c in (df.schema.names if is_batch else df.columns)]
+    if not key_columns or any(k not in column_names for k in key_columns):
+        raise ValueError(f"Key columns {key_columns} must be a non-empty subset of {column_names}")
+
+    staging_table = 'pg_bulk_loader_upsert_staging'
+    update_columns = [c for c in column_names if c not in key_columns]
+
+    ident = sql.Identifier if quote_identifiers else sql.SQL
+    target = sql.SQL('{}.{}').format(ident(schema_name), ident(table_name))
+    cols = sql.SQL(',').join(ident(c) for c in column_names)
+    if update_columns:
+        conflict_action = sql.SQL('DO UPDATE SET {}').format(
+            sql.SQL(', ').join(sql.SQL('{0} = EXCLUDED.{0}').format(ident(c)) for c in update_columns)
+        )
+    else:
+        conflict_action = sql.SQL('DO NOTHING')
+
+    try:
+        cursor = pg_conn.cursor()
+        cursor.execute(sql.SQL(
+            "CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP"
+        ).format(sql.Identifier(staging_table), target))
+        cursor.close()
+
+        copy_rows = copy_record_batch_to_postgres if is_batch else copy_dataframe_to_postgres
+        copy_rows(
+            pg_conn, None, staging_table, df,
+            column_names=column_names,
+            quote_identifiers=quote_identifiers,
+            commit=False
+        )
+
+        cursor = pg_conn.cursor()
+        cursor.execute(sql.SQL(
+            "INSERT INTO {target} ({cols}) SELECT {cols} FROM {staging} "
+            "ON CONFLICT ({keys}) {action}"
+        ).format(
+            target=target,
+            cols=cols,
+            staging=sql.Identifier(staging_table),
+            keys=sql.SQL(',').join(ident(k) for k in key_columns),
+            action=conflict_action
+        ))
+        cursor.close()
+        pg_conn.commit()
+    except Exception as e:
+        logger.error(f"Upsert into {schema_name}.{table_name} failed: {e}")
+        pg_conn.rollback()
+        raise
+
+    logger.debug(f"Upserted {len(df)} rows into {schema_name}.{table_name}")
+    return len(df)
@@ -0,0 +1,212 @@
+import time
+import hashlib
+import logging
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+import psycopg2
+from psycopg2 import sql
+
+from .pg_table_swap import shadow_table_name
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# PostgreSQL truncates identifiers longer than this
+_MAX_IDENTIFIER_LENGTH = 63
+
+
+def _safe_name(name: str) -> str:
+    """Sanitize a source name the way create_postgresql_table does."""
+    return str(name).replace('-', '_').replace(' ', '_')
+
+
+def source_index_name(table_name: str, columns: List[str], suffix: str) -> str:
+    """
+    Name of an index built from the source, following PostgreSQL's own naming
+    (table_pkey, table_col1_col2_key).
+
+    Names longer than PostgreSQL's identifier limit are shortened and get a hash of the
+    full name, so two long names that share a prefix do not collide.
+
+    Args:
+        table_name: PostgreSQL table name
+        columns: Indexed columns (empty for the primary key)
+        suffix: 'pkey' or 'key'
+
+    Returns:
+        Index name
+    """
+    name = '_'.join([table_name, *columns, suffix])
+    if len(name) <= _MAX_IDENTIFIER_LENGTH:
+        return name
+    digest = hashlib.md5(name.encode('utf-8')).hexdigest()[:8]
+    return f"{name[:_MAX_IDENTIFIER_LENGTH - len(suffix) - len(digest) - 2]}_{digest}_{suffix}"
+
+
+def _existing_unique_keys(cursor: Any, table_oid: int) -> Tuple[bool, Set[Tuple[str, ...]]]:
+    """
+    Primary key flag and column lists of the unique indexes a table already has.
+
+    Returns:
+        Tuple of (has primary key, {(column, ...)} of its unique indexes)
+    """
+    cursor.execute(
+        """
+        SELECT i.indisprimary, array_agg(a.attname::text ORDER BY k.ord)
+        FROM pg_index i
+        CROSS JOIN LATERAL unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+        WHERE i.indrelid = %s AND i.indisunique
+        GROUP BY i.indexrelid, i.indisprimary
+        """,
+        (table_oid,)
+    )
+    has_primary_key = False
+    keys = set()
+    for is_primary, column_names in cursor.fetchall():
+        has_primary_key = has_primary_key or is_primary
+        keys.add(tuple(column_names))
+    return has_primary_key, keys
+
+
+def create_source_indexes(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    primary_key: List[str],
+    unique_indexes: List[Dict[str, Any]],
+    analyze: bool = True,
+    quote_identifiers: bool = False,
+    live_table_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Give a loaded table the source's primary key and unique indexes, then ANALYZE it.
+
+    Called after the bulk load, so each index is built once from sorted data instead of
+    being maintained row by row during COPY. Keys the table already has (for example
+    copied from the live table by swap_shadow_table, or created for upserts) are left
+    alone, so repeated syncs only build what is missing. An index that cannot be built
+    (e.g. values that are distinct in the source collide after type conversion) is
+    skipped with a warning.
+
+    A shadow table (see pg_table_swap) is indexed before it is swapped in, so the build
+    never locks the table readers use: make it logged first (set_shadow_logged, which
+    would otherwise rebuild the indexes) and pass the live table's name as live_table_name.
+    The indexes are then created under temporary names (the live table may already have
+    the final ones) and returned in 'renames' for swap_shadow_table to apply.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Schema of the table
+        table_name: Loaded table name (sanitized, with prefix)
+        primary_key: Source primary key columns (empty for none)
+        unique_indexes: Source unique indexes, [{"name": str, "columns": [...]}]
+                        (see SourceCatalog.unique_indexes)
+        analyze: Run ANALYZE on the table afterwards
+        quote_identifiers: Quote names (case-sensitive) instead of using them as-is
+        live_table_name: Live table a shadow table_name replaces (None: table_name is live)
+
+    Returns:
+        Dictionary with index statistics:
+        {
+            "primary_key": bool,        # primary key created
+            "unique_indexes": int,      # unique indexes created
+            "skipped": int,             # indexes that could not be built
+            "renames": [(str, str)],    # (temporary, final) index names, for a shadow
+            "index_seconds": float,
+            "analyze_seconds": float | None
+        }
+    """
+    def ident(name: str) -> sql.Composable:
+        return sql.Identifier(name) if quote_identifiers else sql.SQL(name)
+
+    def folded(columns: List[str]) -> Tuple[str, ...]:
+        # Unquoted names are folded to lower case by PostgreSQL
+        return tuple(_safe_name(col) if quote_identifiers else _safe_name(col).lower() for col in columns)
+
+    def catalog_name(name: str) -> str:
+        # Name as stored in pg_class, for the renames
+        return name if quote_identifiers else name.lower()
+
+    if quote_identifiers:
+        table_ref = sql.SQL('{}.{}').format(sql.Identifier(schema_name), sql.Identifier(table_name))
+        regclass = '.'.join('"' + name.replace('"', '""') + '"' for name in (schema_name, table_name))
+    else:
+        table_ref = sql.SQL(f"{schema_name}.{table_name}")
+        regclass = f"{schema_name}.{table_name}"
+
+    stats = {
+        'primary_key': False, 'unique_indexes': 0, 'skipped': 0, 'renames': [],
+        'index_seconds': 0.0, 'analyze_seconds': None
+    }
+    cursor = pg_conn.cursor()
+    try:
+        started_at = time.perf_counter()
+        cursor.execute("SELECT to_regclass(%s)::oid", (regclass,))
+        table_oid = cursor.fetchone()[0]
+        if table_oid is None:
+            raise ValueError(f"Table {regclass} does not exist")
+        has_primary_key, existing_keys = _existing_unique_keys(cursor, table_oid)
+
+        wanted = []
+        if primary_key and not has_primary_key:
+            wanted.append(('pkey', primary_key))
+        wanted.extend(('key', index['columns']) for index in unique_indexes)
+
+        for kind, columns in wanted:
+            key = folded(columns)
+            if kind == 'key' and key in existing_keys:
+                continue
+            safe_columns = [_safe_name(col) for col in columns]
+            index_name = source_index_name(live_table_name or table_name, [] if kind == 'pkey' else safe_columns, kind)
+            final_name = index_name
+            if live_table_name:
+                index_name = shadow_table_name(index_name)
+            column_list = sql.SQL(', ').join(ident(col) for col in safe_columns)
+            if kind == 'pkey':
+                statement = sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} PRIMARY KEY ({})").format(
+                    table_ref, ident(index_name), column_list
+                )
+            else:
+                statement = sql.SQL("CREATE UNIQUE INDEX {} ON {} ({})").format(
+                    ident(index_name), table_ref, column_list
+                )
+            cursor.execute("SAVEPOINT source_index")
+            try:
+                cursor.execute(statement)
+                cursor.execute("RELEASE SAVEPOINT source_index")
+            except psycopg2.Error as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT source_index")
+                logger.warning(f"Skipping {'primary key' if kind == 'pkey' else 'unique index'} {index_name} on {regclass}: {e}")
+                stats['skipped'] += 1
+                continue
+            existing_keys.add(key)
+            if live_table_name:
+                stats['renames'].append((catalog_name(index_name), catalog_name(final_name)))
+            if kind == 'pkey':
+                stats['primary_key'] = True
+            else:
+                stats['unique_indexes'] += 1
+        pg_conn.commit()
+        stats['index_seconds'] = round(time.perf_counter() - started_at, 3)
+
+        if analyze:
+            started_at = time.perf_counter()
+            cursor.execute(sql.SQL("ANALYZE {}").format(table_ref))
+            pg_conn.commit()
+            stats['analyze_seconds'] = round(time.perf_counter() - started_at, 3)
+    except Exception as e:
+        logger.error(f"Failed to build the indexes of {regclass}: {e}")
+        pg_conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    logger.info(
+        f"Indexed {regclass}: primary key {'created' if stats['primary_key'] else 'unchanged'}, "
+        f"{stats['unique_indexes']} unique indexes created, {stats['skipped']} skipped "
+        f"({stats['index_seconds']}s{', analyzed' if analyze else ''})"
+    )
+    return stats
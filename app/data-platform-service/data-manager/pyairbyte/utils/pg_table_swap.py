@@ -0,0 +1,442 @@
+import time
+import logging
+from typing import List, Dict, Any, Tuple, Optional, Set
+
+import psycopg2
+from psycopg2 import sql
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# How full-refresh loads replace an existing table
+REPLACE_STRATEGY_DROP = 'drop'   # drop and recreate the table, then load it in place
+REPLACE_STRATEGY_SWAP = 'swap'   # load a shadow table and swap it in when complete
+
+SHADOW_SUFFIX = '__shadow'
+
+# PostgreSQL truncates identifiers longer than this
+_MAX_IDENTIFIER_LENGTH = 63
+
+
+def shadow_table_name(table_name: str) -> str:
+    """
+    Name of the shadow table (or temporary index/constraint name) for a live object.
+
+    Args:
+        table_name: Name of the live table, index or constraint
+
+    Returns:
+        Name with SHADOW_SUFFIX, truncated to fit PostgreSQL's identifier limit
+    """
+    return f"{table_name[:_MAX_IDENTIFIER_LENGTH - len(SHADOW_SUFFIX)]}{SHADOW_SUFFIX}"
+
+
+def _table_ref(schema_name: str, table_name: str, quote_identifiers: bool) -> sql.Composable:
+    """Schema-qualified table reference, quoted or as-is (see pg_bulk_loader)."""
+    if quote_identifiers:
+        return sql.SQL('{}.{}').format(sql.Identifier(schema_name), sql.Identifier(table_name))
+    return sql.SQL(f"{schema_name}.{table_name}")
+
+
+def _name_ref(name: str, quote_identifiers: bool) -> sql.Composable:
+    """Unqualified name for RENAME TO, quoted or as-is."""
+    return sql.Identifier(name) if quote_identifiers else sql.SQL(name)
+
+
+def _regclass_oid(cursor: Any, schema_name: str, table_name: str, quote_identifiers: bool) -> Optional[int]:
+    """OID of a table, or None if it does not exist."""
+    if quote_identifiers:
+        schema_name, table_name = ('"' + name.replace('"', '""') + '"' for name in (schema_name, table_name))
+    cursor.execute("SELECT to_regclass(%s)::oid", (f"{schema_name}.{table_name}",))
+    return cursor.fetchone()[0]
+
+
+def create_shadow_table(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    quote_identifiers: bool = False
+) -> str:
+    """
+    Create an empty UNLOGGED shadow of an existing table for a replace load.
+
+    The shadow copies column types, NOT NULL, defaults, identity and generated columns,
+    but no indexes or constraints; swap_shadow_table() adds those after the load. Loaders
+    that derive the table definition from a source schema (MSSQL/MySQL sync) create the
+    shadow themselves with create_postgresql_table(..., unlogged=True) instead.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Schema of the live table
+        table_name: Live table name
+        quote_identifiers: Quote names (case-sensitive) instead of using them as-is
+
+    Returns:
+        Shadow table name
+    """
+    shadow_name = shadow_table_name(table_name)
+    live_ref = _table_ref(schema_name, table_name, quote_identifiers)
+    shadow_ref = _table_ref(schema_name, shadow_name, quote_identifiers)
+    cursor = pg_conn.cursor()
+    try:
+        # A shadow left behind by a failed run is replaced
+        cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(shadow_ref))
+        cursor.execute(sql.SQL(
+            "CREATE UNLOGGED TABLE {} (LIKE {} INCLUDING DEFAULTS INCLUDING IDENTITY "
+            "INCLUDING GENERATED INCLUDING STORAGE INCLUDING COMMENTS)"
+        ).format(shadow_ref, live_ref))
+        pg_conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to create shadow table for {schema_name}.{table_name}: {e}")
+        pg_conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    logger.info(f"Created shadow table {schema_name}.{shadow_name}")
+    return shadow_name
+
+
+def drop_shadow_table(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    shadow_name: str,
+    quote_identifiers: bool = False
+) -> None:
+    """
+    Drop a shadow table after a failed load, leaving the live table untouched.
+
+    Errors are logged, not raised, so this is safe to call from error handlers.
+    """
+    try:
+        pg_conn.rollback()
+        cursor = pg_conn.cursor()
+        cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(
+            _table_ref(schema_name, shadow_name, quote_identifiers)
+        ))
+        pg_conn.commit()
+        cursor.close()
+        logger.info(f"Dropped shadow table {schema_name}.{shadow_name}")
+    except Exception as e:
+        logger.warning(f"Failed to drop shadow table {schema_name}.{shadow_name}: {e}")
+
+
+def set_shadow_logged(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    shadow_name: str,
+    quote_identifiers: bool = False
+) -> float:
+    """
+    Make a loaded shadow table durable (SET LOGGED) before indexes are built on it.
+
+    SET LOGGED rewrites the table and every index on it with full WAL logging, so indexes
+    built first would be built twice. Loaders that index the shadow before the swap call
+    this after the load; the SET LOGGED in swap_shadow_table() is then a no-op.
+
+    Returns:
+        Seconds taken
+
+    Raises:
+        psycopg2.Error: If the table cannot be altered (the transaction is rolled back)
+    """
+    started_at = time.perf_counter()
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(sql.SQL("ALTER TABLE {} SET LOGGED").format(_table_ref(schema_name, shadow_name, quote_identifiers)))
+        pg_conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to make {schema_name}.{shadow_name} logged: {e}")
+        pg_conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return round(time.perf_counter() - started_at, 3)
+
+
+def _copy_constraints(
+    cursor: Any,
+    live_oid: int,
+    shadow_oid: int,
+    shadow_ref: sql.Composable
+) -> Tuple[int, List[Tuple[str, str]]]:
+    """
+    Re-create the live table's constraints on the shadow.
+
+    Primary key, unique and exclusion constraints own an index whose name must be unique
+    in the schema, so they are created under a temporary name and renamed after the swap.
+    A constraint that no longer fits the shadow (e.g. its column was dropped at the
+    source) is skipped with a warning.
+
+    Returns:
+        Tuple of (constraints created, [(temporary name, live name)] to rename after the swap)
+    """
+    cursor.execute(
+        "SELECT conname, contype FROM pg_constraint WHERE conrelid = %s",
+        (shadow_oid,)
+    )
+    existing = cursor.fetchall()
+    existing_names = {name for name, _ in existing}
+    shadow_has_pk = any(contype == 'p' for _, contype in existing)
+
+    cursor.execute(
+        """
+        SELECT conname, contype, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = %s AND contype IN ('p', 'u', 'x', 'c', 'f')
+        ORDER BY contype = 'f', conname
+        """,
+        (live_oid,)
+    )
+    created = 0
+    renames = []
+    for conname, contype, definition in cursor.fetchall():
+        if conname in existing_names or (contype == 'p' and shadow_has_pk):
+            continue
+        owns_index = contype in ('p', 'u', 'x')
+        temp_name = shadow_table_name(conname) if owns_index else conname
+        cursor.execute("SAVEPOINT copy_constraint")
+        try:
+            cursor.execute(sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} {}").format(
+                shadow_ref, sql.Identifier(temp_name), sql.SQL(definition)
+            ))
+            cursor.execute("RELEASE SAVEPOINT copy_constraint")
+        except psycopg2.Error as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT copy_constraint")
+            logger.warning(f"Skipping constraint {conname} ({definition}): {e}")
+            continue
+        created += 1
+        if owns_index:
+            renames.append((temp_name, conname))
+    return created, renames
+
+
+def _index_bodies(cursor: Any, table_oid: int) -> Set[Tuple[bool, str]]:
+    """(unique, definition after USING) of a table's indexes, to compare them across tables."""
+    cursor.execute(
+        "SELECT i.indisunique, pg_get_indexdef(i.indexrelid) FROM pg_index i WHERE i.indrelid = %s",
+        (table_oid,)
+    )
+    return {(is_unique, definition.split(' USING ', 1)[1]) for is_unique, definition in cursor.fetchall()}
+
+
+def _copy_indexes(
+    cursor: Any,
+    live_oid: int,
+    shadow_oid: int,
+    shadow_ref: sql.Composable
+) -> Tuple[int, List[Tuple[str, str]]]:
+    """
+    Re-create the live table's indexes that do not back a constraint on the shadow.
+
+    Indexes the shadow already has (same uniqueness, method, columns and predicate, e.g.
+    source keys built on the shadow before the swap) are not built a second time.
+
+    Returns:
+        Tuple of (indexes created, [(temporary name, live name)] to rename after the swap)
+    """
+    shadow_indexes = _index_bodies(cursor, shadow_oid)
+    cursor.execute(
+        """
+        SELECT c.relname, i.indisunique, pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = %s
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint con
+              WHERE con.conrelid = i.indrelid AND con.conindid = i.indexrelid
+          )
+        ORDER BY c.relname
+        """,
+        (live_oid,)
+    )
+    created = 0
+    renames = []
+    for index_name, is_unique, definition in cursor.fetchall():
+        # pg_get_indexdef: CREATE [UNIQUE] INDEX name ON [ONLY] schema.table USING method (...)
+        index_body = definition.split(' USING ', 1)[1]
+        if (is_unique, index_body) in shadow_indexes:
+            continue
+        temp_name = shadow_table_name(index_name)
+        cursor.execute("SAVEPOINT copy_index")
+        try:
+            cursor.execute(sql.SQL("CREATE {}INDEX {} ON {} USING {}").format(
+                sql.SQL('UNIQUE ' if is_unique else ''), sql.Identifier(temp_name), shadow_ref, sql.SQL(index_body)
+            ))
+            cursor.execute("RELEASE SAVEPOINT copy_index")
+        except psycopg2.Error as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT copy_index")
+            logger.warning(f"Skipping index {index_name} ({definition}): {e}")
+            continue
+        created += 1
+        renames.append((temp_name, index_name))
+    return created, renames
+
+
+def _copy_grants(cursor: Any, live_oid: int, shadow_ref: sql.Composable) -> int:
+    """
+    Re-apply the live table's privileges (other than the owner's) to the shadow.
+
+    Returns:
+        Number of privileges granted
+    """
+    cursor.execute(
+        """
+        SELECT CASE WHEN a.grantee = 0 THEN 'PUBLIC' ELSE pg_get_userbyid(a.grantee) END,
+               a.privilege_type, a.is_grantable
+        FROM pg_class c, aclexplode(c.relacl) a
+        WHERE c.oid = %s AND a.grantee <> c.relowner
+        """,
+        (live_oid,)
+    )
+    granted = 0
+    for grantee, privilege, is_grantable in cursor.fetchall():
+        cursor.execute("SAVEPOINT copy_grant")
+        try:
+            cursor.execute(sql.SQL("GRANT {} ON {} TO {}{}").format(
+                sql.SQL(privilege),
+                shadow_ref,
+                sql.SQL('PUBLIC') if grantee == 'PUBLIC' else sql.Identifier(grantee),
+                sql.SQL(' WITH GRANT OPTION' if is_grantable else '')
+            ))
+            cursor.execute("RELEASE SAVEPOINT copy_grant")
+        except psycopg2.Error as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT copy_grant")
+            logger.warning(f"Skipping grant of {privilege} to {grantee}: {e}")
+            continue
+        granted += 1
+    return granted
+
+
+def _owned_sequences(cursor: Any, live_oid: int, shadow_oid: int) -> List[Tuple[str, str]]:
+    """
+    Sequences owned by live table columns (serial) that the shadow also has.
+
+    Their ownership moves to the shadow before the live table is dropped, so column
+    defaults copied by create_shadow_table() keep working.
+
+    Returns:
+        List of (sequence, column name)
+    """
+    cursor.execute(
+        """
+        SELECT seq.oid::regclass::text, a.attname
+        FROM pg_depend d
+        JOIN pg_class seq ON seq.oid = d.objid AND seq.relkind = 'S'
+        JOIN pg_attribute a ON a.attrelid = d.refobjid AND a.attnum = d.refobjsubid
+        WHERE d.classid = 'pg_class'::regclass
+          AND d.refobjid = %s
+          AND d.deptype = 'a'
+          AND EXISTS (
+              SELECT 1 FROM pg_attribute s
+              WHERE s.attrelid = %s AND s.attname = a.attname AND NOT s.attisdropped
+          )
+        """,
+        (live_oid, shadow_oid)
+    )
+    return cursor.fetchall()
+
+
+def swap_shadow_table(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    table_name: str,
+    shadow_name: str,
+    quote_identifiers: bool = False,
+    index_renames: Optional[List[Tuple[str, str]]] = None
+) -> Dict[str, Any]:
+    """
+    Finish a shadow load and replace the live table with it.
+
+    The shadow is made durable (SET LOGGED, a no-op after set_shadow_logged()), gets the
+    live table's constraints, indexes and grants, and is analyzed, all while readers keep
+    using the live table. The swap itself is one short transaction: move serial sequences,
+    DROP the live table, RENAME the shadow into its place and restore the original
+    index/constraint names. Readers
+    see either the old or the new table, never a partly loaded one. If the live table
+    does not exist yet, the shadow is just renamed.
+
+    Table ownership is not copied: the new table belongs to the loading user, as with
+    DROP/CREATE. Objects depending on the live table (views, foreign keys from other
+    tables) make the DROP fail; the swap is then rolled back and the live table kept.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Schema of both tables
+        table_name: Live table name
+        shadow_name: Loaded shadow table name
+        quote_identifiers: Quote names (case-sensitive) instead of using them as-is
+        index_renames: [(temporary name, final name)] of indexes already built on the
+                       shadow, renamed with the copied ones (see create_source_indexes)
+
+    Returns:
+        Dictionary with swap statistics:
+        {
+            "constraints": int,
+            "indexes": int,
+            "grants": int,
+            "prepare_seconds": float,
+            "swap_seconds": float
+        }
+
+    Raises:
+        psycopg2.Error: If preparing or swapping fails (the shadow table is dropped)
+    """
+    live_ref = _table_ref(schema_name, table_name, quote_identifiers)
+    shadow_ref = _table_ref(schema_name, shadow_name, quote_identifiers)
+    stats = {'constraints': 0, 'indexes': 0, 'grants': 0}
+    cursor = pg_conn.cursor()
+    try:
+        # Build everything the live table has on the shadow, outside the swap transaction
+        prepare_started_at = time.perf_counter()
+        cursor.execute(sql.SQL("ALTER TABLE {} SET LOGGED").format(shadow_ref))
+        shadow_oid = _regclass_oid(cursor, schema_name, shadow_name, quote_identifiers)
+        live_oid = _regclass_oid(cursor, schema_name, table_name, quote_identifiers)
+        renames: List[Tuple[str, str]] = []
+        copied_index_renames: List[Tuple[str, str]] = []
+        sequences: List[Tuple[str, str]] = []
+        if live_oid is not None:
+            stats['constraints'], renames = _copy_constraints(cursor, live_oid, shadow_oid, shadow_ref)
+            stats['indexes'], copied_index_renames = _copy_indexes(cursor, live_oid, shadow_oid, shadow_ref)
+            stats['grants'] = _copy_grants(cursor, live_oid, shadow_ref)
+            sequences = _owned_sequences(cursor, live_oid, shadow_oid)
+        cursor.execute(sql.SQL("ANALYZE {}").format(shadow_ref))
+        pg_conn.commit()
+        stats['prepare_seconds'] = round(time.perf_counter() - prepare_started_at, 3)
+
+        # Swap in one short transaction
+        swap_started_at = time.perf_counter()
+        for sequence, column_name in sequences:
+            cursor.execute(sql.SQL("ALTER SEQUENCE {} OWNED BY {}.{}").format(
+                sql.SQL(sequence), shadow_ref, sql.Identifier(column_name)
+            ))
+        cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(live_ref))
+        cursor.execute(sql.SQL("ALTER TABLE {} RENAME TO {}").format(
+            shadow_ref, _name_ref(table_name, quote_identifiers)
+        ))
+        for temp_name, live_name in renames:
+            cursor.execute(sql.SQL("ALTER TABLE {} RENAME CONSTRAINT {} TO {}").format(
+                live_ref, sql.Identifier(temp_name), sql.Identifier(live_name)
+            ))
+        for temp_name, live_name in copied_index_renames + list(index_renames or []):
+            cursor.execute(sql.SQL("ALTER INDEX {}.{} RENAME TO {}").format(
+                sql.Identifier(schema_name) if quote_identifiers else sql.SQL(schema_name),
+                sql.Identifier(temp_name), sql.Identifier(live_name)
+            ))
+        pg_conn.commit()
+        stats['swap_seconds'] = round(time.perf_counter() - swap_started_at, 3)
+    except Exception as e:
+        logger.error(f"Failed to swap {schema_name}.{shadow_name} into {schema_name}.{table_name}: {e}")
+        cursor.close()
+        drop_shadow_table(pg_conn, schema_name, shadow_name, quote_identifiers)
+        raise
+    cursor.close()
+
+    logger.info(
+        f"Swapped {schema_name}.{shadow_name} into {schema_name}.{table_name} "
+        f"({stats['constraints']} constraints, {stats['indexes']} indexes, {stats['grants']} grants, "
+        f"prepare {stats['prepare_seconds']}s, swap {stats['swap_seconds']}s)"
+    )
+    return stats
@@ -21,6 +21,8 @@ from office365.graph_client import GraphClient
 from office365.runtime.auth.client_credential import ClientCredential
 from office365.sharepoint.client_context import ClientContext
 
+from .http_session import get_http_session
+
 
 class SharePointClient:
     """Legacy SharePoint REST client (kept for backward compatibility).
@@ -176,8 +178,10 @@ class SharePointGraphClient:
         }
         for _ in range(max_retries):
             try:
-                resp = requests.get(url, headers=headers, timeout=30)
+                resp = get_http_session().get(url, headers=headers, timeout=30)
                 if resp.status_code in (429, 500, 502, 503, 504):
+                    # Release the connection to the pool before retrying
+                    resp.close()
                     time.sleep(backoff)
                     backoff = min(backoff * 2, 10)
                     continue
@@ -222,7 +226,7 @@ class SharePointGraphClient:
             "Authorization": f"Bearer {token}",
             "Accept": "application/json",
         }
-        resp = requests.request(method, url, headers=headers, timeout=30)
+        resp = get_http_session().request(method, url, headers=headers, timeout=30)
         if not resp.ok:
             # Enrich 4xx/5xx with response body for easier debugging
             detail = None
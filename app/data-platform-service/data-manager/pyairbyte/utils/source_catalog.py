@@ -0,0 +1,135 @@
+import logging
+from typing import List, Dict, Any, Tuple, Optional, Iterable
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SourceCatalog:
+    """
+    Catalog metadata of the source tables in one sync.
+
+    Built from a single catalog query per sync (see load_mssql_catalog/load_mysql_catalog)
+    and shared read-only by all table syncs, so existence checks, column metadata, primary
+    keys, unique indexes and row estimates cost one catalog load instead of several
+    round trips per table.
+    """
+
+    def __init__(self, schema_name: str, tables: Dict[str, Dict[str, Any]]):
+        """
+        Initialize the catalog.
+
+        Args:
+            schema_name: Source schema name
+            tables: Table name -> {'columns': [...], 'primary_key': [...], 'row_estimate': int | None,
+                    'unique_indexes': [{'name': str, 'columns': [...]}]}; columns use the format
+                    of extract_mssql_schema/extract_mysql_schema
+        """
+        self.schema_name = schema_name
+        self.tables = tables
+
+    @classmethod
+    def from_rows(
+        cls,
+        schema_name: str,
+        table_names: List[str],
+        rows: Iterable[Dict[str, Any]],
+        type_key: str,
+        index_rows: Optional[Iterable[Dict[str, Any]]] = None
+    ) -> 'SourceCatalog':
+        """
+        Build a catalog from one row per source column.
+
+        Rows must be ordered by table and column position and have the keys table_name,
+        column_name, data_type, max_length, precision, scale, is_nullable, default,
+        pk_ordinal (None for non-key columns) and row_estimate. Returned table names are
+        matched to the requested ones exactly, else case-insensitively (MSSQL and MySQL
+        catalogs usually compare names case-insensitively).
+
+        Args:
+            schema_name: Source schema name
+            table_names: Requested table names
+            rows: Catalog rows
+            type_key: Column metadata key for the source type ('mssql_type' or 'mysql_type')
+            index_rows: Optional key columns of the unique indexes other than the primary key,
+                        one row per column with the keys table_name, index_name, column_name
+                        and key_ordinal
+
+        Returns:
+            SourceCatalog keyed by the requested table names
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        pk_positions: Dict[str, List[Tuple[int, str]]] = {}
+        for row in rows:
+            table = found.setdefault(row['table_name'], {
+                'columns': [],
+                'primary_key': [],
+                'row_estimate': int(row['row_estimate']) if row['row_estimate'] is not None else None,
+                'unique_indexes': []
+            })
+            table['columns'].append({
+                'name': row['column_name'],
+                type_key: row['data_type'],
+                'max_length': row['max_length'],
+                'precision': row['precision'],
+                'scale': row['scale'],
+                'is_nullable': bool(row['is_nullable']),
+                'default': row['default']
+            })
+            if row['pk_ordinal'] is not None:
+                pk_positions.setdefault(row['table_name'], []).append((int(row['pk_ordinal']), row['column_name']))
+
+        for name, positions in pk_positions.items():
+            found[name]['primary_key'] = [column for _, column in sorted(positions)]
+
+        index_positions: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
+        for row in index_rows or []:
+            if row['table_name'] in found:
+                index_positions.setdefault((row['table_name'], row['index_name']), []).append(
+                    (int(row['key_ordinal']), row['column_name'])
+                )
+        for (name, index_name), positions in sorted(index_positions.items()):
+            found[name]['unique_indexes'].append({
+                'name': index_name,
+                'columns': [column for _, column in sorted(positions)]
+            })
+
+        by_folded_name = {name.casefold(): name for name in found}
+        tables = {}
+        for table_name in table_names:
+            source_name = table_name if table_name in found else by_folded_name.get(table_name.casefold())
+            if source_name is not None:
+                tables[table_name] = found[source_name]
+        return cls(schema_name, tables)
+
+    def split(self, table_names: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Split table names into existing and missing ones.
+
+        Returns:
+            Tuple of (existing_tables, missing_tables)
+        """
+        existing = [name for name in table_names if name in self.tables]
+        missing = [name for name in table_names if name not in self.tables]
+        return existing, missing
+
+    def columns(self, table_name: str) -> List[Dict[str, Any]]:
+        """Column metadata of a table in column order (empty if the table is unknown)."""
+        table = self.tables.get(table_name)
+        return [dict(col) for col in table['columns']] if table else []
+
+    def primary_key(self, table_name: str) -> List[str]:
+        """Primary key column names in key order (empty if none)."""
+        table = self.tables.get(table_name)
+        return list(table['primary_key']) if table else []
+
+    def unique_indexes(self, table_name: str) -> List[Dict[str, Any]]:
+        """Unique indexes other than the primary key, [{'name': str, 'columns': [...]}] (empty if none)."""
+        table = self.tables.get(table_name)
+        return [dict(index, columns=list(index['columns'])) for index in table.get('unique_indexes', [])] if table else []
+
+    def row_estimate(self, table_name: str) -> Optional[int]:
+        """Row count from the catalog statistics (None for views or unknown tables)."""
+        table = self.tables.get(table_name)
+        return table['row_estimate'] if table else None
@@ -0,0 +1,115 @@
+import hashlib
+import logging
+from typing import List, Dict, Any, Optional, Union
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def project_columns(
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    selected: Optional[List[str]]
+) -> List[Dict[str, Any]]:
+    """
+    Restrict a table's column metadata to the columns a sync reads.
+
+    The projected metadata drives both the source SELECT list and the generated
+    PostgreSQL DDL, so unselected columns are neither transferred nor created.
+    Columns keep their source order.
+
+    Args:
+        table_name: Source table name (for messages)
+        columns: Column metadata of the source table (from the catalog)
+        selected: Column names from the table config ('columns'), or None for all
+
+    Returns:
+        Column metadata of the selected columns
+
+    Raises:
+        ValueError: If a selected column does not exist or none are selected
+    """
+    if selected is None:
+        return columns
+    if isinstance(selected, str):
+        selected = [selected]
+    column_names = {col['name'] for col in columns}
+    unknown = [name for name in selected if name not in column_names]
+    if unknown:
+        raise ValueError(f"Columns {unknown} not found in {table_name}")
+    if not selected:
+        raise ValueError(f"'columns' of {table_name} selects no columns")
+    wanted = set(selected)
+    projected = [col for col in columns if col['name'] in wanted]
+    logger.info(f"Reading {len(projected)} of {len(columns)} columns of {table_name}")
+    return projected
+
+
+def projected_key(key_columns: Optional[Union[str, List[str]]], columns: List[Dict[str, Any]]) -> List[str]:
+    """A key if all its columns are projected, else [] (the key cannot be built on the loaded table)."""
+    if isinstance(key_columns, str):
+        key_columns = [key_columns]
+    column_names = {col['name'] for col in columns}
+    if key_columns and all(col in column_names for col in key_columns):
+        return list(key_columns)
+    return []
+
+
+def projected_unique_indexes(
+    unique_indexes: List[Dict[str, Any]],
+    columns: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """The unique indexes (see SourceCatalog.unique_indexes) whose columns are all projected."""
+    column_names = {col['name'] for col in columns}
+    return [index for index in unique_indexes if all(col in column_names for col in index['columns'])]
+
+
+def loaded_columns_differ(loaded_columns: List[str], columns: List[Dict[str, Any]]) -> bool:
+    """
+    Whether a loaded PostgreSQL table has other columns than a sync would now create.
+
+    Args:
+        loaded_columns: Column names of the loaded table (see sync_state.postgres_table_columns)
+        columns: Projected column metadata of the source table
+
+    Returns:
+        True if the names differ (compared as create_postgresql_table writes them, unquoted)
+    """
+    expected = [col['name'].replace('-', '_').replace(' ', '_').lower() for col in columns]
+    return sorted(expected) != sorted(name.lower() for name in loaded_columns)
+
+
+def combine_conditions(*conditions: Optional[str]) -> Optional[str]:
+    """
+    AND together WHERE conditions (without the WHERE keyword), skipping empty ones.
+
+    Each condition is parenthesized, so a row filter with OR cannot change the meaning of
+    the conditions it is combined with.
+
+    Returns:
+        The combined condition, or None if there is none
+    """
+    present = [condition for condition in conditions if condition]
+    if not present:
+        return None
+    if len(present) == 1:
+        return present[0]
+    return ' AND '.join(f'({condition})' for condition in present)
+
+
+def projection_signature(table_config: Dict[str, Any]) -> Optional[str]:
+    """
+    Short hash of a table's 'columns' and 'where' config, or None without either.
+
+    Appended to change-detection fingerprints, so changing what is read from a table
+    reloads it instead of skipping it as unchanged.
+    """
+    selected = table_config.get('columns')
+    row_filter = table_config.get('where')
+    if selected is None and not row_filter:
+        return None
+    if isinstance(selected, str):
+        selected = [selected]
+    text = f"{sorted(selected) if selected is not None else '*'}|{row_filter or ''}"
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
@@ -5,6 +5,8 @@ from sqlalchemy import create_engine, text
 import pandas as pd
 from airbyte.caches import PostgresCache
 
+from .pg_bulk_loader import copy_dataframe_to_postgres
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -110,14 +112,34 @@ class SqlWriter:
         # Validate schema exists (raises error if not)
         self._validate_schema_exists()
         
-        # Write DataFrame to table
-        df.to_sql(
-            table_name, 
-            self.engine,
-            schema=self.schema_name,
-            if_exists=if_exists,
-            index=False
-        )
+        # to_sql applies if_exists and creates the table, then hands the rows to the insertion
+        # method on the same connection, so the DDL and the COPY share one transaction. It
+        # runs on a connection from engine.begin() because to_sql commits a transaction it
+        # opened itself even when the insert fails: this way a failed COPY also rolls back
+        # the DDL (a 'replace' does not leave an empty table behind). The DDL is built from
+        # the full frame: object columns holding dates, datetimes or bools only get their
+        # DATE/TIMESTAMP/BOOLEAN types when pandas can inspect the values. The COPY encodes
+        # the original frame rather than the INSERT parameters pandas prepares.
+        def copy_rows(pd_table, conn, keys, data_iter):
+            return copy_dataframe_to_postgres(
+                conn.connection,
+                pd_table.schema,
+                pd_table.name,
+                df,
+                column_names=list(keys),
+                quote_identifiers=True,
+                commit=False
+            )
+
+        with self.engine.begin() as conn:
+            df.to_sql(
+                table_name,
+                conn,
+                schema=self.schema_name,
+                if_exists=if_exists,
+                index=False,
+                method=copy_rows
+            )
         
         logger.info(f"Successfully wrote {len(df)} rows to table '{self.schema_name}.{table_name}'")
 
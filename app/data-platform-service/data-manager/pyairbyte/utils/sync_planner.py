@@ -0,0 +1,166 @@
+import math
+import logging
+from typing import List, Dict, Any, Optional, Set
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Assumed throughput of one extraction stream (read, transform and COPY), used to estimate
+# durations; compare with the actual_seconds recorded in the plan to tune it
+DEFAULT_BYTES_PER_SECOND = 20 * 1024 * 1024
+
+# Tables are split into one key range per this many bytes, up to MAX_PLANNED_PARTITIONS
+PARTITION_BYTES = 512 * 1024 * 1024
+MAX_PLANNED_PARTITIONS = 4
+
+# Planned batch sizes aim at chunks of about this many bytes of source data
+TARGET_CHUNK_BYTES = 32 * 1024 * 1024
+MIN_PLANNED_BATCH_SIZE = 1000
+MAX_PLANNED_BATCH_SIZE = 100000
+
+
+def plan_table_syncs(
+    table_names: List[str],
+    table_sizes: Dict[str, Dict[str, Any]],
+    table_configs: Dict[str, Dict[str, Any]],
+    batch_size: int,
+    max_workers: int = 1,
+    partitionable: Optional[Set[str]] = None,
+    bytes_per_second: float = DEFAULT_BYTES_PER_SECOND
+) -> Dict[str, Any]:
+    """
+    Plan a multi-table sync from source table statistics.
+
+    For each table the plan picks a batch size from the average row width (unless the
+    table config sets 'batch_size' or sizes chunks by memory with 'max_chunk_bytes') and
+    a partition count from the data size (unless the config sets 'partitions'; only for
+    tables in partitionable). Tables are scheduled largest first, so the longest syncs
+    start early and smaller ones fill the remaining workers. Tables without statistics
+    keep the requested order after the others and their settings.
+
+    Args:
+        table_names: Tables to sync, in the requested order
+        table_sizes: {table: {"rows": int, "bytes": int}} from the source's statistics
+                     (tables may be missing)
+        table_configs: Per-table configs (connector defaults merged in)
+        batch_size: Batch size of the sync (used when nothing better is known)
+        max_workers: Tables synced in parallel
+        partitionable: Tables that can be split into key ranges (None: none)
+        bytes_per_second: Throughput of one extraction stream for the estimates
+
+    Returns:
+        Dictionary with the plan:
+        {
+            "order": [table, ...],          # scheduling order
+            "max_workers": int,
+            "estimated_seconds": float | None,  # estimated wall time over all workers
+            "tables": {
+                table: {
+                    "rows": int | None, "bytes": int | None,
+                    "batch_size": int, "partitions": int,
+                    "estimated_seconds": float | None
+                }
+            }
+        }
+    """
+    partitionable = partitionable or set()
+    tables = {}
+    for table_name in table_names:
+        config = table_configs.get(table_name) or {}
+        size = table_sizes.get(table_name) or {}
+        rows, data_bytes = size.get('rows'), size.get('bytes')
+        known = rows is not None and data_bytes is not None
+
+        planned_batch = int(config.get('batch_size', batch_size))
+        if known and rows > 0 and 'batch_size' not in config and not config.get('max_chunk_bytes'):
+            row_bytes = max(data_bytes / rows, 1)
+            planned_batch = int(min(MAX_PLANNED_BATCH_SIZE, max(MIN_PLANNED_BATCH_SIZE, TARGET_CHUNK_BYTES // row_bytes)))
+
+        partitions = int(config.get('partitions', 1))
+        if known and 'partitions' not in config and table_name in partitionable:
+            partitions = min(MAX_PLANNED_PARTITIONS, max(1, math.ceil(data_bytes / PARTITION_BYTES)))
+
+        tables[table_name] = {
+            'rows': rows,
+            'bytes': data_bytes,
+            'batch_size': planned_batch,
+            'partitions': partitions,
+            'estimated_seconds': round(data_bytes / bytes_per_second / partitions, 1) if known else None
+        }
+
+    sized = sorted(
+        (name for name in table_names if tables[name]['bytes'] is not None),
+        key=lambda name: tables[name]['bytes'], reverse=True
+    )
+    order = sized + [name for name in table_names if tables[name]['bytes'] is None]
+
+    estimated_seconds = _estimate_wall_seconds(order, tables, max_workers)
+    logger.info(
+        f"Sync plan for {len(order)} tables on {max_workers} workers: order {order}, "
+        f"estimated {estimated_seconds if estimated_seconds is not None else 'unknown'} s"
+    )
+    return {
+        'order': order,
+        'max_workers': max_workers,
+        'estimated_seconds': estimated_seconds,
+        'tables': tables
+    }
+
+
+def _estimate_wall_seconds(order: List[str], tables: Dict[str, Dict[str, Any]], max_workers: int) -> Optional[float]:
+    """Wall time of syncing the tables in order on max_workers workers (None if any is unknown)."""
+    estimates = [tables[name]['estimated_seconds'] for name in order]
+    if not estimates or any(estimate is None for estimate in estimates):
+        return None
+    workers = [0.0] * max(1, min(max_workers, len(estimates)))
+    for estimate in estimates:
+        # Each table starts on the worker that becomes free first
+        workers[workers.index(min(workers))] += estimate
+    return round(max(workers), 1)
+
+
+def apply_sync_plan(
+    table_configs: Dict[str, Dict[str, Any]],
+    plan: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Table configs with the planned 'batch_size' and 'partitions' filled in.
+
+    Settings the configs already have are kept (the plan only fills in what is missing).
+    """
+    planned = {}
+    for table_name, config in table_configs.items():
+        table_plan = plan['tables'].get(table_name)
+        if table_plan is None:
+            planned[table_name] = config
+            continue
+        planned[table_name] = {
+            'batch_size': table_plan['batch_size'],
+            'partitions': table_plan['partitions'],
+            **config
+        }
+    return planned
+
+
+def record_plan_actuals(
+    plan: Dict[str, Any],
+    table_results: Dict[str, Dict[str, Any]],
+    elapsed_seconds: float
+) -> Dict[str, Any]:
+    """
+    Add the actual durations next to the estimates of a plan.
+
+    Args:
+        plan: Plan from plan_table_syncs (updated in place)
+        table_results: Per-table results with 'elapsed_seconds' (see run_table_syncs)
+        elapsed_seconds: Wall time of all table syncs
+
+    Returns:
+        The plan
+    """
+    for table_name, table_plan in plan['tables'].items():
+        table_plan['actual_seconds'] = (table_results.get(table_name) or {}).get('elapsed_seconds')
+    plan['actual_seconds'] = round(elapsed_seconds, 3)
+    return plan
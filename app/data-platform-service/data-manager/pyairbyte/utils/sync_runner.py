@@ -0,0 +1,69 @@
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Tuple, Callable
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# (table_result, succeeded) as returned by the per-table sync functions
+TableOutcome = Tuple[Dict[str, Any], bool]
+
+
+def failed_table_result(table_name: str, error: Exception) -> TableOutcome:
+    """Build the outcome of a table whose sync could not run at all."""
+    error_msg = f"Error syncing table {table_name}: {str(error)}"
+    logger.error(error_msg)
+    return {'rows_synced': 0, 'schema_synced': False, 'errors': [error_msg]}, False
+
+
+def run_table_syncs(
+    table_names: List[str],
+    sync_table: Callable[[str], TableOutcome],
+    max_workers: int = 1
+) -> Dict[str, TableOutcome]:
+    """
+    Run per-table syncs sequentially or on a bounded thread pool.
+
+    sync_table is responsible for its own connections (e.g. checked out from a
+    ConnectionPool) and for catching table-level errors. Anything it still raises is
+    recorded as a failed table so one table cannot abort the others.
+
+    Args:
+        table_names: Tables to sync, in scheduling order
+        sync_table: Callable syncing one table and returning (table_result, succeeded)
+        max_workers: Number of tables synced at the same time (1 = sequential)
+
+    Returns:
+        Dictionary mapping table name to (table_result, succeeded)
+    """
+    outcomes: Dict[str, TableOutcome] = {}
+
+    def timed_sync(table_name: str) -> TableOutcome:
+        started_at = time.perf_counter()
+        table_result, succeeded = sync_table(table_name)
+        table_result['elapsed_seconds'] = round(time.perf_counter() - started_at, 3)
+        return table_result, succeeded
+
+    if max_workers <= 1 or len(table_names) <= 1:
+        for table_name in table_names:
+            try:
+                outcomes[table_name] = timed_sync(table_name)
+            except Exception as e:
+                outcomes[table_name] = failed_table_result(table_name, e)
+        return outcomes
+
+    workers = min(max_workers, len(table_names))
+    logger.info(f"Syncing {len(table_names)} tables with {workers} workers")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='table-sync') as executor:
+        futures = {executor.submit(timed_sync, table_name): table_name for table_name in table_names}
+        for future in as_completed(futures):
+            table_name = futures[future]
+            try:
+                outcomes[table_name] = future.result()
+            except Exception as e:
+                outcomes[table_name] = failed_table_result(table_name, e)
+
+    return outcomes
@@ -0,0 +1,611 @@
+import json
+import logging
+import datetime
+from decimal import Decimal
+from typing import List, Optional, Dict, Any, Tuple, Callable, Sequence
+
+import psycopg2
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Per-table sync state columns added to the cache schema's sync_metadata table
+SYNC_STATE_COLUMNS = {
+    'table_name': 'VARCHAR(255)',
+    'watermark_column': 'VARCHAR(255)',
+    'watermark_value': 'TEXT',
+    'fingerprint': 'TEXT',
+    'checkpoint_key': 'TEXT',
+}
+
+SYNC_MODE_FULL_REFRESH = 'full_refresh'
+SYNC_MODE_INCREMENTAL = 'incremental'
+
+# Change detection for full-refresh tables (table config key 'change_detection'): a
+# fingerprint read from the source before the load is compared with the one stored by
+# the last sync, and the table is skipped when it is unchanged
+CHANGE_DETECTION_CHECKSUM = 'checksum'      # row count + checksum of all rows (full scan on the source)
+CHANGE_DETECTION_ROWVERSION = 'rowversion'  # row count + MAX of a rowversion / auto-updated column
+SYNC_STATUS_SKIPPED_UNCHANGED = 'skipped_unchanged'
+
+# Resumable full refresh (table config key 'resumable'): the sync_metadata row of a load in
+# progress holds the primary key of the last committed chunk in checkpoint_key, and a
+# failed or interrupted load is continued after that key by the next sync
+SYNC_STATUS_RUNNING = 'running'
+
+
+def ensure_sync_metadata_table(pg_conn: psycopg2.extensions.connection, schema_name: str) -> None:
+    """
+    Make sure the cache schema's sync_metadata table exists and has the per-table state columns.
+
+    The base table matches PyAirbyteCacheDBManager.initialize_cache_database(); the state
+    columns are added with ADD COLUMN IF NOT EXISTS so existing tables are upgraded in place.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Cache schema name (e.g., 'pyairbyte_cache')
+    """
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {schema_name}.sync_metadata (
+                id SERIAL PRIMARY KEY,
+                connector_name VARCHAR(255) NOT NULL,
+                schema_name VARCHAR(255) NOT NULL,
+                sync_started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                sync_completed_at TIMESTAMP,
+                sync_status VARCHAR(50) DEFAULT 'running',
+                records_synced INTEGER DEFAULT 0,
+                error_message TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        for col_name, col_type in SYNC_STATE_COLUMNS.items():
+            cursor.execute(
+                f"ALTER TABLE {schema_name}.sync_metadata ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+            )
+        pg_conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to prepare {schema_name}.sync_metadata: {e}")
+        pg_conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _watermark_payload(value: Any) -> Dict[str, Any]:
+    if isinstance(value, datetime.datetime):
+        return {'type': 'datetime', 'value': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'type': 'date', 'value': value.isoformat()}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {'type': 'bytes', 'value': bytes(value).hex()}
+    if isinstance(value, bool):
+        return {'type': 'str', 'value': str(value)}
+    if isinstance(value, int):
+        return {'type': 'int', 'value': value}
+    if isinstance(value, float):
+        return {'type': 'float', 'value': value}
+    if isinstance(value, Decimal):
+        return {'type': 'decimal', 'value': str(value)}
+    return {'type': 'str', 'value': str(value)}
+
+
+def _watermark_from_payload(payload: Dict[str, Any]) -> Any:
+    value_type = payload.get('type')
+    value = payload.get('value')
+    if value_type == 'datetime':
+        return datetime.datetime.fromisoformat(value)
+    if value_type == 'date':
+        return datetime.date.fromisoformat(value)
+    if value_type == 'bytes':
+        return bytes.fromhex(value)
+    if value_type == 'int':
+        return int(value)
+    if value_type == 'float':
+        return float(value)
+    if value_type == 'decimal':
+        return Decimal(value)
+    return value
+
+
+def serialize_watermark(value: Any) -> Optional[str]:
+    """
+    Serialize a watermark value with its type so it can be restored exactly.
+
+    Supports datetime/date (ISO format), int, float, Decimal, bytes (e.g. MSSQL rowversion,
+    stored as hex) and strings.
+
+    Args:
+        value: Watermark value as returned by the source driver
+
+    Returns:
+        JSON string, or None if value is None
+    """
+    if value is None:
+        return None
+    return json.dumps(_watermark_payload(value))
+
+
+def deserialize_watermark(text: Optional[str]) -> Any:
+    """
+    Restore a watermark value written by serialize_watermark().
+
+    Args:
+        text: Serialized watermark
+
+    Returns:
+        The watermark value with its original Python type, or None
+    """
+    if text is None:
+        return None
+    return _watermark_from_payload(json.loads(text))
+
+
+def serialize_checkpoint(key_values: Sequence[Any]) -> str:
+    """
+    Serialize the primary key values of a checkpoint (one per key column, in key order).
+
+    Each value keeps its type the way serialize_watermark() stores it.
+    """
+    return json.dumps([_watermark_payload(value) for value in key_values])
+
+
+def deserialize_checkpoint(text: Optional[str]) -> Optional[List[Any]]:
+    """Restore the key values written by serialize_checkpoint(), or None."""
+    if text is None:
+        return None
+    return [_watermark_from_payload(payload) for payload in json.loads(text)]
+
+
+def describe_watermark(value: Any) -> Optional[str]:
+    """Readable form of a watermark value for sync results and logs."""
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '0x' + bytes(value).hex().upper()
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def get_last_watermark(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    connector_name: str,
+    table_name: str,
+    watermark_column: str
+) -> Any:
+    """
+    Get the high-watermark stored by the last completed sync of a table.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Cache schema holding sync_metadata
+        connector_name: Connector name
+        table_name: Source table name
+        watermark_column: Watermark column; a watermark stored for another column is ignored
+
+    Returns:
+        The last watermark value, or None if the table has not been synced incrementally yet
+    """
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(
+            f"""
+            SELECT watermark_value
+            FROM {schema_name}.sync_metadata
+            WHERE connector_name = %s
+              AND table_name = %s
+              AND watermark_column = %s
+              AND sync_status = 'completed'
+              AND watermark_value IS NOT NULL
+            ORDER BY sync_completed_at DESC, id DESC
+            LIMIT 1
+            """,
+            (connector_name, table_name, watermark_column)
+        )
+        row = cursor.fetchone()
+        return deserialize_watermark(row[0]) if row else None
+    finally:
+        cursor.close()
+
+
+def format_fingerprint(mode: str, row_count: Optional[int], value: Any) -> str:
+    """
+    Build the fingerprint stored for a table, e.g. 'checksum:1200:-93841'.
+
+    The mode is part of the fingerprint so switching modes never compares values of
+    different kinds, and the row count catches deletes a MAX() would not see.
+    """
+    return f"{mode}:{row_count}:{describe_watermark(value)}"
+
+
+def get_last_fingerprint(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    connector_name: str,
+    table_name: str
+) -> Optional[str]:
+    """
+    Get the source fingerprint stored by the last sync of a table.
+
+    Only the most recent sync counts: if it failed or did not record a fingerprint (for
+    example because its load could not be verified), None is returned so the table is
+    loaded again.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Cache schema holding sync_metadata
+        connector_name: Connector name
+        table_name: Source table name
+
+    Returns:
+        The fingerprint, or None
+    """
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(
+            f"""
+            SELECT sync_status, fingerprint
+            FROM {schema_name}.sync_metadata
+            WHERE connector_name = %s
+              AND table_name = %s
+            ORDER BY sync_completed_at DESC, id DESC
+            LIMIT 1
+            """,
+            (connector_name, table_name)
+        )
+        row = cursor.fetchone()
+        return row[1] if row and row[0] == 'completed' else None
+    finally:
+        cursor.close()
+
+
+def record_table_sync(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    connector_name: str,
+    table_name: str,
+    sync_status: str,
+    records_synced: int,
+    sync_started_at: datetime.datetime,
+    watermark_column: Optional[str] = None,
+    watermark_value: Any = None,
+    error_message: Optional[str] = None,
+    fingerprint: Optional[str] = None
+) -> None:
+    """
+    Record the outcome of a table sync in sync_metadata.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Cache schema holding sync_metadata
+        connector_name: Connector name
+        table_name: Source table name
+        sync_status: 'completed' or 'failed'
+        records_synced: Number of rows written by this sync
+        sync_started_at: When the table sync started
+        watermark_column: Watermark column name (incremental mode)
+        watermark_value: New high-watermark (incremental mode)
+        error_message: Error message for failed syncs
+        fingerprint: Source fingerprint the loaded data corresponds to (change detection)
+    """
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(
+            f"""
+            INSERT INTO {schema_name}.sync_metadata (
+                connector_name, schema_name, table_name, sync_started_at, sync_completed_at,
+                sync_status, records_synced, error_message, watermark_column, watermark_value,
+                fingerprint
+            ) VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP, %s, %s, %s, %s, %s, %s)
+            """,
+            (
+                connector_name, schema_name, table_name, sync_started_at,
+                sync_status, records_synced, error_message,
+                watermark_column, serialize_watermark(watermark_value), fingerprint
+            )
+        )
+        pg_conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to record sync state for {table_name}: {e}")
+        pg_conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def get_resume_checkpoint(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    connector_name: str,
+    table_name: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the checkpoint of an unfinished resumable load of a table.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Cache schema holding sync_metadata
+        connector_name: Connector name
+        table_name: Source table name
+
+    Returns:
+        None if there is nothing to resume, else:
+        {
+            "sync_id": int,           # sync_metadata row of the unfinished load
+            "key": list,              # primary key of the last committed chunk
+            "rows_loaded": int,       # rows committed up to and including that chunk
+            "sync_status": str        # 'failed' or 'running' (interrupted)
+        }
+    """
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(
+            f"""
+            SELECT id, sync_status, checkpoint_key, records_synced
+            FROM {schema_name}.sync_metadata
+            WHERE connector_name = %s
+              AND table_name = %s
+              AND checkpoint_key IS NOT NULL
+              AND sync_status <> 'completed'
+            ORDER BY id DESC
+            LIMIT 1
+            """,
+            (connector_name, table_name)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return {
+            'sync_id': row[0],
+            'key': deserialize_checkpoint(row[2]),
+            'rows_loaded': row[3] or 0,
+            'sync_status': row[1]
+        }
+    finally:
+        cursor.close()
+
+
+def start_checkpointed_sync(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    connector_name: str,
+    table_name: str,
+    sync_started_at: datetime.datetime,
+    resume_from: Optional[Dict[str, Any]] = None
+) -> int:
+    """
+    Record the start of a resumable load and return its sync_metadata row id.
+
+    Checkpoints of earlier unfinished loads of the table are discarded (a resumed load
+    carries its checkpoint over into the new row), and rows of loads that were interrupted
+    while running are marked failed, so at most one checkpoint per table exists.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Cache schema holding sync_metadata
+        connector_name: Connector name
+        table_name: Source table name
+        sync_started_at: When the table sync started
+        resume_from: Checkpoint being resumed (see get_resume_checkpoint), or None for a
+                     load from the start
+
+    Returns:
+        The id of the new sync_metadata row
+    """
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(
+            f"""
+            UPDATE {schema_name}.sync_metadata
+            SET checkpoint_key = NULL,
+                sync_status = CASE WHEN sync_status = %s THEN 'failed' ELSE sync_status END,
+                sync_completed_at = COALESCE(sync_completed_at, CURRENT_TIMESTAMP)
+            WHERE connector_name = %s
+              AND table_name = %s
+              AND sync_status <> 'completed'
+              AND (checkpoint_key IS NOT NULL OR sync_status = %s)
+            """,
+            (SYNC_STATUS_RUNNING, connector_name, table_name, SYNC_STATUS_RUNNING)
+        )
+        cursor.execute(
+            f"""
+            INSERT INTO {schema_name}.sync_metadata (
+                connector_name, schema_name, table_name, sync_started_at,
+                sync_status, records_synced, checkpoint_key
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+            RETURNING id
+            """,
+            (
+                connector_name, schema_name, table_name, sync_started_at, SYNC_STATUS_RUNNING,
+                resume_from['rows_loaded'] if resume_from else 0,
+                serialize_checkpoint(resume_from['key']) if resume_from else None
+            )
+        )
+        sync_id = cursor.fetchone()[0]
+        pg_conn.commit()
+        return sync_id
+    except Exception as e:
+        logger.error(f"Failed to record the start of the sync of {table_name}: {e}")
+        pg_conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def save_checkpoint(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    sync_id: int,
+    key_values: Sequence[Any],
+    rows_loaded: int
+) -> None:
+    """
+    Store the primary key of the last loaded chunk of a resumable load.
+
+    Does not commit: the caller commits it in the same transaction as the chunk, so the
+    checkpoint never gets ahead of (or behind) the committed rows.
+
+    Args:
+        pg_conn: PostgreSQL connection the chunk was loaded on
+        schema_name: Cache schema holding sync_metadata
+        sync_id: Row id returned by start_checkpointed_sync()
+        key_values: Primary key values of the chunk's last row, in key order
+        rows_loaded: Rows loaded so far, including this chunk
+    """
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(
+            f"UPDATE {schema_name}.sync_metadata SET checkpoint_key = %s, records_synced = %s WHERE id = %s",
+            (serialize_checkpoint(key_values), rows_loaded, sync_id)
+        )
+    finally:
+        cursor.close()
+
+
+def finish_checkpointed_sync(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    sync_id: int,
+    sync_status: str,
+    records_synced: Optional[int] = None,
+    error_message: Optional[str] = None
+) -> None:
+    """
+    Record the outcome of a resumable load.
+
+    A completed load clears its checkpoint; a failed one keeps it for the next sync.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Cache schema holding sync_metadata
+        sync_id: Row id returned by start_checkpointed_sync()
+        sync_status: 'completed' or 'failed'
+        records_synced: Rows in the loaded table (None keeps the last checkpoint's count)
+        error_message: Error message for failed loads
+    """
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(
+            f"""
+            UPDATE {schema_name}.sync_metadata
+            SET sync_status = %s,
+                sync_completed_at = CURRENT_TIMESTAMP,
+                records_synced = COALESCE(%s, records_synced),
+                error_message = %s,
+                checkpoint_key = CASE WHEN %s = 'completed' THEN NULL ELSE checkpoint_key END
+            WHERE id = %s
+            """,
+            (sync_status, records_synced, error_message, sync_status, sync_id)
+        )
+        pg_conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to record the outcome of sync {sync_id}: {e}")
+        pg_conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def postgres_table_exists(pg_conn: psycopg2.extensions.connection, schema_name: str, table_name: str) -> bool:
+    """Check whether a table exists in PostgreSQL."""
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (f"{schema_name}.{table_name}",))
+        return bool(cursor.fetchone()[0])
+    finally:
+        cursor.close()
+
+
+def postgres_table_columns(pg_conn: psycopg2.extensions.connection, schema_name: str, table_name: str) -> List[str]:
+    """Column names of a PostgreSQL table in column order (empty if it does not exist)."""
+    cursor = pg_conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT attname::text FROM pg_attribute "
+            "WHERE attrelid = to_regclass(%s) AND attnum > 0 AND NOT attisdropped ORDER BY attnum",
+            (f"{schema_name}.{table_name}",)
+        )
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def is_table_unchanged(
+    pg_conn: psycopg2.extensions.connection,
+    schema_name: str,
+    connector_name: str,
+    table_name: str,
+    pg_table_name: str,
+    fingerprint: str
+) -> bool:
+    """
+    Check whether a table can be skipped because its source has not changed.
+
+    Args:
+        pg_conn: PostgreSQL connection
+        schema_name: Cache schema holding sync_metadata and the loaded table
+        connector_name: Connector name
+        table_name: Source table name
+        pg_table_name: Loaded table name (with prefix)
+        fingerprint: Fingerprint just read from the source (see format_fingerprint)
+
+    Returns:
+        True if the last sync loaded data with the same fingerprint and the loaded
+        table still exists
+    """
+    ensure_sync_metadata_table(pg_conn, schema_name)
+    return (
+        get_last_fingerprint(pg_conn, schema_name, connector_name, table_name) == fingerprint
+        and postgres_table_exists(pg_conn, schema_name, pg_table_name)
+    )
+
+
+def resolve_incremental_config(
+    table_name: str,
+    table_config: Dict[str, Any],
+    columns: List[Dict[str, Any]],
+    discover_primary_key: Callable[[], List[str]]
+) -> Tuple[str, List[str]]:
+    """
+    Validate the incremental settings of a table.
+
+    Args:
+        table_name: Source table name
+        table_config: Per-table config with 'watermark_column' and optional 'primary_key'
+                      (a column name or list of column names)
+        columns: Column metadata of the source table
+        discover_primary_key: Called to read the source primary key when the config has none
+
+    Returns:
+        Tuple of (watermark_column, key_columns)
+
+    Raises:
+        ValueError: If the watermark column or primary key is missing or unknown
+    """
+    column_names = {col['name'] for col in columns}
+
+    watermark_column = table_config.get('watermark_column')
+    if not watermark_column:
+        raise ValueError(f"Incremental sync of {table_name} requires 'watermark_column'")
+    if watermark_column not in column_names:
+        raise ValueError(f"Watermark column '{watermark_column}' not found in {table_name}")
+
+    key_columns = table_config.get('primary_key') or discover_primary_key()
+    if isinstance(key_columns, str):
+        key_columns = [key_columns]
+    if not key_columns:
+        raise ValueError(
+            f"Incremental sync of {table_name} requires a primary key; "
+            f"set 'primary_key' in the table config"
+        )
+    unknown = [col for col in key_columns if col not in column_names]
+    if unknown:
+        raise ValueError(f"Primary key columns {unknown} not found in {table_name}")
+
+    return watermark_column, list(key_columns)
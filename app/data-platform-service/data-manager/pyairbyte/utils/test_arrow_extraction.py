@@ -0,0 +1,95 @@
+import unittest
+import sys
+import datetime
+from decimal import Decimal
+
+import pyarrow as pa
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.arrow_extraction import (
+    arrow_type_for_postgres,
+    arrow_schema,
+    column_to_arrow,
+    rows_to_record_batch
+)
+
+
+class TestArrowTypeForPostgres(unittest.TestCase):
+    """Test cases for arrow_type_for_postgres."""
+
+    def test_fixed_types(self):
+        self.assertEqual(arrow_type_for_postgres('INTEGER'), pa.int32())
+        self.assertEqual(arrow_type_for_postgres('DOUBLE PRECISION'), pa.float64())
+        self.assertEqual(arrow_type_for_postgres('TIMESTAMP WITH TIME ZONE'), pa.timestamp('us', tz='UTC'))
+        self.assertEqual(arrow_type_for_postgres('BYTEA'), pa.binary())
+
+    def test_lengths_are_ignored(self):
+        self.assertEqual(arrow_type_for_postgres('VARCHAR(50)'), pa.string())
+        self.assertEqual(arrow_type_for_postgres('CHAR(2)'), pa.string())
+
+    def test_numeric_precision(self):
+        """Numerics with a precision are exact decimals; others are carried as text."""
+        self.assertEqual(arrow_type_for_postgres('NUMERIC(19,4)'), pa.decimal128(19, 4))
+        self.assertEqual(arrow_type_for_postgres('DECIMAL(10)'), pa.decimal128(10, 0))
+        self.assertEqual(arrow_type_for_postgres('NUMERIC'), pa.string())
+        self.assertEqual(arrow_type_for_postgres('NUMERIC(65,30)'), pa.string())
+
+    def test_unknown_types_are_strings(self):
+        self.assertEqual(arrow_type_for_postgres('JSONB'), pa.string())
+
+
+class TestColumnToArrow(unittest.TestCase):
+    """Test cases for converting driver values to Arrow arrays."""
+
+    def test_mysql_bit_bytes_to_bool(self):
+        array = column_to_arrow('flag', [b'\x01', None, b'\x00'], pa.bool_())
+        self.assertEqual(array.to_pylist(), [True, None, False])
+
+    def test_mysql_time_timedelta(self):
+        array = column_to_arrow('at', [datetime.timedelta(hours=3, minutes=4), None], pa.time64('us'))
+        self.assertEqual(array.to_pylist(), [datetime.time(3, 4), None])
+
+    def test_uuid_and_decimal_values_in_string_columns(self):
+        array = column_to_arrow('ref', [Decimal('1.50'), 'x', None], pa.string())
+        self.assertEqual(array.to_pylist(), ['1.50', 'x', None])
+
+    def test_unconvertible_values_fall_back_to_postgres_text(self):
+        """Values Arrow cannot type are carried as the text PostgreSQL parses on COPY."""
+        array = column_to_arrow('at', [datetime.timedelta(hours=30), None], pa.time64('us'))
+        self.assertEqual(array.type, pa.string())
+        self.assertEqual(array.to_pylist(), ['30:00:00.000000', None])
+
+
+class TestRowsToRecordBatch(unittest.TestCase):
+    """Test cases for rows_to_record_batch."""
+
+    def test_rows_become_typed_columns(self):
+        schema = arrow_schema(
+            ['id', 'name', 'amount', 'created'],
+            {'id': 'BIGINT', 'name': 'TEXT', 'amount': 'NUMERIC(10,2)', 'created': 'TIMESTAMP'}
+        )
+        rows = [
+            (1, 'a', Decimal('1.50'), datetime.datetime(2024, 1, 2, 3, 4, 5)),
+            (2, None, None, None)
+        ]
+
+        batch = rows_to_record_batch(rows, schema)
+
+        self.assertEqual(batch.schema, schema)
+        self.assertEqual(batch.num_rows, 2)
+        self.assertEqual(batch.column(2).to_pylist(), [Decimal('1.50'), None])
+
+    def test_columns_missing_from_metadata_are_strings(self):
+        schema = arrow_schema(['id', 'extra'], {'id': 'INTEGER'})
+        self.assertEqual(schema.field('extra').type, pa.string())
+
+    def test_no_rows(self):
+        schema = arrow_schema(['id'], {'id': 'INTEGER'})
+        self.assertEqual(rows_to_record_batch([], schema).num_rows, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ import psycopg2
 import sys
 sys.path.append('/Users/surenr/dev/99x-data-platform/version2/dataplatform-99x/app/data-manager')
 from pyairbyte.utils.cache_db_manager import PyAirbyteCacheDBManager
+from pyairbyte.utils.connection_pool import close_shared_pools
 
 
 class TestPyAirbyteCacheDBManager(unittest.TestCase):
@@ -27,6 +28,7 @@ class TestPyAirbyteCacheDBManager(unittest.TestCase):
     def tearDown(self):
         """Clean up after tests."""
         self.env_patcher.stop()
+        close_shared_pools()
     
     @patch('psycopg2.connect')
     def test_get_connection(self, mock_connect):
@@ -43,7 +45,34 @@ class TestPyAirbyteCacheDBManager(unittest.TestCase):
             password='test_password',
             database='test_cache_db'
         )
-        self.assertEqual(conn, mock_conn)
+        self.assertEqual(conn.raw_connection, mock_conn)
+    
+    @patch('psycopg2.connect')
+    def test_get_connection_reuses_pooled_connection(self, mock_connect):
+        """Test that a closed connection is returned to the pool and reused."""
+        mock_conn = Mock(closed=0, autocommit=False)
+        mock_connect.return_value = mock_conn
+        
+        first = self.cache_manager.get_connection()
+        first.close()
+        second = self.cache_manager.get_connection()
+        
+        mock_connect.assert_called_once()
+        mock_conn.rollback.assert_called_once()
+        mock_conn.close.assert_not_called()
+        self.assertIs(second.raw_connection, mock_conn)
+    
+    @patch('psycopg2.connect')
+    def test_failed_operation_returns_connection_to_pool(self, mock_connect):
+        """Test that a connection is returned to the pool when the statement fails."""
+        mock_conn = Mock(closed=0, autocommit=False)
+        mock_conn.cursor.return_value.execute.side_effect = psycopg2.OperationalError("boom")
+        mock_connect.return_value = mock_conn
+        
+        self.assertFalse(self.cache_manager.truncate_cache_table('t'))
+        mock_conn.rollback.assert_called_once()
+        self.assertIs(self.cache_manager.get_connection().raw_connection, mock_conn)
+        mock_connect.assert_called_once()
     
     @patch('psycopg2.connect')
     def test_create_cache_database_success(self, mock_connect):
@@ -0,0 +1,162 @@
+import unittest
+from unittest.mock import Mock
+import sys
+import time
+import threading
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.chunk_pipeline import run_chunk_pipeline, combine_pipeline_stats
+
+
+class TestRunChunkPipeline(unittest.TestCase):
+    """Test cases for run_chunk_pipeline."""
+
+    def test_chunks_loaded_in_order(self):
+        """Every chunk is loaded once, in the order it was read, on the calling thread."""
+        loaded = []
+        threads = set()
+
+        def load_chunk(chunk, read_seconds):
+            loaded.append(chunk)
+            threads.add(threading.current_thread())
+
+        stats = run_chunk_pipeline(iter(range(20)), load_chunk, depth=2)
+
+        self.assertEqual(loaded, list(range(20)))
+        self.assertEqual(threads, {threading.current_thread()})
+        self.assertEqual(stats['depth'], 2)
+
+    def test_reads_and_loads_overlap(self):
+        """The next chunk is read while the previous one is loaded."""
+        def chunks():
+            for i in range(5):
+                time.sleep(0.02)
+                yield i
+
+        started_at = time.perf_counter()
+        stats = run_chunk_pipeline(chunks(), lambda chunk, read_seconds: time.sleep(0.02), depth=2)
+        elapsed = time.perf_counter() - started_at
+
+        # Sequential would take 5 * (0.02 + 0.02) = 0.2s
+        self.assertLess(elapsed, 0.17)
+        self.assertGreater(stats['extract_busy_seconds'], 0.09)
+        self.assertGreater(stats['load_busy_seconds'], 0.09)
+
+    def test_queue_depth_bounds_read_ahead(self):
+        """The producer reads at most depth + 1 chunks ahead of the loader."""
+        read = []
+        ahead = []
+
+        def chunks():
+            for i in range(10):
+                read.append(i)
+                yield i
+
+        def load_chunk(chunk, read_seconds):
+            time.sleep(0.01)
+            ahead.append(len(read) - chunk - 1)
+
+        run_chunk_pipeline(chunks(), load_chunk, depth=2)
+
+        self.assertLessEqual(max(ahead), 3)
+
+    def test_slow_target_is_bottleneck(self):
+        """A loader slower than the source is reported as the bottleneck."""
+        stats = run_chunk_pipeline(iter(range(5)), lambda chunk, read_seconds: time.sleep(0.02), depth=1)
+
+        self.assertEqual(stats['bottleneck'], 'target')
+        self.assertGreater(stats['extract_idle_seconds'], stats['load_idle_seconds'])
+
+    def test_slow_source_is_bottleneck(self):
+        """A source slower than the loader is reported as the bottleneck."""
+        def chunks():
+            for i in range(5):
+                time.sleep(0.02)
+                yield i
+
+        stats = run_chunk_pipeline(chunks(), lambda chunk, read_seconds: None, depth=2)
+
+        self.assertEqual(stats['bottleneck'], 'source')
+
+    def test_extract_error_is_raised(self):
+        """An error while reading is raised on the calling thread after earlier chunks are loaded."""
+        loaded = []
+
+        def chunks():
+            yield 1
+            raise ValueError('read failed')
+
+        with self.assertRaises(ValueError):
+            run_chunk_pipeline(chunks(), lambda chunk, read_seconds: loaded.append(chunk), depth=2)
+        self.assertEqual(loaded, [1])
+
+    def test_load_error_stops_and_closes_reader(self):
+        """A load error stops the producer and closes the chunk generator."""
+        state = {'read': 0, 'closed': False}
+
+        def chunks():
+            try:
+                for i in range(1000):
+                    state['read'] += 1
+                    yield i
+            finally:
+                state['closed'] = True
+
+        def load_chunk(chunk, read_seconds):
+            raise RuntimeError('COPY failed')
+
+        with self.assertRaises(RuntimeError):
+            run_chunk_pipeline(chunks(), load_chunk, depth=2)
+        self.assertTrue(state['closed'])
+        self.assertLess(state['read'], 10)
+
+    def test_depth_zero_runs_inline(self):
+        """Depth 0 reads and loads alternately on the calling thread."""
+        reader_threads = set()
+
+        def chunks():
+            for i in range(3):
+                reader_threads.add(threading.current_thread())
+                yield i
+
+        loaded = []
+        stats = run_chunk_pipeline(chunks(), lambda chunk, read_seconds: loaded.append(chunk), depth=0)
+
+        self.assertEqual(loaded, [0, 1, 2])
+        self.assertEqual(reader_threads, {threading.current_thread()})
+        self.assertEqual(stats['depth'], 0)
+
+    def test_empty_source(self):
+        """A source without chunks loads nothing."""
+        load_chunk = Mock()
+
+        run_chunk_pipeline(iter([]), load_chunk)
+
+        load_chunk.assert_not_called()
+
+
+class TestCombinePipelineStats(unittest.TestCase):
+    """Test cases for combine_pipeline_stats."""
+
+    def test_partition_times_are_summed(self):
+        """Busy and idle times of partitions are added up."""
+        partition = {
+            'depth': 2, 'extract_busy_seconds': 1.0, 'extract_idle_seconds': 0.5,
+            'load_busy_seconds': 1.2, 'load_idle_seconds': 0.1, 'bottleneck': 'target'
+        }
+
+        combined = combine_pipeline_stats([partition, partition])
+
+        self.assertEqual(combined['extract_busy_seconds'], 2.0)
+        self.assertEqual(combined['load_idle_seconds'], 0.2)
+        self.assertEqual(combined['bottleneck'], 'target')
+
+    def test_no_partitions(self):
+        self.assertIsNone(combine_pipeline_stats([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
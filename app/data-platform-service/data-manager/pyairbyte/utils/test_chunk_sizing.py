@@ -0,0 +1,132 @@
+import unittest
+import sys
+
+import pandas as pd
+import pyarrow as pa
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.chunk_sizing import (
+    ChunkSizer,
+    estimate_row_bytes,
+    lob_column_names,
+    DEFAULT_LOB_CHUNK_BYTES,
+    LOB_INITIAL_CHUNK_ROWS,
+    LOB_ESTIMATE_BYTES,
+    MIN_CHUNK_ROWS,
+    MAX_CHUNK_ROWS
+)
+
+
+class TestEstimateRowBytes(unittest.TestCase):
+    """Test cases for estimate_row_bytes."""
+
+    def test_fixed_width_columns(self):
+        columns = [{'name': 'id', 'mssql_type': 'int'}, {'name': 'at', 'mssql_type': 'datetime2'}]
+        self.assertEqual(estimate_row_bytes(columns, 'mssql_type'), 16)
+
+    def test_declared_length_counts(self):
+        """Narrow and wide character columns are estimated by their declared length."""
+        narrow = [{'name': 'code', 'mysql_type': 'varchar', 'max_length': 10}]
+        wide = [{'name': 'code', 'mysql_type': 'varchar', 'max_length': 4000}]
+        self.assertLess(estimate_row_bytes(narrow, 'mysql_type'), estimate_row_bytes(wide, 'mysql_type'))
+
+    def test_max_columns_use_lob_estimate(self):
+        """NVARCHAR(MAX) (length -1) and TEXT (no length) are assumed to be large."""
+        columns = [
+            {'name': 'notes', 'mssql_type': 'nvarchar', 'max_length': -1},
+            {'name': 'body', 'mssql_type': 'ntext', 'max_length': None}
+        ]
+        self.assertGreaterEqual(estimate_row_bytes(columns, 'mssql_type'), 2 * LOB_ESTIMATE_BYTES)
+
+
+class TestChunkSizer(unittest.TestCase):
+    """Test cases for ChunkSizer."""
+
+    def test_without_budget_batch_size_is_fixed(self):
+        sizer = ChunkSizer(5000)
+        sizer.observe(pd.DataFrame({'a': range(5000)}))
+
+        self.assertFalse(sizer.adaptive)
+        self.assertEqual(sizer.rows, 5000)
+
+    def test_first_chunk_sized_from_estimate(self):
+        """Wide tables start with fewer rows than narrow ones."""
+        wide = [{'name': f'c{i}', 'mssql_type': 'nvarchar', 'max_length': -1} for i in range(300)]
+        narrow = [{'name': 'id', 'mssql_type': 'int'}, {'name': 'code', 'mssql_type': 'varchar', 'max_length': 10}]
+
+        wide_sizer = ChunkSizer.for_columns(wide, 'mssql_type', 10000, 64 * 1024 * 1024)
+        narrow_sizer = ChunkSizer.for_columns(narrow, 'mssql_type', 10000, 64 * 1024 * 1024)
+
+        self.assertLess(wide_sizer.rows, 100 * MIN_CHUNK_ROWS)
+        self.assertGreater(narrow_sizer.rows, 10000)
+
+    def test_measured_chunks_resize(self):
+        """Chunks shrink at once when rows turn out wider than the budget allows."""
+        sizer = ChunkSizer(10000, max_chunk_bytes=100000, estimated_row_bytes=10)
+        batch = pa.RecordBatch.from_arrays([pa.array(['x' * 996] * 1000)], names=['notes'])
+
+        sizer.observe(batch)
+
+        self.assertAlmostEqual(sizer.rows, 100000 // (batch.nbytes / 1000), delta=1)
+        self.assertIsNotNone(sizer.as_dict()['measured_row_bytes'])
+
+    def test_growth_is_gradual(self):
+        """Chunks grow by at most MAX_GROWTH_FACTOR per measured chunk."""
+        sizer = ChunkSizer(10000, max_chunk_bytes=10 * 1024 * 1024, estimated_row_bytes=10 ** 6)
+        self.assertEqual(sizer.rows, MIN_CHUNK_ROWS)
+
+        sizer.observe(pd.DataFrame({'id': range(MIN_CHUNK_ROWS)}))
+
+        self.assertEqual(sizer.rows, 2 * MIN_CHUNK_ROWS)
+
+    def test_bounds(self):
+        sizer = ChunkSizer(10000, max_chunk_bytes=1, estimated_row_bytes=1000)
+        self.assertEqual(sizer.rows, MIN_CHUNK_ROWS)
+
+        sizer = ChunkSizer(10000, max_chunk_bytes=10 ** 12, estimated_row_bytes=1)
+        self.assertEqual(sizer.rows, MAX_CHUNK_ROWS)
+
+
+class TestLobColumns(unittest.TestCase):
+    """Test cases for LOB-aware chunk sizing."""
+
+    COLUMNS = [
+        {'name': 'Id', 'mssql_type': 'int', 'max_length': None},
+        {'name': 'Code', 'mssql_type': 'nvarchar', 'max_length': 50},
+        {'name': 'Notes', 'mssql_type': 'nvarchar', 'max_length': -1},
+        {'name': 'Scan', 'mssql_type': 'image', 'max_length': 2147483647},
+        {'name': 'Thumb', 'mssql_type': 'varbinary', 'max_length': 4000}
+    ]
+
+    def test_lob_column_names(self):
+        """(MAX) columns and LOB types are detected; bounded columns are not."""
+        self.assertEqual(lob_column_names(self.COLUMNS, 'mssql_type'), ['Notes', 'Scan'])
+        self.assertEqual(
+            lob_column_names([{'name': 'body', 'mysql_type': 'longtext', 'max_length': 4294967295}], 'mysql_type'),
+            ['body']
+        )
+
+    def test_lob_table_is_sized_without_budget(self):
+        """A LOB table gets the default budget and a small first chunk; others keep batch_size."""
+        sizer = ChunkSizer.for_columns(self.COLUMNS, 'mssql_type', 10000)
+
+        self.assertTrue(sizer.adaptive)
+        self.assertEqual(sizer.max_chunk_bytes, DEFAULT_LOB_CHUNK_BYTES)
+        self.assertEqual(sizer.rows, LOB_INITIAL_CHUNK_ROWS)
+        self.assertEqual(sizer.as_dict()['lob_columns'], ['Notes', 'Scan'])
+        self.assertFalse(ChunkSizer.for_columns(self.COLUMNS[:2], 'mssql_type', 10000).adaptive)
+
+    def test_large_values_shrink_to_single_rows(self):
+        """Chunks of a LOB table shrink below MIN_CHUNK_ROWS, down to one row."""
+        sizer = ChunkSizer(10000, max_chunk_bytes=1024 * 1024, lob_columns=['Scan'])
+
+        sizer.observe(pa.RecordBatch.from_pydict({'Scan': [b'x' * 4 * 1024 * 1024] * 4}))
+
+        self.assertEqual(sizer.rows, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,7 +25,7 @@ SKIP_INTEGRATION_TESTS = os.getenv('SKIP_CLEANUP_INTEGRATION_TESTS', 'false').lo
 class TestCleanupEventsQueries(unittest.TestCase):
     """Unit tests for cleanup_events GraphQL queries and mutations."""
     
-    @patch('pyairbyte.utils.graphql_util.requests.post')
+    @patch('requests.Session.post')
     def test_query_successfully_processed_events(self, mock_post):
         """Test the GraphQL query for getting successfully processed events."""
         # Mock response
@@ -100,7 +100,7 @@ class TestCleanupEventsQueries(unittest.TestCase):
         self.assertEqual(logs[0]['event_store']['id'], 100)
         mock_post.assert_called_once()
     
-    @patch('pyairbyte.utils.graphql_util.requests.post')
+    @patch('requests.Session.post')
     def test_bulk_insert_completed_events(self, mock_post):
         """Test the bulk insert mutation for completed_integration_events."""
         # Mock response - need to properly configure the mock
@@ -170,7 +170,7 @@ class TestCleanupEventsQueries(unittest.TestCase):
         self.assertEqual(len(insert_data['returning']), 2)
         mock_post.assert_called_once()
     
-    @patch('pyairbyte.utils.graphql_util.requests.post')
+    @patch('requests.Session.post')
     def test_delete_processing_log(self, mock_post):
         """Test the delete mutation for event_processed_logs."""
         # Mock response
@@ -201,7 +201,7 @@ class TestCleanupEventsQueries(unittest.TestCase):
         self.assertEqual(deleted['id'], 1)
         mock_post.assert_called_once()
     
-    @patch('pyairbyte.utils.graphql_util.requests.post')
+    @patch('requests.Session.post')
     def test_delete_event_store(self, mock_post):
         """Test the delete mutation for event_store."""
         # Mock response
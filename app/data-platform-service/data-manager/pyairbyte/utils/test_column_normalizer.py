@@ -0,0 +1,150 @@
+import unittest
+import sys
+import datetime
+
+import numpy as np
+import pandas as pd
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.column_normalizer import (
+    compile_normalization_plan,
+    normalize_chunk,
+    NORMALIZE_UUID,
+    NORMALIZE_BOOL,
+    NORMALIZE_DATETIME,
+    NORMALIZE_TIME,
+    NORMALIZE_NULLS
+)
+
+
+class TestCompileNormalizationPlan(unittest.TestCase):
+    """Test cases for compile_normalization_plan."""
+
+    def test_mssql_plan(self):
+        """MSSQL types map to their normalization kinds."""
+        columns = [
+            {'name': 'id', 'mssql_type': 'INT'},
+            {'name': 'guid', 'mssql_type': 'uniqueidentifier'},
+            {'name': 'flag', 'mssql_type': 'bit'},
+            {'name': 'created', 'mssql_type': 'datetime2'},
+            {'name': 'at', 'mssql_type': 'time'}
+        ]
+
+        plan = compile_normalization_plan(columns, 'mssql_type')
+
+        self.assertEqual(plan, (
+            ('id', NORMALIZE_NULLS),
+            ('guid', NORMALIZE_UUID),
+            ('flag', NORMALIZE_BOOL),
+            ('created', NORMALIZE_DATETIME),
+            ('at', NORMALIZE_TIME)
+        ))
+
+    def test_mysql_plan(self):
+        """MySQL timestamp is treated as datetime."""
+        plan = compile_normalization_plan([{'name': 'ts', 'mysql_type': 'timestamp'}], 'mysql_type')
+
+        self.assertEqual(plan, (('ts', NORMALIZE_DATETIME),))
+
+    def test_plan_is_cached_per_schema(self):
+        """The same schema returns the same compiled plan object."""
+        columns = [{'name': 'a', 'mssql_type': 'bit'}]
+
+        self.assertIs(
+            compile_normalization_plan(columns, 'mssql_type'),
+            compile_normalization_plan([dict(c) for c in columns], 'mssql_type')
+        )
+
+    def test_unsupported_type_key(self):
+        """Unknown type keys are rejected."""
+        with self.assertRaises(ValueError):
+            compile_normalization_plan([{'name': 'a', 'oracle_type': 'number'}], 'oracle_type')
+
+
+class TestNormalizeChunk(unittest.TestCase):
+    """Test cases for normalize_chunk."""
+
+    def _normalize(self, df, columns, type_key='mssql_type'):
+        return normalize_chunk(df, compile_normalization_plan(columns, type_key))
+
+    def test_uuid_keeps_nulls(self):
+        """NULL uniqueidentifiers stay None instead of becoming the string 'None'."""
+        df = pd.DataFrame({'guid': ['6F9619FF-8B86-D011-B42D-00C04FC964FF', None]})
+
+        result = self._normalize(df, [{'name': 'guid', 'mssql_type': 'uniqueidentifier'}])
+
+        self.assertEqual(result['guid'].tolist(), ['6F9619FF-8B86-D011-B42D-00C04FC964FF', None])
+
+    def test_bit_to_nullable_bool(self):
+        """BIT values become booleans and NULLs are preserved."""
+        df = pd.DataFrame({'flag': pd.Series([True, False, None, 1], dtype=object)})
+
+        result = self._normalize(df, [{'name': 'flag', 'mssql_type': 'bit'}])
+
+        self.assertEqual(str(result['flag'].dtype), 'boolean')
+        self.assertEqual(result['flag'].tolist(), [True, False, pd.NA, True])
+
+    def test_mysql_bit_bytes(self):
+        """MySQL returns BIT as bytes."""
+        df = pd.DataFrame({'flag': [b'\x01', b'\x00', None]})
+
+        result = self._normalize(df, [{'name': 'flag', 'mysql_type': 'bit'}], 'mysql_type')
+
+        self.assertEqual(result['flag'].tolist(), [True, False, pd.NA])
+
+    def test_bool_dtype_is_untouched(self):
+        """Columns already of bool dtype are not converted."""
+        df = pd.DataFrame({'flag': [True, False]})
+
+        result = self._normalize(df, [{'name': 'flag', 'mssql_type': 'bit'}])
+
+        self.assertEqual(result['flag'].dtype, bool)
+
+    def test_datetime_invalid_values_become_nat(self):
+        """Datetime columns are parsed column-wise; invalid values and NULLs become NaT."""
+        df = pd.DataFrame({'created': [datetime.datetime(2024, 1, 2, 3, 4, 5), None, 'not a date']})
+
+        result = self._normalize(df, [{'name': 'created', 'mssql_type': 'datetime'}])
+
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(result['created'].dtype))
+        self.assertEqual(result['created'].iloc[0], pd.Timestamp('2024-01-02 03:04:05'))
+        self.assertTrue(pd.isna(result['created'].iloc[1]))
+        self.assertTrue(pd.isna(result['created'].iloc[2]))
+
+    def test_time_nulls_become_none(self):
+        """TIME values are kept as Python objects with None for NULL."""
+        df = pd.DataFrame({'at': [datetime.time(1, 2, 3), None]})
+
+        result = self._normalize(df, [{'name': 'at', 'mssql_type': 'time'}])
+
+        self.assertEqual(result['at'].tolist(), [datetime.time(1, 2, 3), None])
+
+    def test_object_nulls_become_none_and_numeric_kept(self):
+        """NaN becomes None in object columns; numeric columns keep their dtype."""
+        df = pd.DataFrame({
+            'name': pd.Series(['a', np.nan], dtype=object),
+            'amount': [1.5, np.nan]
+        })
+
+        result = self._normalize(df, [
+            {'name': 'name', 'mssql_type': 'nvarchar'},
+            {'name': 'amount', 'mssql_type': 'float'}
+        ])
+
+        self.assertEqual(result['name'].tolist(), ['a', None])
+        self.assertEqual(result['amount'].dtype, np.float64)
+
+    def test_missing_columns_are_skipped(self):
+        """Columns in the plan but not in the chunk are ignored."""
+        df = pd.DataFrame({'a': [1]})
+
+        result = self._normalize(df, [{'name': 'b', 'mssql_type': 'bit'}])
+
+        self.assertEqual(list(result.columns), ['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+import unittest
+from unittest.mock import Mock
+import sys
+import queue
+import threading
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.connection_pool import (
+    ConnectionPool, get_shared_pool, shared_pool_metrics, close_shared_pools
+)
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test cases for ConnectionPool."""
+
+    def setUp(self):
+        self.factory = Mock(side_effect=lambda: Mock())
+
+    def test_connections_are_reused(self):
+        """A released connection is handed out again instead of opening a new one."""
+        pool = ConnectionPool(self.factory, max_size=2)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(self.factory.call_count, 1)
+
+    def test_max_size_blocks(self):
+        """No more than max_size connections are opened."""
+        pool = ConnectionPool(self.factory, max_size=1)
+        conn = pool.acquire()
+
+        with self.assertRaises(queue.Empty):
+            pool.acquire(timeout=0.01)
+
+        pool.release(conn)
+        self.assertIs(pool.acquire(timeout=0.01), conn)
+        self.assertEqual(self.factory.call_count, 1)
+
+    def test_waiting_thread_gets_released_connection(self):
+        """A blocked caller receives the next released connection."""
+        pool = ConnectionPool(self.factory, max_size=1)
+        conn = pool.acquire()
+        received = []
+
+        waiter = threading.Thread(target=lambda: received.append(pool.acquire(timeout=5)))
+        waiter.start()
+        pool.release(conn)
+        waiter.join(5)
+
+        self.assertEqual(received, [conn])
+
+    def test_reset_runs_on_release(self):
+        """The reset callback (e.g. rollback) runs before reuse."""
+        reset = Mock()
+        pool = ConnectionPool(self.factory, max_size=1, reset=reset)
+
+        with pool.connection() as conn:
+            pass
+
+        reset.assert_called_once_with(conn)
+
+    def test_error_discards_connection(self):
+        """A connection used when an error occurred is closed, not reused."""
+        pool = ConnectionPool(self.factory, max_size=1)
+
+        with self.assertRaises(RuntimeError):
+            with pool.connection() as conn:
+                raise RuntimeError("boom")
+
+        conn.close.assert_called_once()
+        with pool.connection() as new_conn:
+            self.assertIsNot(new_conn, conn)
+
+    def test_failed_factory_frees_slot(self):
+        """A failed connect does not use up pool capacity."""
+        factory = Mock(side_effect=[Exception("unreachable"), Mock()])
+        pool = ConnectionPool(factory, max_size=1)
+
+        with self.assertRaises(Exception):
+            pool.acquire()
+
+        self.assertIsNotNone(pool.acquire(timeout=0.01))
+
+    def test_close_all(self):
+        """Idle connections are closed and the pool refuses new checkouts."""
+        pool = ConnectionPool(self.factory, max_size=1)
+        with pool.connection() as conn:
+            pass
+
+        pool.close_all()
+
+        conn.close.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+    def test_stats(self):
+        """Checkouts, reuse and open connections are counted."""
+        pool = ConnectionPool(self.factory, max_size=2, name='cache')
+        with pool.connection():
+            pass
+        conn = pool.acquire()
+
+        stats = pool.stats()
+
+        self.assertEqual((stats['checkouts'], stats['created'], stats['reused']), (2, 1, 1))
+        self.assertEqual((stats['open'], stats['idle']), (1, 0))
+        self.assertGreaterEqual(stats['wait_seconds'], 0)
+        pool.release(conn)
+
+    def test_non_blocking_pool_opens_overflow(self):
+        """With block=False extra connections are opened and closed when the pool is full."""
+        pool = ConnectionPool(self.factory, max_size=1, block=False)
+        first = pool.acquire()
+        second = pool.acquire(timeout=0.01)
+
+        pool.release(first)
+        pool.release(second)
+
+        self.assertIsNot(first, second)
+        second.close.assert_called_once()
+        self.assertEqual((pool.stats()['open'], pool.stats()['idle']), (1, 1))
+
+    def test_invalid_idle_connection_is_replaced(self):
+        """Idle connections failing validation are closed instead of handed out."""
+        pool = ConnectionPool(self.factory, max_size=1, validate=lambda conn: False)
+        with pool.connection() as conn:
+            pass
+
+        with pool.connection() as new_conn:
+            self.assertIsNot(new_conn, conn)
+
+        conn.close.assert_called_once()
+        self.assertEqual(pool.stats()['discarded'], 1)
+
+    def test_checkout_close_returns_connection(self):
+        """close() on a checked-out connection returns it to the pool; other calls pass through."""
+        pool = ConnectionPool(self.factory, max_size=1)
+        pooled = pool.checkout()
+        conn = pooled.raw_connection
+
+        pooled.cursor()
+        pooled.autocommit = True
+        pooled.close()
+        pooled.close()
+
+        conn.cursor.assert_called_once()
+        self.assertTrue(conn.autocommit)
+        conn.close.assert_not_called()
+        self.assertIs(pool.acquire(timeout=0.01), conn)
+
+    def test_closed_connection_rejects_use(self):
+        """Reading or setting attributes after close() reports the closed connection."""
+        pool = ConnectionPool(self.factory, max_size=1, name='test')
+        pooled = pool.checkout()
+        pooled.close()
+
+        with self.assertRaisesRegex(AttributeError, "Connection from pool 'test' is closed"):
+            pooled.cursor()
+        with self.assertRaisesRegex(AttributeError, "Connection from pool 'test' is closed"):
+            pooled.autocommit = True
+
+
+class TestSharedPools(unittest.TestCase):
+    """Test cases for the process-wide pool registry."""
+
+    def tearDown(self):
+        close_shared_pools()
+
+    def test_pool_per_key(self):
+        """Callers with the same key share a pool; other keys get their own."""
+        factory = Mock(side_effect=lambda: Mock())
+
+        first = get_shared_pool(('postgres', 'db', 'a'), factory, name='a')
+        again = get_shared_pool(('postgres', 'db', 'a'), factory, name='a')
+        other = get_shared_pool(('postgres', 'db', 'b'), factory, name='b')
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+
+    def test_metrics_and_close(self):
+        """Metrics are reported per pool, and closing forgets the pools."""
+        conn = Mock(autocommit=True)
+        pool = get_shared_pool('key', lambda: conn, name='cache')
+        pool.checkout().close()
+
+        self.assertEqual(shared_pool_metrics()['cache']['checkouts'], 1)
+        conn.rollback.assert_called_once()
+        self.assertFalse(conn.autocommit)
+
+        close_shared_pools()
+
+        conn.close.assert_called_once()
+        self.assertEqual(shared_pool_metrics(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
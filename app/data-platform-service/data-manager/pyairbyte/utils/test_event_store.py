@@ -12,11 +12,14 @@ if '/app/data-manager' not in sys.path:
 from pyairbyte.utils.event_store import (
     write_event,
     get_unprocessed_or_failed_events,
+    iter_unprocessed_or_failed_events,
     log_event_processing,
     bulk_write_events,
+    load_known_event_hashes,
     _create_event_hash,
-    _check_hash_exists
+    _check_hashes_completed
 )
+from pyairbyte.utils.hash_filter import KnownHashFilter
 
 
 class TestEventStore(unittest.TestCase):
@@ -57,73 +60,44 @@ class TestEventStore(unittest.TestCase):
         self.assertNotEqual(hash1, hash4)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
-    def test_check_hash_exists_true_in_store(self, mock_query_graphql_api):
-        """Test hash existence check when hash exists in event_store."""
-        # First call: check event_store (found)
-        # Second call: check completed_integration_events (not called because first found it)
+    def test_check_hashes_completed_found(self, mock_query_graphql_api):
+        """Test completed check when a hash exists in completed_integration_events."""
         mock_query_graphql_api.return_value = {
             'data': {
-                'event_store': [
-                    {'id': 1, 'event_hash': 'test_hash'}
+                'completed_integration_events': [
+                    {'event_hash': 'test_hash'}
                 ]
             }
         }
         
-        result = _check_hash_exists('test_hash')
+        result = _check_hashes_completed(['test_hash', 'other_hash'])
         
-        self.assertTrue(result)
-        # Should only call once (stops after finding in event_store)
+        self.assertEqual(result, {'test_hash'})
         self.assertEqual(mock_query_graphql_api.call_count, 1)
+        # event_store duplicates are left to on_conflict, only completed events are looked up
+        query = mock_query_graphql_api.call_args[0][0]
+        self.assertNotIn('event_store(', query)
+        self.assertIn('completed_integration_events(', query)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
-    def test_check_hash_exists_true_in_completed(self, mock_query_graphql_api):
-        """Test hash existence check when hash exists in completed_integration_events."""
-        # First call: check event_store (not found)
-        # Second call: check completed_integration_events (found)
-        mock_query_graphql_api.side_effect = [
-            {
-                'data': {
-                    'event_store': []
-                }
-            },
-            {
-                'data': {
-                    'completed_integration_events': [
-                        {'id': 1, 'event_hash': 'test_hash'}
-                    ]
-                }
+    def test_check_hashes_completed_not_found(self, mock_query_graphql_api):
+        """Test completed check when no hash has been processed."""
+        mock_query_graphql_api.return_value = {
+            'data': {
+                'completed_integration_events': []
             }
-        ]
+        }
         
-        result = _check_hash_exists('test_hash')
+        result = _check_hashes_completed(['test_hash'])
         
-        self.assertTrue(result)
-        # Should call twice (check both tables)
-        self.assertEqual(mock_query_graphql_api.call_count, 2)
+        self.assertEqual(result, set())
+        self.assertEqual(mock_query_graphql_api.call_count, 1)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
-    def test_check_hash_exists_false(self, mock_query_graphql_api):
-        """Test hash existence check when hash does not exist in either table."""
-        # First call: check event_store (not found)
-        # Second call: check completed_integration_events (not found)
-        mock_query_graphql_api.side_effect = [
-            {
-                'data': {
-                    'event_store': []
-                }
-            },
-            {
-                'data': {
-                    'completed_integration_events': []
-                }
-            }
-        ]
-        
-        result = _check_hash_exists('test_hash')
-        
-        self.assertFalse(result)
-        # Should call twice (check both tables)
-        self.assertEqual(mock_query_graphql_api.call_count, 2)
+    def test_check_hashes_completed_empty(self, mock_query_graphql_api):
+        """Test that no request is made for an empty hash list."""
+        self.assertEqual(_check_hashes_completed([]), set())
+        mock_query_graphql_api.assert_not_called()
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
     def test_write_event_success(self, mock_query_graphql_api):
@@ -136,11 +110,9 @@ class TestEventStore(unittest.TestCase):
         
         # Mock hash check (hash doesn't exist in either table)
         mock_query_graphql_api.side_effect = [
-            # First call: check event_store (not found)
-            {'data': {'event_store': []}},
-            # Second call: check completed_integration_events (not found)
-            {'data': {'completed_integration_events': []}},
-            # Third call: insert event
+            # First call: check event_store and completed_integration_events (not found)
+            {'data': {'event_store': [], 'completed_integration_events': []}},
+            # Second call: insert event
             {
                 'data': {
                     'insert_event_store_one': {
@@ -161,7 +133,7 @@ class TestEventStore(unittest.TestCase):
         self.assertEqual(result['event_hash'], expected_hash)
         self.assertEqual(result['message'], 'Event successfully inserted into event_store')
         self.assertIsNotNone(result['data'])
-        self.assertEqual(mock_query_graphql_api.call_count, 3)
+        self.assertEqual(mock_query_graphql_api.call_count, 2)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
     def test_write_event_duplicate_detected_in_store(self, mock_query_graphql_api):
@@ -169,22 +141,19 @@ class TestEventStore(unittest.TestCase):
         event_type = "UNIT4_DITIO_EVENT"
         event_data = {"test": "data", "value": 123}
         
-        # Mock hash check (hash exists in event_store)
-        mock_query_graphql_api.return_value = {
-            'data': {
-                'event_store': [
-                    {'id': 1, 'event_hash': 'test_hash'}
-                ]
-            }
-        }
+        mock_query_graphql_api.side_effect = [
+            # First call: check completed_integration_events (not found)
+            {'data': {'completed_integration_events': []}},
+            # Second call: insert skipped by on_conflict (hash exists in event_store)
+            {'data': {'insert_event_store_one': None}}
+        ]
         
         result = write_event(event_type, event_data)
         
         self.assertEqual(result['status'], 'duplicate')
         self.assertIsNone(result['event_id'])
-        self.assertIn('already exists', result['message'])
-        # Should only call once (stops after finding in event_store)
-        self.assertEqual(mock_query_graphql_api.call_count, 1)
+        self.assertIn('already exists in event_store', result['message'])
+        self.assertEqual(mock_query_graphql_api.call_count, 2)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
     def test_write_event_duplicate_detected_in_completed(self, mock_query_graphql_api):
@@ -193,26 +162,20 @@ class TestEventStore(unittest.TestCase):
         event_data = {"test": "data", "value": 123}
         
         # Mock hash check (hash exists in completed_integration_events)
-        mock_query_graphql_api.side_effect = [
-            # First call: check event_store (not found)
-            {'data': {'event_store': []}},
-            # Second call: check completed_integration_events (found)
-            {
-                'data': {
-                    'completed_integration_events': [
-                        {'id': 1, 'event_hash': 'test_hash'}
-                    ]
-                }
+        mock_query_graphql_api.return_value = {
+            'data': {
+                'event_store': [],
+                'completed_integration_events': [
+                    {'id': 1, 'event_hash': 'test_hash'}
+                ]
             }
-        ]
+        }
         
         result = write_event(event_type, event_data)
         
         self.assertEqual(result['status'], 'duplicate')
         self.assertIsNone(result['event_id'])
         self.assertIn('already exists', result['message'])
-        # Should call twice (check both tables)
-        self.assertEqual(mock_query_graphql_api.call_count, 2)
         mock_query_graphql_api.assert_called_once()  # Only hash check, no insert
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
@@ -272,23 +235,29 @@ class TestEventStore(unittest.TestCase):
         self.assertIn('Internal server error', result['message'])
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
-    def test_write_event_insert_returns_no_data(self, mock_query_graphql_api):
-        """Test write_event when insert returns no data."""
+    def test_write_event_insert_uses_on_conflict(self, mock_query_graphql_api):
+        """Test write_event only pre-checks completed events and inserts with on_conflict."""
         event_type = "UNIT4_DITIO_EVENT"
         event_data = {"test": "data"}
         
         mock_query_graphql_api.side_effect = [
-            # First call: check hash exists
-            {'data': {'event_store': []}},
-            # Second call: insert returns no data
-            {'data': {'insert_event_store_one': None}}
+            # First call: check completed_integration_events
+            {'data': {'completed_integration_events': []}},
+            # Second call: insert
+            {'data': {'insert_event_store_one': {'id': 1, 'event_hash': 'test_hash'}}}
         ]
         
-        result = write_event(event_type, event_data)
+        with patch.dict(os.environ, {'EVENT_STORE_HASH_CONSTRAINT': 'event_store_hash_unique'}):
+            result = write_event(event_type, event_data)
         
-        self.assertEqual(result['status'], 'error')
-        self.assertIsNone(result['event_id'])
-        self.assertEqual(result['message'], 'Event insertion returned no data')
+        self.assertEqual(result['status'], 'success')
+        check_query = mock_query_graphql_api.call_args_list[0][0][0]
+        self.assertNotIn('event_store(', check_query)
+        insert_variables = mock_query_graphql_api.call_args_list[1][1]['variables']
+        self.assertEqual(
+            insert_variables['onConflict'],
+            {'constraint': 'event_store_hash_unique', 'update_columns': []}
+        )
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
     def test_get_unprocessed_or_failed_events_success(self, mock_query_graphql_api):
@@ -335,8 +304,68 @@ class TestEventStore(unittest.TestCase):
         self.assertEqual(result['events'][1]['id'], 2)
         self.assertIn('Retrieved 2 unprocessed or failed events', result['message'])
         self.assertIsNotNone(result['data'])
+        # Events are returned once, not again inside data
+        self.assertNotIn('event_store', json.dumps(result['data']))
         mock_query_graphql_api.assert_called_once()
     
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_iter_unprocessed_or_failed_events_keyset_pages(self, mock_query_graphql_api):
+        """Test events are streamed page by page with an id cursor."""
+        mock_query_graphql_api.side_effect = [
+            {'data': {'event_store': [{'id': 3}, {'id': 7}]}},
+            {'data': {'event_store': [{'id': 8}, {'id': 12}]}},
+            {'data': {'event_store': []}}
+        ]
+        
+        events = iter_unprocessed_or_failed_events("UNIT4_DITIO_EVENT", page_size=2)
+        first = next(events)
+        
+        # The first event is available after one request
+        self.assertEqual(first['id'], 3)
+        self.assertEqual(mock_query_graphql_api.call_count, 1)
+        self.assertEqual([e['id'] for e in events], [7, 8, 12])
+        after_ids = [call[1]['variables']['afterId'] for call in mock_query_graphql_api.call_args_list]
+        self.assertEqual(after_ids, [0, 7, 12])
+        self.assertTrue(all(call[1]['variables']['limit'] == 2 for call in mock_query_graphql_api.call_args_list))
+    
+    def test_iter_unprocessed_or_failed_events_invalid_page_size(self):
+        """Test an invalid page size is rejected."""
+        with self.assertRaises(ValueError):
+            list(iter_unprocessed_or_failed_events("UNIT4_DITIO_EVENT", page_size=0))
+    
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_get_unprocessed_or_failed_events_invalid_page_size(self, mock_query_graphql_api):
+        """Test an invalid page size is reported as an error without querying."""
+        result = get_unprocessed_or_failed_events("UNIT4_DITIO_EVENT", page_size=0)
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertIn('Invalid page_size', result['message'])
+        mock_query_graphql_api.assert_not_called()
+    
+    @patch.dict(os.environ, {'EVENT_READ_PAGE_SIZE': '-5'})
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_invalid_page_size_from_environment(self, mock_query_graphql_api):
+        """Test EVENT_READ_PAGE_SIZE is validated like the page_size argument."""
+        result = get_unprocessed_or_failed_events("UNIT4_DITIO_EVENT")
+        
+        self.assertIn('Invalid page_size', result['message'])
+        with self.assertRaises(ValueError):
+            list(iter_unprocessed_or_failed_events("UNIT4_DITIO_EVENT"))
+        mock_query_graphql_api.assert_not_called()
+    
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_get_unprocessed_or_failed_events_collects_pages(self, mock_query_graphql_api):
+        """Test all pages are collected into one result."""
+        mock_query_graphql_api.side_effect = [
+            {'data': {'event_store': [{'id': 1}, {'id': 2}]}},
+            {'data': {'event_store': [{'id': 3}]}}
+        ]
+        
+        result = get_unprocessed_or_failed_events("UNIT4_DITIO_EVENT", page_size=2)
+        
+        self.assertEqual(result['count'], 3)
+        self.assertEqual(result['data'], {'pages': 2, 'page_size': 2})
+    
     @patch('pyairbyte.utils.event_store.query_graphql_api')
     def test_get_unprocessed_or_failed_events_empty(self, mock_query_graphql_api):
         """Test retrieval when no events found."""
@@ -449,12 +478,12 @@ class TestEventStore(unittest.TestCase):
         self.assertEqual(hash1, hash2)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
-    def test_check_hash_exists_raises_exception(self, mock_query_graphql_api):
-        """Test that check_hash_exists raises exception on error."""
+    def test_check_hashes_completed_raises_exception(self, mock_query_graphql_api):
+        """Test that _check_hashes_completed raises exception on error."""
         mock_query_graphql_api.side_effect = ValueError("GraphQL error")
         
         with self.assertRaises(ValueError):
-            _check_hash_exists('test_hash')
+            _check_hashes_completed(['test_hash'])
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
     def test_log_event_processing_insert_success(self, mock_query_graphql_api):
@@ -836,8 +865,7 @@ class TestEventStore(unittest.TestCase):
         
         # Mock: hash check (no duplicates in either table), then insert
         mock_query_graphql_api.side_effect = [
-            {'data': {'event_store': []}},  # No existing hashes in event_store
-            {'data': {'completed_integration_events': []}},  # No existing hashes in completed
+            {'data': {'event_store': [], 'completed_integration_events': []}},  # No existing hashes in either table
             {
                 'data': {
                     'insert_event_store': {
@@ -876,8 +904,7 @@ class TestEventStore(unittest.TestCase):
         
         # Mock: hash check (no duplicates in either table), then insert
         mock_query_graphql_api.side_effect = [
-            {'data': {'event_store': []}},  # No existing hashes in event_store
-            {'data': {'completed_integration_events': []}},  # No existing hashes in completed
+            {'data': {'event_store': [], 'completed_integration_events': []}},  # No existing hashes in either table
             {
                 'data': {
                     'insert_event_store': {
@@ -916,14 +943,8 @@ class TestEventStore(unittest.TestCase):
         
         # Mock: hash check (hash1 exists in event_store, hash2 doesn't exist), then insert only hash2
         mock_query_graphql_api.side_effect = [
-            # Check event_store
-            {'data': {'event_store': [{'event_hash': hash1}]}},  # hash1 exists
-            # Check completed_integration_events
-            {'data': {'completed_integration_events': []}},  # hash1 not in completed
-            # Check event_store for hash2
-            {'data': {'event_store': []}},  # hash2 doesn't exist
-            # Check completed_integration_events for hash2
-            {'data': {'completed_integration_events': []}},  # hash2 doesn't exist
+            # Check both tables (hash1 in event_store)
+            {'data': {'event_store': [{'event_hash': hash1}], 'completed_integration_events': []}},
             # Insert hash2
             {
                 'data': {
@@ -958,11 +979,12 @@ class TestEventStore(unittest.TestCase):
         hash1 = _create_event_hash("TEST_EVENT", {"id": 1})
         hash2 = _create_event_hash("TEST_EVENT", {"id": 2})
         
-        # Mock: hash check (both exist in event_store)
+        # Mock: both exist in event_store, so on_conflict skips both rows
         mock_query_graphql_api.side_effect = [
-            # Check event_store (both found)
-            {'data': {'event_store': [{'event_hash': hash1}, {'event_hash': hash2}]}},
-            # Check completed_integration_events (not needed since both found in store)
+            # Check completed_integration_events (not found)
+            {'data': {'completed_integration_events': []}},
+            # Insert (nothing inserted)
+            {'data': {'insert_event_store': {'affected_rows': 0, 'returning': []}}}
         ]
         
         result = bulk_write_events(events)
@@ -973,8 +995,8 @@ class TestEventStore(unittest.TestCase):
         self.assertEqual(result['events_duplicate'], 2)
         self.assertEqual(result['events_failed'], 0)
         self.assertEqual(len(result['created_event_ids']), 0)
-        self.assertEqual(len(result['duplicate_hashes']), 2)
-        # Should call hash check for both tables
+        self.assertEqual(set(result['duplicate_hashes']), {hash1, hash2})
+        # Completed check and insert
         self.assertEqual(mock_query_graphql_api.call_count, 2)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
@@ -991,10 +1013,8 @@ class TestEventStore(unittest.TestCase):
         
         # Mock: hash1 exists in completed_integration_events, hash2 doesn't exist
         mock_query_graphql_api.side_effect = [
-            # Check event_store (hash1 not found, hash2 not found)
-            {'data': {'event_store': []}},
-            # Check completed_integration_events (hash1 found, hash2 not found)
-            {'data': {'completed_integration_events': [{'event_hash': hash1}]}},
+            # Check both tables (hash1 in completed_integration_events)
+            {'data': {'event_store': [], 'completed_integration_events': [{'event_hash': hash1}]}},
             # Insert hash2
             {
                 'data': {
@@ -1032,10 +1052,8 @@ class TestEventStore(unittest.TestCase):
         
         # Mock: both exist in completed_integration_events
         mock_query_graphql_api.side_effect = [
-            # Check event_store (both not found)
-            {'data': {'event_store': []}},
-            # Check completed_integration_events (both found)
-            {'data': {'completed_integration_events': [{'event_hash': hash1}, {'event_hash': hash2}]}}
+            # Check both tables (both found in completed_integration_events)
+            {'data': {'event_store': [], 'completed_integration_events': [{'event_hash': hash1}, {'event_hash': hash2}]}}
         ]
         
         result = bulk_write_events(events)
@@ -1047,8 +1065,8 @@ class TestEventStore(unittest.TestCase):
         self.assertEqual(result['events_failed'], 0)
         self.assertEqual(len(result['created_event_ids']), 0)
         self.assertEqual(len(result['duplicate_hashes']), 2)
-        # Should call hash check for both tables
-        self.assertEqual(mock_query_graphql_api.call_count, 2)
+        # Only the completed check, no insert
+        self.assertEqual(mock_query_graphql_api.call_count, 1)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
     def test_bulk_write_events_mixed_duplicates(self, mock_query_graphql_api):
@@ -1065,10 +1083,8 @@ class TestEventStore(unittest.TestCase):
         
         # Mock: hash1 in event_store, hash2 in completed_integration_events, hash3 new
         mock_query_graphql_api.side_effect = [
-            # Check event_store (hash1 found, hash2 not found, hash3 not found)
-            {'data': {'event_store': [{'event_hash': hash1}]}},
-            # Check completed_integration_events (hash1 not found, hash2 found, hash3 not found)
-            {'data': {'completed_integration_events': [{'event_hash': hash2}]}},
+            # Check both tables (hash1 in event_store, hash2 in completed_integration_events)
+            {'data': {'event_store': [{'event_hash': hash1}], 'completed_integration_events': [{'event_hash': hash2}]}},
             # Insert hash3
             {
                 'data': {
@@ -1094,6 +1110,128 @@ class TestEventStore(unittest.TestCase):
         self.assertIn(hash1, result['duplicate_hashes'])
         self.assertIn(hash2, result['duplicate_hashes'])
     
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_bulk_write_events_repeats_within_batch(self, mock_query_graphql_api):
+        """Test bulk_write_events inserts an event repeated within a batch once."""
+        events = [
+            {"event_type": "TEST_EVENT", "event_data": {"id": 1}},
+            {"event_type": "TEST_EVENT", "event_data": {"id": 1}}
+        ]
+        hash1 = _create_event_hash("TEST_EVENT", {"id": 1})
+        
+        mock_query_graphql_api.side_effect = [
+            {'data': {'completed_integration_events': []}},
+            {'data': {'insert_event_store': {'affected_rows': 1, 'returning': [{'id': 1, 'event_hash': hash1}]}}}
+        ]
+        
+        result = bulk_write_events(events)
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['events_created'], 1)
+        self.assertEqual(result['events_duplicate'], 1)
+        self.assertEqual(len(mock_query_graphql_api.call_args_list[1][1]['variables']['objects']), 1)
+    
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_bulk_write_events_with_hash_filter(self, mock_query_graphql_api):
+        """Test hashes unknown to the Bloom filter skip the completed check; stats are reported."""
+        events = [
+            {"event_type": "TEST_EVENT", "event_data": {"id": 1}},  # Known (already in event_store)
+            {"event_type": "TEST_EVENT", "event_data": {"id": 2}}   # New
+        ]
+        hash1 = _create_event_hash("TEST_EVENT", {"id": 1})
+        hash2 = _create_event_hash("TEST_EVENT", {"id": 2})
+        hash_filter = KnownHashFilter(capacity=100, known_capacity=0)
+        hash_filter.add(hash1)
+        
+        mock_query_graphql_api.side_effect = [
+            {'data': {'completed_integration_events': []}},
+            {'data': {'insert_event_store': {'affected_rows': 1, 'returning': [{'id': 2, 'event_hash': hash2}]}}}
+        ]
+        
+        result = bulk_write_events(events, hash_filter=hash_filter)
+        
+        self.assertEqual(result['events_created'], 1)
+        self.assertEqual(result['events_duplicate'], 1)
+        # Only the maybe-known hash is checked remotely
+        self.assertEqual(mock_query_graphql_api.call_args_list[0][1]['variables']['hashes'], [hash1])
+        self.assertEqual(result['hash_filter']['definitely_new'], 1)
+        self.assertEqual(result['hash_filter']['false_positives'], 0)
+        self.assertIn(hash2, hash_filter)
+    
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_bulk_write_events_remembered_hashes_skip_check_and_insert(self, mock_query_graphql_api):
+        """Test hashes the filter remembers exactly are duplicates without any remote call."""
+        events = [
+            {"event_type": "TEST_EVENT", "event_data": {"id": 1}},  # Known (remembered)
+            {"event_type": "TEST_EVENT", "event_data": {"id": 2}}   # New
+        ]
+        hash1 = _create_event_hash("TEST_EVENT", {"id": 1})
+        hash2 = _create_event_hash("TEST_EVENT", {"id": 2})
+        hash_filter = KnownHashFilter(capacity=100)
+        hash_filter.add(hash1)
+        
+        mock_query_graphql_api.return_value = {
+            'data': {'insert_event_store': {'affected_rows': 1, 'returning': [{'id': 2, 'event_hash': hash2}]}}
+        }
+        
+        result = bulk_write_events(events, hash_filter=hash_filter)
+        
+        self.assertEqual(result['events_created'], 1)
+        self.assertEqual(result['events_duplicate'], 1)
+        mock_query_graphql_api.assert_called_once()
+        objects = mock_query_graphql_api.call_args[1]['variables']['objects']
+        self.assertEqual([o['event_hash'] for o in objects], [hash2])
+        self.assertEqual(result['hash_filter']['known'], 1)
+        self.assertEqual(result['hash_filter']['hit_rate'], 1.0)
+        
+        # A rerun regenerating the same events makes no remote call at all
+        mock_query_graphql_api.reset_mock()
+        result = bulk_write_events(events, hash_filter=hash_filter)
+        
+        self.assertEqual(result['events_duplicate'], 2)
+        mock_query_graphql_api.assert_not_called()
+    
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_bulk_write_events_hash_filter_skips_check_for_new_batch(self, mock_query_graphql_api):
+        """Test a batch of hashes all unknown to the filter goes straight to the insert."""
+        events = [{"event_type": "TEST_EVENT", "event_data": {"id": 1}}]
+        
+        mock_query_graphql_api.return_value = {
+            'data': {'insert_event_store': {'affected_rows': 1, 'returning': [{'id': 1}]}}
+        }
+        
+        result = bulk_write_events(events, hash_filter=KnownHashFilter(capacity=100))
+        
+        self.assertEqual(result['events_created'], 1)
+        mock_query_graphql_api.assert_called_once()
+        self.assertEqual(result['hash_filter']['hit_rate'], 1.0)
+    
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_load_known_event_hashes_pages_by_id(self, mock_query_graphql_api):
+        """Test the warm load scans both tables with keyset pagination."""
+        mock_query_graphql_api.side_effect = [
+            {'data': {'event_store': [{'id': 1, 'event_hash': 'a'}, {'id': 5, 'event_hash': 'b'}]}},
+            {'data': {'event_store': [{'id': 9, 'event_hash': 'c'}]}},
+            {'data': {'completed_integration_events': []}}
+        ]
+        
+        hash_filter = load_known_event_hashes(page_size=2)
+        
+        self.assertTrue(all(h in hash_filter for h in ('a', 'b', 'c')))
+        after_ids = [call[1]['variables']['afterId'] for call in mock_query_graphql_api.call_args_list]
+        self.assertEqual(after_ids, [0, 5, 0])
+        self.assertIn('completed_integration_events(', mock_query_graphql_api.call_args_list[2][0][0])
+    
+    @patch.dict(os.environ, {'EVENT_HASH_SCAN_PAGE_SIZE': '0'})
+    @patch('pyairbyte.utils.event_store.query_graphql_api')
+    def test_load_known_event_hashes_invalid_page_size(self, mock_query_graphql_api):
+        """Test the scan page size (argument or EVENT_HASH_SCAN_PAGE_SIZE) must be positive."""
+        with self.assertRaises(ValueError):
+            load_known_event_hashes(page_size=0)
+        with self.assertRaises(ValueError):
+            load_known_event_hashes()
+        mock_query_graphql_api.assert_not_called()
+    
     def test_bulk_write_events_validation_errors(self):
         """Test bulk_write_events with validation errors."""
         events = [
@@ -1119,6 +1257,14 @@ class TestEventStore(unittest.TestCase):
         self.assertEqual(result['events_created'], 0)
         self.assertEqual(result['events_duplicate'], 0)
         self.assertGreater(len(result['errors']), 0)
+        self.assertIsNone(result['hash_filter'])
+    
+    def test_bulk_write_events_all_invalid_reports_hash_filter(self):
+        """Test the hash filter statistics are returned when every event fails validation."""
+        result = bulk_write_events([{"event_type": "TEST_EVENT"}], hash_filter=KnownHashFilter(capacity=100))
+        
+        self.assertEqual(result['status'], 'error')
+        self.assertEqual(result['hash_filter']['lookups'], 0)
     
     @patch('pyairbyte.utils.event_store.query_graphql_api')
     def test_bulk_write_events_chunking(self, mock_query_graphql_api):
@@ -0,0 +1,86 @@
+import unittest
+import sys
+import hashlib
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.hash_filter import KnownHashFilter
+
+
+def _hash(i: int) -> str:
+    return hashlib.sha256(str(i).encode('utf-8')).hexdigest()
+
+
+class TestKnownHashFilter(unittest.TestCase):
+    """Test cases for KnownHashFilter."""
+
+    def test_added_hashes_are_always_found(self):
+        """A Bloom filter has no false negatives."""
+        hash_filter = KnownHashFilter(capacity=1000)
+        hashes = [_hash(i) for i in range(1000)]
+
+        hash_filter.update(hashes)
+
+        self.assertTrue(all(h in hash_filter for h in hashes))
+
+    def test_false_positive_rate_near_target(self):
+        """At capacity, unknown hashes are rarely reported as known."""
+        hash_filter = KnownHashFilter(capacity=10000, false_positive_rate=0.01)
+        hash_filter.update(_hash(i) for i in range(10000))
+
+        false_positives = sum(_hash(i) in hash_filter for i in range(10000, 30000))
+
+        self.assertLess(false_positives / 20000, 0.02)
+
+    def test_stats(self):
+        """Lookups are split into known, definitely new and maybe known; rates follow."""
+        hash_filter = KnownHashFilter(capacity=100, known_capacity=1)
+        hash_filter.add('evicted')
+        hash_filter.add('known')
+
+        self.assertIs(hash_filter.lookup('known'), True)
+        self.assertIsNone(hash_filter.lookup('evicted'))
+        self.assertIs(hash_filter.lookup('new'), False)
+        hash_filter.record_false_positives(1)
+        stats = hash_filter.stats()
+
+        self.assertEqual(
+            (stats['lookups'], stats['known'], stats['definitely_new'], stats['maybe_known']), (3, 1, 1, 1)
+        )
+        self.assertAlmostEqual(stats['hit_rate'], 0.6667)
+        self.assertEqual(stats['false_positive_rate'], 0.5)
+        self.assertEqual((stats['hashes'], stats['remembered']), (2, 1))
+
+    def test_known_hashes_are_least_recently_used(self):
+        """The exact set keeps the hashes most recently added or found."""
+        hash_filter = KnownHashFilter(capacity=100, known_capacity=2)
+        hash_filter.update(['a', 'b'])
+
+        self.assertIs(hash_filter.lookup('a'), True)
+        hash_filter.add('c')
+
+        self.assertIs(hash_filter.lookup('a'), True)
+        self.assertIsNone(hash_filter.lookup('b'))
+
+    def test_without_known_set(self):
+        """known_capacity=0 keeps only the Bloom filter."""
+        hash_filter = KnownHashFilter(capacity=100, known_capacity=0)
+        hash_filter.add('known')
+
+        self.assertIsNone(hash_filter.lookup('known'))
+        self.assertEqual(hash_filter.stats()['remembered'], 0)
+
+    def test_invalid_settings(self):
+        """Capacity and false-positive rate are validated."""
+        with self.assertRaises(ValueError):
+            KnownHashFilter(capacity=0)
+        with self.assertRaises(ValueError):
+            KnownHashFilter(false_positive_rate=1.5)
+        with self.assertRaises(ValueError):
+            KnownHashFilter(known_capacity=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+import requests
+from email.message import Message
+from requests.cookies import MockRequest, MockResponse
+
+from pyairbyte.utils.http_session import get_http_session, configure_http_session, close_http_session
+
+
+class TestHttpSession(unittest.TestCase):
+    """Test cases for the shared HTTP session."""
+
+    def tearDown(self):
+        close_http_session()
+
+    def test_session_is_shared(self):
+        """Callers get the same session until it is closed."""
+        session = get_http_session()
+
+        self.assertIs(get_http_session(), session)
+        close_http_session()
+        self.assertIsNot(get_http_session(), session)
+
+    @patch.dict(os.environ, {'HTTP_POOL_CONNECTIONS': '3', 'HTTP_POOL_MAXSIZE': '7'})
+    def test_pool_sizes_from_environment(self):
+        """Pool sizes are read from HTTP_POOL_CONNECTIONS and HTTP_POOL_MAXSIZE."""
+        adapter = get_http_session().get_adapter('https://api.example.com')
+
+        self.assertEqual((adapter._pool_connections, adapter._pool_maxsize), (3, 7))
+        self.assertFalse(adapter._pool_block)
+
+    def test_configure_replaces_session(self):
+        """configure_http_session closes the old session and applies the new sizes."""
+        old = get_http_session()
+
+        with patch.object(old, 'close') as close:
+            new = configure_http_session(pool_connections=2, pool_maxsize=4)
+
+        close.assert_called_once()
+        self.assertIs(get_http_session(), new)
+        self.assertEqual(new.get_adapter('http://hasura:8080')._pool_maxsize, 4)
+
+    def test_cookies_are_not_kept(self):
+        """Cookies set by one response are not stored on the shared session."""
+        session = get_http_session()
+        headers = Message()
+        headers['Set-Cookie'] = 'session=abc; Path=/'
+        request = requests.Request('GET', 'https://api.example.com/').prepare()
+
+        session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+        self.assertEqual(len(session.cookies), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
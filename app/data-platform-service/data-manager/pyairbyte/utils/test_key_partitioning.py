@@ -0,0 +1,98 @@
+import unittest
+import sys
+import datetime
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.key_partitioning import (
+    minmax_boundaries,
+    histogram_boundaries,
+    ranges_from_boundaries,
+    describe_range
+)
+
+
+class TestMinMaxBoundaries(unittest.TestCase):
+    """Test cases for minmax_boundaries."""
+
+    def test_integer_keys(self):
+        """Integer ranges are split into equally wide parts."""
+        self.assertEqual(minmax_boundaries(1, 100, 4), [26, 51, 76])
+
+    def test_small_integer_range(self):
+        """No more ranges than distinct keys."""
+        self.assertEqual(minmax_boundaries(1, 2, 8), [2])
+
+    def test_datetime_keys(self):
+        """Datetime ranges are split by time span."""
+        start = datetime.datetime(2024, 1, 1)
+        end = datetime.datetime(2024, 1, 5)
+
+        self.assertEqual(
+            minmax_boundaries(start, end, 2),
+            [datetime.datetime(2024, 1, 3)]
+        )
+
+    def test_date_keys(self):
+        """Date ranges are split on whole days."""
+        self.assertEqual(
+            minmax_boundaries(datetime.date(2024, 1, 1), datetime.date(2024, 1, 10), 2),
+            [datetime.date(2024, 1, 6)]
+        )
+
+    def test_single_partition_or_empty_table(self):
+        """Nothing to split for one partition, an empty table or a single key."""
+        self.assertEqual(minmax_boundaries(1, 100, 1), [])
+        self.assertEqual(minmax_boundaries(None, None, 4), [])
+        self.assertEqual(minmax_boundaries(5, 5, 4), [])
+
+    def test_unsupported_type(self):
+        """String keys cannot be split."""
+        with self.assertRaises(TypeError):
+            minmax_boundaries('a', 'z', 2)
+
+
+class TestHistogramBoundaries(unittest.TestCase):
+    """Test cases for histogram_boundaries."""
+
+    def test_equal_row_counts(self):
+        """Boundaries follow the row distribution, not the key span."""
+        steps = [(10, 100), (20, 100), (1000, 100), (5000, 100)]
+
+        self.assertEqual(histogram_boundaries(steps, 2), [20])
+
+    def test_skewed_distribution(self):
+        """Dense key areas get narrower ranges."""
+        steps = [(1, 10), (2, 500), (3, 500), (1000, 10)]
+
+        self.assertEqual(histogram_boundaries(steps, 2), [2])
+
+    def test_no_statistics(self):
+        """Empty histograms produce no boundaries."""
+        self.assertEqual(histogram_boundaries([], 4), [])
+
+
+class TestRangesFromBoundaries(unittest.TestCase):
+    """Test cases for ranges_from_boundaries."""
+
+    def test_ranges_cover_all_keys(self):
+        """Outer ranges are unbounded and inner ranges are contiguous."""
+        self.assertEqual(
+            ranges_from_boundaries([10, 20]),
+            [(None, 10), (10, 20), (20, None)]
+        )
+
+    def test_no_boundaries(self):
+        """Without boundaries there is one unbounded range."""
+        self.assertEqual(ranges_from_boundaries([]), [(None, None)])
+
+    def test_describe_range(self):
+        """Ranges are shown in interval notation."""
+        self.assertEqual(describe_range((None, 10)), '(-inf, 10)')
+        self.assertEqual(describe_range((10, None)), '[10, +inf)')
+
+
+if __name__ == '__main__':
+    unittest.main()
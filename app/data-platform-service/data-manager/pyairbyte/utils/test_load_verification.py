@@ -0,0 +1,153 @@
+import unittest
+import sys
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.column_normalizer import compile_normalization_plan, normalize_chunk
+from pyairbyte.utils.load_verification import (
+    ChunkChecksums,
+    chunk_hash_aggregate,
+    compare_row_counts
+)
+
+
+COLUMNS = [
+    {'name': 'id', 'mssql_type': 'int'},
+    {'name': 'active', 'mssql_type': 'bit'},
+    {'name': 'created', 'mssql_type': 'datetime2'},
+    {'name': 'amount', 'mssql_type': 'decimal'},
+    {'name': 'note', 'mssql_type': 'nvarchar'}
+]
+
+
+def _source_chunk():
+    """A chunk with the Python types pyodbc returns."""
+    return pd.DataFrame({
+        'id': [1, 2, None],
+        'active': [True, False, None],
+        'created': [datetime.datetime(2024, 1, 2, 3, 4, 5), None, datetime.datetime(2023, 6, 1)],
+        'amount': [Decimal('1.50'), Decimal('2'), None],
+        'note': ['a', None, 'c']
+    })
+
+
+class TestChunkHashAggregate(unittest.TestCase):
+    """Test cases for chunk_hash_aggregate."""
+
+    def setUp(self):
+        self.plan = compile_normalization_plan(COLUMNS, 'mssql_type')
+
+    def test_same_hash_before_and_after_normalization(self):
+        """Rows hash the same as read from the source and as normalized for COPY."""
+        chunk = _source_chunk()
+        source_hash = chunk_hash_aggregate(chunk, self.plan)
+
+        normalized = normalize_chunk(chunk, self.plan)
+
+        self.assertEqual(chunk_hash_aggregate(normalized, self.plan), source_hash)
+
+    def test_row_order_does_not_matter(self):
+        """Aggregates of chunks read in a different order are equal."""
+        chunk = _source_chunk()
+        reversed_chunk = chunk.iloc[::-1].reset_index(drop=True)
+
+        self.assertEqual(
+            chunk_hash_aggregate(chunk, self.plan),
+            chunk_hash_aggregate(reversed_chunk, self.plan)
+        )
+
+    def test_changed_value_changes_hash(self):
+        """A single changed value gives a different aggregate."""
+        chunk = _source_chunk()
+        changed = _source_chunk()
+        changed.loc[1, 'note'] = 'b'
+
+        self.assertNotEqual(chunk_hash_aggregate(chunk, self.plan), chunk_hash_aggregate(changed, self.plan))
+
+    def test_null_differs_from_empty_string(self):
+        """NULL and '' are different values after the load, so they hash differently."""
+        plan = (('note', 'nulls'),)
+
+        self.assertNotEqual(
+            chunk_hash_aggregate(pd.DataFrame({'note': [None]}), plan),
+            chunk_hash_aggregate(pd.DataFrame({'note': ['']}), plan)
+        )
+
+    def test_empty_chunk(self):
+        self.assertEqual(chunk_hash_aggregate(pd.DataFrame({'id': []}), ()), 0)
+
+
+class TestChunkChecksums(unittest.TestCase):
+    """Test cases for ChunkChecksums."""
+
+    def setUp(self):
+        self.plan = compile_normalization_plan(COLUMNS, 'mssql_type')
+
+    def test_matching_chunks(self):
+        checksums = ChunkChecksums()
+        chunk = _source_chunk()
+        checksums.add_chunk(chunk_hash_aggregate(chunk, self.plan), normalize_chunk(chunk, self.plan), self.plan)
+
+        result = checksums.as_dict()
+        self.assertTrue(checksums.matched)
+        self.assertEqual((result['chunks'], result['rows']), (1, 3))
+        self.assertEqual(result['source_hash'], result['written_hash'])
+
+    def test_lost_value_is_detected(self):
+        """A value dropped between extraction and load marks the chunk as mismatched."""
+        checksums = ChunkChecksums()
+        chunk = _source_chunk()
+        source_hash = chunk_hash_aggregate(chunk, self.plan)
+        written = normalize_chunk(chunk, self.plan)
+        written.loc[0, 'amount'] = np.nan
+
+        checksums.add_chunk(source_hash, written, self.plan)
+
+        self.assertFalse(checksums.matched)
+        self.assertEqual(checksums.mismatched_chunks, 1)
+
+    def test_merge_partitions(self):
+        """Partition accumulators merge into the same totals as one accumulator."""
+        chunk = _source_chunk()
+        whole = ChunkChecksums()
+        parts = [ChunkChecksums(), ChunkChecksums()]
+        for i in range(2):
+            part = chunk.iloc[i:i + 2].reset_index(drop=True)
+            source_hash = chunk_hash_aggregate(part, self.plan)
+            written = normalize_chunk(part.copy(), self.plan)
+            whole.add_chunk(source_hash, written, self.plan)
+            parts[i].add_chunk(source_hash, written, self.plan)
+
+        merged = ChunkChecksums()
+        for part in parts:
+            merged.merge(part)
+
+        self.assertEqual(merged.as_dict(), whole.as_dict())
+
+
+class TestCompareRowCounts(unittest.TestCase):
+    """Test cases for compare_row_counts."""
+
+    def test_exact(self):
+        self.assertTrue(compare_row_counts(100, 100))
+        self.assertFalse(compare_row_counts(100, 99))
+
+    def test_tolerance_for_estimates(self):
+        """Estimated source counts are accepted within a relative tolerance."""
+        self.assertTrue(compare_row_counts(80, 100, tolerance=0.5))
+        self.assertFalse(compare_row_counts(40, 100, tolerance=0.5))
+
+    def test_unknown_or_failed_counts_do_not_match(self):
+        self.assertFalse(compare_row_counts(None, 100))
+        self.assertFalse(compare_row_counts(-1, -1))
+
+
+if __name__ == '__main__':
+    unittest.main()
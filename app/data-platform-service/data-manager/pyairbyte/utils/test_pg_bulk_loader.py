@@ -0,0 +1,295 @@
+import unittest
+from unittest.mock import Mock, MagicMock
+import io
+import csv
+import sys
+import uuid
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.pg_bulk_loader import (
+    dataframe_to_csv_buffer,
+    record_batch_to_csv_buffer,
+    copy_dataframe_to_postgres,
+    copy_record_batch_to_postgres,
+    copy_dataframe_with_engine,
+    upsert_dataframe_to_postgres
+)
+
+
+def _parse_csv(buffer):
+    """Parse a COPY CSV buffer into lists of field strings."""
+    return list(csv.reader(buffer))
+
+
+def _text(buffer):
+    """Decode the bytes CSV buffer written for a record batch."""
+    return io.StringIO(buffer.getvalue().decode('utf-8'))
+
+
+class TestDataFrameToCsvBuffer(unittest.TestCase):
+    """Test cases for CSV encoding used by COPY."""
+
+    def test_nulls_are_unquoted_empty_fields(self):
+        """NaN, None, NaT and pd.NA must become unquoted empty fields (COPY NULL)."""
+        df = pd.DataFrame({
+            'a': [1.0, np.nan],
+            'b': ['x', None],
+            'c': pd.to_datetime(['2024-01-02 03:04:05', None]),
+            'd': pd.array([1, pd.NA], dtype='Int64')
+        })
+        lines = dataframe_to_csv_buffer(df).getvalue().splitlines()
+
+        self.assertEqual(lines[0], '"1","x","2024-01-02 03:04:05","1"')
+        self.assertEqual(lines[1], ',,,')
+
+    def test_empty_string_is_not_null(self):
+        """Empty strings are quoted so they are not loaded as NULL."""
+        df = pd.DataFrame({'a': ['', None]})
+        lines = dataframe_to_csv_buffer(df).getvalue().splitlines()
+
+        self.assertEqual(lines, ['""', ''])
+
+    def test_quotes_commas_and_newlines_are_escaped(self):
+        """Embedded quotes, delimiters and newlines survive a CSV round trip."""
+        value = 'He said "hi",\nthen left'
+        df = pd.DataFrame({'a': [value], 'b': [2]})
+        rows = _parse_csv(dataframe_to_csv_buffer(df))
+
+        self.assertEqual(rows, [[value, '2']])
+
+    def test_integral_floats_written_as_integers(self):
+        """Integer columns read back as float (because of NULLs) must load into INTEGER columns."""
+        df = pd.DataFrame({'a': [1.0, 2.5, np.nan, 1e20]})
+        lines = dataframe_to_csv_buffer(df).getvalue().splitlines()
+
+        self.assertEqual(lines[0], '"1"')
+        self.assertEqual(lines[1], '"2.5"')
+        self.assertEqual(lines[2], '')
+        self.assertEqual(lines[3], '"1e+20"')
+
+    def test_bytea_uuid_json_and_object_values(self):
+        """bytes, UUID, dict, Decimal, bool and date objects get PostgreSQL text formats."""
+        u = uuid.UUID('12345678-1234-5678-1234-567812345678')
+        df = pd.DataFrame({
+            'bin': [b'\x00\xff'],
+            'uid': [u],
+            'js': [{'k': 'v'}],
+            'dec': [Decimal('10.50')],
+            'flag': pd.Series([True], dtype=object),
+            'day': [datetime.date(2024, 5, 6)],
+            'dur': [datetime.timedelta(hours=1, minutes=2, seconds=3)]
+        })
+        rows = _parse_csv(dataframe_to_csv_buffer(df))
+
+        self.assertEqual(rows[0], [
+            '\\x00ff',
+            '12345678-1234-5678-1234-567812345678',
+            '{"k": "v"}',
+            '10.50',
+            'true',
+            '2024-05-06',
+            '01:02:03.000000'
+        ])
+
+    def test_bool_dtype(self):
+        """Boolean columns are written as true/false."""
+        df = pd.DataFrame({'a': [True, False]})
+        lines = dataframe_to_csv_buffer(df).getvalue().splitlines()
+
+        self.assertEqual(lines, ['"true"', '"false"'])
+
+    def test_empty_dataframe(self):
+        """An empty DataFrame produces an empty buffer."""
+        self.assertEqual(dataframe_to_csv_buffer(pd.DataFrame({'a': []})).getvalue(), '')
+
+
+class TestRecordBatchToCsvBuffer(unittest.TestCase):
+    """Test cases for CSV encoding of Arrow record batches."""
+
+    def test_nulls_empty_strings_and_quoting(self):
+        """NULL is an unquoted empty field, '' stays a quoted empty string."""
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(['', None, 'a"b,c'], pa.string()), pa.array([True, None, False])],
+            names=['s', 'b']
+        )
+        self.assertEqual(
+            _parse_csv(_text(record_batch_to_csv_buffer(batch))),
+            [['', 'true'], ['', ''], ['a"b,c', 'false']]
+        )
+        lines = _text(record_batch_to_csv_buffer(batch)).getvalue().splitlines()
+        self.assertEqual(lines[0], '"",true')
+        self.assertEqual(lines[1], ',')
+
+    def test_binary_as_bytea_hex(self):
+        batch = pa.RecordBatch.from_arrays([pa.array([b'\x01\xff', None], pa.binary())], names=['b'])
+        lines = _text(record_batch_to_csv_buffer(batch)).getvalue().splitlines()
+        self.assertEqual(lines, ['"\\x01ff"', ''])
+
+    def test_typed_values(self):
+        batch = pa.RecordBatch.from_arrays([
+            pa.array([Decimal('1.50')], pa.decimal128(10, 2)),
+            pa.array([datetime.datetime(2024, 1, 2, 3, 4, 5)], pa.timestamp('us')),
+            pa.array([datetime.date(2024, 1, 2)], pa.date32())
+        ], names=['d', 'ts', 'dt'])
+        self.assertEqual(
+            _text(record_batch_to_csv_buffer(batch)).getvalue(),
+            '1.50,2024-01-02 03:04:05.000000,2024-01-02\n'
+        )
+
+
+class TestCopyDataFrameToPostgres(unittest.TestCase):
+    """Test cases for copy_dataframe_to_postgres."""
+
+    def setUp(self):
+        self.mock_conn = Mock()
+        self.mock_cursor = Mock()
+        self.mock_conn.cursor.return_value = self.mock_cursor
+
+    def test_copy_unquoted_identifiers(self):
+        """COPY uses the provided column names and commits."""
+        df = pd.DataFrame({'Col A': [1, 2], 'b': ['x', 'y']})
+
+        rows = copy_dataframe_to_postgres(
+            self.mock_conn, 'pyairbyte_cache', 'mssql_orders', df, ['col_a', 'b']
+        )
+
+        self.assertEqual(rows, 2)
+        copy_sql, buffer = self.mock_cursor.copy_expert.call_args[0]
+        self.assertEqual(
+            copy_sql,
+            "COPY pyairbyte_cache.mssql_orders (col_a,b) FROM STDIN WITH (FORMAT csv)"
+        )
+        self.assertEqual(buffer.getvalue(), '"1","x"\n"2","y"\n')
+        self.mock_conn.commit.assert_called_once()
+
+    def test_copy_returns_server_row_count(self):
+        """The row count PostgreSQL reports for the COPY is returned when available."""
+        self.mock_cursor.rowcount = 1
+        df = pd.DataFrame({'a': [1, 2]})
+
+        self.assertEqual(copy_dataframe_to_postgres(self.mock_conn, 's', 't', df), 1)
+
+    def test_copy_record_batch(self):
+        """Record batches are copied with the same COPY statement as DataFrames."""
+        batch = pa.RecordBatch.from_arrays([pa.array([1, 2]), pa.array(['x', None])], names=['Col A', 'b'])
+
+        rows = copy_record_batch_to_postgres(
+            self.mock_conn, 'pyairbyte_cache', 'mssql_orders', batch, ['col_a', 'b']
+        )
+
+        self.assertEqual(rows, 2)
+        copy_sql, buffer = self.mock_cursor.copy_expert.call_args[0]
+        self.assertEqual(
+            copy_sql,
+            "COPY pyairbyte_cache.mssql_orders (col_a,b) FROM STDIN WITH (FORMAT csv)"
+        )
+        self.assertEqual(buffer.getvalue(), b'1,"x"\n2,\n')
+        self.mock_conn.commit.assert_called_once()
+
+    def test_copy_without_commit(self):
+        """commit=False leaves the transaction to the caller."""
+        df = pd.DataFrame({'a': [1]})
+
+        copy_dataframe_to_postgres(self.mock_conn, 's', 't', df, commit=False)
+
+        self.mock_conn.commit.assert_not_called()
+
+    def test_copy_failure_rolls_back(self):
+        """A failed COPY is rolled back and re-raised."""
+        self.mock_cursor.copy_expert.side_effect = Exception("bad input")
+        df = pd.DataFrame({'a': [1]})
+
+        with self.assertRaises(Exception):
+            copy_dataframe_to_postgres(self.mock_conn, 's', 't', df)
+
+        self.mock_conn.rollback.assert_called_once()
+        self.mock_conn.commit.assert_not_called()
+
+    def test_empty_dataframe_skips_copy(self):
+        """Nothing is sent for an empty DataFrame."""
+        rows = copy_dataframe_to_postgres(self.mock_conn, 's', 't', pd.DataFrame({'a': []}))
+
+        self.assertEqual(rows, 0)
+        self.mock_cursor.copy_expert.assert_not_called()
+
+    def test_column_name_count_mismatch(self):
+        """column_names must match the DataFrame width."""
+        df = pd.DataFrame({'a': [1], 'b': [2]})
+
+        with self.assertRaises(ValueError):
+            copy_dataframe_to_postgres(self.mock_conn, 's', 't', df, ['a'])
+
+    def test_copy_with_engine_closes_raw_connection(self):
+        """The raw DBAPI connection is returned to the engine after the COPY."""
+        engine = MagicMock()
+        engine.raw_connection.return_value = self.mock_conn
+        df = pd.DataFrame({'a': [1]})
+
+        rows = copy_dataframe_with_engine(engine, 's', 't', df)
+
+        self.assertEqual(rows, 1)
+        self.mock_conn.close.assert_called_once()
+
+
+class TestUpsertDataFrameToPostgres(unittest.TestCase):
+    """Test cases for upsert_dataframe_to_postgres."""
+
+    def setUp(self):
+        self.mock_conn = Mock()
+        self.mock_cursor = Mock()
+        self.mock_conn.cursor.return_value = self.mock_cursor
+        # Render psycopg2.sql objects without a real connection
+        self.mock_cursor.execute.side_effect = lambda stmt, *args: None
+
+    def _statements(self):
+        return [c[0][0] for c in self.mock_cursor.execute.call_args_list]
+
+    def test_upsert_via_staging_table(self):
+        """Rows are copied to a temp table and merged with ON CONFLICT in one transaction."""
+        df = pd.DataFrame({'id': [1, 2], 'name': ['a', 'b']})
+
+        rows = upsert_dataframe_to_postgres(self.mock_conn, 'pyairbyte_cache', 'mssql_orders', df, ['id'])
+
+        self.assertEqual(rows, 2)
+        create_stmt, merge_stmt = [repr(s) for s in self._statements()]
+        self.assertIn('CREATE TEMP TABLE', create_stmt)
+        self.assertIn('ON COMMIT DROP', create_stmt)
+        self.assertIn('ON CONFLICT', merge_stmt)
+        self.assertIn("SQL('name')", merge_stmt)
+        copy_sql = self.mock_cursor.copy_expert.call_args[0][0]
+        self.assertEqual(copy_sql, 'COPY pg_bulk_loader_upsert_staging (id,name) FROM STDIN WITH (FORMAT csv)')
+        self.mock_conn.commit.assert_called_once()
+
+    def test_key_only_table_does_nothing_on_conflict(self):
+        """Tables that only have key columns use DO NOTHING."""
+        upsert_dataframe_to_postgres(self.mock_conn, 's', 't', pd.DataFrame({'id': [1]}), ['id'])
+
+        self.assertIn('DO NOTHING', repr(self._statements()[1]))
+
+    def test_unknown_key_column(self):
+        """Key columns must be part of the loaded columns."""
+        with self.assertRaises(ValueError):
+            upsert_dataframe_to_postgres(self.mock_conn, 's', 't', pd.DataFrame({'a': [1]}), ['id'])
+
+    def test_failure_rolls_back(self):
+        """A failed merge rolls back the staging load."""
+        self.mock_cursor.execute.side_effect = [None, Exception('duplicate key')]
+
+        with self.assertRaises(Exception):
+            upsert_dataframe_to_postgres(self.mock_conn, 's', 't', pd.DataFrame({'id': [1], 'v': [2]}), ['id'])
+
+        self.mock_conn.rollback.assert_called_once()
+        self.mock_conn.commit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+from unittest.mock import Mock
+import sys
+
+import psycopg2
+from psycopg2 import sql
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.pg_indexes import source_index_name, create_source_indexes
+
+
+def _statement_text(statement) -> str:
+    """Render a statement passed to a mock cursor without a database connection."""
+    if isinstance(statement, str):
+        return statement
+    if isinstance(statement, sql.Composed):
+        return ''.join(_statement_text(part) for part in statement.seq)
+    if isinstance(statement, sql.SQL):
+        return statement.string
+    if isinstance(statement, sql.Identifier):
+        return '.'.join(f'"{s}"' for s in statement.strings)
+    raise TypeError(f"Unexpected statement {statement!r}")
+
+
+class TestSourceIndexName(unittest.TestCase):
+    """Test cases for source_index_name."""
+
+    def test_postgres_naming(self):
+        """Names follow PostgreSQL's table_pkey / table_columns_key convention."""
+        self.assertEqual(source_index_name('mssql_Orders', [], 'pkey'), 'mssql_Orders_pkey')
+        self.assertEqual(source_index_name('mssql_Orders', ['Part', 'Code'], 'key'), 'mssql_Orders_Part_Code_key')
+
+    def test_long_names_fit_identifier_limit(self):
+        """Long names are shortened with a hash, so names sharing a prefix stay distinct."""
+        first = source_index_name('mssql_' + 'x' * 60, ['ColumnA'], 'key')
+        second = source_index_name('mssql_' + 'x' * 60, ['ColumnB'], 'key')
+
+        self.assertEqual(len(first), 63)
+        self.assertTrue(first.endswith('_key'))
+        self.assertNotEqual(first, second)
+
+
+class TestCreateSourceIndexes(unittest.TestCase):
+    """Test cases for create_source_indexes."""
+
+    def setUp(self):
+        self.mock_conn = Mock()
+        self.mock_cursor = Mock()
+        self.mock_conn.cursor.return_value = self.mock_cursor
+        self.mock_cursor.fetchone.return_value = (16384,)
+
+    def _statements(self):
+        return [_statement_text(call[0][0]) for call in self.mock_cursor.execute.call_args_list]
+
+    def test_builds_missing_keys_and_analyzes(self):
+        """A table without keys gets the primary key and unique indexes, then ANALYZE."""
+        self.mock_cursor.fetchall.return_value = []
+
+        stats = create_source_indexes(
+            self.mock_conn, 'pyairbyte_cache', 'mssql_Orders', ['Id'],
+            [{'name': 'UX_Code', 'columns': ['Order Code']}]
+        )
+
+        statements = self._statements()
+        self.assertIn('ALTER TABLE pyairbyte_cache.mssql_Orders ADD CONSTRAINT mssql_Orders_pkey PRIMARY KEY (Id)', statements)
+        self.assertIn(
+            'CREATE UNIQUE INDEX mssql_Orders_Order_Code_key ON pyairbyte_cache.mssql_Orders (Order_Code)', statements
+        )
+        self.assertEqual(statements[-1], 'ANALYZE pyairbyte_cache.mssql_Orders')
+        self.assertTrue(stats['primary_key'])
+        self.assertEqual(stats['unique_indexes'], 1)
+        self.assertIsNotNone(stats['analyze_seconds'])
+
+    def test_existing_keys_are_kept(self):
+        """Keys the table already has (e.g. copied by the swap) are not built again."""
+        self.mock_cursor.fetchall.return_value = [(True, ['id']), (False, ['part', 'code'])]
+
+        stats = create_source_indexes(
+            self.mock_conn, 'pyairbyte_cache', 'mssql_Orders', ['Id'],
+            [{'name': 'UX_Code_Part', 'columns': ['Part', 'Code']}], analyze=False
+        )
+
+        statements = self._statements()
+        self.assertFalse(any('ADD CONSTRAINT' in s or 'CREATE UNIQUE INDEX' in s for s in statements))
+        self.assertFalse(any(s.startswith('ANALYZE') for s in statements))
+        self.assertEqual((stats['primary_key'], stats['unique_indexes']), (False, 0))
+
+    def test_shadow_keys_get_temporary_names(self):
+        """Keys built on a shadow are named after the live table and renamed by the swap."""
+        self.mock_cursor.fetchall.return_value = []
+
+        stats = create_source_indexes(
+            self.mock_conn, 'pyairbyte_cache', 'mssql_Orders__shadow', ['Id'],
+            [{'name': 'UX_Code', 'columns': ['Code']}], analyze=False, live_table_name='mssql_Orders'
+        )
+
+        statements = self._statements()
+        self.assertIn(
+            'ALTER TABLE pyairbyte_cache.mssql_Orders__shadow ADD CONSTRAINT mssql_Orders_pkey__shadow PRIMARY KEY (Id)',
+            statements
+        )
+        self.assertIn(
+            'CREATE UNIQUE INDEX mssql_Orders_Code_key__shadow ON pyairbyte_cache.mssql_Orders__shadow (Code)', statements
+        )
+        # Unquoted names are stored in lower case
+        self.assertEqual(stats['renames'], [
+            ('mssql_orders_pkey__shadow', 'mssql_orders_pkey'),
+            ('mssql_orders_code_key__shadow', 'mssql_orders_code_key')
+        ])
+
+    def test_failed_index_is_skipped(self):
+        """An index that cannot be built is rolled back to its savepoint and skipped."""
+        self.mock_cursor.fetchall.return_value = []
+
+        def execute(statement, params=None):
+            if 'CREATE UNIQUE INDEX' in _statement_text(statement):
+                raise psycopg2.IntegrityError('duplicate key')
+        self.mock_cursor.execute.side_effect = execute
+
+        stats = create_source_indexes(
+            self.mock_conn, 'pyairbyte_cache', 'mssql_Orders', [],
+            [{'name': 'UX_Ts', 'columns': ['Ts']}], analyze=False
+        )
+
+        self.assertIn('ROLLBACK TO SAVEPOINT source_index', self._statements())
+        self.assertEqual((stats['unique_indexes'], stats['skipped']), (0, 1))
+        self.mock_conn.commit.assert_called_once()
+
+    def test_missing_table(self):
+        """Indexing a table that does not exist is an error."""
+        self.mock_cursor.fetchone.return_value = (None,)
+
+        with self.assertRaises(ValueError):
+            create_source_indexes(self.mock_conn, 'pyairbyte_cache', 'mssql_Orders', ['Id'], [])
+        self.mock_conn.rollback.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import unittest
+from unittest.mock import Mock
+import sys
+
+from psycopg2 import sql
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.pg_table_swap import (
+    SHADOW_SUFFIX,
+    shadow_table_name,
+    create_shadow_table,
+    drop_shadow_table,
+    set_shadow_logged,
+    swap_shadow_table
+)
+
+
+def _statement_text(statement) -> str:
+    """Render a statement passed to a mock cursor without a database connection."""
+    if isinstance(statement, str):
+        return statement
+    if isinstance(statement, sql.Composed):
+        return ''.join(_statement_text(part) for part in statement.seq)
+    if isinstance(statement, sql.SQL):
+        return statement.string
+    if isinstance(statement, sql.Identifier):
+        return '.'.join(f'"{s}"' for s in statement.strings)
+    raise TypeError(f"Unexpected statement {statement!r}")
+
+
+class TestShadowTableName(unittest.TestCase):
+    """Test cases for shadow_table_name."""
+
+    def test_suffix(self):
+        """The shadow name is the live name plus the suffix."""
+        self.assertEqual(shadow_table_name('mssql_Orders'), 'mssql_Orders__shadow')
+
+    def test_long_names_fit_identifier_limit(self):
+        """Long names are truncated so the suffix is not cut off by PostgreSQL."""
+        name = shadow_table_name('x' * 80)
+        self.assertEqual(len(name), 63)
+        self.assertTrue(name.endswith(SHADOW_SUFFIX))
+
+
+class TestShadowTableLifecycle(unittest.TestCase):
+    """Test cases for creating, dropping and swapping shadow tables."""
+
+    def setUp(self):
+        self.mock_conn = Mock()
+        self.mock_cursor = Mock()
+        self.mock_conn.cursor.return_value = self.mock_cursor
+
+    def statements(self):
+        return [_statement_text(c[0][0]) for c in self.mock_cursor.execute.call_args_list]
+
+    def test_create_shadow_table(self):
+        """The shadow is an UNLOGGED copy of the live columns without indexes."""
+        shadow_name = create_shadow_table(self.mock_conn, 'reports', 'Sales', quote_identifiers=True)
+
+        self.assertEqual(shadow_name, 'Sales__shadow')
+        statements = self.statements()
+        self.assertEqual(statements[0], 'DROP TABLE IF EXISTS "reports"."Sales__shadow"')
+        self.assertTrue(statements[1].startswith(
+            'CREATE UNLOGGED TABLE "reports"."Sales__shadow" (LIKE "reports"."Sales" INCLUDING DEFAULTS'
+        ))
+        self.assertNotIn('INDEXES', statements[1])
+        self.mock_conn.commit.assert_called_once()
+
+    def test_drop_shadow_table_never_raises(self):
+        """Dropping a shadow in an error handler logs failures instead of raising."""
+        self.mock_cursor.execute.side_effect = Exception("connection lost")
+
+        drop_shadow_table(self.mock_conn, 'pyairbyte_cache', 'mssql_orders__shadow')
+
+        self.mock_conn.rollback.assert_called_once()
+
+    def test_set_shadow_logged(self):
+        """The shadow is made logged in its own transaction, before indexes are built on it."""
+        set_shadow_logged(self.mock_conn, 'pyairbyte_cache', 'mssql_orders__shadow')
+
+        self.assertEqual(self.statements(), ['ALTER TABLE pyairbyte_cache.mssql_orders__shadow SET LOGGED'])
+        self.mock_conn.commit.assert_called_once()
+
+    def test_set_shadow_logged_failure_rolls_back(self):
+        """A failed SET LOGGED is rolled back and raised."""
+        self.mock_cursor.execute.side_effect = Exception("disk full")
+
+        with self.assertRaises(Exception):
+            set_shadow_logged(self.mock_conn, 'pyairbyte_cache', 'mssql_orders__shadow')
+        self.mock_conn.rollback.assert_called_once()
+
+    def test_swap_without_live_table(self):
+        """On the first load the shadow is made durable, analyzed and renamed."""
+        # shadow oid, then no live table
+        self.mock_cursor.fetchone.side_effect = [(101,), (None,)]
+
+        stats = swap_shadow_table(self.mock_conn, 'pyairbyte_cache', 'mssql_orders', 'mssql_orders__shadow')
+
+        self.assertEqual(stats['indexes'], 0)
+        statements = self.statements()
+        self.assertEqual(statements[0], 'ALTER TABLE pyairbyte_cache.mssql_orders__shadow SET LOGGED')
+        self.assertIn('ANALYZE pyairbyte_cache.mssql_orders__shadow', statements)
+        self.assertEqual(statements[-2:], [
+            'DROP TABLE IF EXISTS pyairbyte_cache.mssql_orders',
+            'ALTER TABLE pyairbyte_cache.mssql_orders__shadow RENAME TO mssql_orders'
+        ])
+        self.assertEqual(self.mock_conn.commit.call_count, 2)
+
+    def test_swap_copies_indexes_constraints_and_grants(self):
+        """Live indexes, constraints and grants are rebuilt on the shadow before the swap."""
+        self.mock_cursor.fetchone.side_effect = [(101,), (100,)]
+        self.mock_cursor.fetchall.side_effect = [
+            [],                                                            # shadow constraints
+            [('orders_pkey', 'p', 'PRIMARY KEY (id)')],                    # live constraints
+            [],                                                            # shadow indexes
+            [('orders_name_idx', False, 'CREATE INDEX orders_name_idx ON pyairbyte_cache.mssql_orders USING btree (name)')],
+            [('bi_reader', 'SELECT', False), ('PUBLIC', 'SELECT', False)],  # grants
+            []                                                             # owned sequences
+        ]
+
+        stats = swap_shadow_table(self.mock_conn, 'pyairbyte_cache', 'mssql_orders', 'mssql_orders__shadow')
+
+        self.assertEqual((stats['constraints'], stats['indexes'], stats['grants']), (1, 1, 2))
+        statements = self.statements()
+        self.assertIn(
+            'ALTER TABLE pyairbyte_cache.mssql_orders__shadow ADD CONSTRAINT "orders_pkey__shadow" PRIMARY KEY (id)',
+            statements
+        )
+        self.assertIn(
+            'CREATE INDEX "orders_name_idx__shadow" ON pyairbyte_cache.mssql_orders__shadow USING btree (name)',
+            statements
+        )
+        self.assertIn('GRANT SELECT ON pyairbyte_cache.mssql_orders__shadow TO "bi_reader"', statements)
+        self.assertIn('GRANT SELECT ON pyairbyte_cache.mssql_orders__shadow TO PUBLIC', statements)
+
+        # Index builds happen before the swap transaction, renames after the DROP
+        drop_at = statements.index('DROP TABLE IF EXISTS pyairbyte_cache.mssql_orders')
+        self.assertLess(statements.index('ANALYZE pyairbyte_cache.mssql_orders__shadow'), drop_at)
+        self.assertEqual(statements[drop_at + 1:], [
+            'ALTER TABLE pyairbyte_cache.mssql_orders__shadow RENAME TO mssql_orders',
+            'ALTER TABLE pyairbyte_cache.mssql_orders RENAME CONSTRAINT "orders_pkey__shadow" TO "orders_pkey"',
+            'ALTER INDEX pyairbyte_cache."orders_name_idx__shadow" RENAME TO "orders_name_idx"'
+        ])
+
+    def test_swap_keeps_keys_built_on_shadow(self):
+        """Indexes the shadow already has are not copied; its own renames follow the swap."""
+        self.mock_cursor.fetchone.side_effect = [(101,), (100,)]
+        self.mock_cursor.fetchall.side_effect = [
+            [('mssql_orders_pkey__shadow', 'p')],                          # shadow constraints
+            [('mssql_orders_pkey', 'p', 'PRIMARY KEY (id)')],              # live constraints
+            [(True, 'CREATE UNIQUE INDEX mssql_orders_pkey__shadow ON pyairbyte_cache.mssql_orders__shadow USING btree (id)'),
+             (True, 'CREATE UNIQUE INDEX mssql_orders_code_key__shadow ON pyairbyte_cache.mssql_orders__shadow USING btree (code)')],
+            [('mssql_orders_code_key', True, 'CREATE UNIQUE INDEX mssql_orders_code_key ON pyairbyte_cache.mssql_orders USING btree (code)'),
+             ('orders_name_idx', False, 'CREATE INDEX orders_name_idx ON pyairbyte_cache.mssql_orders USING btree (name)')],
+            [],                                                            # grants
+            []                                                             # owned sequences
+        ]
+
+        stats = swap_shadow_table(
+            self.mock_conn, 'pyairbyte_cache', 'mssql_orders', 'mssql_orders__shadow',
+            index_renames=[('mssql_orders_pkey__shadow', 'mssql_orders_pkey'),
+                           ('mssql_orders_code_key__shadow', 'mssql_orders_code_key')]
+        )
+
+        self.assertEqual((stats['constraints'], stats['indexes']), (0, 1))
+        statements = self.statements()
+        self.assertFalse(any('PRIMARY KEY' in s or 'CREATE UNIQUE INDEX' in s for s in statements))
+        drop_at = statements.index('DROP TABLE IF EXISTS pyairbyte_cache.mssql_orders')
+        self.assertEqual(statements[drop_at + 2:], [
+            'ALTER INDEX pyairbyte_cache."orders_name_idx__shadow" RENAME TO "orders_name_idx"',
+            'ALTER INDEX pyairbyte_cache."mssql_orders_pkey__shadow" RENAME TO "mssql_orders_pkey"',
+            'ALTER INDEX pyairbyte_cache."mssql_orders_code_key__shadow" RENAME TO "mssql_orders_code_key"'
+        ])
+
+    def test_swap_failure_keeps_live_table(self):
+        """A failed swap is rolled back and the shadow dropped."""
+        self.mock_cursor.fetchone.side_effect = [(101,), (None,)]
+        self.mock_cursor.execute.side_effect = [None, None, None, None, Exception("lock timeout"), None]
+
+        with self.assertRaises(Exception):
+            swap_shadow_table(self.mock_conn, 'pyairbyte_cache', 'mssql_orders', 'mssql_orders__shadow')
+
+        self.mock_conn.rollback.assert_called()
+        self.assertEqual(self.statements()[-1], 'DROP TABLE IF EXISTS pyairbyte_cache.mssql_orders__shadow')
+
+
+if __name__ == '__main__':
+    unittest.main()
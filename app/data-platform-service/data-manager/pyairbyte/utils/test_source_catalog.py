@@ -0,0 +1,94 @@
+import unittest
+import sys
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.source_catalog import SourceCatalog
+
+
+def _row(table, column, pk_ordinal=None, row_estimate=100, data_type='int', is_nullable=False):
+    return {
+        'table_name': table,
+        'column_name': column,
+        'data_type': data_type,
+        'max_length': None,
+        'precision': 10,
+        'scale': 0,
+        'is_nullable': is_nullable,
+        'default': None,
+        'pk_ordinal': pk_ordinal,
+        'row_estimate': row_estimate
+    }
+
+
+class TestSourceCatalog(unittest.TestCase):
+    """Test cases for SourceCatalog."""
+
+    def setUp(self):
+        rows = [
+            _row('OrderLines', 'LineNo', pk_ordinal=2, row_estimate=5000),
+            _row('OrderLines', 'OrderId', pk_ordinal=1, row_estimate=5000),
+            _row('OrderLines', 'Note', data_type='nvarchar', is_nullable=True, row_estimate=5000),
+            _row('Customers', 'Id', pk_ordinal=1, row_estimate=None),
+        ]
+        index_rows = [
+            {'table_name': 'OrderLines', 'index_name': 'UX_Note', 'column_name': 'LineNo', 'key_ordinal': 2},
+            {'table_name': 'OrderLines', 'index_name': 'UX_Note', 'column_name': 'Note', 'key_ordinal': 1},
+            {'table_name': 'Dropped', 'index_name': 'UX_Id', 'column_name': 'Id', 'key_ordinal': 1},
+        ]
+        self.catalog = SourceCatalog.from_rows(
+            'dbo', ['OrderLines', 'customers', 'Missing'], rows, 'mssql_type', index_rows
+        )
+
+    def test_split(self):
+        """Tables without catalog rows are reported missing, in request order."""
+        self.assertEqual(
+            self.catalog.split(['OrderLines', 'customers', 'Missing']),
+            (['OrderLines', 'customers'], ['Missing'])
+        )
+
+    def test_case_insensitive_match(self):
+        """Requested names match the catalog's names case-insensitively."""
+        self.assertEqual([c['name'] for c in self.catalog.columns('customers')], ['Id'])
+
+    def test_columns_keep_extract_schema_format(self):
+        """Column metadata has the same keys as extract_mssql_schema()."""
+        columns = self.catalog.columns('OrderLines')
+
+        self.assertEqual([c['name'] for c in columns], ['LineNo', 'OrderId', 'Note'])
+        self.assertEqual(
+            columns[2],
+            {'name': 'Note', 'mssql_type': 'nvarchar', 'max_length': None, 'precision': 10,
+             'scale': 0, 'is_nullable': True, 'default': None}
+        )
+
+    def test_columns_are_copies(self):
+        """Callers cannot change the cached metadata shared by other table syncs."""
+        self.catalog.columns('OrderLines')[0]['name'] = 'changed'
+
+        self.assertEqual(self.catalog.columns('OrderLines')[0]['name'], 'LineNo')
+
+    def test_primary_key_in_key_order(self):
+        """Primary key columns are ordered by key position, not column position."""
+        self.assertEqual(self.catalog.primary_key('OrderLines'), ['OrderId', 'LineNo'])
+        self.assertEqual(self.catalog.primary_key('Missing'), [])
+
+    def test_unique_indexes_in_key_order(self):
+        """Unique index columns are ordered by key position; tables without any have none."""
+        self.assertEqual(
+            self.catalog.unique_indexes('OrderLines'), [{'name': 'UX_Note', 'columns': ['Note', 'LineNo']}]
+        )
+        self.assertEqual(self.catalog.unique_indexes('customers'), [])
+        self.assertEqual(self.catalog.unique_indexes('Missing'), [])
+
+    def test_row_estimate(self):
+        """Row estimates come from the catalog; views and unknown tables have none."""
+        self.assertEqual(self.catalog.row_estimate('OrderLines'), 5000)
+        self.assertIsNone(self.catalog.row_estimate('customers'))
+        self.assertIsNone(self.catalog.row_estimate('Missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import sys
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.source_projection import (
+    project_columns,
+    projected_key,
+    projected_unique_indexes,
+    loaded_columns_differ,
+    combine_conditions,
+    projection_signature
+)
+
+
+COLUMNS = [
+    {'name': 'Id', 'mssql_type': 'int'},
+    {'name': 'Order Code', 'mssql_type': 'nvarchar'},
+    {'name': 'Notes', 'mssql_type': 'nvarchar'},
+    {'name': 'Year', 'mssql_type': 'int'}
+]
+
+
+class TestProjectColumns(unittest.TestCase):
+    """Test cases for project_columns and the key helpers."""
+
+    def test_keeps_source_order(self):
+        """Selected columns are returned in source order, whatever the config order."""
+        projected = project_columns('Orders', COLUMNS, ['Year', 'Id'])
+        self.assertEqual([col['name'] for col in projected], ['Id', 'Year'])
+
+    def test_all_columns_without_config(self):
+        self.assertIs(project_columns('Orders', COLUMNS, None), COLUMNS)
+
+    def test_unknown_or_empty_selection(self):
+        with self.assertRaises(ValueError):
+            project_columns('Orders', COLUMNS, ['Id', 'Missing'])
+        with self.assertRaises(ValueError):
+            project_columns('Orders', COLUMNS, [])
+
+    def test_keys_outside_projection_are_dropped(self):
+        """Keys and unique indexes are only kept if all their columns are projected."""
+        projected = project_columns('Orders', COLUMNS, ['Id', 'Year'])
+        indexes = [{'name': 'UX_Year', 'columns': ['Year', 'Id']}, {'name': 'UX_Code', 'columns': ['Order Code']}]
+
+        self.assertEqual(projected_key(['Id'], projected), ['Id'])
+        self.assertEqual(projected_key('Id', projected), ['Id'])
+        self.assertEqual(projected_key(['Id', 'Order Code'], projected), [])
+        self.assertEqual([i['name'] for i in projected_unique_indexes(indexes, projected)], ['UX_Year'])
+
+    def test_loaded_columns_differ(self):
+        """Loaded names are compared as created: sanitized and folded to lower case."""
+        projected = project_columns('Orders', COLUMNS, ['Id', 'Order Code'])
+        self.assertFalse(loaded_columns_differ(['order_code', 'id'], projected))
+        self.assertTrue(loaded_columns_differ(['id', 'order_code', 'notes'], projected))
+
+
+class TestConditions(unittest.TestCase):
+    """Test cases for combine_conditions and projection_signature."""
+
+    def test_combine_conditions(self):
+        self.assertIsNone(combine_conditions(None, ''))
+        self.assertEqual(combine_conditions('Year >= 2022', None), 'Year >= 2022')
+        self.assertEqual(
+            combine_conditions('Year = 2022 OR Year = 2023', '[Id] > ?'),
+            '(Year = 2022 OR Year = 2023) AND ([Id] > ?)'
+        )
+
+    def test_projection_signature(self):
+        """The signature changes with the projection and ignores column order."""
+        self.assertIsNone(projection_signature({'sync_mode': 'full_refresh'}))
+        base = projection_signature({'columns': ['Id', 'Year']})
+        self.assertEqual(base, projection_signature({'columns': ['Year', 'Id']}))
+        self.assertNotEqual(base, projection_signature({'columns': ['Id', 'Year'], 'where': 'Year >= 2022'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import datetime
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+import pandas as pd
+from sqlalchemy import create_engine, event, inspect
+
+from pyairbyte.utils.sql_writer import SqlWriter
+
+
+class TestSqlWriter(unittest.TestCase):
+    """Test cases for SqlWriter."""
+
+    def setUp(self):
+        """Create a writer on an in-memory database (COPY itself is tested in test_pg_bulk_loader)."""
+        cache = Mock(schema_name='main', host='localhost', port=5432, database='db', username='user', password='pw')
+        self.writer = SqlWriter('test-connector', cache=cache)
+        self.writer.engine = self._transactional_sqlite_engine()
+        patch.object(self.writer, '_validate_schema_exists').start()
+        self.copy = patch('pyairbyte.utils.sql_writer.copy_dataframe_to_postgres').start()
+        self.addCleanup(patch.stopall)
+
+    @staticmethod
+    def _transactional_sqlite_engine():
+        """SQLite engine whose DDL runs inside transactions, like PostgreSQL's."""
+        engine = create_engine('sqlite://')
+
+        @event.listens_for(engine, 'connect')
+        def disable_driver_transactions(dbapi_conn, connection_record):
+            dbapi_conn.isolation_level = None
+
+        @event.listens_for(engine, 'begin')
+        def begin(conn):
+            conn.exec_driver_sql('BEGIN')
+
+        return engine
+
+    def _column_types(self, table_name):
+        columns = inspect(self.writer.engine).get_columns(table_name, schema='main')
+        return {column['name']: type(column['type']).__name__ for column in columns}
+
+    def test_column_types_from_full_frame(self):
+        """Object columns of dates, datetimes and bools keep their types in the created table."""
+        df = pd.DataFrame({
+            'id': [1, 2],
+            'name': ['a', 'b'],
+            'day': [datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)],
+            'flag': pd.Series([True, None], dtype=object),
+            'seen_at': pd.Series([datetime.datetime(2024, 1, 1, 12), None], dtype=object)
+        })
+
+        self.writer.write_df_to_table(df, 'typed_table')
+
+        types = self._column_types('typed_table')
+        self.assertEqual(types['day'], 'DATE')
+        self.assertEqual(types['flag'], 'BOOLEAN')
+        self.assertEqual(types['seen_at'], 'DATETIME')
+        self.assertEqual(types['id'], 'BIGINT')
+        self.assertEqual(types['name'], 'TEXT')
+        self.copy.assert_called_once()
+        args, kwargs = self.copy.call_args
+        self.assertEqual(args[1:3], ('main', 'typed_table'))
+        self.assertIs(args[3], df)
+        self.assertEqual(kwargs['column_names'], ['id', 'name', 'day', 'flag', 'seen_at'])
+        self.assertFalse(kwargs['commit'])
+
+    def test_if_exists_replace(self):
+        """if_exists='replace' recreates the table with the new frame's columns."""
+        self.writer.write_df_to_table(pd.DataFrame({'old': [1]}), 'replaced')
+        self.writer.write_df_to_table(pd.DataFrame({'new': ['x']}), 'replaced', if_exists='replace')
+
+        self.assertEqual(list(self._column_types('replaced')), ['new'])
+
+    def test_failed_copy_rolls_back_replace(self):
+        """A failed COPY rolls back the table replacement instead of leaving an empty table."""
+        self.writer.write_df_to_table(pd.DataFrame({'old': [1]}), 'replaced')
+        self.copy.side_effect = RuntimeError('COPY failed')
+
+        with self.assertRaises(RuntimeError):
+            self.writer.write_df_to_table(pd.DataFrame({'new': ['x']}), 'replaced', if_exists='replace')
+
+        self.assertEqual(list(self._column_types('replaced')), ['old'])
+
+    def test_if_exists_fail(self):
+        """if_exists='fail' raises when the table exists and nothing is copied."""
+        self.writer.write_df_to_table(pd.DataFrame({'a': [1]}), 'existing')
+        self.copy.reset_mock()
+
+        with self.assertRaises(ValueError):
+            self.writer.write_df_to_table(pd.DataFrame({'a': [2]}), 'existing', if_exists='fail')
+        self.copy.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
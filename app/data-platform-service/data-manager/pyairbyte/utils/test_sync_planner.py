@@ -0,0 +1,103 @@
+import unittest
+import sys
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.sync_planner import (
+    plan_table_syncs, apply_sync_plan, record_plan_actuals,
+    PARTITION_BYTES, MAX_PLANNED_PARTITIONS, MIN_PLANNED_BATCH_SIZE, MAX_PLANNED_BATCH_SIZE
+)
+
+MB = 1024 * 1024
+
+
+class TestSyncPlanner(unittest.TestCase):
+    """Test cases for the pre-sync planner."""
+
+    def test_largest_tables_first(self):
+        """Tables are ordered by size; tables without statistics follow in requested order."""
+        sizes = {
+            'small': {'rows': 10, 'bytes': 1 * MB},
+            'large': {'rows': 1000, 'bytes': 500 * MB},
+            'medium': {'rows': 100, 'bytes': 50 * MB}
+        }
+
+        plan = plan_table_syncs(['small', 'view_a', 'large', 'medium', 'view_b'], sizes, {}, 10000)
+
+        self.assertEqual(plan['order'], ['large', 'medium', 'small', 'view_a', 'view_b'])
+        self.assertIsNone(plan['tables']['view_a']['estimated_seconds'])
+        self.assertIsNone(plan['estimated_seconds'])
+
+    def test_batch_size_from_row_width(self):
+        """Wide rows get small batches, narrow rows large ones, within the limits."""
+        sizes = {
+            'wide': {'rows': 1000, 'bytes': 1000 * 64 * 1024},
+            'narrow': {'rows': 10 ** 6, 'bytes': 10 ** 6 * 20},
+            'medium': {'rows': 10 ** 6, 'bytes': 10 ** 6 * 1024}
+        }
+
+        tables = plan_table_syncs(['wide', 'narrow', 'medium'], sizes, {}, 10000)['tables']
+
+        self.assertEqual(tables['wide']['batch_size'], MIN_PLANNED_BATCH_SIZE)
+        self.assertEqual(tables['narrow']['batch_size'], MAX_PLANNED_BATCH_SIZE)
+        self.assertEqual(tables['medium']['batch_size'], 32768)
+
+    def test_configured_settings_are_kept(self):
+        """Explicit batch sizes, chunk budgets and partitions are not replanned."""
+        sizes = {name: {'rows': 10 ** 6, 'bytes': 10 ** 6 * 1024} for name in ('a', 'b', 'c')}
+        configs = {
+            'a': {'batch_size': 500, 'partitions': 2},
+            'b': {'max_chunk_bytes': 8 * MB},
+            'c': {}
+        }
+
+        tables = plan_table_syncs(['a', 'b', 'c'], sizes, configs, 10000, partitionable={'a', 'b'})['tables']
+
+        self.assertEqual((tables['a']['batch_size'], tables['a']['partitions']), (500, 2))
+        self.assertEqual(tables['b']['batch_size'], 10000)
+        # 'c' cannot be split into key ranges
+        self.assertEqual(tables['c']['partitions'], 1)
+
+    def test_partitions_from_size(self):
+        """Partitionable tables get one key range per PARTITION_BYTES, capped."""
+        sizes = {
+            'small': {'rows': 1000, 'bytes': PARTITION_BYTES // 2},
+            'medium': {'rows': 1000, 'bytes': PARTITION_BYTES * 2},
+            'huge': {'rows': 1000, 'bytes': PARTITION_BYTES * 100}
+        }
+
+        tables = plan_table_syncs(
+            ['small', 'medium', 'huge'], sizes, {}, 10000, partitionable={'small', 'medium', 'huge'},
+            bytes_per_second=PARTITION_BYTES
+        )['tables']
+
+        self.assertEqual([tables[t]['partitions'] for t in ('small', 'medium', 'huge')], [1, 2, MAX_PLANNED_PARTITIONS])
+        self.assertEqual(tables['medium']['estimated_seconds'], 1.0)
+
+    def test_wall_time_estimate(self):
+        """The estimate schedules tables on the first free worker."""
+        sizes = {name: {'rows': 1, 'bytes': size * MB} for name, size in (('a', 30), ('b', 20), ('c', 10), ('d', 10))}
+
+        plan = plan_table_syncs(['d', 'c', 'b', 'a'], sizes, {}, 10000, max_workers=2, bytes_per_second=MB)
+
+        # a on one worker, b + c + d on the other
+        self.assertEqual(plan['estimated_seconds'], 40.0)
+
+    def test_apply_and_record(self):
+        """Planned settings fill table configs; actual durations are recorded next to estimates."""
+        sizes = {'a': {'rows': 10 ** 6, 'bytes': 10 ** 6 * 1024}}
+        plan = plan_table_syncs(['a', 'b'], sizes, {'a': {'sync_mode': 'full_refresh'}}, 10000)
+
+        configs = apply_sync_plan({'a': {'sync_mode': 'full_refresh'}, 'b': {'batch_size': 7}}, plan)
+        record_plan_actuals(plan, {'a': {'elapsed_seconds': 12.5}, 'b': {'elapsed_seconds': 0.1}}, 12.6)
+
+        self.assertEqual(configs['a'], {'batch_size': 32768, 'partitions': 1, 'sync_mode': 'full_refresh'})
+        self.assertEqual(configs['b']['batch_size'], 7)
+        self.assertEqual(plan['tables']['a']['actual_seconds'], 12.5)
+        self.assertEqual(plan['actual_seconds'], 12.6)
+
+
+if __name__ == '__main__':
+    unittest.main()
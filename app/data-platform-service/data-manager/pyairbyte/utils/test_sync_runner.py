@@ -0,0 +1,65 @@
+import unittest
+import sys
+import time
+import threading
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.sync_runner import run_table_syncs
+
+
+class TestRunTableSyncs(unittest.TestCase):
+    """Test cases for run_table_syncs."""
+
+    def test_sequential(self):
+        """With one worker, tables are synced in order."""
+        order = []
+
+        def sync_table(table_name):
+            order.append(table_name)
+            return {'rows_synced': 1, 'errors': []}, True
+
+        outcomes = run_table_syncs(['a', 'b', 'c'], sync_table)
+
+        self.assertEqual(order, ['a', 'b', 'c'])
+        self.assertEqual(set(outcomes), {'a', 'b', 'c'})
+        self.assertIn('elapsed_seconds', outcomes['a'][0])
+
+    def test_parallel_runs_tables_concurrently(self):
+        """Several tables run at the same time, bounded by max_workers."""
+        lock = threading.Lock()
+        running = {'now': 0, 'peak': 0}
+
+        def sync_table(table_name):
+            with lock:
+                running['now'] += 1
+                running['peak'] = max(running['peak'], running['now'])
+            time.sleep(0.05)
+            with lock:
+                running['now'] -= 1
+            return {'rows_synced': 1, 'errors': []}, True
+
+        outcomes = run_table_syncs([f't{i}' for i in range(6)], sync_table, max_workers=3)
+
+        self.assertEqual(len(outcomes), 6)
+        self.assertEqual(running['peak'], 3)
+
+    def test_unexpected_error_marks_table_failed(self):
+        """An exception escaping a table sync fails only that table."""
+        def sync_table(table_name):
+            if table_name == 'bad':
+                raise RuntimeError("no connection")
+            return {'rows_synced': 5, 'errors': []}, True
+
+        outcomes = run_table_syncs(['good', 'bad'], sync_table, max_workers=2)
+
+        self.assertTrue(outcomes['good'][1])
+        bad_result, bad_succeeded = outcomes['bad']
+        self.assertFalse(bad_succeeded)
+        self.assertIn('no connection', bad_result['errors'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
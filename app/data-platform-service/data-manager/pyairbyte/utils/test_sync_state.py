@@ -0,0 +1,275 @@
+import unittest
+from unittest.mock import Mock
+import sys
+import datetime
+from decimal import Decimal
+
+# Add the data-manager path to sys.path for imports
+if '/app/data-manager' not in sys.path:
+    sys.path.append('/app/data-manager')
+
+from pyairbyte.utils.sync_state import (
+    ensure_sync_metadata_table,
+    serialize_watermark,
+    deserialize_watermark,
+    describe_watermark,
+    get_last_watermark,
+    record_table_sync,
+    format_fingerprint,
+    get_last_fingerprint,
+    is_table_unchanged,
+    serialize_checkpoint,
+    deserialize_checkpoint,
+    get_resume_checkpoint,
+    start_checkpointed_sync,
+    save_checkpoint,
+    finish_checkpointed_sync,
+    resolve_incremental_config
+)
+
+
+class TestWatermarkSerialization(unittest.TestCase):
+    """Test cases for watermark (de)serialization."""
+
+    def test_round_trip_preserves_type(self):
+        """Watermarks come back with their original Python type."""
+        values = [
+            datetime.datetime(2024, 5, 6, 7, 8, 9, 123456),
+            datetime.datetime(2024, 5, 6, 7, 8, 9, tzinfo=datetime.timezone.utc),
+            datetime.date(2024, 5, 6),
+            b'\x00\x00\x00\x00\x00\x01\x86\xa0',
+            12345678901234,
+            1.5,
+            Decimal('10.25'),
+            'abc'
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                restored = deserialize_watermark(serialize_watermark(value))
+                self.assertEqual(restored, value)
+                self.assertIs(type(restored), type(value))
+
+    def test_none(self):
+        """None is stored as NULL."""
+        self.assertIsNone(serialize_watermark(None))
+        self.assertIsNone(deserialize_watermark(None))
+
+    def test_describe_rowversion(self):
+        """rowversion watermarks are shown as hex."""
+        self.assertEqual(describe_watermark(b'\x00\x01\xab'), '0x0001AB')
+
+
+class TestSyncMetadata(unittest.TestCase):
+    """Test cases for sync_metadata access."""
+
+    def setUp(self):
+        self.mock_conn = Mock()
+        self.mock_cursor = Mock()
+        self.mock_conn.cursor.return_value = self.mock_cursor
+
+    def test_ensure_table_adds_state_columns(self):
+        """The table is created if missing and upgraded with the state columns."""
+        ensure_sync_metadata_table(self.mock_conn, 'pyairbyte_cache')
+
+        statements = [c[0][0] for c in self.mock_cursor.execute.call_args_list]
+        self.assertTrue(any('CREATE TABLE IF NOT EXISTS pyairbyte_cache.sync_metadata' in s for s in statements))
+        self.assertTrue(any('ADD COLUMN IF NOT EXISTS watermark_value TEXT' in s for s in statements))
+        self.mock_conn.commit.assert_called_once()
+
+    def test_get_last_watermark(self):
+        """The stored watermark is deserialized."""
+        self.mock_cursor.fetchone.return_value = (serialize_watermark(42),)
+
+        value = get_last_watermark(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders', 'RowVer')
+
+        self.assertEqual(value, 42)
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("sync_status = 'completed'", query)
+        self.assertEqual(params, ('erp', 'Orders', 'RowVer'))
+
+    def test_get_last_watermark_missing(self):
+        """No completed sync means no watermark."""
+        self.mock_cursor.fetchone.return_value = None
+
+        self.assertIsNone(get_last_watermark(self.mock_conn, 's', 'erp', 'Orders', 'RowVer'))
+
+    def test_record_table_sync(self):
+        """A sync outcome is inserted with the serialized watermark and committed."""
+        started = datetime.datetime(2024, 1, 1)
+
+        record_table_sync(
+            self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders', 'completed', 10,
+            started, 'RowVer', b'\x01'
+        )
+
+        params = self.mock_cursor.execute.call_args[0][1]
+        self.assertEqual(params[:7], ('erp', 'pyairbyte_cache', 'Orders', started, 'completed', 10, None))
+        self.assertEqual(params[7], 'RowVer')
+        self.assertEqual(deserialize_watermark(params[8]), b'\x01')
+        self.assertIsNone(params[9])
+        self.mock_conn.commit.assert_called_once()
+
+    def test_record_fingerprint(self):
+        """The source fingerprint is stored with the sync outcome."""
+        record_table_sync(
+            self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders', 'completed', 10,
+            datetime.datetime(2024, 1, 1), fingerprint='checksum:10:123'
+        )
+
+        params = self.mock_cursor.execute.call_args[0][1]
+        self.assertEqual(params[9], 'checksum:10:123')
+
+
+class TestChangeDetection(unittest.TestCase):
+    """Test cases for table fingerprints."""
+
+    def setUp(self):
+        self.mock_conn = Mock()
+        self.mock_cursor = Mock()
+        self.mock_conn.cursor.return_value = self.mock_cursor
+
+    def test_format_fingerprint(self):
+        """Fingerprints carry the mode, row count and value."""
+        self.assertEqual(format_fingerprint('checksum', 12, -93841), 'checksum:12:-93841')
+        self.assertEqual(format_fingerprint('rowversion', 3, b'\x00\x0a'), 'rowversion:3:0x000A')
+        self.assertEqual(format_fingerprint('checksum', 0, None), 'checksum:0:None')
+
+    def test_last_fingerprint_of_completed_sync(self):
+        """The fingerprint of the most recent sync is returned if it completed."""
+        self.mock_cursor.fetchone.return_value = ('completed', 'checksum:10:123')
+
+        value = get_last_fingerprint(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders')
+
+        self.assertEqual(value, 'checksum:10:123')
+        self.assertEqual(self.mock_cursor.execute.call_args[0][1], ('erp', 'Orders'))
+
+    def test_last_sync_failed(self):
+        """A failed last sync invalidates the stored fingerprint."""
+        self.mock_cursor.fetchone.return_value = ('failed', None)
+
+        self.assertIsNone(get_last_fingerprint(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders'))
+
+    def test_is_table_unchanged(self):
+        """A table is unchanged if the fingerprint matches and the loaded table exists."""
+        self.mock_cursor.fetchone.side_effect = [('completed', 'checksum:10:123'), (True,)]
+
+        self.assertTrue(
+            is_table_unchanged(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders', 'mssql_Orders', 'checksum:10:123')
+        )
+
+    def test_changed_fingerprint(self):
+        """A different fingerprint means the table is reloaded."""
+        self.mock_cursor.fetchone.side_effect = [('completed', 'checksum:10:123'), (True,)]
+
+        self.assertFalse(
+            is_table_unchanged(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders', 'mssql_Orders', 'checksum:11:99')
+        )
+
+    def test_loaded_table_dropped(self):
+        """A matching fingerprint does not skip a table that no longer exists in PostgreSQL."""
+        self.mock_cursor.fetchone.side_effect = [('completed', 'checksum:10:123'), (False,)]
+
+        self.assertFalse(
+            is_table_unchanged(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders', 'mssql_Orders', 'checksum:10:123')
+        )
+
+
+class TestCheckpoints(unittest.TestCase):
+    """Test cases for resumable load checkpoints."""
+
+    def setUp(self):
+        self.mock_conn = Mock()
+        self.mock_cursor = Mock()
+        self.mock_conn.cursor.return_value = self.mock_cursor
+
+    def test_round_trip_composite_key(self):
+        """Checkpoint keys keep the type of every key column."""
+        key = [42, 'k9', datetime.date(2024, 5, 6)]
+
+        self.assertEqual(deserialize_checkpoint(serialize_checkpoint(key)), key)
+        self.assertIsNone(deserialize_checkpoint(None))
+
+    def test_get_resume_checkpoint(self):
+        """The checkpoint of an unfinished load is returned with its row count."""
+        self.mock_cursor.fetchone.return_value = (7, 'failed', serialize_checkpoint([119, 'k9']), 1200)
+
+        resume = get_resume_checkpoint(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders')
+
+        self.assertEqual(resume, {'sync_id': 7, 'key': [119, 'k9'], 'rows_loaded': 1200, 'sync_status': 'failed'})
+        self.assertIn('checkpoint_key IS NOT NULL', self.mock_cursor.execute.call_args[0][0])
+
+    def test_nothing_to_resume(self):
+        """Without an unfinished load there is no checkpoint."""
+        self.mock_cursor.fetchone.return_value = None
+
+        self.assertIsNone(get_resume_checkpoint(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders'))
+
+    def test_start_carries_checkpoint_over(self):
+        """A resumed load starts its row with the checkpoint it continues after."""
+        self.mock_cursor.fetchone.return_value = (8,)
+        started_at = datetime.datetime(2024, 5, 6, 7, 0, 0)
+        resume = {'sync_id': 7, 'key': [119, 'k9'], 'rows_loaded': 1200, 'sync_status': 'failed'}
+
+        sync_id = start_checkpointed_sync(self.mock_conn, 'pyairbyte_cache', 'erp', 'Orders', started_at, resume)
+
+        self.assertEqual(sync_id, 8)
+        discard_sql = self.mock_cursor.execute.call_args_list[0][0][0]
+        self.assertIn('SET checkpoint_key = NULL', discard_sql)
+        params = self.mock_cursor.execute.call_args_list[1][0][1]
+        self.assertEqual(params[4:], ('running', 1200, serialize_checkpoint([119, 'k9'])))
+        self.mock_conn.commit.assert_called_once()
+
+    def test_save_checkpoint_does_not_commit(self):
+        """Checkpoints are committed by the caller together with the chunk."""
+        save_checkpoint(self.mock_conn, 'pyairbyte_cache', 8, [120, 'k3'], 1300)
+
+        self.assertEqual(self.mock_cursor.execute.call_args[0][1], (serialize_checkpoint([120, 'k3']), 1300, 8))
+        self.mock_conn.commit.assert_not_called()
+
+    def test_finish_failed_keeps_checkpoint(self):
+        """A failed load keeps its checkpoint; the status decides whether it is cleared."""
+        finish_checkpointed_sync(self.mock_conn, 'pyairbyte_cache', 8, 'failed', error_message='network blip')
+
+        sql, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("CASE WHEN %s = 'completed' THEN NULL", sql)
+        self.assertEqual(params, ('failed', None, 'network blip', 'failed', 8))
+        self.mock_conn.commit.assert_called_once()
+
+
+class TestResolveIncrementalConfig(unittest.TestCase):
+    """Test cases for resolve_incremental_config."""
+
+    columns = [{'name': 'Id'}, {'name': 'RowVer'}, {'name': 'Name'}]
+
+    def test_config_primary_key(self):
+        """A configured primary key is used without discovery."""
+        discover = Mock()
+
+        result = resolve_incremental_config(
+            'Orders', {'watermark_column': 'RowVer', 'primary_key': 'Id'}, self.columns, discover
+        )
+
+        self.assertEqual(result, ('RowVer', ['Id']))
+        discover.assert_not_called()
+
+    def test_discovered_primary_key(self):
+        """The source primary key is used when none is configured."""
+        result = resolve_incremental_config(
+            'Orders', {'watermark_column': 'RowVer'}, self.columns, lambda: ['Id']
+        )
+
+        self.assertEqual(result, ('RowVer', ['Id']))
+
+    def test_missing_watermark_column(self):
+        """An unknown watermark column is rejected."""
+        with self.assertRaises(ValueError):
+            resolve_incremental_config('Orders', {'watermark_column': 'Changed'}, self.columns, lambda: ['Id'])
+
+    def test_missing_primary_key(self):
+        """A table without a primary key cannot be upserted."""
+        with self.assertRaises(ValueError):
+            resolve_incremental_config('Orders', {'watermark_column': 'RowVer'}, self.columns, lambda: [])
+
+
+if __name__ == '__main__':
+    unittest.main()